@@ -0,0 +1,15 @@
+# Copyright: (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""NetApp StorageGRID - Run na_sg_grid_tenant in the controller worker"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import ansible_collections.netapp.storagegrid.plugins.modules.na_sg_grid_tenant as na_sg_grid_tenant
+from ansible_collections.netapp.storagegrid.plugins.plugin_utils.sg_action import SGActionModule
+
+
+class ActionModule(SGActionModule):
+    MODULE = na_sg_grid_tenant
@@ -0,0 +1,94 @@
+# Copyright: (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""NetApp StorageGRID - Run na_sg_org_s3_key_rotation, and write the new keys to a vault encrypted file"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import tempfile
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.common.text.converters import to_bytes, to_native, to_text
+from ansible.parsing.vault import VaultLib, match_encrypt_secret
+import ansible_collections.netapp.storagegrid.plugins.modules.na_sg_org_s3_key_rotation as na_sg_org_s3_key_rotation
+from ansible_collections.netapp.storagegrid.plugins.plugin_utils.sg_action import SGActionModule
+
+
+def write_vault_file(path, vaulttext):
+    """ Write the file atomically, readable by its owner only """
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".%s." % os.path.basename(path))
+    try:
+        with os.fdopen(fd, "wb") as vault_file:
+            vault_file.write(vaulttext)
+        os.chmod(tmp_path, 0o600)
+        os.rename(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+class ActionModule(SGActionModule):
+    MODULE = na_sg_org_s3_key_rotation
+
+    def get_vault_secret(self):
+        """ Return (vault_id, secret) used to encrypt dest, fail before any key is created when there is none """
+        vault_id = self._task.args.get("vault_id")
+        secrets = self._loader._vault.secrets or []
+        try:
+            match = match_encrypt_secret(secrets, encrypt_vault_id=vault_id)
+        except AnsibleError as exc:
+            match = None
+            error = to_native(exc)
+        else:
+            error = "A vault password is required to encrypt dest, use --ask-vault-pass or --vault-id."
+        if not match:
+            raise AnsibleError(error)
+        return match
+
+    def run(self, tmp=None, task_vars=None):
+        dest = self._task.args.get("dest")
+        if not dest or self._task.check_mode:
+            return super(ActionModule, self).run(tmp, task_vars)
+
+        dest = os.path.expanduser(to_native(dest))
+        try:
+            vault_id, secret = self.get_vault_secret()
+        except AnsibleError as exc:
+            return dict(failed=True, msg=to_native(exc))
+
+        result = super(ActionModule, self).run(tmp, task_vars)
+        keys = [entry for entry in result.get("rotated") or [] if entry.get("secret_access_key")]
+        if not keys:
+            return result
+
+        content = dict(
+            keys=[
+                dict(
+                    unique_name=entry["unique_name"],
+                    user_id=entry["user_id"],
+                    access_key=entry["access_key"],
+                    secret_access_key=entry["secret_access_key"],
+                    expires=entry.get("expires"),
+                    superseded=entry.get("superseded"),
+                )
+                for entry in keys
+            ]
+        )
+        try:
+            vaulttext = VaultLib().encrypt(to_text(json.dumps(content, indent=2)), secret, vault_id=vault_id)
+            write_vault_file(dest, to_bytes(vaulttext))
+        except Exception as exc:
+            # the keys are created, do not lose them
+            result["failed"] = True
+            result["msg"] = "Error writing the new S3 access keys to %s: %s" % (dest, to_native(exc))
+            return result
+
+        for entry in keys:
+            del entry["secret_access_key"]
+        result["dest"] = dest
+        return result
@@ -0,0 +1,188 @@
+# Copyright: (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""NetApp StorageGRID - Profile REST API calls per endpoint and per task"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+name: sg_api_profile
+type: aggregate
+short_description: NetApp StorageGRID profile REST API calls per endpoint and per task.
+version_added: '21.18.0'
+author: NetApp Ansible Team (@vinaykus) <ng-ansibleteam@netapp.com>
+description:
+  - Enables request telemetry in the StorageGRID modules, which then return the method, endpoint, status,
+    response size and latency of every REST API call they make.
+  - Aggregates the calls over the whole playbook, and reports the p50, p95 and p99 latency of each endpoint,
+    the number of calls made by each task, and the slowest tasks.
+  - The report is displayed at the end of the playbook, and written as JSON and/or CSV files.
+  - Endpoints are aggregated on their template, with identifiers and names replaced by C({id}).
+requirements:
+  - Enable this callback with the C(callbacks_enabled) setting.
+  - Modules must run on the controller, for instance with C(delegate_to=localhost), to inherit the
+    C(NETAPP_SG_API_TELEMETRY) environment variable set by this callback.
+options:
+  report_path:
+    description:
+      - Path of the report files, without extension.
+      - C(.json), C(_endpoints.csv) and C(_tasks.csv) are added depending on I(report_format).
+    type: path
+    default: ./sg_api_profile
+    env:
+      - name: NETAPP_SG_API_PROFILE_PATH
+    ini:
+      - section: callback_sg_api_profile
+        key: report_path
+  report_format:
+    description:
+      - Formats of the report files.
+    type: list
+    elements: str
+    choices: ['json', 'csv']
+    default: ['json']
+    env:
+      - name: NETAPP_SG_API_PROFILE_FORMAT
+    ini:
+      - section: callback_sg_api_profile
+        key: report_format
+  slowest_tasks:
+    description:
+      - Number of slowest tasks to report, ranked by their total API latency.
+    type: int
+    default: 10
+    env:
+      - name: NETAPP_SG_API_PROFILE_SLOWEST_TASKS
+    ini:
+      - section: callback_sg_api_profile
+        key: slowest_tasks
+"""
+
+import csv
+import json
+import math
+import os
+
+from ansible.module_utils.common.text.converters import to_text
+from ansible.plugins.callback import CallbackBase
+from ansible_collections.netapp.storagegrid.plugins.module_utils.telemetry import RESULT_KEY, TELEMETRY_ENV
+
+ENDPOINT_FIELDS = ["method", "endpoint", "calls", "errors", "bytes", "total_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+TASK_FIELDS = ["task", "path", "calls", "errors", "total_ms"]
+
+
+def percentile(ordered, fraction):
+    """ Nearest-rank percentile of a sorted list """
+    if not ordered:
+        return None
+    rank = max(int(math.ceil(fraction * len(ordered))), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def is_error(call):
+    return call.get("status") is None or call["status"] >= 400
+
+
+class CallbackModule(CallbackBase):
+    """ Aggregate the StorageGRID REST API calls returned by the modules """
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "aggregate"
+    CALLBACK_NAME = "netapp.storagegrid.sg_api_profile"
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, display=None):
+        super(CallbackModule, self).__init__(display=display)
+        # workers and the modules they run on the controller inherit the environment
+        os.environ[TELEMETRY_ENV] = "1"
+        self.endpoints = {}
+        self.tasks = {}
+
+    def record_calls(self, result):
+        calls = []
+        for payload in [result._result] + list(result._result.get("results") or []):
+            if isinstance(payload, dict) and payload.get(RESULT_KEY):
+                calls.extend(payload.pop(RESULT_KEY))
+        if not calls:
+            return
+
+        task = result._task
+        task_stats = self.tasks.setdefault(
+            task._uuid, dict(task=to_text(task.get_name()), path=to_text(task.get_path() or ""), calls=0, errors=0, total_ms=0.0)
+        )
+        for call in calls:
+            endpoint = self.endpoints.setdefault(
+                (call["method"], call["endpoint"]), dict(method=call["method"], endpoint=call["endpoint"], latencies=[], errors=0, bytes=0)
+            )
+            endpoint["latencies"].append(call["latency_ms"])
+            endpoint["bytes"] += call.get("bytes") or 0
+            task_stats["calls"] += 1
+            task_stats["total_ms"] += call["latency_ms"]
+            if is_error(call):
+                endpoint["errors"] += 1
+                task_stats["errors"] += 1
+
+    def v2_runner_on_ok(self, result):
+        self.record_calls(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self.record_calls(result)
+
+    def build_report(self):
+        endpoints = []
+        for endpoint in self.endpoints.values():
+            latencies = sorted(endpoint["latencies"])
+            endpoints.append(dict(
+                method=endpoint["method"],
+                endpoint=endpoint["endpoint"],
+                calls=len(latencies),
+                errors=endpoint["errors"],
+                bytes=endpoint["bytes"],
+                total_ms=round(sum(latencies), 3),
+                p50_ms=percentile(latencies, 0.50),
+                p95_ms=percentile(latencies, 0.95),
+                p99_ms=percentile(latencies, 0.99),
+                max_ms=latencies[-1],
+            ))
+        endpoints.sort(key=lambda item: item["total_ms"], reverse=True)
+        tasks = [dict(task, total_ms=round(task["total_ms"], 3)) for task in self.tasks.values()]
+        slowest = sorted(tasks, key=lambda item: item["total_ms"], reverse=True)[:self.get_option("slowest_tasks")]
+        return dict(endpoints=endpoints, tasks=tasks, slowest_tasks=slowest)
+
+    def write_report(self, report):
+        path = self.get_option("report_path")
+        formats = self.get_option("report_format")
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        if "json" in formats:
+            with open(path + ".json", "w") as report_file:
+                json.dump(report, report_file, indent=2)
+        if "csv" in formats:
+            for suffix, fields, rows in (("_endpoints.csv", ENDPOINT_FIELDS, report["endpoints"]), ("_tasks.csv", TASK_FIELDS, report["tasks"])):
+                with open(path + suffix, "w", newline="") as report_file:
+                    writer = csv.DictWriter(report_file, fieldnames=fields)
+                    writer.writeheader()
+                    writer.writerows(rows)
+
+    def v2_playbook_on_stats(self, stats):
+        if not self.endpoints:
+            return
+        report = self.build_report()
+        self._display.banner("STORAGEGRID API PROFILE")
+        for endpoint in report["endpoints"]:
+            self._display.display(
+                "%-6s %-60s calls=%-5d errors=%-3d p50=%.1fms p95=%.1fms p99=%.1fms"
+                % (endpoint["method"], endpoint["endpoint"], endpoint["calls"], endpoint["errors"],
+                   endpoint["p50_ms"], endpoint["p95_ms"], endpoint["p99_ms"])
+            )
+        self._display.display("Slowest tasks:")
+        for task in report["slowest_tasks"]:
+            self._display.display("  %-60s calls=%-5d total=%.1fms" % (task["task"], task["calls"], task["total_ms"]))
+        try:
+            self.write_report(report)
+        except (IOError, OSError) as exc:
+            self._display.warning("Unable to write the StorageGRID API profile report: %s" % to_text(exc))
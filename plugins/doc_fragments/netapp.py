@@ -27,17 +27,48 @@ options:
     - The authorization token for the API request
   api_url:
     required: true
-    type: str
+    type: list
+    elements: str
     description:
     - The url to the StorageGRID Admin Node REST API.
+    - A list of urls of admin nodes of the same grid can be given.  They are probed concurrently and the fastest
+      healthy node is used, and on a connection error, idempotent requests (GET, PUT, DELETE) are sent again to the next node.
   validate_certs:
     required: false
     default: true
     description:
     - Should https certificates be validated?
     type: bool
+  rate_limit:
+    required: false
+    type: float
+    description:
+    - Maximum number of requests per second sent to an admin node by all the tasks running on this host.
+    - Must be greater than 0.
+    - The limit is a token bucket in a file of the temporary directory, locked while it is updated, so it is shared by forks.
+    - Can also be set with the C(NETAPP_SG_RATE_LIMIT) environment variable.
+    - By default, requests are not limited.
+    version_added: 21.18.0
+  rate_limit_burst:
+    required: false
+    type: int
+    description:
+    - Number of requests that can be sent at once before I(rate_limit) applies, at least 1.
+    - Can also be set with the C(NETAPP_SG_RATE_LIMIT_BURST) environment variable.
+    - Defaults to I(rate_limit), and to at least 1.
+    version_added: 21.18.0
 notes:
   - The modules prefixed with C(na_sg) are built to manage NetApp StorageGRID.
+  - When the environment variable C(NETAPP_SG_ENDPOINT_CACHE) is set to the path of a file, the admin node selected
+    from a list of I(api_url) is remembered there for 5 minutes, so later tasks skip probing.
+  - When the environment variable C(NETAPP_SG_PERF) is set to C(1), for instance with the C(environment) keyword of a task,
+    the module result includes a C(perf) dictionary with the wall time of the run split between HTTP requests, rate limit
+    waits and local processing, the request count by method, the bytes sent and received, the retries on another admin node,
+    and the 5 endpoints which took the most time.
+  - When the environment variable C(NETAPP_SG_PROFILE) is set to a directory, the module run is profiled with cProfile
+    and tracemalloc, or only one of them with C(NETAPP_SG_PROFILE_MODE) set to C(cpu) or C(memory). A C(.prof) file and
+    a report of the top allocation sites are written to the directory, and the result includes a C(sg_profile) dictionary
+    with their paths, the peak traced memory, and the 20 functions which spent the most time.
 """
 
     # Documentation fragment for StorageGRID node PGE
@@ -56,4 +87,6 @@ options:
     type: bool
 notes:
   - The modules prefixed with C(na_sg_pge) are built to manage NetApp StorageGRID node Pre-Grid Environment (PGE) configuration.
+  - When the environment variable C(NETAPP_SG_PROFILE) is set to a directory, the module run is profiled with cProfile
+    and tracemalloc, and the result includes a C(sg_profile) dictionary with the 20 functions which spent the most time.
 """
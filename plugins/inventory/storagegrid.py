@@ -0,0 +1,261 @@
+# Copyright: (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""NetApp StorageGRID - Dynamic inventory of grid nodes"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+name: storagegrid
+short_description: NetApp StorageGRID grid node inventory source.
+version_added: '21.18.0'
+author: NetApp Ansible Team (@vinaykus) <ng-ansibleteam@netapp.com>
+description:
+  - Build an inventory of the Admin, Gateway and Storage Nodes of one or more NetApp StorageGRID grids.
+  - Nodes are read from C(grid/node-health), and HA group membership from C(private/ha-groups).
+  - Hosts are grouped by grid, site, node type, health severity and connection state, and by HA group.
+  - Grids are queried concurrently, and the results can be kept in the Ansible inventory cache.
+  - The configuration file name must end with C(storagegrid.yml) or C(storagegrid.yaml).
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+options:
+  plugin:
+    description: Token that ensures this is a source file for the plugin.
+    required: true
+    type: str
+    choices: ['netapp.storagegrid.storagegrid']
+  grids:
+    description:
+      - List of grids to read nodes from.
+    required: true
+    type: list
+    elements: dict
+    suboptions:
+      api_url:
+        description:
+          - The url to the StorageGRID Admin Node REST API.
+        required: true
+        type: str
+      auth_token:
+        description:
+          - The grid authorization token for the API request.
+        required: true
+        type: str
+      validate_certs:
+        description:
+          - Should https certificates be validated?
+        type: bool
+        default: true
+      name:
+        description:
+          - Name of the grid, used for the C(sg_grid_<name>) group and the C(sg_grid) host variable.
+          - Defaults to the host name of I(api_url).
+        type: str
+      host_prefix:
+        description:
+          - Prefix added to the inventory host name of every node of this grid.
+          - Use it when several grids share node names.
+        type: str
+        default: ''
+  group_prefix:
+    description:
+      - Prefix of every group created by this plugin.
+    type: str
+    default: sg_
+  max_concurrent_grids:
+    description:
+      - Maximum number of grids queried at the same time.
+    type: int
+    default: 4
+  timeout:
+    description:
+      - Timeout in seconds for each REST API request.
+    type: int
+    default: 60
+notes:
+  - The host variable C(ansible_host) is not set, use I(compose) to derive it from the C(sg_*) host variables
+    or from a naming convention.
+"""
+
+EXAMPLES = """
+# storagegrid.yml
+plugin: netapp.storagegrid.storagegrid
+grids:
+  - api_url: "https://grid1-admin.example.com"
+    auth_token: "{{ lookup('env', 'SG_GRID1_TOKEN') }}"
+    name: grid1
+  - api_url: "https://grid2-admin.example.com"
+    auth_token: "storagegrid-auth-token"
+    name: grid2
+    validate_certs: false
+
+# Cache the inventory for 15 minutes
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/storagegrid_inventory
+cache_timeout: 900
+
+# Only keep healthy Storage Nodes in a dedicated group
+groups:
+  healthy_storage: sg_node_type == 'storageNode' and sg_severity == 'normal'
+compose:
+  ansible_host: inventory_hostname ~ '.example.com'
+"""
+
+from urllib.parse import urlparse
+
+from ansible.errors import AnsibleError, AnsibleParserError
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+from ansible_collections.netapp.storagegrid.plugins.plugin_utils import sg_client
+
+NODE_TYPES = {
+    "adminNode": "admin",
+    "apiGatewayNode": "gateway",
+    "storageNode": "storage",
+    "archiveNode": "archive",
+}
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+    """ Host inventory built from StorageGRID node-health """
+
+    NAME = "netapp.storagegrid.storagegrid"
+
+    def verify_file(self, path):
+        """ Return true if path is a configuration file for this plugin """
+        if super(InventoryModule, self).verify_file(path):
+            return path.endswith(("storagegrid.yml", "storagegrid.yaml"))
+        return False
+
+    def get_grid_name(self, grid):
+        if grid.get("name"):
+            return grid["name"]
+        api_url = to_native(grid["api_url"])
+        if "://" not in api_url:
+            api_url = "https://" + api_url
+        return urlparse(api_url).hostname or api_url
+
+    def fetch_grid(self, grid):
+        """ Read nodes and HA groups of one grid, return a JSON serializable dict for the cache """
+        if not grid.get("api_url") or not grid.get("auth_token"):
+            raise AnsibleParserError("Each entry in grids requires api_url and auth_token.")
+        name = self.get_grid_name(grid)
+        rest_api = sg_client.get_rest_api(
+            grid["api_url"], grid["auth_token"], grid.get("validate_certs", True), self.get_option("timeout")
+        )
+        try:
+            rest_api.get_sg_product_version(api_root="grid")
+        except AnsibleError as exc:
+            raise AnsibleError("Error reading grid %s: %s" % (name, to_native(exc)))
+        api_version = rest_api.get_api_version()
+
+        nodes, error = rest_api.get("api/%s/grid/node-health" % api_version)
+        if error:
+            raise AnsibleError("Error reading nodes of grid %s: %s" % (name, to_native(error)))
+        ha_groups, error = rest_api.get("api/%s/private/ha-groups" % api_version)
+        if error:
+            raise AnsibleError("Error reading HA groups of grid %s: %s" % (name, to_native(error)))
+
+        return dict(
+            name=name,
+            api_url=to_native(grid["api_url"]),
+            host_prefix=grid.get("host_prefix") or "",
+            version=rest_api.sg_version["full"],
+            nodes=nodes.get("data") or [],
+            ha_groups=ha_groups.get("data") or [],
+        )
+
+    def get_grids(self):
+        """ Return the configured grids, with api_url and auth_token templated, e.g. from a lookup """
+        grids = []
+        for grid in self.get_option("grids"):
+            grid = dict(grid)
+            for key in ("api_url", "auth_token"):
+                if grid.get(key) and self.templar.is_template(grid[key]):
+                    grid[key] = self.templar.template(grid[key])
+            grids.append(grid)
+        return grids
+
+    def fetch_grids(self):
+        """ Read every configured grid, several at a time """
+        return sg_client.run_concurrently(self.fetch_grid, self.get_grids(), self.get_option("max_concurrent_grids"))
+
+    def add_group(self, name):
+        return self.inventory.add_group(self._sanitize_group_name(self.get_option("group_prefix") + name))
+
+    def populate(self, grids):
+        """ Add hosts, groups and host variables to the inventory """
+        strict = self.get_option("strict")
+        for grid in grids:
+            grid_group = self.add_group("grid_%s" % grid["name"])
+            self.inventory.set_variable(grid_group, "sg_api_url", grid["api_url"])
+            self.inventory.set_variable(grid_group, "sg_version", grid["version"])
+
+            ha_membership = {}
+            for ha_group in grid["ha_groups"]:
+                group = self.add_group("ha_%s" % ha_group["name"])
+                self.inventory.set_variable(group, "sg_virtual_ips", ha_group.get("virtualIps") or [])
+                for interface in ha_group.get("interfaces") or []:
+                    ha_membership.setdefault(interface.get("nodeId"), []).append(dict(group=group, ha_group=ha_group["name"]))
+
+            for node in grid["nodes"]:
+                host = self.inventory.add_host(grid["host_prefix"] + node["name"], group=grid_group)
+                node_type = node.get("type")
+                hostvars = dict(
+                    sg_grid=grid["name"],
+                    sg_node_id=node.get("id"),
+                    sg_node_type=node_type,
+                    sg_site_id=node.get("siteId"),
+                    sg_site_name=node.get("siteName"),
+                    sg_severity=node.get("severity"),
+                    sg_state=node.get("state"),
+                    sg_is_primary_admin=bool(node.get("isPrimaryAdmin")),
+                    sg_ha_groups=[member["ha_group"] for member in ha_membership.get(node.get("id"), [])],
+                )
+                for key, value in hostvars.items():
+                    self.inventory.set_variable(host, key, value)
+
+                if node.get("siteName"):
+                    self.inventory.add_host(host, group=self.add_group("site_%s" % node["siteName"]))
+                if node_type:
+                    self.inventory.add_host(host, group=self.add_group("%s_nodes" % NODE_TYPES.get(node_type, node_type)))
+                if node.get("isPrimaryAdmin"):
+                    self.inventory.add_host(host, group=self.add_group("primary_admin"))
+                if node.get("severity"):
+                    self.inventory.add_host(host, group=self.add_group("health_%s" % node["severity"]))
+                if node.get("state"):
+                    self.inventory.add_host(host, group=self.add_group("state_%s" % node["state"]))
+                for member in ha_membership.get(node.get("id"), []):
+                    self.inventory.add_host(host, group=member["group"])
+
+                hostvars = self.inventory.get_host(host).get_vars()
+                self._set_composite_vars(self.get_option("compose"), hostvars, host, strict=strict)
+                self._add_host_to_composed_groups(self.get_option("groups"), hostvars, host, strict=strict)
+                self._add_host_to_keyed_groups(self.get_option("keyed_groups"), hostvars, host, strict=strict)
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option("cache") and cache
+        update_cache = self.get_option("cache") and not cache
+
+        grids = None
+        if use_cache:
+            try:
+                grids = self._cache[cache_key]
+            except KeyError:
+                # cache expired or not populated yet
+                update_cache = True
+        if grids is None:
+            grids = self.fetch_grids()
+        if update_cache:
+            self._cache[cache_key] = grids
+
+        self.populate(grids)
@@ -0,0 +1,205 @@
+# Copyright: (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""NetApp StorageGRID - Resolve object names to objects"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+name: sg_object
+short_description: NetApp StorageGRID resolve object names to IDs or objects.
+version_added: '21.18.0'
+author: NetApp Ansible Team (@vinaykus) <ng-ansibleteam@netapp.com>
+description:
+  - Look up StorageGRID objects by name, and return their ID (or another attribute, or the whole object).
+  - All names of one call are resolved with a single sweep of the collection, paging through collections
+    such as tenants, users and groups, and stopping as soon as every name is found.
+  - Results are memoized in the controller process, so later lookups of the same kind on the same grid
+    or tenant are served without a new API request.
+options:
+  _terms:
+    description:
+      - The kind of object, followed by one or more names.
+      - C(tenant), C(grid_group), C(grid_user), C(ilm_pool), C(ilm_rule), C(ilm_policy), C(ec_profile),
+        C(ha_group) and C(node) require a grid I(auth_token).
+      - C(org_group), C(org_user) and C(bucket) require a tenant I(auth_token).
+      - Group and user names are unique names, C(group/) or C(user/) is added when the name has no prefix.
+    required: true
+    type: list
+    elements: str
+  api_url:
+    description:
+      - The url to the StorageGRID Admin Node REST API.
+    required: true
+    type: str
+  auth_token:
+    description:
+      - The authorization token for the API request.
+    required: true
+    type: str
+  validate_certs:
+    description:
+      - Should https certificates be validated?
+    type: bool
+    default: true
+  attribute:
+    description:
+      - Attribute of each object to return.
+      - Set to an empty string to return the whole object.
+    type: str
+    default: id
+  on_missing:
+    description:
+      - Action to take when a name is not found.
+      - C(error) fails the lookup, C(warn) and C(skip) return C(None) for that name.
+    type: str
+    choices: ['error', 'warn', 'skip']
+    default: error
+notes:
+  - Memoized results live as long as the controller process running the lookup, objects created or deleted
+    during that time by other tasks may not be seen.
+"""
+
+EXAMPLES = """
+- name: Get the ID of a tenant
+  ansible.builtin.debug:
+    msg: "{{ lookup('netapp.storagegrid.sg_object', 'tenant', 'tenant1', api_url=sg_api_url, auth_token=grid_token) }}"
+
+- name: Resolve many group names with one sweep
+  ansible.builtin.set_fact:
+    group_ids: "{{ query('netapp.storagegrid.sg_object', 'org_group', 'group/admins', 'readers', 'writers',
+                         api_url=sg_api_url, auth_token=tenant_token) }}"
+
+- name: Get the whole ILM pool object
+  ansible.builtin.set_fact:
+    pool: "{{ lookup('netapp.storagegrid.sg_object', 'ilm_pool', 'pool-site1', attribute='',
+                     api_url=sg_api_url, auth_token=grid_token) }}"
+"""
+
+RETURN = """
+_raw:
+  description:
+    - The requested attribute, or the whole object, for each name, in the order of the names.
+  type: list
+  elements: raw
+"""
+
+import hashlib
+import threading
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.common.text.converters import to_bytes, to_native
+from ansible.plugins.lookup import LookupBase
+from ansible.utils.display import Display
+from ansible_collections.netapp.storagegrid.plugins.plugin_utils import sg_client
+
+display = Display()
+
+# api_root is grid or org, key is the name attribute, paginated collections accept limit and marker
+OBJECT_KINDS = {
+    "tenant": dict(api_root="grid", api="grid/accounts", key="name", paginated=True),
+    "grid_group": dict(api_root="grid", api="grid/groups", key="uniqueName", prefix="group/", paginated=True),
+    "grid_user": dict(api_root="grid", api="grid/users", key="uniqueName", prefix="user/", paginated=True),
+    "org_group": dict(api_root="org", api="org/groups", key="uniqueName", prefix="group/", paginated=True),
+    "org_user": dict(api_root="org", api="org/users", key="uniqueName", prefix="user/", paginated=True),
+    "bucket": dict(api_root="org", api="org/containers", key="name"),
+    "ilm_pool": dict(api_root="grid", api="private/ilm-pools", key="name"),
+    "ilm_rule": dict(api_root="grid", api="grid/ilm-rules", key="name"),
+    "ilm_policy": dict(api_root="grid", api="grid/ilm-policies", key="name"),
+    "ec_profile": dict(api_root="grid", api="grid/ec-profiles", key="name"),
+    "ha_group": dict(api_root="grid", api="private/ha-groups", key="name"),
+    "node": dict(api_root="grid", api="grid/node-health", key="name"),
+}
+
+PAGE_LIMIT = 250
+
+# (api_url, token digest) -> dict(api_version, kinds={kind: dict(objects={name: object}, complete=bool)})
+_MEMO = {}
+_MEMO_LOCK = threading.Lock()
+
+
+class LookupModule(LookupBase):
+    """ Resolve StorageGRID object names """
+
+    def get_endpoint_memo(self, rest_api, api_root):
+        """ Return the memo of this grid or tenant, reading the API version on first use """
+        key = (rest_api.api_url, hashlib.sha256(to_bytes(rest_api.auth_token)).hexdigest())
+        with _MEMO_LOCK:
+            memo = _MEMO.get(key)
+        if memo is None:
+            rest_api.get_sg_product_version(api_root=api_root)
+            memo = dict(api_version=rest_api.get_api_version(), kinds={})
+            with _MEMO_LOCK:
+                memo = _MEMO.setdefault(key, memo)
+        return memo
+
+    def sweep(self, rest_api, api, kind, names):
+        """ Read the collection until every name is found, return (dict of name -> object, complete) """
+        found = set()
+        stopped = []
+
+        def all_found(page):
+            found.update(record.get(kind["key"]) for record in page if record.get(kind["key"]) in names)
+            # stopping on a short page still reads the whole collection
+            if len(found) == len(names) and len(page) == PAGE_LIMIT:
+                stopped.append(True)
+            return len(found) == len(names)
+
+        if kind.get("paginated"):
+            records, error = rest_api.get_paginated(api, limit=PAGE_LIMIT, until=all_found)
+        else:
+            response, error = rest_api.get(api)
+            records = None if error else response.get("data") or []
+        if error:
+            raise AnsibleError("Error reading %s: %s" % (api, to_native(error)))
+        # an early stop leaves the rest of the collection unread
+        return dict((record.get(kind["key"]), record) for record in records), not stopped
+
+    def resolve(self, kind_name, names):
+        kind = OBJECT_KINDS[kind_name]
+        if kind.get("prefix"):
+            names = [name if "/" in name else kind["prefix"] + name for name in names]
+        rest_api = sg_client.get_rest_api(
+            self.get_option("api_url"), self.get_option("auth_token"), self.get_option("validate_certs")
+        )
+        memo = self.get_endpoint_memo(rest_api, kind["api_root"])
+        with _MEMO_LOCK:
+            cache = memo["kinds"].setdefault(kind_name, dict(objects={}, complete=False))
+            missing = set(name for name in names if name not in cache["objects"])
+        if missing and not cache["complete"]:
+            api = "api/%s/%s" % (memo["api_version"], kind["api"])
+            objects, complete = self.sweep(rest_api, api, kind, missing)
+            with _MEMO_LOCK:
+                cache["objects"].update(objects)
+                cache["complete"] = cache["complete"] or complete
+        return [(name, cache["objects"].get(name)) for name in names]
+
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+        if len(terms) < 2:
+            raise AnsibleError("sg_object requires the kind of object and at least one name.")
+        kind_name = terms[0]
+        if kind_name not in OBJECT_KINDS:
+            raise AnsibleError(
+                "Unsupported object kind '%s', expected one of: %s." % (kind_name, ", ".join(sorted(OBJECT_KINDS)))
+            )
+        attribute = self.get_option("attribute")
+        on_missing = self.get_option("on_missing")
+
+        results = []
+        for name, record in self.resolve(kind_name, [to_native(term) for term in terms[1:]]):
+            if record is None:
+                msg = "%s '%s' not found." % (kind_name, name)
+                if on_missing == "error":
+                    raise AnsibleError(msg)
+                if on_missing == "warn":
+                    display.warning(msg)
+                results.append(None)
+            elif attribute:
+                results.append(record.get(attribute))
+            else:
+                results.append(record)
+        return results
@@ -0,0 +1,133 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+""" Run a module against several grids at once, with the results keyed by grid """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.netapp.storagegrid.plugins.module_utils.tools import run_concurrently
+
+
+def grids_argument_spec():
+    """ grids and max_concurrent_grids options, api_url and auth_token are not required with grids """
+    return dict(
+        api_url=dict(required=False, type="list", elements="str"),
+        auth_token=dict(required=False, type="str", no_log=True),
+        grids=dict(type="list", elements="dict", required=False, options=dict(
+            name=dict(type="str", required=False),
+            api_url=dict(type="list", elements="str", required=True),
+            auth_token=dict(type="str", required=True, no_log=True),
+            validate_certs=dict(type="bool", required=False),
+        )),
+        max_concurrent_grids=dict(type="int", required=False, default=12),
+    )
+
+
+def grids_argument_constraints():
+    """ AnsibleModule keyword arguments, either api_url and auth_token, or grids """
+    return dict(
+        required_one_of=[("api_url", "grids")],
+        required_together=[("api_url", "auth_token")],
+        mutually_exclusive=[("api_url", "grids"), ("auth_token", "grids")],
+    )
+
+
+class GridResult(Exception):
+    """ Raised by GridModule.exit_json and GridModule.fail_json with the result of the grid """
+
+    def __init__(self, result):
+        super(GridResult, self).__init__(result.get("msg"))
+        self.result = result
+
+
+class GridModule(object):
+    """
+    Stand-in for the AnsibleModule of one grid: params hold the api_url, auth_token and validate_certs of the grid,
+    exit_json and fail_json raise GridResult rather than exiting, and warnings are kept with the grid result.
+    Other attributes are the ones of the AnsibleModule.
+    """
+
+    def __init__(self, module, grid):
+        self._module = module
+        self.params = dict(module.params, api_url=grid["api_url"], auth_token=grid["auth_token"], grids=None)
+        if grid.get("validate_certs") is not None:
+            self.params["validate_certs"] = grid["validate_certs"]
+        self.warnings = []
+        # the pooled session of the action plugin is not shared between threads
+        self.sg_session = None
+
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+    def warn(self, warning):
+        self.warnings.append(warning)
+
+    def exit_json(self, **kwargs):
+        raise GridResult(kwargs)
+
+    def fail_json(self, **kwargs):
+        kwargs["failed"] = True
+        raise GridResult(kwargs)
+
+
+def grid_names(grids):
+    """ Return (names, error), a grid is named after its first api_url unless it has a name """
+    names = [grid.get("name") or grid["api_url"][0] for grid in grids]
+    duplicates = sorted(set(name for name in names if names.count(name) > 1))
+    if duplicates:
+        return None, "Error in grids: %s is listed more than once, use name to tell them apart." % ", ".join(duplicates)
+    return names, None
+
+
+def run_grids(module, grids, run, max_workers=12):
+    """
+    Call run(grid_module) for every grid concurrently, run ends with grid_module.exit_json or fail_json.
+    An error on a grid does not stop the others, it is returned as the result of the grid, with failed and msg.
+    Return (results keyed by grid name, error)
+    """
+    names, error = grid_names(grids)
+    if error:
+        return None, error
+
+    def run_grid(grid):
+        grid_module = GridModule(module, grid)
+        try:
+            run(grid_module)
+            result = dict(failed=True, msg="Error: no result for grid %s." % grid["api_url"][0])
+        except GridResult as exc:
+            result = exc.result
+        except Exception as exc:
+            result = dict(failed=True, msg="Error: %s" % exc)
+        result.pop("changed", None)
+        if grid_module.warnings:
+            result["warnings"] = grid_module.warnings
+        return result
+
+    return dict(zip(names, run_concurrently(run_grid, grids, max_workers))), None
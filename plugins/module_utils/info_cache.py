@@ -0,0 +1,94 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+""" Local cache of the responses of the info modules, for subsets that rarely change """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+CACHE_VERSION = 1
+
+
+class ResponseCache(object):
+    """
+    Responses of an admin node, one file per subset and query parameters under path.
+    Entries are written to a temporary file and renamed, so concurrent processes sharing path only ever read
+    complete entries, and the last writer wins.  Errors reading or writing the cache are not fatal,
+    an unreadable entry is a miss and a failed write is reported as a warning.
+    """
+
+    def __init__(self, path, api_url):
+        self.path = path
+        self.api_url = api_url
+        self.warnings = []
+
+    def entry_path(self, api, params):
+        key = json.dumps([self.api_url, api, params or {}], sort_keys=True, separators=(",", ":"))
+        return os.path.join(self.path, "%s.json" % hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+    def get(self, api, params, max_age):
+        """ Return (response, age in seconds) of an entry younger than max_age, or (None, None) """
+        try:
+            with open(self.entry_path(api, params)) as entry_file:
+                entry = json.load(entry_file)
+        except (IOError, OSError, ValueError):
+            return None, None
+        if not isinstance(entry, dict) or entry.get("version") != CACHE_VERSION or "response" not in entry:
+            return None, None
+        age = time.time() - entry.get("stored", 0)
+        if age < 0 or age > max_age:
+            return None, None
+        return entry["response"], age
+
+    def put(self, api, params, response):
+        """ Store the response of api, replacing the previous entry """
+        entry = dict(version=CACHE_VERSION, stored=time.time(), api_url=self.api_url, api=api, params=params or {}, response=response)
+        try:
+            try:
+                os.makedirs(self.path, 0o700)
+            except OSError:
+                # created by a concurrent process
+                if not os.path.isdir(self.path):
+                    raise
+            fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=".entry.")
+            try:
+                with os.fdopen(fd, "w") as entry_file:
+                    json.dump(entry, entry_file, separators=(",", ":"))
+                os.rename(tmp_path, self.entry_path(api, params))
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except (IOError, OSError) as exc:
+            self.warnings.append("Error writing cache %s: %s" % (self.path, exc))
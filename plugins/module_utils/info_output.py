@@ -0,0 +1,165 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+""" Compressed NDJSON output of the info modules, written as responses are decoded """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import gzip
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import zlib
+
+
+def content_digest(path):
+    """ SHA-256 of the uncompressed lines of an existing file, None if it does not exist or cannot be read """
+    digest = hashlib.sha256()
+    try:
+        with gzip.open(path, "rb") as existing:
+            for block in iter(lambda: existing.read(65536), b""):
+                digest.update(block)
+    except (IOError, OSError, EOFError, zlib.error):
+        return None
+    return digest.hexdigest()
+
+
+class NdjsonWriter(object):
+    """
+    Write the subsets of an info module to a gzip compressed NDJSON file, one line for each item of a list subset,
+    {"subset": "grid/accounts", "item": {...}}, and one line for other subsets, {"subset": "grid/license", "data": {...}}.
+    The file is written to a temporary file and renamed on close, so readers never see a partial file.
+    The file is created with mode 0600, as it holds credentials, a replaced file keeps its mode.
+    With dry_run, lines are counted and hashed but not written.
+    The manifest holds the number of lines and the SHA-256 of the lines of each subset, and of the compressed file.
+    An existing file with the same lines is kept, the manifest tells whether the lines changed.
+    """
+
+    def __init__(self, path, dry_run=False):
+        self.path = path
+        self.dry_run = dry_run
+        self.subsets = []
+        self.content = hashlib.sha256()
+        self.tmp_path = None
+        self.raw = None
+        self.gzip = None
+        if not dry_run:
+            directory = os.path.dirname(os.path.abspath(path))
+            fd, self.tmp_path = tempfile.mkstemp(dir=directory, prefix=".%s." % os.path.basename(path))
+            self.raw = os.fdopen(fd, "wb")
+            self.gzip = gzip.GzipFile(filename="", mode="wb", fileobj=self.raw)
+
+    def write_line(self, record, entry, digest):
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        digest.update(line)
+        self.content.update(line)
+        entry["bytes"] += len(line)
+        if self.gzip is not None:
+            self.gzip.write(line)
+
+    def write_subset(self, subset, items, decoder, query=None):
+        """
+        Write the items of a subset as they are decoded, keeping the matching items of a query.
+        decoder is the json_stream.DataArrayDecoder of items, telling whether the subset is a list.
+        Return an error, or None.
+        """
+        entry = dict(subset=subset, type=None, count=0, bytes=0)
+        digest = hashlib.sha256()
+        try:
+            for item in items:
+                if query is not None:
+                    if not query.matches(item):
+                        continue
+                    item = query.project(item)
+                if decoder.is_array:
+                    self.write_line(dict(subset=subset, item=item), entry, digest)
+                else:
+                    self.write_line(dict(subset=subset, data=item), entry, digest)
+                entry["count"] += 1
+        except Exception as exc:
+            return "Error reading the response of %s: %s" % (subset, exc)
+        finally:
+            items.close()
+        entry["type"] = "list" if decoder.is_array else "object"
+        entry["sha256"] = digest.hexdigest()
+        self.subsets.append(entry)
+        return None
+
+    def write_document(self, subset, document):
+        """ Write a subset already read as a whole """
+        entry = dict(subset=subset, type="object", count=1, bytes=0)
+        digest = hashlib.sha256()
+        self.write_line(dict(subset=subset, data=document), entry, digest)
+        entry["sha256"] = digest.hexdigest()
+        self.subsets.append(entry)
+
+    def abort(self):
+        if self.gzip is not None:
+            self.gzip.close()
+            self.raw.close()
+            os.unlink(self.tmp_path)
+            self.gzip = None
+
+    def close(self):
+        """ Return (manifest, error) """
+        changed = content_digest(self.path) != self.content.hexdigest()
+        manifest = dict(
+            dest=self.path,
+            format="ndjson.gz",
+            changed=changed,
+            written=changed and not self.dry_run,
+            items=sum(entry["count"] for entry in self.subsets),
+            subsets=self.subsets,
+        )
+        if self.gzip is None:
+            return manifest, None
+        try:
+            self.gzip.close()
+            self.raw.close()
+            self.gzip = None
+            if changed:
+                if os.path.exists(self.path):
+                    os.chmod(self.tmp_path, stat.S_IMODE(os.stat(self.path).st_mode))
+                os.rename(self.tmp_path, self.path)
+            else:
+                os.unlink(self.tmp_path)
+            digest = hashlib.sha256()
+            with open(self.path, "rb") as compressed:
+                for block in iter(lambda: compressed.read(65536), b""):
+                    digest.update(block)
+            manifest["bytes"] = os.path.getsize(self.path)
+            manifest["sha256"] = digest.hexdigest()
+        except (IOError, OSError) as exc:
+            if os.path.exists(self.tmp_path):
+                os.unlink(self.tmp_path)
+            return None, "Error writing %s: %s" % (self.path, exc)
+        return manifest, None
@@ -0,0 +1,250 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+""" Field selection and filters of the info modules, applied to each item as a response is decoded """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import re
+
+from ansible_collections.netapp.storagegrid.plugins.module_utils.info_output import NdjsonWriter
+from ansible_collections.netapp.storagegrid.plugins.module_utils.json_stream import DataArrayDecoder
+
+PREDICATE = re.compile(r"^\s*([^\s=!<>~]+)\s*(==|!=|<=|>=|<|>|=~)\s*(.+?)\s*$")
+OPERATORS = {
+    "==": lambda value, expected: value == expected,
+    "!=": lambda value, expected: value != expected,
+    "<": lambda value, expected: value < expected,
+    "<=": lambda value, expected: value <= expected,
+    ">": lambda value, expected: value > expected,
+    ">=": lambda value, expected: value >= expected,
+    "=~": lambda value, expected: isinstance(value, str) and expected.search(value) is not None,
+}
+
+
+def subset_options_argument_spec():
+    """ Argument spec of the subset_options option of the info modules """
+    return dict(
+        subset_options=dict(
+            required=False,
+            type="list",
+            elements="dict",
+            options=dict(
+                subset=dict(required=True, type="str"),
+                fields=dict(required=False, type="list", elements="str"),
+                filters=dict(required=False, type="list", elements="str"),
+                parameters=dict(required=False, type="dict"),
+            ),
+        )
+    )
+
+
+def split_path(path):
+    return [key for key in path.split(".") if key]
+
+
+def lookup(value, keys):
+    """ Return the values found at keys, a path going through or ending on a list reaches each of its elements """
+    if not keys:
+        return list(value) if isinstance(value, list) else [value]
+    if isinstance(value, list):
+        if keys[0].isdigit():
+            index = int(keys[0])
+            return lookup(value[index], keys[1:]) if index < len(value) else []
+        return [found for element in value for found in lookup(element, keys)]
+    if isinstance(value, dict) and keys[0] in value:
+        return lookup(value[keys[0]], keys[1:])
+    return []
+
+
+class Predicate(object):
+    """ path, or path <operator> value, where value is a JSON literal or a bare string """
+
+    def __init__(self, expression):
+        match = PREDICATE.match(expression)
+        if match:
+            path, self.operator, literal = match.groups()
+            try:
+                self.expected = json.loads(literal)
+            except ValueError:
+                self.expected = literal
+            if self.operator == "=~":
+                try:
+                    self.expected = re.compile(str(self.expected))
+                except re.error as exc:
+                    raise ValueError("invalid regular expression in '%s': %s" % (expression, exc))
+        elif expression.strip() and not any(char in expression for char in "=!<>~ "):
+            path, self.operator, self.expected = expression.strip(), None, None
+        else:
+            raise ValueError("invalid filter '%s', expected 'path' or 'path <operator> value'" % expression)
+        self.keys = split_path(path)
+        if not self.keys:
+            raise ValueError("invalid filter '%s', the path is empty" % expression)
+
+    def matches(self, item):
+        """ True when the predicate holds for any value at the path, or when a missing value is compared with != """
+        values = [value for value in lookup(item, self.keys) if value is not None]
+        if self.operator is None:
+            return bool(values)
+        if not values:
+            return self.operator == "!=" and self.expected is not None
+        compare = OPERATORS[self.operator]
+        for value in values:
+            try:
+                if compare(value, self.expected):
+                    return True
+            except TypeError:
+                # ordering of unrelated types, such as a string and a number
+                continue
+        return False
+
+
+class InfoQuery(object):
+    """
+    Keep the items matching every filter, and the listed fields of each item.
+    Fields are dotted paths, such as policy.quotaObjectBytes, a path going through a list selects the field
+    in each element of the list.  Filters are paths, true when the value is present and not null, or predicates
+    such as capabilities == s3, name =~ ^prod-, or policy.quotaObjectBytes > 1000000000.
+    ValueError is raised for an invalid filter.
+    """
+
+    def __init__(self, fields=None, filters=None):
+        self.tree = None
+        if fields:
+            self.tree = {}
+            for field in fields:
+                node = self.tree
+                for key in split_path(field):
+                    node = node.setdefault(key, {})
+        self.predicates = [Predicate(expression) for expression in filters or []]
+
+    def matches(self, item):
+        return all(predicate.matches(item) for predicate in self.predicates)
+
+    def project(self, item):
+        return item if self.tree is None else self.project_tree(item, self.tree)
+
+    def project_tree(self, value, tree):
+        if not tree:
+            return value
+        if isinstance(value, list):
+            return [self.project_tree(element, tree) for element in value]
+        if isinstance(value, dict):
+            return dict((key, self.project_tree(value[key], subtree)) for key, subtree in tree.items() if key in value)
+        return value
+
+    def apply(self, items):
+        """ Yield the selected fields of the matching items """
+        for item in items:
+            if self.matches(item):
+                yield self.project(item)
+
+
+class InfoSubsets(object):
+    """
+    Parameters, subset_options and streamed reads of the subsets of an info module.
+    convert_subsets is the module function mapping an info name to its REST API subset.
+    Errors fail the module.
+    """
+
+    def __init__(self, rest_api, module, convert_subsets):
+        self.rest_api = rest_api
+        self.module = module
+        self.convert_subsets = convert_subsets
+
+    def get_subset_parameters(self, options=None):
+        """ Return the rest api parameters of a subset, its subset_options parameters merged over parameters """
+        data = {}
+        # allow for passing in any additional rest api parameters
+        if self.module.params.get("parameters"):
+            data.update(self.module.params["parameters"])
+        if options and options.get("parameters"):
+            data.update(options["parameters"])
+        return data
+
+    def get_subset_options(self):
+        """ Return the subset_options by subset, with their compiled fields and filters """
+        subset_options = {}
+        for option in self.module.params.get("subset_options") or []:
+            subset = self.convert_subsets([option["subset"]])[0]
+            if subset in subset_options:
+                self.module.fail_json(msg="Error in subset_options: %s is listed more than once." % option["subset"])
+            option = dict(option)
+            if option.get("fields") or option.get("filters"):
+                try:
+                    option["query"] = InfoQuery(option.get("fields"), option.get("filters"))
+                except ValueError as exc:
+                    self.module.fail_json(msg="Error in subset_options for %s: %s" % (option["subset"], exc))
+            subset_options[subset] = option
+        return subset_options
+
+    def get_subset_items(self, api, data, query):
+        """
+        Decode the response item by item, keeping the selected fields of the matching items only
+        return dict(data=list of items), or dict(data=object) when the subset is not a list
+        """
+        decoder = DataArrayDecoder()
+        items, error = self.rest_api.iter_data(api, data, decoder=decoder)
+        if error:
+            self.module.fail_json(msg=error)
+        try:
+            selected = list(query.apply(items))
+        except Exception as exc:
+            self.module.fail_json(msg="Error reading the response of %s: %s" % (api, exc))
+        finally:
+            items.close()
+        if not decoder.is_array:
+            return dict(data=selected[0] if selected else None)
+        return dict(data=selected)
+
+    def write_subsets(self, subsets, get_sg_subset_info, subset_options):
+        """
+        Stream the subsets to the dest file, item by item as the responses are decoded
+        return the manifest of the file
+        """
+        dest = self.module.params["dest"]
+        try:
+            writer = NdjsonWriter(dest, dry_run=self.module.check_mode)
+        except (IOError, OSError) as exc:
+            self.module.fail_json(msg="Error writing %s: %s" % (dest, exc))
+        for subset in subsets:
+            options = subset_options.get(subset) or {}
+            decoder = DataArrayDecoder()
+            items, error = self.rest_api.iter_data(get_sg_subset_info[subset]["api_call"], self.get_subset_parameters(options), decoder=decoder)
+            if not error:
+                error = writer.write_subset(subset, items, decoder, options.get("query"))
+            if error:
+                writer.abort()
+                self.module.fail_json(msg=error)
+        manifest, error = writer.close()
+        if error:
+            self.module.fail_json(msg=error)
+        return manifest
@@ -0,0 +1,141 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+""" Snapshots of the info modules, to return only what changed since the previous run """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import tempfile
+
+SNAPSHOT_VERSION = 1
+# fields identifying the items of list subsets, the first one present is used
+ITEM_KEYS = ("id", "name", "uniqueName", "key")
+
+
+def content_hash(value):
+    """ Hash of a JSON value, independent of the order of dict keys """
+    return hashlib.sha256(json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def item_key(item):
+    """ Key of an item of a list subset, its content hash when it has no identifying field """
+    if isinstance(item, dict):
+        for key in ITEM_KEYS:
+            if item.get(key) is not None:
+                return "%s:%s" % (key, item[key])
+    return "hash:%s" % content_hash(item)
+
+
+def load_snapshot(path):
+    """ Return (snapshot, error), an empty snapshot when the file does not exist yet """
+    if not os.path.exists(path):
+        return dict(version=SNAPSHOT_VERSION, subsets={}), None
+    try:
+        with open(path) as snapshot_file:
+            snapshot = json.load(snapshot_file)
+    except (IOError, OSError, ValueError) as exc:
+        return None, "Error reading snapshot %s: %s" % (path, exc)
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION or not isinstance(snapshot.get("subsets"), dict):
+        return None, "Error reading snapshot %s: not a version %d snapshot." % (path, SNAPSHOT_VERSION)
+    return snapshot, None
+
+
+def save_snapshot(path, snapshot):
+    """ Replace the snapshot file atomically, return an error or None """
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".%s." % os.path.basename(path))
+        try:
+            with os.fdopen(fd, "w") as snapshot_file:
+                json.dump(snapshot, snapshot_file, sort_keys=True, separators=(",", ":"))
+            os.rename(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    except (IOError, OSError) as exc:
+        return "Error writing snapshot %s: %s" % (path, exc)
+    return None
+
+
+def subset_delta(previous, response):
+    """
+    Compare the data of a subset response with its previous snapshot entry.
+    Return (snapshot entry, delta), delta is None when nothing changed.
+    For list subsets, the delta only holds the added and modified items, with the keys of the added,
+    modified and removed items.  For other subsets, the delta is the response.
+    """
+    data = response.get("data") if isinstance(response, dict) else response
+    if not isinstance(data, list):
+        entry = dict(hash=content_hash(data))
+        if previous is not None and previous.get("hash") == entry["hash"]:
+            return entry, None
+        return entry, response
+
+    previous_items = (previous or {}).get("items") or {}
+    items = {}
+    changed_items = []
+    added = []
+    modified = []
+    for item in data:
+        key = item_key(item)
+        items[key] = content_hash(item)
+        if key not in previous_items:
+            added.append(key)
+            changed_items.append(item)
+        elif previous_items[key] != items[key]:
+            modified.append(key)
+            changed_items.append(item)
+    removed = [key for key in previous_items if key not in items]
+    entry = dict(items=items)
+    if previous is not None and "items" in previous and not (added or modified or removed):
+        return entry, None
+    return entry, dict(data=changed_items, added=added, modified=modified, removed=removed)
+
+
+def diff_against_snapshot(path, sg_info, update=True):
+    """
+    Return (changes, error), changes holds the subsets of sg_info that changed since the snapshot at path.
+    The snapshot is updated with the gathered subsets when they changed, unless update is False, entries of other subsets are kept.
+    """
+    snapshot, error = load_snapshot(path)
+    if error:
+        return None, error
+    changes = {}
+    for subset, response in sg_info.items():
+        entry, delta = subset_delta(snapshot["subsets"].get(subset), response)
+        snapshot["subsets"][subset] = entry
+        if delta is not None:
+            changes[subset] = delta
+    if update and changes:
+        error = save_snapshot(path, snapshot)
+    return changes, error
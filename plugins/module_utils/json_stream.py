@@ -0,0 +1,254 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+""" Incremental decoding of the data array of StorageGRID API responses """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import codecs
+import json
+import re
+
+# decoded characters kept in the buffer before the consumed part is dropped
+BUFFER_COMPACT_SIZE = 65536
+WHITESPACE = " \t\n\r"
+# the characters that matter when looking for the end of a value, an escape sequence is one token
+VALUE_TOKENS = re.compile(r'\\.?|["{}\[\]]', re.DOTALL)
+SCALAR_END = re.compile(r'[,\]}\s]')
+
+
+class DataArrayDecoder(object):
+    """
+    Decode the items of the top level data array of a JSON document, as chunks of the document arrive.
+    Each item is decoded as soon as it is complete, the bytes before it are dropped, so memory is
+    bounded by the size of one item rather than the size of the document.
+    The members before data are skipped, and the document after the array is never read.
+    A data value that is not an array is returned as a single item.
+
+        decoder = DataArrayDecoder()
+        for chunk in chunks:
+            for item in decoder.feed(chunk):
+                ...
+        decoder.close()
+    """
+
+    def __init__(self, key="data"):
+        self.key = key
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        # prefix: looking for the key, value: after the key, items: inside the array, done
+        self.state = "prefix"
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.string_start = None
+        self.expect_key = False
+        self.found_key = False
+        self.eof = False
+        # whether the data value is an array, once it is reached
+        self.is_array = None
+        # scan of the container or string at pos, resumed with each chunk until it is complete
+        self.value_scanned = 0
+        self.value_depth = 0
+        self.value_in_string = False
+        self.value_escape = False
+
+    @property
+    def done(self):
+        return self.state == "done"
+
+    def feed(self, chunk):
+        """ Add a chunk of bytes, return the list of items completed by it """
+        if self.done:
+            return []
+        self.buffer += self.text_decoder.decode(chunk)
+        return self.decode()
+
+    def close(self):
+        """ Signal the end of the document, return the last items, and raise ValueError if the array is incomplete """
+        if self.done:
+            return []
+        self.buffer += self.text_decoder.decode(b"", final=True)
+        self.eof = True
+        items = self.decode()
+        if not self.done:
+            if self.state == "prefix":
+                raise ValueError("no %s member in the response" % self.key)
+            raise ValueError("incomplete %s array in the response" % self.key)
+        return items
+
+    def decode(self):
+        items = []
+        if self.state == "prefix":
+            self.scan_prefix()
+        if self.state == "value":
+            self.decode_value(items)
+        if self.state == "items":
+            self.decode_items(items)
+        if self.pos > BUFFER_COMPACT_SIZE:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        return items
+
+    def scan_prefix(self):
+        """ Skip the top level members until the key, leave pos on its value """
+        buffer = self.buffer
+        pos = self.pos
+        while pos < len(buffer):
+            char = buffer[pos]
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == "\\":
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+                    if self.depth == 1 and self.expect_key:
+                        self.expect_key = False
+                        self.found_key = buffer[self.string_start:pos] == self.key
+            elif char == '"':
+                self.in_string = True
+                self.string_start = pos + 1
+            elif char in "{[":
+                self.depth += 1
+                self.expect_key = self.depth == 1 and char == "{"
+            elif char in "}]":
+                self.depth -= 1
+            elif char == "," and self.depth == 1:
+                self.expect_key = True
+            elif char == ":" and self.depth == 1 and self.found_key:
+                self.state = "value"
+                pos += 1
+                break
+            pos += 1
+        self.pos = pos
+        if self.state == "prefix" and not self.in_string:
+            # nothing before pos is needed any more
+            self.buffer = buffer[pos:]
+            self.pos = 0
+            self.string_start = None
+
+    def skip_whitespace(self):
+        while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+            self.pos += 1
+        return self.pos < len(self.buffer)
+
+    def decode_value(self, items):
+        if not self.skip_whitespace():
+            return
+        self.is_array = self.buffer[self.pos] == "["
+        if self.is_array:
+            self.pos += 1
+            self.state = "items"
+            return
+        item = self.decode_one()
+        if item is not None:
+            items.append(item[0])
+            self.state = "done"
+
+    def decode_items(self, items):
+        while self.skip_whitespace():
+            char = self.buffer[self.pos]
+            if char == "]":
+                self.pos += 1
+                self.state = "done"
+                return
+            if char == ",":
+                self.pos += 1
+                continue
+            item = self.decode_one()
+            if item is None:
+                return
+            items.append(item[0])
+
+    def value_complete(self):
+        """
+        Whether the value at pos is complete in the buffer.
+        Containers and strings are scanned once, from where the previous chunk stopped, so a large value
+        is decoded in a single raw_decode rather than retried from its start with every chunk.
+        """
+        buffer = self.buffer
+        if buffer[self.pos] not in '{["':
+            # a number or literal ends at the next delimiter, which may be in a later chunk
+            return SCALAR_END.search(buffer, self.pos) is not None
+        scan = self.pos + self.value_scanned
+        if self.value_escape:
+            # a backslash ended the previous chunk, skip the character it escapes
+            if scan == len(buffer):
+                return False
+            self.value_escape = False
+            scan += 1
+        for match in VALUE_TOKENS.finditer(buffer, scan):
+            token = match.group()
+            if token[0] == "\\":
+                self.value_escape = len(token) == 1
+            elif token == '"':
+                self.value_in_string = not self.value_in_string
+            elif self.value_in_string:
+                continue
+            elif token in "{[":
+                self.value_depth += 1
+            else:
+                self.value_depth -= 1
+            if self.value_depth == 0 and not self.value_in_string:
+                self.value_scanned = 0
+                return True
+        self.value_scanned = len(buffer) - self.pos
+        return False
+
+    def decode_one(self):
+        """ Decode the value at pos, return a 1-tuple, or None when more data is needed """
+        if not self.value_complete() and not self.eof:
+            return None
+        try:
+            value, end = self.json_decoder.raw_decode(self.buffer, self.pos)
+        except ValueError:
+            if self.eof:
+                raise
+            return None
+        self.pos = end
+        return (value,)
+
+
+def iter_data_items(chunks, key="data", decoder=None):
+    """
+    Yield the items of the data array of a JSON document read from an iterable of byte chunks.
+    A decoder can be given to check is_array afterwards.
+    """
+    decoder = decoder or DataArrayDecoder(key)
+    for chunk in chunks:
+        for item in decoder.feed(chunk):
+            yield item
+        if decoder.done:
+            return
+    for item in decoder.close():
+        yield item
@@ -0,0 +1,115 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+
+""" Levelled module logging, returned with the module result """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import threading
+from datetime import datetime
+
+from ansible.module_utils.common.parameters import remove_values
+
+LOG_LEVELS = ["error", "warning", "info", "debug"]
+# maximum size of one message, and of all the messages returned with the result
+MAX_MESSAGE_SIZE = 4096
+MAX_LOG_SIZE = 65536
+
+
+def log_level_argument_spec():
+    """ Argument spec of the log_level option, for the modules returning a log """
+    return dict(log_level=dict(required=False, type="str", choices=LOG_LEVELS, default="info"))
+
+
+class ModuleLogger(object):
+    """
+    Collect log messages at or above a level, formatting them only when they are kept.
+    Messages use lazy % arguments, e.g. logger.debug("all ILM rules: %s", response["data"]),
+    so that payloads are only turned into strings when log_level is debug.
+    Messages longer than max_message_size are truncated, and once max_size characters are kept,
+    later messages are counted but dropped.
+    """
+
+    def __init__(self, module, level="info", max_size=MAX_LOG_SIZE, max_message_size=MAX_MESSAGE_SIZE):
+        self.module = module
+        self.threshold = LOG_LEVELS.index(level)
+        self.max_size = max_size
+        self.max_message_size = max_message_size
+        self.messages = []
+        self.size = 0
+        self.dropped = 0
+        self.lock = threading.Lock()
+
+    def is_enabled(self, level):
+        return LOG_LEVELS.index(level) <= self.threshold
+
+    def log(self, level, msg, *args):
+        if not self.is_enabled(level):
+            return
+        if args:
+            msg = msg % args
+        if len(msg) > self.max_message_size:
+            msg = "%s... (%d characters truncated)" % (msg[:self.max_message_size], len(msg) - self.max_message_size)
+        self.module.log(msg)
+        entry = "%s %s: %s" % (datetime.now().strftime("%Y/%m/%d-%H:%M:%S"), level, msg)
+        with self.lock:
+            if self.size + len(entry) > self.max_size:
+                self.dropped += 1
+                return
+            self.size += len(entry)
+            self.messages.append(entry)
+
+    def error(self, msg, *args):
+        self.log("error", msg, *args)
+
+    def warning(self, msg, *args):
+        self.log("warning", msg, *args)
+
+    def info(self, msg, *args):
+        self.log("info", msg, *args)
+
+    def debug(self, msg, *args):
+        self.log("debug", msg, *args)
+
+    def debug_params(self):
+        """ Log the module parameters, without the no_log values such as auth_token """
+        if self.is_enabled("debug"):
+            self.debug("params: %s", remove_values(self.module.params, getattr(self.module, "no_log_values", set())))
+
+    @property
+    def entries(self):
+        """ Messages to return with the result, with a last message if some were dropped """
+        with self.lock:
+            entries = list(self.messages)
+            if self.dropped:
+                entries.append("log truncated at %d characters, %d messages dropped" % (self.max_size, self.dropped))
+        return entries
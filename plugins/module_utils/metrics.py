@@ -0,0 +1,196 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+""" Support functions for the StorageGRID Prometheus metrics endpoints """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import re
+
+METRIC_QUERY_API = "api/v4/grid/metric-query"
+METRIC_QUERY_RANGE_API = "api/v4/grid/metric-query-range"
+
+# Prometheus rejects range queries returning more than 11,000 points per series.
+MAX_POINTS_PER_QUERY = 10000
+
+DURATION_UNITS = dict(
+    ms=0.001,
+    s=1,
+    m=60,
+    h=3600,
+    d=86400,
+    w=604800,
+    y=31536000,
+)
+
+
+def parse_duration(duration):
+    """
+    Convert a Prometheus duration string such as '90s', '1h30m' or '7d' to seconds.
+    Plain numbers are interpreted as seconds.
+    Raises ValueError for an invalid duration.
+    """
+    if isinstance(duration, (int, float)):
+        return float(duration)
+    duration = str(duration).strip()
+    try:
+        return float(duration)
+    except ValueError:
+        pass
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|s|m|h|d|w|y)", duration)
+    if not parts or "".join(number + unit for number, unit in parts) != duration:
+        raise ValueError("invalid duration: %s" % duration)
+    return sum(float(number) * DURATION_UNITS[unit] for number, unit in parts)
+
+
+def get_metric_query(rest_api, params):
+    """ Evaluate an instant query, return (data, error) """
+    response, error = rest_api.get(METRIC_QUERY_API, params)
+    if error:
+        return None, error
+    return response["data"], None
+
+
+def get_metric_query_range(rest_api, params):
+    """ Evaluate a query over a range of time, return (data, error) """
+    response, error = rest_api.get(METRIC_QUERY_RANGE_API, params)
+    if error:
+        return None, error
+    return response["data"], None
+
+
+def get_metric_query_range_batched(rest_api, query, start, end, step, timeout=None, label_keys=None):
+    """
+    Evaluate a range query over a window of any length.
+    start and end are epoch seconds, step is in seconds.
+    The window is split into chunks below the Prometheus point limit, so a single
+    query covers every series (node, site, ...) for the whole window.
+    Samples of the same series are merged across chunks, keyed on label_keys
+    (all labels when None).
+    Return (dict of label tuple -> dict(metric=labels, values={timestamp: float}), error)
+    """
+    series = {}
+    chunk = step * MAX_POINTS_PER_QUERY
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + chunk - step, end)
+        params = {
+            "query": query,
+            "start": "%.3f" % chunk_start,
+            "end": "%.3f" % chunk_end,
+            "step": "%ds" % step,
+        }
+        if timeout:
+            params["timeout"] = timeout
+        data, error = get_metric_query_range(rest_api, params)
+        if error:
+            return None, error
+        for result in data.get("result") or []:
+            metric = result.get("metric", {})
+            keys = sorted(metric) if label_keys is None else label_keys
+            key = tuple(metric.get(k) for k in keys)
+            entry = series.setdefault(key, dict(metric=metric, values={}))
+            for timestamp, value in result.get("values") or []:
+                try:
+                    entry["values"][float(timestamp)] = float(value)
+                except (TypeError, ValueError):
+                    # NaN markers and the like are simply missing samples
+                    continue
+        chunk_start = chunk_end + step
+    return series, None
+
+
+def align_series(series_list, start, step, count):
+    """
+    Lay out samples of several series on a shared time grid of count steps.
+    Missing samples are None.  All series share the same x axis, which lets the
+    trend fit below walk every series in a single pass.
+    """
+    matrix = []
+    for values in series_list:
+        row = [None] * count
+        for timestamp, value in values.items():
+            index = int(round((timestamp - start) / step))
+            if 0 <= index < count:
+                row[index] = value
+        matrix.append(row)
+    return matrix
+
+
+def _median(values):
+    ordered = sorted(values)
+    size = len(ordered)
+    if size == 0:
+        return None
+    middle = size // 2
+    if size % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2.0
+
+
+def fit_trends(matrix, step, season_steps=None):
+    """
+    Fit a robust linear trend to every row of an aligned sample matrix.
+
+    The slope is the median of the pairwise slopes between samples a fixed lag apart.
+    With no season the lag is half the window, the efficient split-half form of the
+    Theil-Sen estimator.  With a season, the lag is rounded down to a whole number
+    of seasons so the periodic component cancels out of every pair.
+    The intercept is the median residual.  Both are insensitive to spikes and
+    short-lived gaps, which ordinary least squares is not.
+
+    Return a list of dict(slope=per second, intercept, spread, samples) or None
+    where a row has too few samples to fit.
+    """
+    count = len(matrix[0]) if matrix else 0
+    lag = count // 2
+    seasonal = False
+    if season_steps and season_steps > 0 and lag >= season_steps:
+        lag = (lag // season_steps) * season_steps
+        seasonal = True
+    fits = []
+    for row in matrix:
+        if lag < 1:
+            fits.append(None)
+            continue
+        slopes = [
+            (row[index + lag] - row[index]) / (lag * step)
+            for index in range(count - lag)
+            if row[index] is not None and row[index + lag] is not None
+        ]
+        if not slopes:
+            fits.append(None)
+            continue
+        slope = _median(slopes)
+        residuals = [value - slope * index * step for index, value in enumerate(row) if value is not None]
+        intercept = _median(residuals)
+        spread = _median([abs(residual - intercept) for residual in residuals])
+        fits.append(dict(slope=slope, intercept=intercept, spread=spread, samples=len(residuals), seasonal=seasonal))
+    return fits
@@ -30,7 +30,20 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from ansible.module_utils.basic import missing_required_lib
+import copy
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+from ansible.module_utils.basic import env_fallback, missing_required_lib
+import ansible_collections.netapp.storagegrid.plugins.module_utils.json_stream as json_stream
+import ansible_collections.netapp.storagegrid.plugins.module_utils.profiler as profiler
+import ansible_collections.netapp.storagegrid.plugins.module_utils.rate_limit as rate_limit
+import ansible_collections.netapp.storagegrid.plugins.module_utils.telemetry as telemetry
+from ansible_collections.netapp.storagegrid.plugins.module_utils.tools import run_concurrently
 
 COLLECTION_VERSION = "21.17.0"
 
@@ -56,26 +69,186 @@ POW2_BYTE_MAP = dict(
     yb=1024**8,
 )
 
+# Path of a JSON file remembering the admin node selected for a list of api_url, shared by module runs
+ENDPOINT_CACHE_ENV = "NETAPP_SG_ENDPOINT_CACHE"
+ENDPOINT_CACHE_TTL = 300
+# unauthenticated, answered by every admin node
+PROBE_API = "api/versions"
+PROBE_TIMEOUT = 5
+# requests sent again to the next admin node when the connection fails, POST and PATCH never are
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+# version prefix of the resource path of a request
+API_VERSION_PREFIX = re.compile(r"^api/v\d+/")
+
+# admin nodes of each list of api_url, fastest healthy one first, for the modules run by this process
+_ENDPOINTS = {}
+_ENDPOINTS_LOCK = threading.Lock()
+
 
 def na_storagegrid_host_argument_spec():
     return dict(
-        api_url=dict(required=True, type="str"),
+        api_url=dict(required=True, type="list", elements="str"),
         validate_certs=dict(required=False, type="bool", default=True),
         auth_token=dict(required=True, type="str", no_log=True),
+        rate_limit=dict(required=False, type="float", fallback=(env_fallback, ["NETAPP_SG_RATE_LIMIT"])),
+        rate_limit_burst=dict(required=False, type="int", fallback=(env_fallback, ["NETAPP_SG_RATE_LIMIT_BURST"])),
     )
 
 
+def normalize_api_url(api_url):
+    if not api_url.startswith("https://"):
+        api_url = "https://" + api_url
+    return api_url
+
+
+def load_endpoint_cache(path):
+    """ Return the endpoint cache at path, empty if it does not exist or cannot be read """
+    try:
+        with open(path) as cache_file:
+            cache = json.load(cache_file)
+    except (IOError, OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_endpoint_cache(path, key, endpoints):
+    """ Record the endpoints of key, replacing the file atomically, errors are ignored as the cache is optional """
+    cache = load_endpoint_cache(path)
+    cache[key] = dict(endpoints=endpoints, selected=time.time())
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".%s." % os.path.basename(path))
+        try:
+            with os.fdopen(fd, "w") as cache_file:
+                json.dump(cache, cache_file)
+            os.rename(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    except (IOError, OSError):
+        pass
+
+
+def resource_path(api):
+    """ Segments of the resource path of a request, without the API version and the query string """
+    return API_VERSION_PREFIX.sub("", api.split("?", 1)[0].strip("/")).split("/")
+
+
+def request_size(response):
+    """ Size of the body sent with the request of a response, 0 when unknown or streamed """
+    body = getattr(getattr(response, "request", None), "body", None)
+    return len(body) if isinstance(body, (bytes, str)) else 0
+
+
 class SGRestAPI(object):
-    def __init__(self, module, timeout=60):
+    def __init__(self, module, timeout=60, memoize=True):
         self.module = module
+        # profile the rest of the module run when NETAPP_SG_PROFILE is set
+        profiler.attach(module)
+        # successful GET responses of this client, returned again for identical GETs until a write on the same path
+        # modules polling a resource for changes create their client with memoize=False
+        self.memoize = memoize
+        self.memo = {}
+        self.in_flight = {}
+        self.memo_lock = threading.Lock()
+        self.memo_generation = 0
         self.auth_token = self.module.params["auth_token"]
-        self.api_url = self.module.params["api_url"]
-        if not self.api_url.startswith("https://"):
-            self.api_url = "https://" + self.api_url
+        api_urls = self.module.params["api_url"]
+        # a list of admin nodes of the same grid, or a single one
+        self.api_urls = [normalize_api_url(api_url) for api_url in (api_urls if isinstance(api_urls, list) else [api_urls])]
+        self.api_url = self.api_urls[0]
+        # the admin nodes are remembered by the list as given
+        self.endpoints_key = json.dumps(self.api_urls)
         self.verify = self.module.params["validate_certs"]
         self.timeout = timeout
         self.check_required_library()
         self.sg_version = dict(major=-1, minor=-1, full="", valid=False)
+        self.recorder = telemetry.attach(module) if telemetry.is_enabled() or telemetry.is_perf_enabled() else None
+        # a pooled requests.Session is provided when the module runs inside an action plugin
+        self.session = getattr(module, "sg_session", None)
+        # requests per second to each admin node, shared by the module processes on this host
+        self.rate_limit = self.module.params.get("rate_limit")
+        self.rate_limit_burst = self.module.params.get("rate_limit_burst")
+        if self.rate_limit is not None and self.rate_limit <= 0:
+            self.module.fail_json(msg="Error: rate_limit must be greater than 0, got %s" % self.rate_limit)
+        if self.rate_limit_burst is not None and self.rate_limit_burst < 1:
+            self.module.fail_json(msg="Error: rate_limit_burst must be at least 1, got %s" % self.rate_limit_burst)
+        if len(self.api_urls) > 1:
+            self.select_endpoint()
+
+    def select_endpoint(self):
+        """
+        Use the fastest healthy admin node of api_url.  The nodes are probed concurrently the first time,
+        the order is then reused by the modules run in this process, and for ENDPOINT_CACHE_TTL seconds
+        by other runs when ENDPOINT_CACHE_ENV is set.
+        """
+        key = self.endpoints_key
+        with _ENDPOINTS_LOCK:
+            endpoints = _ENDPOINTS.get(key)
+        cache_path = os.environ.get(ENDPOINT_CACHE_ENV)
+        if endpoints is None and cache_path:
+            entry = load_endpoint_cache(cache_path).get(key) or {}
+            if time.time() - entry.get("selected", 0) < ENDPOINT_CACHE_TTL and sorted(entry.get("endpoints") or []) == sorted(self.api_urls):
+                endpoints = entry["endpoints"]
+        if endpoints is None:
+            endpoints = self.probe_endpoints()
+            if cache_path:
+                save_endpoint_cache(cache_path, key, endpoints)
+        with _ENDPOINTS_LOCK:
+            _ENDPOINTS[key] = endpoints
+        self.api_urls = list(endpoints)
+        self.api_url = self.api_urls[0]
+
+    def probe_endpoint(self, api_url):
+        """ Return the latency of an admin node, or None if it does not answer """
+        http = self.session if self.session is not None else requests
+        start = time.time()
+        try:
+            response = http.request("GET", "%s/%s" % (api_url, PROBE_API), timeout=PROBE_TIMEOUT, verify=self.verify)
+        except Exception:
+            return None
+        return time.time() - start if response.status_code == 200 else None
+
+    def probe_endpoints(self):
+        """ Return the admin nodes, healthy ones first by latency, then the others in the given order """
+        latencies = run_concurrently(self.probe_endpoint, self.api_urls, len(self.api_urls))
+        healthy = sorted((latency, index) for index, latency in enumerate(latencies) if latency is not None)
+        order = [index for latency, index in healthy] + [index for index, latency in enumerate(latencies) if latency is None]
+        return [self.api_urls[index] for index in order]
+
+    def throttle(self):
+        """ Wait for the rate limit of the admin node, if any """
+        if self.rate_limit:
+            start = time.time()
+            try:
+                rate_limit.TokenBucket(rate_limit.bucket_path(self.api_url), self.rate_limit, self.rate_limit_burst).acquire()
+                if self.recorder is not None:
+                    self.recorder.record_wait(time.time() - start)
+            except (IOError, OSError) as exc:
+                self.module.warn("Rate limit disabled, error updating %s: %s" % (rate_limit.bucket_path(self.api_url), exc))
+                self.rate_limit = None
+
+    def fail_over(self, method, files=None):
+        """
+        After a connection error on the current admin node, switch to the next one for an idempotent request.
+        The failed node is moved last for the rest of the run.
+        Return True when the request can be sent again.
+        """
+        if method not in IDEMPOTENT_METHODS or files or len(self.api_urls) < 2:
+            return False
+        failed = self.api_url
+        if self.api_urls.index(failed) == len(self.api_urls) - 1:
+            # every node was tried
+            return False
+        self.api_url = self.api_urls[self.api_urls.index(failed) + 1]
+        with _ENDPOINTS_LOCK:
+            endpoints = [api_url for api_url in self.api_urls if api_url != failed] + [failed]
+            _ENDPOINTS[self.endpoints_key] = endpoints
+        if os.environ.get(ENDPOINT_CACHE_ENV):
+            save_endpoint_cache(os.environ[ENDPOINT_CACHE_ENV], self.endpoints_key, endpoints)
+        if getattr(self, "recorder", None) is not None:
+            self.recorder.record_retry()
+        return True
 
     def check_required_library(self):
         if not HAS_REQUESTS:
@@ -110,10 +283,15 @@ class SGRestAPI(object):
                 error = None
             return json, error
 
+        if method != "GET" and getattr(self, "memoize", False):
+            self.invalidate(api)
+        http = self.session if self.session is not None else requests
+        self.throttle()
+        start = time.time()
         try:
             if files:
                 headers["Content-Type"] = "multipart/form-data"
-                response = requests.request(
+                response = http.request(
                     method,
                     url,
                     headers=headers,
@@ -125,7 +303,7 @@ class SGRestAPI(object):
                 )
             else:
                 headers["Content-Type"] = "application/json"
-                response = requests.request(
+                response = http.request(
                     method,
                     url,
                     headers=headers,
@@ -134,10 +312,13 @@ class SGRestAPI(object):
                     verify=self.verify,
                     params=params,
                 )
+            status_code = response.status_code
+            content = response.content
 
             # check if response is binary file
             content_type = response.headers.get("content-type", "").lower()
             if "application/zip" in content_type or "octet-stream" in content_type:
+                self.record_call(method, api, status_code, content, start, response)
                 return response, None
 
             # If the response was successful, no Exception will be raised
@@ -152,16 +333,70 @@ class SGRestAPI(object):
                 error_details = str(err)
         except requests.exceptions.ConnectionError as err:
             error_details = str(err)
+            if self.fail_over(method, files):
+                self.record_call(method, api, status_code, content, start)
+                return self.send_request(method, api, params, json, files)
         except Exception as err:
             error_details = str(err)
         if json_error is not None:
             error_details = json_error
 
+        self.record_call(method, api, status_code, content, start, response if status_code is not None else None)
         return json_dict, error_details
 
+    def record_call(self, method, api, status_code, content, start, response=None):
+        """ Record method, endpoint, status, sizes and latency of a request when telemetry or perf is enabled """
+        if self.recorder is not None:
+            self.recorder.record(method, api, status_code, len(content or b""), time.time() - start, request_size(response))
+
+    def invalidate(self, api):
+        """
+        Drop the memoized GETs of the resource path of a write, and of the paths above and below it:
+        a write on org/containers/bucket1/versioning invalidates org/containers and org/containers/bucket1.
+        """
+        path = resource_path(api)
+        with self.memo_lock:
+            self.memo_generation += 1
+            for key in list(self.memo):
+                cached_path = resource_path(key[0])
+                depth = min(len(path), len(cached_path))
+                if path[:depth] == cached_path[:depth]:
+                    del self.memo[key]
+
+    def get_memoized(self, api, params=None):
+        """
+        Return the memoized response of an identical GET, or send it.  Concurrent identical GETs are sent once,
+        the other threads wait for its response.  Errors are not memoized, and callers get their own copy of a response.
+        """
+        key = (api, json.dumps(params or {}, sort_keys=True, default=str))
+        with self.memo_lock:
+            if key in self.memo:
+                return copy.deepcopy(self.memo[key])
+            flight = self.in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.in_flight[key] = dict(event=threading.Event(), result=(None, "GET %s was not sent" % api))
+                generation = self.memo_generation
+        if not leader:
+            flight["event"].wait()
+            return copy.deepcopy(flight["result"])
+        try:
+            flight["result"] = self.send_request("GET", api, params)
+        finally:
+            response, error = flight["result"]
+            with self.memo_lock:
+                del self.in_flight[key]
+                # a response sent before a write on its path is already stale
+                if error is None and isinstance(response, dict) and generation == self.memo_generation:
+                    self.memo[key] = copy.deepcopy(response), None
+            flight["event"].set()
+        return flight["result"]
+
     # If an error was reported in the json payload, it is handled below
     def get(self, api, params=None):
         method = "GET"
+        if getattr(self, "memoize", False):
+            return self.get_memoized(api, params)
         return self.send_request(method, api, params)
 
     def post(self, api, data=None, params=None, files=None):
@@ -180,6 +415,103 @@ class SGRestAPI(object):
         method = "DELETE"
         return self.send_request(method, api, params, json=data)
 
+    def get_paginated(self, api, params=None, limit=250, until=None):
+        """
+        GET every page of a marker paginated collection, such as grid/accounts or org/users.
+        The marker of the next page is the id of the last record.
+        until is an optional function called with each page of records, returning True to stop early.
+        Return (list of records, error)
+        """
+        params = dict(params or {})
+        params["limit"] = limit
+        records = []
+        while True:
+            response, error = self.get(api, dict(params))
+            if error:
+                return None, error
+            page = response.get("data") or []
+            records.extend(page)
+            stop = until is not None and until(page)
+            # a short page is the last one
+            if stop or len(page) < limit:
+                return records, None
+            params["marker"] = page[-1]["id"]
+
+    def iter_data(self, api, params=None, chunk_size=65536, decoder=None):
+        """
+        GET api, and decode the data array of the response incrementally from the streamed body.
+        Items are read from the network as the iterator is consumed, and only one item is held at a time,
+        stop consuming the iterator, or close it, to stop early and drop the rest of the response.
+        The iterator raises ValueError if the body is not valid JSON, or IOError if the connection fails.
+        decoder is an optional json_stream.DataArrayDecoder, to tell afterwards if data was an array.
+        Return (iterator of items, error)
+        """
+        url = "%s/%s" % (self.api_url, api)
+        headers = {
+            "Authorization": "Bearer {}".format(self.auth_token),
+            "Cache-Control": "no-cache",
+            "Content-Type": "application/json",
+        }
+        http = self.session if self.session is not None else requests
+        self.throttle()
+        start = time.time()
+        try:
+            response = http.request("GET", url, headers=headers, timeout=self.timeout, verify=self.verify, params=params, stream=True)
+        except Exception as err:
+            self.record_call("GET", api, None, None, start)
+            if isinstance(err, requests.exceptions.ConnectionError) and self.fail_over("GET"):
+                return self.iter_data(api, params, chunk_size, decoder)
+            return None, str(err)
+
+        if response.status_code not in [200, 201, 202, 204]:
+            content = response.content
+            self.record_call("GET", api, response.status_code, content, start)
+            try:
+                error = response.json().get("message")
+            except ValueError:
+                error = None
+            return None, error or "%s %s" % (response.status_code, response.reason)
+
+        def items():
+            size = [0]
+
+            def chunks():
+                for chunk in response.iter_content(chunk_size):
+                    size[0] += len(chunk)
+                    yield chunk
+
+            try:
+                for item in json_stream.iter_data_items(chunks(), decoder=decoder):
+                    yield item
+            finally:
+                response.close()
+                if self.recorder is not None:
+                    self.recorder.record("GET", api, response.status_code, size[0], time.time() - start, request_size(response))
+
+        return items(), None
+
+    def filter_data(self, api, params=None, predicate=None, first=False):
+        """
+        GET api and keep the items of the data array for which predicate returns True, all of them by default.
+        The response is decoded incrementally, and with first, the request stops at the first match.
+        Return (list of matching items, error)
+        """
+        items, error = self.iter_data(api, params)
+        if error:
+            return None, error
+        matches = []
+        try:
+            for item in items:
+                if predicate is None or predicate(item):
+                    matches.append(item)
+                    if first:
+                        break
+        except Exception as err:
+            return None, "Error reading the response of %s: %s" % (api, err)
+        finally:
+            items.close()
+        return matches, None
+
     def get_sg_product_version(self, api_root="grid"):
         method = "GET"
         api = "api/v3/%s/config/product-version" % api_root
@@ -239,6 +571,7 @@ class PgeRestAPI(SGRestAPI):
     """
     def __init__(self, module, timeout=60):
         self.module = module
+        profiler.attach(module)
         self.api_url = self.module.params["api_url"]
         self.verify = self.module.params["validate_certs"]
         self.timeout = timeout
@@ -316,6 +649,7 @@ class SGAuthGenRestAPI(SGRestAPI):
     """
     def __init__(self, module, timeout=60):
         self.module = module
+        profiler.attach(module)
         self.hostname = self.module.params["hostname"]
         self.username = self.module.params["username"]
         self.password = self.module.params["password"]
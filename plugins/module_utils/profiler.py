@@ -0,0 +1,151 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+""" cProfile and tracemalloc profiles of module runs, written to a directory and summarized in the module result """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import cProfile
+import os
+import pstats
+import re
+import time
+import tracemalloc
+
+# Directory the profiles are written to, profiling is disabled when not set
+PROFILE_ENV = "NETAPP_SG_PROFILE"
+# cpu, memory or both, the default
+PROFILE_MODE_ENV = "NETAPP_SG_PROFILE_MODE"
+RESULT_KEY = "sg_profile"
+# Number of functions returned with the result, and of allocation sites written to the report
+TOP_FUNCTIONS = 20
+TOP_ALLOCATIONS = 50
+
+
+def is_enabled():
+    return bool(os.environ.get(PROFILE_ENV))
+
+
+def profile_mode():
+    mode = os.environ.get(PROFILE_MODE_ENV, "both").lower()
+    return mode if mode in ("cpu", "memory") else "both"
+
+
+def top_functions(profile, count=TOP_FUNCTIONS):
+    """ Return the functions which spent the most time in their own code, with their calls and cumulative time """
+    stats = pstats.Stats(profile).stats
+    entries = sorted(stats.items(), key=lambda entry: entry[1][2], reverse=True)[:count]
+    return [
+        dict(
+            function="%s:%d(%s)" % (filename, line, name),
+            calls=total_calls,
+            total_ms=round(total_time * 1000.0, 3),
+            cumulative_ms=round(cumulative_time * 1000.0, 3),
+        )
+        for (filename, line, name), (dummy, total_calls, total_time, cumulative_time, dummy_callers) in entries
+    ]
+
+
+class ModuleProfiler(object):
+    """ Profile a module run, from the creation of its REST API client to exit_json or fail_json """
+
+    def __init__(self, module, directory, mode):
+        self.module = module
+        self.directory = directory
+        self.profile = cProfile.Profile() if mode in ("cpu", "both") else None
+        self.trace_memory = mode in ("memory", "both") and not tracemalloc.is_tracing()
+        name = re.sub(r"[^\w.-]", "_", getattr(module, "_name", None) or "module")
+        self.basename = os.path.join(directory, "%s-%s-%d" % (name, time.strftime("%Y%m%dT%H%M%S"), os.getpid()))
+        self.summary = None
+
+    def start(self):
+        if self.trace_memory:
+            tracemalloc.start()
+        if self.profile is not None:
+            try:
+                self.profile.enable()
+            except ValueError as exc:
+                # another profiler is active in this thread
+                self.module.warn("CPU profile disabled: %s" % exc)
+                self.profile = None
+
+    def stop(self):
+        """ Stop profiling, write the reports, and return their summary """
+        if self.summary is not None:
+            return self.summary
+        if self.profile is not None:
+            self.profile.disable()
+        summary = {}
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory, 0o700)
+            if self.profile is not None:
+                summary["prof"] = "%s.prof" % self.basename
+                self.profile.dump_stats(summary["prof"])
+                summary["top_functions"] = top_functions(self.profile)
+            if self.trace_memory:
+                summary["allocations"] = "%s.allocations.txt" % self.basename
+                summary["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+                statistics = tracemalloc.take_snapshot().statistics("lineno")
+                tracemalloc.stop()
+                with open(summary["allocations"], "w") as report:
+                    report.write("peak %d bytes, %d allocation sites\n" % (summary["peak_bytes"], len(statistics)))
+                    for statistic in statistics[:TOP_ALLOCATIONS]:
+                        report.write("%s\n" % statistic)
+        except (IOError, OSError) as exc:
+            summary["error"] = "Error writing the profile to %s: %s" % (self.directory, exc)
+        finally:
+            if self.trace_memory and tracemalloc.is_tracing():
+                tracemalloc.stop()
+        self.summary = summary
+        return summary
+
+
+def attach(module):
+    """
+    Start profiling a module, once, when PROFILE_ENV is set.
+    The profile stops when the module exits, on success and on failure, and its summary is added to the result under RESULT_KEY.
+    cProfile only profiles the thread which created the client, tracemalloc traces every thread.
+    """
+    if not is_enabled() or getattr(module, "_sg_profiler", None) is not None:
+        return None
+    profiler = ModuleProfiler(module, os.environ[PROFILE_ENV], profile_mode())
+    module._sg_profiler = profiler
+
+    def with_profile(exit_function):
+        def wrapper(*args, **kwargs):
+            kwargs[RESULT_KEY] = profiler.stop()
+            return exit_function(*args, **kwargs)
+        return wrapper
+
+    module.exit_json = with_profile(module.exit_json)
+    module.fail_json = with_profile(module.fail_json)
+    profiler.start()
+    return profiler
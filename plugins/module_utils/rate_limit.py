@@ -0,0 +1,110 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+""" Client-side rate limit of the requests sent to an admin node, shared by every module process on the host """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+
+def bucket_path(api_url):
+    """ State file of the bucket of an admin node, one per user as the file is private """
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), "netapp_sg_rate_limit_%s_%s.json" % (uid, hashlib.sha256(api_url.encode("utf-8")).hexdigest()[:16]))
+
+
+class TokenBucket(object):
+    """
+    Token bucket holding up to burst tokens, refilled at rate tokens per second, and taking one token per request.
+    The bucket is a small JSON file locked with flock while it is updated, so forked module processes,
+    and threads of one process, share it.  Without fcntl, the bucket is only shared by the threads of a process.
+    """
+
+    # serializes the threads of this process when flock is not available
+    _thread_lock = threading.Lock()
+
+    def __init__(self, path, rate, burst=None):
+        self.path = path
+        self.rate = float(rate)
+        self.burst = max(1, burst if burst is not None else int(self.rate))
+
+    def take(self, now):
+        """ Update the bucket at now, return 0 if a token was taken, otherwise the seconds until one is available """
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "r+") as bucket_file:
+            if HAS_FCNTL:
+                fcntl.flock(bucket_file, fcntl.LOCK_EX)
+            try:
+                try:
+                    state = json.loads(bucket_file.read() or "{}")
+                except ValueError:
+                    state = {}
+                tokens = float(state.get("tokens", self.burst))
+                elapsed = max(0.0, now - float(state.get("updated", now)))
+                tokens = min(float(self.burst), tokens + elapsed * self.rate)
+                wait = 0.0
+                if tokens >= 1.0:
+                    tokens -= 1.0
+                else:
+                    wait = (1.0 - tokens) / self.rate
+                bucket_file.seek(0)
+                bucket_file.truncate()
+                bucket_file.write(json.dumps(dict(tokens=tokens, updated=now)))
+                bucket_file.flush()
+            finally:
+                if HAS_FCNTL:
+                    fcntl.flock(bucket_file, fcntl.LOCK_UN)
+        return wait
+
+    def acquire(self):
+        """ Wait for a token, return the number of seconds waited """
+        start = time.time()
+        while True:
+            if HAS_FCNTL:
+                wait = self.take(time.time())
+            else:
+                with self._thread_lock:
+                    wait = self.take(time.time())
+            if not wait:
+                return time.time() - start
+            time.sleep(wait)
@@ -0,0 +1,186 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+""" Per-request telemetry for the StorageGRID REST API, returned with the module result """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import threading
+import time
+
+# Set by the netapp.storagegrid.sg_api_profile callback, inherited by modules running on the controller
+TELEMETRY_ENV = "NETAPP_SG_API_TELEMETRY"
+RESULT_KEY = "sg_api_calls"
+# Set per task to return a summary of where the time of the module run went
+PERF_ENV = "NETAPP_SG_PERF"
+PERF_KEY = "perf"
+# Number of endpoints listed in the slowest entry of the perf summary
+SLOWEST_ENDPOINTS = 5
+
+# Collections whose next path segment identifies one item, by id or by name
+ITEM_PARENTS = frozenset([
+    "accounts", "alert-receivers", "client-certificates", "containers", "ec-profiles", "gateway-configs",
+    "groups", "ha-groups", "ilm-policies", "ilm-policy-tags", "ilm-pools", "ilm-rules", "policies",
+    "s3-access-keys", "users", "vlan-interfaces",
+])
+# Path segments which are never identifiers
+LITERAL_SEGMENTS = frozenset(["current-user", "root"])
+# Unique names span two segments, e.g. group/admins
+UNIQUE_NAME_PREFIXES = frozenset(["group", "user", "federated-group", "federated-user"])
+
+
+def is_enabled():
+    return os.environ.get(TELEMETRY_ENV, "").lower() in ("1", "true", "yes", "on")
+
+
+def is_perf_enabled():
+    return os.environ.get(PERF_ENV, "").lower() in ("1", "true", "yes", "on")
+
+
+def endpoint_template(api):
+    """
+    Return the endpoint of a request with identifiers replaced by {id}, so that requests on
+    different items of a collection are aggregated, e.g.
+    api/v4/org/containers/bucket1/versioning -> api/v4/org/containers/{id}/versioning
+    """
+    segments = api.split("?", 1)[0].strip("/").split("/")
+    template = []
+    index = 0
+    while index < len(segments):
+        segment = segments[index]
+        template.append(segment)
+        index += 1
+        if segment in ITEM_PARENTS and index < len(segments) and segments[index] not in LITERAL_SEGMENTS:
+            if segments[index] in UNIQUE_NAME_PREFIXES and index + 1 < len(segments):
+                index += 1
+            template.append("{id}")
+            index += 1
+    return "/".join(template)
+
+
+class ApiCallRecorder(object):
+    """ Collect the REST API calls made while a module runs """
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+        self.start = time.time()
+        self.bytes_sent = 0
+        self.retries = 0
+        self.rate_limit_wait = 0.0
+
+    def record(self, method, api, status_code, response_bytes, elapsed, request_bytes=0):
+        call = dict(
+            method=method,
+            endpoint=endpoint_template(api),
+            status=status_code,
+            bytes=response_bytes,
+            latency_ms=round(elapsed * 1000.0, 3),
+        )
+        with self.lock:
+            self.calls.append(call)
+            self.bytes_sent += request_bytes
+
+    def record_retry(self):
+        with self.lock:
+            self.retries += 1
+
+    def record_wait(self, elapsed):
+        with self.lock:
+            self.rate_limit_wait += elapsed
+
+    def perf_summary(self):
+        """
+        Return the wall time since the recorder was created, split between HTTP requests and local processing,
+        with the request counts by method, the bytes sent and received, the retries on another admin node,
+        and the endpoints which took the most time.
+        Requests made concurrently are all counted, so http_time_ms may exceed wall_time_ms.
+        """
+        wall_time = (time.time() - self.start) * 1000.0
+        with self.lock:
+            calls = list(self.calls)
+            bytes_sent = self.bytes_sent
+            retries = self.retries
+            rate_limit_wait = self.rate_limit_wait * 1000.0
+        http_time = sum(call["latency_ms"] for call in calls)
+        by_method = {}
+        endpoints = {}
+        for call in calls:
+            by_method[call["method"]] = by_method.get(call["method"], 0) + 1
+            stats = endpoints.setdefault((call["method"], call["endpoint"]), dict(requests=0, total_ms=0.0, max_ms=0.0))
+            stats["requests"] += 1
+            stats["total_ms"] += call["latency_ms"]
+            stats["max_ms"] = max(stats["max_ms"], call["latency_ms"])
+        slowest = sorted(endpoints.items(), key=lambda entry: entry[1]["total_ms"], reverse=True)[:SLOWEST_ENDPOINTS]
+        return dict(
+            wall_time_ms=round(wall_time, 3),
+            http_time_ms=round(http_time, 3),
+            local_time_ms=round(max(wall_time - http_time - rate_limit_wait, 0.0), 3),
+            rate_limit_wait_ms=round(rate_limit_wait, 3),
+            requests=len(calls),
+            requests_by_method=by_method,
+            bytes_sent=bytes_sent,
+            bytes_received=sum(call["bytes"] for call in calls),
+            retries=retries,
+            slowest_endpoints=[
+                dict(method=method, endpoint=endpoint, requests=stats["requests"], total_ms=round(stats["total_ms"], 3), max_ms=stats["max_ms"])
+                for (method, endpoint), stats in slowest
+            ],
+        )
+
+
+def attach(module):
+    """
+    Return the recorder of a module, creating it on first use.
+    The recorded calls are added to the result under RESULT_KEY when telemetry is enabled,
+    and their summary under PERF_KEY when perf is enabled, on success and on failure.
+    """
+    recorder = getattr(module, "_sg_api_recorder", None)
+    if recorder is not None:
+        return recorder
+    recorder = ApiCallRecorder()
+    module._sg_api_recorder = recorder
+    calls = is_enabled()
+    perf = is_perf_enabled()
+
+    def with_calls(exit_function):
+        def wrapper(*args, **kwargs):
+            if calls:
+                kwargs[RESULT_KEY] = list(recorder.calls)
+            if perf:
+                kwargs[PERF_KEY] = recorder.perf_summary()
+            return exit_function(*args, **kwargs)
+        return wrapper
+
+    module.exit_json = with_calls(module.exit_json)
+    module.fail_json = with_calls(module.fail_json)
+    return recorder
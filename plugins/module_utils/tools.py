@@ -30,6 +30,8 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from concurrent.futures import ThreadPoolExecutor
+
 
 def first_inside_second_dict_or_list(d1, d2):
     """
@@ -97,3 +99,16 @@ def first_inside_second_dict_or_list(d1, d2):
         raise Exception("Unsupported input type %s.") % (type(d1))
 
     return answer
+
+
+def run_concurrently(function, items, max_workers=4):
+    """
+    Call function on every item using a pool of threads, and return the results in the order of items.
+    An exception raised for any item is raised again once all calls are done.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(function, item) for item in items]
+    return [future.result() for future in futures]
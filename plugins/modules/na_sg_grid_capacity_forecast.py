@@ -0,0 +1,322 @@
+#!/usr/bin/python
+
+# (c) 2026, NetApp Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""NetApp StorageGRID - Storage capacity trend and exhaustion forecast"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {
+    "metadata_version": "1.1",
+    "status": ["preview"],
+    "supported_by": "community",
+}
+
+
+DOCUMENTATION = """
+module: na_sg_grid_capacity_forecast
+short_description: NetApp StorageGRID forecast storage capacity exhaustion.
+extends_documentation_fragment:
+    - netapp.storagegrid.netapp.sg
+version_added: '21.18.0'
+author: NetApp Ansible Team (@vinaykus) <ng-ansibleteam@netapp.com>
+description:
+  - Forecast when the object storage of each site and/or Storage Node on NetApp StorageGRID will run out.
+  - Used and usable capacity are read from the grid metrics over a look-back window, a robust trend is fitted
+    to the used capacity of every site or node, and the growth rate and projected exhaustion date are reported.
+  - All sites and nodes are read with one range query per metric and level, split into chunks below the
+    Prometheus point limit, rather than one query per node.
+options:
+  levels:
+    description:
+    - Aggregation levels to forecast.
+    type: list
+    elements: str
+    choices: ['site', 'node']
+    default: ['site']
+  lookback_days:
+    description:
+    - Number of days of history used to fit the trend.
+    type: int
+    default: 90
+  end_time:
+    description:
+    - End of the look-back window, as an RFC 3339 date-time such as C(2026-01-31T00:00:00Z).
+    - If not provided, the current time is used.
+    type: str
+  step:
+    description:
+    - Sampling interval of the history, as a Prometheus duration such as C(1h) or C(30m).
+    type: str
+    default: 1h
+  trend:
+    description:
+    - C(linear) fits a straight line to the used capacity.
+    - C(seasonal) compares samples a whole number of I(season) periods apart, so a recurring daily or
+      weekly ingest pattern does not skew the growth rate.
+    type: str
+    choices: ['linear', 'seasonal']
+    default: linear
+  season:
+    description:
+    - Length of the recurring pattern when I(trend=seasonal), as a Prometheus duration.
+    - Falls back to a linear fit when the look-back window is shorter than two seasons.
+    type: str
+    default: 7d
+  used_metric:
+    description:
+    - Metric reporting the object data stored on each Storage Node, in bytes.
+    type: str
+    default: storagegrid_storage_utilization_data_bytes
+  usable_metric:
+    description:
+    - Metric reporting the usable space still available on each Storage Node, in bytes.
+    type: str
+    default: storagegrid_storage_utilization_usable_space_bytes
+  timeout:
+    description:
+    - Timeout duration for each query execution.
+    type: str
+"""
+
+EXAMPLES = """
+- name: Forecast capacity exhaustion per site over the last 90 days
+  netapp.storagegrid.na_sg_grid_capacity_forecast:
+    api_url: "https://<storagegrid-endpoint-url>"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+  register: sg_forecast
+
+- name: Forecast per site and per node with a weekly seasonal trend
+  netapp.storagegrid.na_sg_grid_capacity_forecast:
+    api_url: "https://<storagegrid-endpoint-url>"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    levels:
+      - site
+      - node
+    lookback_days: 120
+    step: 2h
+    trend: seasonal
+    season: 7d
+  register: sg_forecast
+"""
+
+RETURN = """
+sg_capacity_forecast:
+    description: Capacity forecast for each requested level, sorted by ascending days to exhaustion.
+    returned: always
+    type: dict
+    sample: {
+        "site": [
+            {
+                "site_id": "99d94acc-b2d4-4e4e-86e5-b715af68b40b",
+                "site_name": "site1",
+                "used_bytes": 21456490549248,
+                "usable_bytes": 8000000000000,
+                "capacity_bytes": 29456490549248,
+                "utilization_percent": 72.84,
+                "growth_bytes_per_day": 53687091200.0,
+                "days_to_exhaustion": 149.0,
+                "exhaustion_date": "2026-06-21T00:00:00Z",
+                "samples": 2160,
+                "seasonal": false
+            }
+        ],
+        "window": {
+            "start": "2025-10-23T00:00:00Z",
+            "end": "2026-01-21T00:00:00Z",
+            "step_seconds": 3600
+        }
+    }
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
+import ansible_collections.netapp.storagegrid.plugins.module_utils.metrics as metrics_utils
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
+from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import SGRestAPI
+
+EPOCH = datetime(1970, 1, 1)
+
+LEVEL_LABELS = {
+    "site": ["site_id", "site_name"],
+    "node": ["node_id", "instance", "site_id", "site_name"],
+}
+
+
+class SgCapacityForecast(object):
+    """
+    Forecast storage capacity exhaustion for StorageGRID sites and nodes
+    """
+
+    def __init__(self):
+        """
+        Parse arguments, setup variables,
+        check parameters and ensure request module is installed
+        """
+        self.argument_spec = netapp_utils.na_storagegrid_host_argument_spec()
+        self.argument_spec.update(
+            dict(
+                levels=dict(type="list", elements="str", choices=["site", "node"], default=["site"]),
+                lookback_days=dict(type="int", default=90),
+                end_time=dict(type="str", required=False),
+                step=dict(type="str", default="1h"),
+                trend=dict(type="str", choices=["linear", "seasonal"], default="linear"),
+                season=dict(type="str", default="7d"),
+                used_metric=dict(type="str", default="storagegrid_storage_utilization_data_bytes"),
+                usable_metric=dict(type="str", default="storagegrid_storage_utilization_usable_space_bytes"),
+                timeout=dict(type="str", required=False),
+            )
+        )
+        self.module = AnsibleModule(
+            argument_spec=self.argument_spec,
+            supports_check_mode=True
+        )
+        self.na_helper = NetAppModule()
+
+        # set up variables
+        self.parameters = self.na_helper.set_parameters(self.module.params)
+        # Calling generic SG rest_api class
+        self.rest_api = SGRestAPI(self.module)
+        # Get API version
+        self.rest_api.get_sg_product_version(api_root="grid")
+
+        if self.parameters["lookback_days"] < 1:
+            self.module.fail_json(msg="Error: lookback_days must be at least 1.")
+        try:
+            self.step = int(metrics_utils.parse_duration(self.parameters["step"]))
+            season = metrics_utils.parse_duration(self.parameters["season"])
+        except ValueError as exc:
+            self.module.fail_json(msg="Error: %s" % exc)
+        if self.step < 1:
+            self.module.fail_json(msg="Error: step must be at least 1s.")
+        self.season_steps = int(season // self.step) if self.parameters["trend"] == "seasonal" else None
+
+        if self.parameters.get("end_time"):
+            self.end = self.parse_time(self.parameters["end_time"])
+        else:
+            self.end = time.time()
+        # align the window on the step so every series shares the same sample grid
+        self.end -= self.end % self.step
+        self.start = self.end - self.parameters["lookback_days"] * 86400
+        self.count = int((self.end - self.start) // self.step) + 1
+
+    def parse_time(self, value):
+        """ Convert an RFC 3339 date-time to epoch seconds """
+        value = value.strip()
+        if value.endswith("Z"):
+            value = value[:-1]
+        for time_format in ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
+            try:
+                return (datetime.strptime(value, time_format) - EPOCH).total_seconds()
+            except ValueError:
+                continue
+        self.module.fail_json(msg="Error: end_time '%s' is not an RFC 3339 UTC date-time." % value)
+
+    @staticmethod
+    def format_time(epoch):
+        return (EPOCH + timedelta(seconds=epoch)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def get_level_series(self, metric, level):
+        """ Get the samples of one metric for every site or node in one batched range query """
+        labels = LEVEL_LABELS[level]
+        query = "sum by (%s) (%s)" % (", ".join(labels), metric)
+        series, error = metrics_utils.get_metric_query_range_batched(
+            self.rest_api, query, self.start, self.end, self.step, self.parameters.get("timeout"), label_keys=labels
+        )
+        if error:
+            self.module.fail_json(msg=error)
+        return series
+
+    def forecast_level(self, level):
+        """ Fit the used capacity trend of every site or node and project its exhaustion """
+        used = self.get_level_series(self.parameters["used_metric"], level)
+        usable = self.get_level_series(self.parameters["usable_metric"], level)
+
+        keys = sorted(used)
+        used_matrix = metrics_utils.align_series([used[key]["values"] for key in keys], self.start, self.step, self.count)
+        usable_matrix = metrics_utils.align_series(
+            [usable[key]["values"] if key in usable else {} for key in keys], self.start, self.step, self.count
+        )
+        fits = metrics_utils.fit_trends(used_matrix, self.step, self.season_steps)
+
+        forecast = []
+        for key, used_row, usable_row, fit in zip(keys, used_matrix, usable_matrix, fits):
+            labels = used[key]["metric"]
+            entry = dict((label, labels.get(label)) for label in LEVEL_LABELS[level])
+            latest = self.latest_sample(used_row, usable_row)
+            entry.update(
+                used_bytes=None,
+                usable_bytes=None,
+                capacity_bytes=None,
+                utilization_percent=None,
+                growth_bytes_per_day=None,
+                days_to_exhaustion=None,
+                exhaustion_date=None,
+                samples=fit["samples"] if fit else 0,
+                seasonal=fit["seasonal"] if fit else False,
+            )
+            if latest is not None:
+                used_bytes, usable_bytes = latest
+                capacity = used_bytes + usable_bytes
+                entry.update(
+                    used_bytes=int(used_bytes),
+                    usable_bytes=int(usable_bytes),
+                    capacity_bytes=int(capacity),
+                    utilization_percent=round(100.0 * used_bytes / capacity, 2) if capacity else None,
+                )
+                if fit is not None:
+                    growth = fit["slope"] * 86400
+                    entry["growth_bytes_per_day"] = round(growth, 1)
+                    projected = fit["intercept"] + fit["slope"] * (self.end - self.start)
+                    if growth > 0:
+                        days = max(capacity - projected, 0) / growth
+                        entry["days_to_exhaustion"] = round(days, 1)
+                        entry["exhaustion_date"] = self.format_time(self.end + days * 86400)
+            forecast.append(entry)
+
+        # soonest to fill first, sites or nodes which are not growing last
+        forecast.sort(key=lambda item: (item["days_to_exhaustion"] is None, item["days_to_exhaustion"]))
+        return forecast
+
+    @staticmethod
+    def latest_sample(used_row, usable_row):
+        """ Return the most recent (used, usable) pair where both metrics were sampled """
+        for used_bytes, usable_bytes in zip(reversed(used_row), reversed(usable_row)):
+            if used_bytes is not None and usable_bytes is not None:
+                return used_bytes, usable_bytes
+        return None
+
+    def apply(self):
+        """ Gather metrics, fit trends and exit """
+        result = dict(
+            window=dict(
+                start=self.format_time(self.start),
+                end=self.format_time(self.end),
+                step_seconds=self.step,
+            )
+        )
+        for level in self.parameters["levels"]:
+            result[level] = self.forecast_level(level)
+
+        self.module.exit_json(changed=False, sg_capacity_forecast=result)
+
+
+def main():
+    """
+    Main function
+    """
+    na_sg_grid_capacity_forecast = SgCapacityForecast()
+    na_sg_grid_capacity_forecast.apply()
+
+
+if __name__ == "__main__":
+    main()
@@ -48,6 +48,17 @@ options:
     type: str
     choices: ['present', 'absent']
     default: present
+  log_level:
+    description:
+    - Level of the messages returned in I(log).
+    - With C(debug), the parameters, request bodies and the objects listed from StorageGRID are also logged,
+      which can be large on grids with many ILM objects.
+    - The log is truncated to 64 KiB.
+    required: false
+    type: str
+    choices: ['error', 'warning', 'info', 'debug']
+    default: info
+    version_added: '21.18.0'
   validate_certs:
     description:
     - Should https certificates be validated?
@@ -87,14 +98,11 @@ resp:
     }
 """
 
-from datetime import datetime
-
 import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import SGRestAPI
-
-__LOGGING__ = []
+from ansible_collections.netapp.storagegrid.plugins.module_utils.logger import ModuleLogger, log_level_argument_spec
 
 
 class EC_profile(object):
@@ -116,6 +124,7 @@ class EC_profile(object):
                 scheme_id=dict(required=False, type="str"),
             )
         )
+        self.argument_spec.update(log_level_argument_spec())
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
             required_if=[("state", "present", ["pool_id", "scheme_id"])],
@@ -125,7 +134,8 @@ class EC_profile(object):
 
         # set up state variables
         self.parameters = self.na_helper.set_parameters(self.module.params)
-        __LOGGING__.append("params: %s" % self.module.params)
+        self.logger = ModuleLogger(self.module, self.parameters["log_level"])
+        self.logger.debug_params()
         # Calling generic SG rest_api class
         self.rest_api = SGRestAPI(self.module)
         # Get API version
@@ -139,16 +149,7 @@ class EC_profile(object):
             self.data["poolId"] = self.parameters["pool_id"]
         if self.parameters.get("scheme_id"):
             self.data["schemeId"] = self.parameters["scheme_id"]
-        __LOGGING__.append("data: %s" % self.data)
-
-    def module_logging_handler(self, log_msg):
-        """Module logging handler"""
-        # Create timestamp for logs
-        date_now = datetime.now()
-        timestamp = date_now.strftime("%Y/%m/%d-%H:%M:%S")
-        # Log events
-        self.module.log(log_msg)
-        __LOGGING__.append("%s: %s" % (timestamp, log_msg))
+        self.logger.debug("data: %s", self.data)
 
     def get_ec_profile(self):
         # Check if profile exists
@@ -156,8 +157,8 @@ class EC_profile(object):
         api = "api/%s/grid/ec-profiles?showDeactivated=true" % self.api_version
         response, error = self.rest_api.get(api)
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
-        self.module_logging_handler("all EC profiles: %s" % response['data'])
+            self.module.fail_json(msg=error, log=self.logger.entries)
+        self.logger.debug("all EC profiles: %s", response['data'])
         # if EC profile with 'name' exists, return it, else none
         for profile in response["data"]:
             if profile["name"] == self.parameters["name"]:
@@ -166,26 +167,26 @@ class EC_profile(object):
         return None
 
     def create_ec_profile(self):
-        __LOGGING__.append("creating EC profile with payload: %s" % self.data)
+        self.logger.debug("creating EC profile with payload: %s", self.data)
         api = "api/%s/private/ec-profiles" % self.api_version
         response, error = self.rest_api.post(api, self.data)
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
         return response["data"]
 
     def deactivate_ec_profile(self):
-        __LOGGING__.append("deactivating EC profile")
+        self.logger.info("deactivating EC profile")
         api = "api/%s/private/ec-profiles/%s/deactivate" % (self.api_version, self.id)
         response, error = self.rest_api.post(api, None)
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
 
     def update_ec_profile(self):
-        __LOGGING__.append("updating EC profile with payload: %s" % self.data)
+        self.logger.debug("updating EC profile with payload: %s", self.data)
         api = "api/%s/private/ec-profiles/%s" % (self.api_version, self.id)
         response, error = self.rest_api.put(api, self.data)
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
         return response["data"]
 
     def apply(self):
@@ -194,7 +195,7 @@ class EC_profile(object):
         """
 
         ec_profile = self.get_ec_profile()
-        self.module_logging_handler("got matching EC profile: %s" % ec_profile)
+        self.logger.debug("got matching EC profile: %s", ec_profile)
 
         cd_action = self.na_helper.get_cd_action(ec_profile, self.parameters)
 
@@ -220,19 +221,19 @@ class EC_profile(object):
                     self.deactivate_ec_profile()
                     resp_data = None
                     result_message = "EC profile deactivated"
-                    __LOGGING__.append("EC profile deactivated")
+                    self.logger.info("EC profile deactivated")
 
                 elif cd_action == "create":
                     resp_data = self.create_ec_profile()
                     result_message = "EC profile created"
-                    __LOGGING__.append("EC profile created")
+                    self.logger.info("EC profile created")
 
                 else:
                     resp_data = self.update_ec_profile()
                     result_message = "EC profile updated"
-                    __LOGGING__.append("EC profile updated")
+                    self.logger.info("EC profile updated")
 
-        self.module.exit_json(changed=self.na_helper.changed, msg=result_message, resp=resp_data, log=__LOGGING__)
+        self.module.exit_json(changed=self.na_helper.changed, msg=result_message, resp=resp_data, log=self.logger.entries)
 
 
 def main():
@@ -26,6 +26,7 @@ version_added: '21.16.0'
 author: NetApp Ansible Team (@vinaykus) <ng-ansibleteam@netapp.com>
 description:
   - Create, update, or delete node firewall on NetApp StorageGRID.
+  - With I(firewalls), reconcile the blocked ports and privileged IPs of many nodes in a single task.
 options:
   state:
     description:
@@ -57,6 +58,71 @@ options:
     description:
     - Whether to allow internal port access to the grid.
     type: bool
+  firewalls:
+    description:
+    - Complete list of the firewall entries, by node UUID or default list ID, to reconcile in a single task.
+    - The blocked ports, privileged IPs and external ports are listed once, compared as sets with the current entries,
+      and only the entries that differ are then created, updated or deleted concurrently.
+    - Options not set for an entry default to the value of the module option of the same name.
+      Blocked ports or privileged IPs that are not set are left unchanged.
+    - Mutually exclusive with I(id).
+    type: list
+    elements: dict
+    version_added: '21.18.0'
+    suboptions:
+      id:
+        description:
+        - The node UUID or the default list ID.
+        type: str
+        required: true
+      state:
+        description:
+        - Whether the firewall entries should be present or absent.
+        type: str
+        choices: ['present', 'absent']
+      blocked_udp_ports:
+        description:
+        - List of UDP ports to block for external communication.
+        type: list
+        elements: int
+      blocked_tcp_ports:
+        description:
+        - List of TCP ports to block for external communication.
+        type: list
+        elements: int
+      privileged_ips:
+        description:
+        - A list of privileged IP addresses, or subnets in CIDR notation.
+        type: list
+        elements: str
+      grid_internal_access:
+        description:
+        - Whether to allow internal port access to the grid.
+        type: bool
+  purge_firewalls:
+    description:
+    - With I(firewalls), delete the blocked ports and privileged IPs of the IDs that are not in the list.
+    type: bool
+    default: false
+    version_added: '21.18.0'
+  collapse_privileged_ips:
+    description:
+    - With I(firewalls), merge the privileged IPs into the smallest list of subnets covering the same addresses,
+      for instance C(10.0.0.0/25) and C(10.0.0.128/25) into C(10.0.0.0/24), before comparing and sending them.
+    - This reduces the number of entries the grid evaluates for large lists.
+    - Otherwise duplicates are still removed and the addresses are still compared as sets.
+    type: bool
+    default: true
+    version_added: '21.18.0'
+  max_concurrent_requests:
+    description:
+    - With I(firewalls), maximum number of firewall entries changed at the same time.
+    type: int
+    default: 8
+    version_added: '21.18.0'
+notes:
+- With I(firewalls), an entry that fails to be changed does not stop the other ones, and the module fails
+  after all the entries are processed, reporting the error of each ID in I(firewalls).
 """
 
 EXAMPLES = """
@@ -92,6 +158,21 @@ EXAMPLES = """
     privileged_ips: ["192.168.1.1/32"]
     grid_internal_access: true
 
+- name: reconcile the firewall of all the nodes, deleting the entries of unlisted nodes
+  netapp.storagegrid.na_sg_grid_firewall:
+    api_url: "https://<storagegrid-endpoint-url>"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    blocked_tcp_ports: [22, 80]
+    privileged_ips: "{{ admin_subnets }}"
+    grid_internal_access: true
+    purge_firewalls: true
+    firewalls:
+      - id: "00000000-0000-0000-0000-000000000000"
+      - id: "00000000-0000-0000-0000-000000000001"
+        blocked_tcp_ports: [22]
+        blocked_udp_ports: [68]
+
 - name: delete a firewall
   netapp.storagegrid.na_sg_grid_firewall:
     api_url: "https://<storagegrid-endpoint-url>"
@@ -118,12 +199,57 @@ resp:
             "udpPorts": [68]
         }
     }
+firewalls:
+    description:
+    - Result for each firewall ID, with I(firewalls).
+    - I(blocked_ports) and I(privileged_ips) are C(create), C(update), C(delete) or C(none).
+    - I(error) is only set when a change failed.
+    returned: success or failure, with I(firewalls)
+    type: list
+    elements: dict
+    version_added: '21.18.0'
+    sample: [
+        {
+            "id": "00000000-0000-0000-0000-000000000000",
+            "blocked_ports": "none",
+            "privileged_ips": "update",
+            "changed": true
+        }
+    ]
 """
 
+import ipaddress
+
 import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import SGRestAPI
+from ansible_collections.netapp.storagegrid.plugins.module_utils.tools import run_concurrently
+
+FIREWALL_RESOURCES = dict(
+    blocked_ports="firewall-blocked-ports",
+    privileged_ips="firewall-privileged-ips",
+)
+
+
+def normalize_privileged_ips(values, collapse=True):
+    """
+    Return the privileged IPs as a sorted list without duplicates, single addresses without a prefix length.
+    With collapse, adjacent and overlapping subnets are merged into the smallest covering list.
+    Raise ValueError for an invalid address.
+    """
+    networks = set(ipaddress.ip_network(u"%s" % value, strict=False) for value in values)
+    if collapse:
+        networks = [
+            network
+            for version in (4, 6)
+            for network in ipaddress.collapse_addresses(network for network in networks if network.version == version)
+        ]
+    networks = sorted(networks, key=lambda network: (network.version, network))
+    return [
+        str(network.network_address) if network.prefixlen == network.max_prefixlen else str(network)
+        for network in networks
+    ]
 
 
 class SgFirewall(object):
@@ -145,25 +271,46 @@ class SgFirewall(object):
                 blocked_tcp_ports=dict(type="list", elements="int", required=False),
                 privileged_ips=dict(type="list", elements="str", required=False),
                 grid_internal_access=dict(type="bool", required=False),
+                firewalls=dict(
+                    type="list",
+                    elements="dict",
+                    required=False,
+                    options=dict(
+                        id=dict(type="str", required=True),
+                        state=dict(type="str", choices=["present", "absent"], required=False),
+                        blocked_udp_ports=dict(type="list", elements="int", required=False),
+                        blocked_tcp_ports=dict(type="list", elements="int", required=False),
+                        privileged_ips=dict(type="list", elements="str", required=False),
+                        grid_internal_access=dict(type="bool", required=False),
+                    ),
+                ),
+                purge_firewalls=dict(type="bool", required=False, default=False),
+                collapse_privileged_ips=dict(type="bool", required=False, default=True),
+                max_concurrent_requests=dict(type="int", required=False, default=8),
             )
         )
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
-            required_if=[
-                ("state", "present", ["id"]),
-                ("state", "present", ["blocked_udp_ports", "blocked_tcp_ports", "privileged_ips", "grid_internal_access"], True)
-            ],
+            mutually_exclusive=[("id", "firewalls")],
             supports_check_mode=True
         )
         self.na_helper = NetAppModule()
 
         # set up state variables
         self.parameters = self.na_helper.set_parameters(self.module.params)
+
+        # options required when state is present, the entries of firewalls may set them
+        if "firewalls" not in self.parameters:
+            self.check_required_options()
+
         # Calling generic SG rest_api class
         self.rest_api = SGRestAPI(self.module)
         # Get API version
         self.rest_api.get_sg_product_version()
 
+        if "firewalls" in self.parameters:
+            return
+
         # Checking for the parameters passed and create new parameters list
         self.blocked_port_info = {}
         self.blocked_port_info["id"] = self.parameters["id"]
@@ -179,6 +326,15 @@ class SgFirewall(object):
         if self.parameters.get("grid_internal_access") is not None:
             self.privileged_ips_info["gridInternalAccess"] = self.parameters["grid_internal_access"]
 
+    def check_required_options(self):
+        if self.parameters["state"] != "present":
+            return
+        if "id" not in self.parameters:
+            self.module.fail_json(msg="state is present but all of the following are missing: id")
+        options = ["blocked_udp_ports", "blocked_tcp_ports", "privileged_ips", "grid_internal_access"]
+        if not any(option in self.parameters for option in options):
+            self.module.fail_json(msg="state is present but any of the following are missing: %s" % ", ".join(options))
+
     def get_blocked_ports(self):
         ''' Get blocked ports list'''
         api = "api/v4/private/firewall-blocked-ports"
@@ -276,9 +432,178 @@ class SgFirewall(object):
                 if port not in all_external_ports["externalUdpPorts"]:
                     self.module.fail_json(msg="UDP port %s is not a valid external port." % port)
 
+    def get_firewall_entries(self, resource):
+        ''' Get all the blocked ports or privileged IPs entries, indexed by ID '''
+        api = "api/v4/private/%s" % FIREWALL_RESOURCES[resource]
+        response, error = self.rest_api.get(api)
+        if error:
+            self.module.fail_json(msg=error)
+        return dict((entry["id"], entry) for entry in response["data"])
+
+    def get_firewall_parameters(self, firewall):
+        ''' Options not set for an entry default to the module options '''
+        parameters = dict(self.parameters)
+        for option in ("firewalls", "purge_firewalls", "collapse_privileged_ips", "max_concurrent_requests"):
+            parameters.pop(option, None)
+        parameters.update((key, value) for key, value in firewall.items() if value is not None)
+        return parameters
+
+    def plan_blocked_ports(self, parameters, current):
+        ''' Return (action, data) for the blocked ports of an entry '''
+        if parameters.get("blocked_tcp_ports") is None and parameters.get("blocked_udp_ports") is None:
+            return None, None
+        data = dict(id=parameters["id"])
+        for option, key in (("blocked_tcp_ports", "tcpPorts"), ("blocked_udp_ports", "udpPorts")):
+            if parameters.get(option) is not None:
+                data[key] = sorted(set(parameters[option]))
+            elif current is not None:
+                data[key] = current.get(key) or []
+            else:
+                data[key] = []
+        if current is None:
+            return "create", data
+        if any(set(data[key]) != set(current.get(key) or []) for key in ("tcpPorts", "udpPorts")):
+            return "update", data
+        return None, None
+
+    def plan_privileged_ips(self, parameters, current):
+        ''' Return (action, data) for the privileged IPs of an entry, comparing normalized IPs '''
+        if parameters.get("privileged_ips") is None and parameters.get("grid_internal_access") is None:
+            return None, None
+        collapse = self.parameters["collapse_privileged_ips"]
+        data = dict(id=parameters["id"])
+        if parameters.get("privileged_ips") is not None:
+            try:
+                data["privilegedIps"] = normalize_privileged_ips(parameters["privileged_ips"], collapse)
+            except ValueError as exc:
+                self.module.fail_json(msg="Error in firewalls for %s: %s" % (parameters["id"], exc))
+        elif current is not None:
+            data["privilegedIps"] = current.get("privilegedIps") or []
+        if parameters.get("grid_internal_access") is not None:
+            data["gridInternalAccess"] = parameters["grid_internal_access"]
+        elif current is not None:
+            data["gridInternalAccess"] = current.get("gridInternalAccess", False)
+        if current is None:
+            return "create", data
+
+        try:
+            current_ips = set(normalize_privileged_ips(current.get("privilegedIps") or [], collapse))
+        except ValueError:
+            current_ips = set(current.get("privilegedIps") or [])
+        if set(data["privilegedIps"]) != current_ips or data["gridInternalAccess"] != current.get("gridInternalAccess", False):
+            return "update", data
+        return None, None
+
+    def check_external_ports(self, changes):
+        ''' Check the blocked ports to send against the external ports, listed once '''
+        requested = [change for change in changes if change["resource"] == "blocked_ports" and change["action"] in ("create", "update")]
+        if not requested:
+            return
+        all_external_ports = self.get_all_external_ports()
+        for change in requested:
+            for key, protocol, external in (("tcpPorts", "TCP", "externalTcpPorts"), ("udpPorts", "UDP", "externalUdpPorts")):
+                invalid = sorted(set(change["data"][key]) - set(all_external_ports[external]))
+                if invalid:
+                    self.module.fail_json(msg="Error in firewalls for %s: %s port %s is not a valid external port."
+                                          % (change["id"], protocol, invalid[0]))
+
+    def plan_firewall_changes(self, blocked_ports, privileged_ips):
+        '''
+        Compare each entry with the current blocked ports and privileged IPs, and return the list of changes.
+        Each change is a dict with id, resource (blocked_ports or privileged_ips), action and the request body.
+        '''
+        changes = []
+        ids = []
+        for firewall in self.parameters["firewalls"]:
+            parameters = self.get_firewall_parameters(firewall)
+            firewall_id = parameters["id"]
+            if firewall_id in ids:
+                self.module.fail_json(msg="Error in firewalls: %s is listed more than once." % firewall_id)
+            ids.append(firewall_id)
+
+            if parameters["state"] == "absent":
+                for resource, current in (("blocked_ports", blocked_ports), ("privileged_ips", privileged_ips)):
+                    if firewall_id in current:
+                        changes.append(dict(id=firewall_id, resource=resource, action="delete", data=None))
+                continue
+
+            for resource, plan, current in (
+                ("blocked_ports", self.plan_blocked_ports, blocked_ports),
+                ("privileged_ips", self.plan_privileged_ips, privileged_ips),
+            ):
+                action, data = plan(parameters, current.get(firewall_id))
+                if action:
+                    changes.append(dict(id=firewall_id, resource=resource, action=action, data=data))
+
+        if self.parameters["purge_firewalls"]:
+            listed = set(ids)
+            for resource, current in (("blocked_ports", blocked_ports), ("privileged_ips", privileged_ips)):
+                for firewall_id in sorted(set(current) - listed):
+                    changes.append(dict(id=firewall_id, resource=resource, action="delete", data=None))
+                    if firewall_id not in ids:
+                        ids.append(firewall_id)
+        return ids, changes
+
+    def apply_firewall_change(self, change):
+        '''
+        Apply one create, update or delete, called from a worker thread.
+        Errors are reported in the result rather than with fail_json, so the other entries carry on.
+        '''
+        api = "api/v4/private/%s" % FIREWALL_RESOURCES[change["resource"]]
+        if change["action"] == "create":
+            response, error = self.rest_api.post(api, change["data"])
+        elif change["action"] == "update":
+            response, error = self.rest_api.put("%s/%s" % (api, change["id"]), change["data"])
+        else:
+            response, error = self.rest_api.delete("%s/%s" % (api, change["id"]), None)
+        return str(error) if error else None
+
+    def apply_firewalls(self):
+        '''
+        Reconcile the list of firewall entries: list the current entries once, compare them as sets,
+        then create, update and delete the entries that differ concurrently
+        '''
+        ids, changes = self.plan_firewall_changes(
+            self.get_firewall_entries("blocked_ports"), self.get_firewall_entries("privileged_ips")
+        )
+        self.check_external_ports(changes)
+
+        errors = [None] * len(changes)
+        if not self.module.check_mode:
+            errors = run_concurrently(self.apply_firewall_change, changes, self.parameters["max_concurrent_requests"])
+
+        results = dict((firewall_id, dict(id=firewall_id, blocked_ports="none", privileged_ips="none", changed=False)) for firewall_id in ids)
+        for change, error in zip(changes, errors):
+            result = results[change["id"]]
+            result[change["resource"]] = change["action"]
+            if error:
+                result["error"] = "; ".join(filter(None, [result.get("error"), "%s: %s" % (change["resource"], error)]))
+            else:
+                result["changed"] = True
+        results = [results[firewall_id] for firewall_id in ids]
+
+        changed = any(error is None for error in errors)
+        counts = []
+        for resource, label in (("blocked_ports", "blocked port lists"), ("privileged_ips", "privileged IP lists")):
+            for action in ("create", "update", "delete"):
+                count = len([1 for change, error in zip(changes, errors) if change["resource"] == resource and change["action"] == action and not error])
+                if count:
+                    counts.append("%d %s %sd" % (count, label, action))
+        failed = [result for result in results if "error" in result]
+        if failed:
+            msg = "Error changing %d of %d firewall entries: %s" % (
+                len(failed), len(results), "; ".join("%s: %s" % (result["id"], result["error"]) for result in failed)
+            )
+            self.module.fail_json(msg=msg, changed=changed, firewalls=results)
+        self.module.exit_json(changed=changed, msg="; ".join(counts), firewalls=results)
+
     def apply(self):
         ''' Apply firewall changes '''
 
+        if "firewalls" in self.parameters:
+            self.apply_firewalls()
+            return
+
         blocked_ports = self.get_blocked_ports()
         privileged_ips = self.get_privileged_ip()
 
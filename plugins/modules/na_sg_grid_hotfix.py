@@ -132,7 +132,8 @@ class SgHotfix:
         # set up state variables
         self.parameters = self.na_helper.set_parameters(self.module.params)
         # Calling generic SG rest_api class
-        self.rest_api = SGRestAPI(self.module)
+        # node details are polled while the hotfix is applied
+        self.rest_api = SGRestAPI(self.module, memoize=False)
         # Get API version
         self.rest_api.get_sg_product_version()
         self.api_version = self.rest_api.get_api_version()
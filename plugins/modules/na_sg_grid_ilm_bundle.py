@@ -0,0 +1,935 @@
+#!/usr/bin/python
+
+# (c) 2026, NetApp Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""NetApp StorageGRID - Manage ILM pools, EC profiles, rules, policies and policy tags in one task"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {
+    "metadata_version": "1.1",
+    "status": ["preview"],
+    "supported_by": "community",
+}
+
+
+DOCUMENTATION = """
+module: na_sg_grid_ilm_bundle
+short_description: NetApp StorageGRID manage an ILM configuration in one task.
+extends_documentation_fragment:
+    - netapp.storagegrid.netapp.sg
+version_added: '21.18.0'
+author: NetApp Ansible Team (@vinaykus) <ng-ansibleteam@netapp.com>
+description:
+  - Create, update and delete the ILM pools, EC profiles, ILM rules, ILM policies and ILM policy tags of a NetApp StorageGRID
+    grid in a single task.
+  - Each collection is listed once, and the whole bundle is compared with it before any change is made.
+    References that cannot be resolved fail the task before anything is changed.
+  - Pools, EC profiles, rules and policies are referenced by name or by ID. A reference to an object created by the bundle
+    makes the referencing object wait for it, other creates and updates run concurrently.
+  - Objects to delete are deleted after all the creates and updates, policy tags first and pools last.
+  - The suboptions of each list are the options of M(netapp.storagegrid.na_sg_grid_ilm_pool),
+    M(netapp.storagegrid.na_sg_grid_ec_profile), M(netapp.storagegrid.na_sg_grid_ilm_rule),
+    M(netapp.storagegrid.na_sg_grid_ilm_policy) and M(netapp.storagegrid.na_sg_grid_ilm_policy_tag).
+options:
+  pools:
+    description:
+    - ILM pools of the bundle.
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+        - The name of the storage pool.
+        required: true
+        type: str
+      state:
+        description:
+        - Whether the pool should exist.
+        type: str
+        choices: ['present', 'absent']
+        default: present
+      disks:
+        description:
+        - A list of the sites and storage grades in the storage pool.
+        type: list
+        elements: dict
+        suboptions:
+          description:
+            description:
+            - The IDs of all sites and storage grades for this storage pool.
+            type: str
+          group:
+            description:
+            - If both the group and siteId fields are provided, the siteId is used.
+            type: int
+          grade:
+            description:
+            - Storage grade ID.
+            type: int
+          siteId:
+            description:
+            - If both the group and siteId fields are provided, the siteId is used.
+            type: str
+      archives:
+        description:
+        - A list of the sites that use the Archive Nodes storage grade.
+        type: list
+        elements: dict
+        suboptions:
+          description:
+            description:
+            - The IDs of all sites and storage grades for this storage pool.
+            type: str
+          group:
+            description:
+            - If both the group and siteId fields are provided, the siteId is used.
+            type: int
+          grade:
+            description:
+            - Storage grade ID.
+            type: int
+          siteId:
+            description:
+            - If both the group and siteId fields are provided, the siteId is used.
+            type: str
+  ec_profiles:
+    description:
+    - EC profiles of the bundle.
+    - State C(absent) deactivates the EC profile.
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+        - The EC profile's name.
+        required: true
+        type: str
+      state:
+        description:
+        - Whether the EC profile should be active.
+        type: str
+        choices: ['present', 'absent']
+        default: present
+      pool_id:
+        description:
+        - Name or ID of the storage pool of the selected scheme.
+        type: str
+      scheme_id:
+        description:
+        - The selected scheme for the EC profile.
+        type: str
+  rules:
+    description:
+    - ILM rules of the bundle.
+    - The I(poolId), I(temporaryPoolId) and I(profileId) of the placements are pool and EC profile names or IDs.
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+        - Displayed name of the ILM rule.
+        required: true
+        type: str
+      state:
+        description:
+        - Whether the rule should exist.
+        type: str
+        choices: ['present', 'absent']
+        default: present
+      bucket_filter:
+        description:
+        - S3 or Swift bucket(s) to which the ILM rule applies.
+        type: dict
+        suboptions:
+          operator:
+            description:
+            - Operator used to match bucket(s) with the value.
+            required: true
+            type: str
+            choices: ['contains', 'endsWith', 'equals', 'startsWith']
+          value:
+            description:
+            - str value used to match bucket(s) with the specified operator.
+            required: true
+            type: str
+      description:
+        description:
+        - A short description of the ILM rule to indicate its purpose.
+        type: str
+      filters:
+        description:
+        - Filtering criteria used to determine if the ILM rule shall be applied to the evaluated object.
+        type: list
+        elements: dict
+        default: []
+        suboptions:
+          logicalOperator:
+            description:
+            - Logical operator connecting filtering criteria when more than one criterion provided.
+            type: str
+          criteria:
+            description:
+            - A group of logical conditions based on object metadata.
+            type: list
+            elements: dict
+            suboptions:
+              operator:
+                description:
+                - Used to compare the "metadataName" with the "value" str.
+                required: true
+                type: str
+                choices: ['contains', 'notContains', 'equals', 'notEquals', 'startsWith', 'notStartsWith', 'endsWith', 'notEndsWith',
+                  'exists', 'notExists', 'lessThan', 'lessThanOrEquals', 'greaterThan', 'greaterThanOrEquals']
+              metadataName:
+                description:
+                - System metadata identifier, user metadata name, or tag name.
+                required: true
+                type: str
+              metadataType:
+                description:
+                - Indicates the type of filtered metadata.
+                type: str
+              value:
+                description:
+                - Entry against which the metadata values specified by metadataName should be compared.
+                type: str
+      ingest_behavior:
+        description:
+        - How objects matching this rule are stored on ingest.
+        type: str
+        choices: ['strict', 'balanced', 'dual-commit']
+        default: balanced
+      placements:
+        description:
+        - Specifies where and how object data that matches the ILM rule is stored.
+        type: list
+        elements: dict
+        suboptions:
+          retention:
+            description:
+            - Specifies where and how object data that matches the ILM rule is stored over time.
+            required: true
+            type: dict
+            suboptions:
+              after:
+                description:
+                - Day when object storage starts.
+                required: true
+                type: int
+              duration:
+                description:
+                - Number of days object data to be stored at the specified locations. Objects stored forever if null.
+                type: int
+          replicated:
+            description:
+            - Creates replicated copies of object data.
+            type: list
+            elements: dict
+            suboptions:
+              poolId:
+                description:
+                - Name or ID of the storage pool where object data is saved.
+                type: str
+              temporaryPoolId:
+                description:
+                - Temporary locations are deprecated and should not be used for new ILM rules.
+                type: str
+              cloudStoragePoolId:
+                description:
+                - ID of the Cloud Storage Pool where object data is saved.
+                type: str
+              copies:
+                description:
+                - Number of replicated copies.
+                required: true
+                type: int
+          erasureCoded:
+            description:
+            - Creates erasure coded copies of object data.
+            type: list
+            elements: dict
+            suboptions:
+              poolId:
+                description:
+                - Name or ID of the storage pool where object data is stored.
+                required: true
+                type: str
+              profileId:
+                description:
+                - Name or ID of the erasure coding profile used.
+                required: true
+                type: str
+      reference_time:
+        description:
+        - Indicates the time from which the ILM rule is applied.
+        type: str
+        choices: ['ingestTime', 'lastAccessTime', 'noncurrentTime', 'userDefinedCreationTime']
+        default: ingestTime
+      tenant_account_id:
+        description:
+        - One or more S3 or Swift tenant account IDs to which the ILM rule applies.
+        type: str
+  policies:
+    description:
+    - ILM policies of the bundle.
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+        - The unique name of the policy.
+        required: true
+        type: str
+      state:
+        description:
+        - Whether the policy should exist.
+        type: str
+        choices: ['present', 'absent']
+        default: present
+      default_rule:
+        description:
+        - Name or ID of the default rule of the policy.
+        type: str
+      reason:
+        description:
+        - Policy description.
+        type: str
+      rules:
+        description:
+        - Names or IDs of the ILM rules, in the order in which they are evaluated.
+        type: list
+        elements: str
+  policy_tags:
+    description:
+    - ILM policy tags of the bundle.
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+        - The unique name of this tag.
+        required: true
+        type: str
+      state:
+        description:
+        - Whether the policy tag should exist.
+        type: str
+        choices: ['present', 'absent']
+        default: present
+      description:
+        description:
+        - The description of this policy tag.
+        type: str
+      policy_id:
+        description:
+        - Name or ID of the ILM policy that uses this tag.
+        type: str
+  max_concurrent_requests:
+    description:
+    - Maximum number of collections listed, or of independent objects changed, at the same time.
+    type: int
+    default: 8
+notes:
+  - Supports check mode, the plan then shows C(<created kind name>) for the IDs of objects still to create.
+  - StorageGRID has no transaction API. When a change fails, the changes depending on it and the deletes are not made,
+    and the module fails after the other changes are done, reporting the error of each object in I(plan).
+"""
+
+EXAMPLES = """
+- name: create a pool, an EC profile, two rules, a policy and its tag
+  netapp.storagegrid.na_sg_grid_ilm_bundle:
+    api_url: "https://<storagegrid-endpoint-url>"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    pools:
+      - name: Data Center 1
+        disks:
+          - group: 10
+        archives: []
+    ec_profiles:
+      - name: 2 plus 1 DC1
+        pool_id: Data Center 1
+        scheme_id: "1"
+    rules:
+      - name: EC DC1
+        placements:
+          - retention:
+              after: 0
+            erasureCoded:
+              - poolId: Data Center 1
+                profileId: 2 plus 1 DC1
+      - name: 2 Copies DC1
+        placements:
+          - retention:
+              after: 0
+            replicated:
+              - poolId: Data Center 1
+                copies: 2
+    policies:
+      - name: DC1 policy
+        reason: EC large objects, replicate the others
+        rules:
+          - EC DC1
+          - 2 Copies DC1
+        default_rule: 2 Copies DC1
+    policy_tags:
+      - name: dc1
+        description: Applies ILM policy 'DC1 policy'
+        policy_id: DC1 policy
+
+- name: delete an ILM rule and its pool
+  netapp.storagegrid.na_sg_grid_ilm_bundle:
+    api_url: "https://<storagegrid-endpoint-url>"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    rules:
+      - name: 2 Copies DC1
+        state: absent
+    pools:
+      - name: Data Center 1
+        state: absent
+"""
+
+RETURN = """
+plan:
+    description:
+      - One entry for each object of the bundle, in dependency order.
+      - I(action) is C(create), C(update), C(delete), C(deactivate) or C(none).
+      - I(before) is the current object, set for updates and deletes. I(after) is the request body, set for creates and updates.
+      - I(error) is only set when the change failed or was not made.
+    returned: always
+    type: list
+    elements: dict
+    sample: [
+        {
+            "kind": "ec_profiles",
+            "name": "2 plus 1 DC1",
+            "id": "5",
+            "action": "create",
+            "changed": true,
+            "after": {
+                "name": "2 plus 1 DC1",
+                "poolId": "p10771105546308032398",
+                "schemeId": "1"
+            }
+        }
+    ]
+"""
+
+import copy
+
+import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
+from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import SGRestAPI
+from ansible_collections.netapp.storagegrid.plugins.module_utils.tools import first_inside_second_dict_or_list, run_concurrently
+
+# in dependency order, each kind only references the kinds before it
+KINDS = ["pools", "ec_profiles", "rules", "policies", "policy_tags"]
+
+KIND_INFO = dict(
+    pools=dict(label="ILM pools", list_api="api/%s/private/ilm-pools", api="api/%s/private/ilm-pools", name_key="displayName"),
+    ec_profiles=dict(
+        label="EC profiles", list_api="api/%s/grid/ec-profiles?showDeactivated=true", api="api/%s/private/ec-profiles", name_key="name"
+    ),
+    rules=dict(label="ILM rules", list_api="api/%s/grid/ilm-rules", api="api/%s/grid/ilm-rules", name_key="displayName"),
+    policies=dict(label="ILM policies", list_api="api/%s/grid/ilm-policies", api="api/%s/grid/ilm-policies", name_key="name"),
+    policy_tags=dict(label="ILM policy tags", list_api="api/%s/grid/ilm-policy-tags", api="api/%s/grid/ilm-policy-tags", name_key="name"),
+)
+
+# kinds each kind references, and the kinds to list to plan it
+REFERENCES = dict(
+    pools=[],
+    ec_profiles=["pools"],
+    rules=["pools", "ec_profiles"],
+    policies=["rules"],
+    policy_tags=["policies"],
+)
+
+REQUIRED = dict(
+    pools=["disks", "archives"],
+    ec_profiles=["pool_id", "scheme_id"],
+    rules=["placements"],
+    policies=["default_rule", "rules"],
+    policy_tags=[],
+)
+
+SUBOPTION_ARGS = dict(
+    description=dict(required=False, type="str"),
+    group=dict(required=False, type="int"),
+    grade=dict(required=False, type="int"),
+    siteId=dict(required=False, type="str"),
+)
+
+CRITERIA_OPERATORS = [
+    "contains", "notContains", "equals", "notEquals", "startsWith", "notStartsWith", "endsWith", "notEndsWith",
+    "exists", "notExists", "lessThan", "lessThanOrEquals", "greaterThan", "greaterThanOrEquals",
+]
+
+
+class PendingId(object):
+    """ ID of an object created by the bundle, known once it is created """
+
+    def __init__(self, kind, name):
+        self.key = (kind, name)
+
+    def __str__(self):
+        return "<created %s %s>" % self.key
+
+
+def substitute(value, ids):
+    """ Return a copy of a request body, with the IDs of the created objects, or a placeholder if not created yet """
+    if isinstance(value, PendingId):
+        return ids.get(value.key) or str(value)
+    if isinstance(value, dict):
+        return dict((key, substitute(item, ids)) for key, item in value.items())
+    if isinstance(value, list):
+        return [substitute(item, ids) for item in value]
+    return value
+
+
+class SgGridIlmBundle(object):
+    """
+    Reconcile StorageGRID ILM pools, EC profiles, rules, policies and policy tags
+    """
+
+    def __init__(self):
+        """
+        Parse arguments, setup state variables,
+        check parameters and ensure request module is installed
+        """
+        self.argument_spec = netapp_utils.na_storagegrid_host_argument_spec()
+        self.argument_spec.update(
+            dict(
+                pools=dict(
+                    required=False,
+                    type="list",
+                    elements="dict",
+                    options=dict(
+                        name=dict(required=True, type="str"),
+                        state=dict(required=False, type="str", choices=["present", "absent"], default="present"),
+                        disks=dict(required=False, type="list", elements="dict", options=SUBOPTION_ARGS),
+                        archives=dict(required=False, type="list", elements="dict", options=SUBOPTION_ARGS),
+                    ),
+                ),
+                ec_profiles=dict(
+                    required=False,
+                    type="list",
+                    elements="dict",
+                    options=dict(
+                        name=dict(required=True, type="str"),
+                        state=dict(required=False, type="str", choices=["present", "absent"], default="present"),
+                        pool_id=dict(required=False, type="str"),
+                        scheme_id=dict(required=False, type="str"),
+                    ),
+                ),
+                rules=dict(
+                    required=False,
+                    type="list",
+                    elements="dict",
+                    options=dict(
+                        name=dict(required=True, type="str"),
+                        state=dict(required=False, type="str", choices=["present", "absent"], default="present"),
+                        bucket_filter=dict(
+                            required=False,
+                            type="dict",
+                            options=dict(
+                                operator=dict(required=True, type="str", choices=["contains", "endsWith", "equals", "startsWith"]),
+                                value=dict(required=True, type="str"),
+                            ),
+                        ),
+                        description=dict(required=False, type="str"),
+                        filters=dict(
+                            required=False,
+                            type="list",
+                            elements="dict",
+                            default=[],
+                            options=dict(
+                                logicalOperator=dict(required=False, type="str"),
+                                criteria=dict(
+                                    required=False,
+                                    type="list",
+                                    elements="dict",
+                                    options=dict(
+                                        operator=dict(required=True, type="str", choices=CRITERIA_OPERATORS),
+                                        metadataName=dict(required=True, type="str"),
+                                        metadataType=dict(required=False, type="str"),
+                                        value=dict(required=False, type="str"),
+                                    ),
+                                ),
+                            ),
+                        ),
+                        ingest_behavior=dict(required=False, type="str", choices=["strict", "balanced", "dual-commit"], default="balanced"),
+                        placements=dict(
+                            required=False,
+                            type="list",
+                            elements="dict",
+                            options=dict(
+                                retention=dict(
+                                    required=True,
+                                    type="dict",
+                                    options=dict(
+                                        after=dict(type="int", required=True),
+                                        duration=dict(type="int", required=False),
+                                    ),
+                                ),
+                                replicated=dict(
+                                    required=False,
+                                    type="list",
+                                    elements="dict",
+                                    options=dict(
+                                        poolId=dict(required=False, type="str"),
+                                        temporaryPoolId=dict(required=False, type="str"),
+                                        cloudStoragePoolId=dict(required=False, type="str"),
+                                        copies=dict(required=True, type="int"),
+                                    ),
+                                ),
+                                erasureCoded=dict(
+                                    required=False,
+                                    type="list",
+                                    elements="dict",
+                                    options=dict(profileId=dict(required=True, type="str"), poolId=dict(required=True, type="str")),
+                                ),
+                            ),
+                        ),
+                        reference_time=dict(
+                            required=False,
+                            type="str",
+                            choices=["ingestTime", "lastAccessTime", "noncurrentTime", "userDefinedCreationTime"],
+                            default="ingestTime",
+                        ),
+                        tenant_account_id=dict(required=False, type="str"),
+                    ),
+                ),
+                policies=dict(
+                    required=False,
+                    type="list",
+                    elements="dict",
+                    options=dict(
+                        name=dict(required=True, type="str"),
+                        state=dict(required=False, type="str", choices=["present", "absent"], default="present"),
+                        default_rule=dict(required=False, type="str"),
+                        reason=dict(required=False, type="str"),
+                        rules=dict(required=False, type="list", elements="str"),
+                    ),
+                ),
+                policy_tags=dict(
+                    required=False,
+                    type="list",
+                    elements="dict",
+                    options=dict(
+                        name=dict(required=True, type="str"),
+                        state=dict(required=False, type="str", choices=["present", "absent"], default="present"),
+                        description=dict(required=False, type="str"),
+                        policy_id=dict(required=False, type="str"),
+                    ),
+                ),
+                max_concurrent_requests=dict(required=False, type="int", default=8),
+            )
+        )
+
+        self.module = AnsibleModule(
+            argument_spec=self.argument_spec,
+            required_one_of=[KINDS],
+            supports_check_mode=True,
+        )
+
+        self.na_helper = NetAppModule()
+
+        # set up state variables
+        self.parameters = self.na_helper.set_parameters(self.module.params)
+        # Calling generic SG rest_api class
+        self.rest_api = SGRestAPI(self.module)
+        # Get API version
+        self.rest_api.get_sg_product_version()
+        self.api_version = self.rest_api.get_api_version()
+
+        # current objects by kind, by name and by ID
+        self.by_name = {}
+        self.by_id = {}
+        # planned changes by kind and name
+        self.planned = dict((kind, {}) for kind in KINDS)
+        # IDs of the objects created by the bundle
+        self.created_ids = {}
+
+    def get_collection(self, kind):
+        """ GET all the objects of a kind, called from a worker thread, return (records, error) """
+        response, error = self.rest_api.get(KIND_INFO[kind]["list_api"] % self.api_version)
+        if error:
+            return None, error
+        return response.get("data") or [], None
+
+    def get_collections(self):
+        """ List each collection used by the bundle once, concurrently, and index it by name and by ID """
+        kinds = set()
+        for kind in KINDS:
+            if self.parameters.get(kind):
+                kinds.add(kind)
+                kinds.update(REFERENCES[kind])
+        kinds = [kind for kind in KINDS if kind in kinds]
+        for kind, (records, error) in zip(kinds, run_concurrently(self.get_collection, kinds, self.parameters["max_concurrent_requests"])):
+            if error:
+                self.module.fail_json(msg=error)
+            name_key = KIND_INFO[kind]["name_key"]
+            self.by_id[kind] = dict((record["id"], record) for record in records)
+            self.by_name[kind] = {}
+            for record in records:
+                # deactivated EC profiles keep their name, and cannot be activated again
+                if kind == "ec_profiles" and not record.get("active", True):
+                    continue
+                self.by_name[kind][record[name_key]] = record
+
+    def resolve(self, kind, value, item, deps):
+        """ Return the ID of an object referenced by name or ID, or a PendingId when the bundle creates it """
+        if value is None:
+            return None
+        planned = self.planned[kind].get(value)
+        if planned is not None:
+            if planned["action"] == "create":
+                deps.add((kind, value))
+                return PendingId(kind, value)
+            if planned["state"] == "absent":
+                self.module.fail_json(msg="Error in %s for %s: %s %s is removed by the bundle." % (item["kind"], item["name"], kind, value))
+        if value in self.by_name[kind]:
+            return self.by_name[kind][value]["id"]
+        if value in self.by_id[kind]:
+            return value
+        self.module.fail_json(msg="Error in %s for %s: %s %s not found." % (item["kind"], item["name"], kind, value))
+
+    def build_pool_data(self, parameters, item, deps):
+        data = {"displayName": parameters["name"]}
+        if parameters.get("disks"):
+            data["disks"] = parameters["disks"]
+        if parameters.get("archives"):
+            data["archives"] = parameters["archives"]
+        return data
+
+    def build_ec_profile_data(self, parameters, item, deps):
+        data = {"name": parameters["name"]}
+        if parameters.get("pool_id"):
+            data["poolId"] = self.resolve("pools", parameters["pool_id"], item, deps)
+        if parameters.get("scheme_id"):
+            data["schemeId"] = parameters["scheme_id"]
+        return data
+
+    def build_rule_data(self, parameters, item, deps):
+        data = {"displayName": parameters["name"], "filters": parameters["filters"]}
+        if parameters.get("bucket_filter"):
+            data["bucketFilter"] = parameters["bucket_filter"]
+            # this deprecated parameter is required for PUT operations when bucketFilter is set
+            data["api"] = "s3OrSwift"
+        if parameters.get("description"):
+            data["description"] = parameters["description"]
+        if parameters.get("ingest_behavior"):
+            data["ingestBehavior"] = parameters["ingest_behavior"]
+        if parameters.get("placements"):
+            placements = copy.deepcopy(parameters["placements"])
+            for placement in placements:
+                for copies in (placement.get("replicated") or []) + (placement.get("erasureCoded") or []):
+                    for key in ("poolId", "temporaryPoolId"):
+                        if key in copies:
+                            copies[key] = self.resolve("pools", copies[key], item, deps)
+                    if "profileId" in copies:
+                        copies["profileId"] = self.resolve("ec_profiles", copies["profileId"], item, deps)
+            data["placements"] = placements
+        if parameters.get("reference_time"):
+            data["referenceTime"] = parameters["reference_time"]
+        if parameters.get("tenant_account_id"):
+            data["tenantAccountId"] = parameters["tenant_account_id"]
+        return data
+
+    def build_policy_data(self, parameters, item, deps):
+        data = {"name": parameters["name"]}
+        if parameters.get("rules"):
+            data["rules"] = [self.resolve("rules", rule, item, deps) for rule in parameters["rules"]]
+        if parameters.get("default_rule"):
+            data["defaultRule"] = self.resolve("rules", parameters["default_rule"], item, deps)
+        if parameters.get("reason"):
+            data["reason"] = parameters["reason"]
+        return data
+
+    def build_policy_tag_data(self, parameters, item, deps):
+        data = {"name": parameters["name"]}
+        if parameters.get("description"):
+            data["description"] = parameters["description"]
+        if parameters.get("policy_id"):
+            data["policyId"] = self.resolve("policies", parameters["policy_id"], item, deps)
+        return data
+
+    def is_modified(self, kind, current, data):
+        """ Same comparisons as the module of each kind, IDs still to create never match """
+        data = substitute(data, {})
+        if kind == "pools":
+            return any(
+                data.get(key) and not first_inside_second_dict_or_list(data[key], current.get(key) or [])
+                for key in ("disks", "archives")
+            )
+        if kind == "rules":
+            for key in ("filters", "placements"):
+                if data.get(key) and not first_inside_second_dict_or_list(data[key], current.get(key) or []):
+                    return True
+            keys = ["bucketFilter", "description", "ingestBehavior", "referenceTime", "tenantAccountId"]
+        elif kind == "ec_profiles":
+            keys = ["poolId", "schemeId"]
+        elif kind == "policies":
+            keys = ["reason", "rules", "defaultRule"]
+        else:
+            keys = ["description", "policyId"]
+        return any(data.get(key) and data[key] != current.get(key) for key in keys)
+
+    def plan_changes(self):
+        """
+        Compare each object of the bundle with the current objects, in dependency order, and return the list of changes.
+        Each change is a dict with kind, name, state, action, the current object, the request body, and the
+        keys of the created objects it depends on.
+        """
+        builders = dict(
+            pools=self.build_pool_data,
+            ec_profiles=self.build_ec_profile_data,
+            rules=self.build_rule_data,
+            policies=self.build_policy_data,
+            policy_tags=self.build_policy_tag_data,
+        )
+        changes = []
+        for kind in KINDS:
+            for parameters in self.parameters.get(kind) or []:
+                name = parameters["name"]
+                if name in self.planned[kind]:
+                    self.module.fail_json(msg="Error in %s: %s is listed more than once." % (kind, name))
+                current = self.by_name[kind].get(name)
+                change = dict(kind=kind, name=name, state=parameters["state"], action=None, current=current, data=None, deps=set())
+
+                if parameters["state"] == "absent":
+                    if current is not None:
+                        change["action"] = "deactivate" if kind == "ec_profiles" else "delete"
+                else:
+                    missing = [option for option in REQUIRED[kind] if parameters.get(option) is None]
+                    if missing:
+                        self.module.fail_json(msg="Error in %s for %s: state is present but all of the following are missing: %s"
+                                              % (kind, name, ", ".join(missing)))
+                    change["data"] = builders[kind](parameters, change, change["deps"])
+                    if current is None:
+                        change["action"] = "create"
+                    elif self.is_modified(kind, current, change["data"]):
+                        change["action"] = "update"
+                        if kind in ("pools", "policy_tags"):
+                            change["data"]["id"] = current["id"]
+                self.planned[kind][name] = change
+                changes.append(change)
+        return changes
+
+    def apply_change(self, change):
+        """
+        Apply the change of one object, called from a worker thread.
+        Errors are reported in the change rather than with fail_json, so the independent changes carry on.
+        """
+        api = KIND_INFO[change["kind"]]["api"] % self.api_version
+        data = substitute(change["data"], self.created_ids)
+        if change["action"] == "create":
+            response, error = self.rest_api.post(api, data)
+            if not error:
+                self.created_ids[(change["kind"], change["name"])] = response["data"]["id"]
+        elif change["action"] == "update":
+            response, error = self.rest_api.put("%s/%s" % (api, change["current"]["id"]), data)
+        elif change["action"] == "deactivate":
+            response, error = self.rest_api.post("%s/%s/deactivate" % (api, change["current"]["id"]), None)
+        else:
+            response, error = self.rest_api.delete("%s/%s" % (api, change["current"]["id"]), None)
+        if error:
+            change["error"] = str(error)
+
+    def run_changes(self, changes):
+        """
+        Creates and updates run in waves: a change runs once the objects it references are created,
+        and the changes of a wave run concurrently. Deletes follow in reverse dependency order.
+        """
+        max_workers = self.parameters["max_concurrent_requests"]
+        done = set()
+        failed = set()
+        pending = [change for change in changes if change["action"] in ("create", "update")]
+        while pending:
+            for change in pending:
+                failed_deps = sorted(change["deps"] & failed)
+                if failed_deps:
+                    change["error"] = "not applied, %s %s was not created" % failed_deps[0]
+                    failed.add((change["kind"], change["name"]))
+            pending = [change for change in pending if "error" not in change]
+            wave = [change for change in pending if change["deps"] <= done]
+            run_concurrently(self.apply_change, wave, max_workers)
+            for change in wave:
+                (failed if "error" in change else done).add((change["kind"], change["name"]))
+            pending = [change for change in pending if change not in wave]
+
+        removals = [change for change in changes if change["action"] in ("delete", "deactivate")]
+        for kind in reversed(KINDS):
+            wave = [change for change in removals if change["kind"] == kind]
+            if failed:
+                for change in wave:
+                    change["error"] = "not applied, an earlier change failed"
+                continue
+            run_concurrently(self.apply_change, wave, max_workers)
+            failed.update((change["kind"], change["name"]) for change in wave if "error" in change)
+
+    def build_plan(self, changes):
+        plan = []
+        for change in changes:
+            current = change["current"]
+            entry = dict(
+                kind=change["kind"],
+                name=change["name"],
+                id=self.created_ids.get((change["kind"], change["name"])) or (current["id"] if current else None),
+                action=change["action"] or "none",
+                changed=bool(change["action"]) and "error" not in change,
+            )
+            if change["action"] in ("update", "delete", "deactivate"):
+                entry["before"] = current
+            if change["action"] in ("create", "update"):
+                entry["after"] = substitute(change["data"], self.created_ids)
+            if "error" in change:
+                entry["error"] = change["error"]
+            plan.append(entry)
+        return plan
+
+    def apply(self):
+        """
+        Perform pre-checks, call functions and exit
+        """
+        self.get_collections()
+        changes = self.plan_changes()
+        if not self.module.check_mode:
+            self.run_changes(changes)
+        plan = self.build_plan(changes)
+
+        changed = any(entry["changed"] for entry in plan)
+        counts = []
+        for kind in KINDS:
+            for action in ("create", "update", "delete", "deactivate"):
+                count = len([entry for entry in plan if entry["kind"] == kind and entry["action"] == action and entry["changed"]])
+                if count:
+                    counts.append("%d %s %sd" % (count, KIND_INFO[kind]["label"], action))
+        failed = [entry for entry in plan if "error" in entry]
+        if failed:
+            msg = "Error applying %d of %d ILM changes: %s" % (
+                len(failed),
+                len([entry for entry in plan if entry["action"] != "none"]),
+                "; ".join("%s %s: %s" % (entry["kind"], entry["name"], entry["error"]) for entry in failed),
+            )
+            self.module.fail_json(msg=msg, changed=changed, plan=plan)
+        self.module.exit_json(changed=changed, msg="; ".join(counts), plan=plan)
+
+
+def main():
+    """
+    Main function
+    """
+    na_sg_grid_ilm_bundle = SgGridIlmBundle()
+    na_sg_grid_ilm_bundle.apply()
+
+
+if __name__ == "__main__":
+    main()
@@ -56,6 +56,17 @@ options:
     type: str
     choices: ['present', 'absent']
     default: present
+  log_level:
+    description:
+    - Level of the messages returned in I(log).
+    - With C(debug), the parameters, request bodies and the objects listed from StorageGRID are also logged,
+      which can be large on grids with many ILM objects.
+    - The log is truncated to 64 KiB.
+    required: false
+    type: str
+    choices: ['error', 'warning', 'info', 'debug']
+    default: info
+    version_added: '21.18.0'
   validate_certs:
     description:
     - Should https certificates be validated?
@@ -102,14 +113,11 @@ resp:
     }
 """
 
-from datetime import datetime
-
 import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import SGRestAPI
-
-__LOGGING__ = []
+from ansible_collections.netapp.storagegrid.plugins.module_utils.logger import ModuleLogger, log_level_argument_spec
 
 
 class ILM_policy(object):
@@ -132,6 +140,7 @@ class ILM_policy(object):
                 rules=dict(required=False, type="list", elements="str"),
             )
         )
+        self.argument_spec.update(log_level_argument_spec())
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
             required_if=[("state", "present", ["default_rule", "rules"])],
@@ -141,7 +150,8 @@ class ILM_policy(object):
 
         # set up state variables
         self.parameters = self.na_helper.set_parameters(self.module.params)
-        __LOGGING__.append("params: %s" % (self.module.params))
+        self.logger = ModuleLogger(self.module, self.parameters["log_level"])
+        self.logger.debug_params()
         # Calling generic SG rest_api class
         self.rest_api = SGRestAPI(self.module)
         # Get API version
@@ -158,16 +168,7 @@ class ILM_policy(object):
         # optional parameters
         if self.parameters.get("reason"):
             self.data["reason"] = self.parameters.get("reason")
-        __LOGGING__.append("data: %s" % (self.data))
-
-    def module_logging_handler(self, log_msg):
-        """Module logging handler"""
-        # Create timestamp for logs
-        date_now = datetime.now()
-        timestamp = date_now.strftime("%Y/%m/%d-%H:%M:%S")
-        # Log events
-        self.module.log(log_msg)
-        __LOGGING__.append("%s: %s" % (timestamp, log_msg))
+        self.logger.debug("data: %s", self.data)
 
     def get_ilm_policy(self):
         # Check if policy exists
@@ -176,8 +177,8 @@ class ILM_policy(object):
         response, error = self.rest_api.get(api)
 
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
-        self.module_logging_handler("all ILM policies: %s" % (response['data']))
+            self.module.fail_json(msg=error, log=self.logger.entries)
+        self.logger.debug("all ILM policies: %s", response['data'])
         # if policy with 'name' exists, return it, else none
         for policy in response["data"]:
             if policy["name"] == self.parameters["name"]:
@@ -187,30 +188,30 @@ class ILM_policy(object):
         return None
 
     def create_ilm_policy(self):
-        __LOGGING__.append("creating ILM policy with payload: %s" % (self.data))
+        self.logger.debug("creating ILM policy with payload: %s", self.data)
         api = "api/%s/grid/ilm-policies" % self.api_version
         response, error = self.rest_api.post(api, self.data)
 
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
 
         return response["data"]
 
     def delete_ilm_policy(self):
-        __LOGGING__.append("deleting ILM policy")
+        self.logger.info("deleting ILM policy")
         api = "api/%s/grid/ilm-policies/%s" % (self.api_version, self.id)
 
         response, error = self.rest_api.delete(api, None)
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
 
     def update_ilm_policy(self):
-        __LOGGING__.append("updating ILM policy with payload: %s" % self.data)
+        self.logger.debug("updating ILM policy with payload: %s", self.data)
         api = "api/%s/grid/ilm-policies/%s" % (self.api_version, self.id)
         response, error = self.rest_api.put(api, self.data)
 
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
 
         return response["data"]
 
@@ -220,7 +221,7 @@ class ILM_policy(object):
         """
 
         ilm_policy = self.get_ilm_policy()
-        self.module_logging_handler("got matching ILM policys: %s" % ilm_policy)
+        self.logger.debug("got matching ILM policys: %s", ilm_policy)
 
         cd_action = self.na_helper.get_cd_action(ilm_policy, self.parameters)
 
@@ -243,19 +244,19 @@ class ILM_policy(object):
                     self.delete_ilm_policy()
                     resp_data = None
                     result_message = "ILM policy deleted"
-                    __LOGGING__.append("ILM policy deleted")
+                    self.logger.info("ILM policy deleted")
 
                 elif cd_action == "create":
                     resp_data = self.create_ilm_policy()
                     result_message = "ILM policy created"
-                    __LOGGING__.append("ILM policy created")
+                    self.logger.info("ILM policy created")
 
                 else:
                     resp_data = self.update_ilm_policy()
                     result_message = "ILM policy updated"
-                    __LOGGING__.append("ILM policy updated")
+                    self.logger.info("ILM policy updated")
 
-        self.module.exit_json(changed=self.na_helper.changed, msg=result_message, resp=resp_data, log=__LOGGING__)
+        self.module.exit_json(changed=self.na_helper.changed, msg=result_message, resp=resp_data, log=self.logger.entries)
 
 
 def main():
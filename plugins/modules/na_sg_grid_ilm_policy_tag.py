@@ -53,6 +53,17 @@ options:
     type: str
     choices: ['present', 'absent']
     default: present
+  log_level:
+    description:
+    - Level of the messages returned in I(log).
+    - With C(debug), the parameters, request bodies and the objects listed from StorageGRID are also logged,
+      which can be large on grids with many ILM objects.
+    - The log is truncated to 64 KiB.
+    required: false
+    type: str
+    choices: ['error', 'warning', 'info', 'debug']
+    default: info
+    version_added: '21.18.0'
   validate_certs:
     description:
     - Should https certificates be validated?
@@ -91,14 +102,11 @@ resp:
     }
 """
 
-from datetime import datetime
-
 import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import SGRestAPI
-
-__LOGGING__ = []
+from ansible_collections.netapp.storagegrid.plugins.module_utils.logger import ModuleLogger, log_level_argument_spec
 
 
 class ILM_policy_tag(object):
@@ -120,6 +128,7 @@ class ILM_policy_tag(object):
                 policy_id=dict(required=False, type="str"),
             )
         )
+        self.argument_spec.update(log_level_argument_spec())
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
             supports_check_mode=True,
@@ -128,7 +137,8 @@ class ILM_policy_tag(object):
 
         # set up state variables
         self.parameters = self.na_helper.set_parameters(self.module.params)
-        __LOGGING__.append("params: %s" % (self.module.params))
+        self.logger = ModuleLogger(self.module, self.parameters["log_level"])
+        self.logger.debug_params()
         # Calling generic SG rest_api class
         self.rest_api = SGRestAPI(self.module)
         # Get API version
@@ -142,16 +152,7 @@ class ILM_policy_tag(object):
             self.data["description"] = self.parameters["description"]
         if self.parameters.get("policy_id"):
             self.data["policyId"] = self.parameters["policy_id"]
-        __LOGGING__.append("data: %s" % (self.data))
-
-    def module_logging_handler(self, log_msg):
-        """Module logging handler"""
-        # Create timestamp for logs
-        date_now = datetime.now()
-        timestamp = date_now.strftime("%Y/%m/%d-%H:%M:%S")
-        # Log events
-        self.module.log(log_msg)
-        __LOGGING__.append("%s: %s" % (timestamp, log_msg))
+        self.logger.debug("data: %s", self.data)
 
     def get_ILM_policy_tags(self):
         # Check if policy tag exists
@@ -159,8 +160,8 @@ class ILM_policy_tag(object):
         api = "api/%s/grid/ilm-policy-tags" % self.api_version
         response, error = self.rest_api.get(api)
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
-        self.module_logging_handler("all ILM policy tags: %s" % (response["data"]))
+            self.module.fail_json(msg=error, log=self.logger.entries)
+        self.logger.debug("all ILM policy tags: %s", response["data"])
         # if ILM policy tag with 'name' exists, return it, else none
         for tag in response["data"]:
             if tag["name"] == self.parameters["name"]:
@@ -170,26 +171,26 @@ class ILM_policy_tag(object):
         return None
 
     def create_ILM_policy_tag(self):
-        __LOGGING__.append("creating ILM policy tag with payload: %s" % (self.data))
+        self.logger.debug("creating ILM policy tag with payload: %s", self.data)
         api = "api/%s/grid/ilm-policy-tags" % self.api_version
         response, error = self.rest_api.post(api, self.data)
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
         return response["data"]
 
     def delete_ILM_policy_tag(self):
-        __LOGGING__.append("deleting ILM policy tag")
+        self.logger.info("deleting ILM policy tag")
         api = "api/%s/grid/ilm-policy-tags/%s" % (self.api_version, self.id)
         response, error = self.rest_api.delete(api, None)
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
 
     def update_ILM_policy_tag(self):
-        __LOGGING__.append("updating ILM policy tag with payload: %s" % (self.data))
+        self.logger.debug("updating ILM policy tag with payload: %s", self.data)
         api = "api/%s/grid/ilm-policy-tags/%s" % (self.api_version, self.id)
         response, error = self.rest_api.put(api, self.data)
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
         return response["data"]
 
     def apply(self):
@@ -198,7 +199,7 @@ class ILM_policy_tag(object):
         """
 
         ILM_policy_tag = self.get_ILM_policy_tags()
-        self.module_logging_handler("got matching ILM policy tag: %s" % (ILM_policy_tag))
+        self.logger.debug("got matching ILM policy tag: %s", ILM_policy_tag)
 
         cd_action = self.na_helper.get_cd_action(ILM_policy_tag, self.parameters)
 
@@ -219,19 +220,19 @@ class ILM_policy_tag(object):
                     self.delete_ILM_policy_tag()
                     resp_data = None
                     result_message = "ILM policy tag deleted"
-                    __LOGGING__.append("ILM policy tag deleted")
+                    self.logger.info("ILM policy tag deleted")
 
                 elif cd_action == "create":
                     resp_data = self.create_ILM_policy_tag()
                     result_message = "ILM policy tag created"
-                    __LOGGING__.append("ILM policy tag created")
+                    self.logger.info("ILM policy tag created")
 
                 else:
                     resp_data = self.update_ILM_policy_tag()
                     result_message = "ILM policy tag updated"
-                    __LOGGING__.append("ILM policy tag updated")
+                    self.logger.info("ILM policy tag updated")
 
-        self.module.exit_json(changed=self.na_helper.changed, msg=result_message, resp=resp_data, log=__LOGGING__)
+        self.module.exit_json(changed=self.na_helper.changed, msg=result_message, resp=resp_data, log=self.logger.entries)
 
 
 def main():
@@ -99,6 +99,17 @@ options:
     type: str
     choices: ['present', 'absent']
     default: present
+  log_level:
+    description:
+    - Level of the messages returned in I(log).
+    - With C(debug), the parameters, request bodies and the objects listed from StorageGRID are also logged,
+      which can be large on grids with many ILM objects.
+    - The log is truncated to 64 KiB.
+    required: false
+    type: str
+    choices: ['error', 'warning', 'info', 'debug']
+    default: info
+    version_added: '21.18.0'
   validate_certs:
     description:
     - Should https certificates be validated?
@@ -145,16 +156,13 @@ resp:
     }
 """
 
-from datetime import datetime
-
 import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import SGRestAPI
+from ansible_collections.netapp.storagegrid.plugins.module_utils.logger import ModuleLogger, log_level_argument_spec
 from ansible_collections.netapp.storagegrid.plugins.module_utils.tools import first_inside_second_dict_or_list
 
-__LOGGING__ = []
-
 
 class ILM_pool(object):
     """
@@ -195,6 +203,7 @@ class ILM_pool(object):
                 ),
             )
         )
+        self.argument_spec.update(log_level_argument_spec())
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
             required_if=[("state", "present", ["disks", "archives"])],
@@ -204,7 +213,8 @@ class ILM_pool(object):
 
         # set up state variables
         self.parameters = self.na_helper.set_parameters(self.module.params)
-        __LOGGING__.append("params: %s" % self.module.params)
+        self.logger = ModuleLogger(self.module, self.parameters["log_level"])
+        self.logger.debug_params()
         # Calling generic SG rest_api class
         self.rest_api = SGRestAPI(self.module)
         # Get API version
@@ -218,16 +228,7 @@ class ILM_pool(object):
             self.data["disks"] = self.parameters["disks"]
         if self.parameters.get("archives"):
             self.data["archives"] = self.parameters["archives"]
-        __LOGGING__.append("data: %s" % self.data)
-
-    def module_logging_handler(self, log_msg):
-        """Module logging handler"""
-        # Create timestamp for logs
-        date_now = datetime.now()
-        timestamp = date_now.strftime("%Y/%m/%d-%H:%M:%S")
-        # Log events
-        self.module.log(log_msg)
-        __LOGGING__.append("%s: %s" % (timestamp, log_msg))
+        self.logger.debug("data: %s", self.data)
 
     def get_ilm_pools(self):
         # Check if profile exists
@@ -235,8 +236,8 @@ class ILM_pool(object):
         api = "api/%s/private/ilm-pools" % self.api_version
         response, error = self.rest_api.get(api)
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
-        self.module_logging_handler("all ILM pools: %s" % response['data'])
+            self.module.fail_json(msg=error, log=self.logger.entries)
+        self.logger.debug("all ILM pools: %s", response['data'])
         # if ILM pool with 'name' exists, return it, else none
         for pool in response["data"]:
             if pool["displayName"] == self.parameters["name"]:
@@ -246,26 +247,26 @@ class ILM_pool(object):
         return None
 
     def create_ilm_pool(self):
-        __LOGGING__.append("creating ILM pool with payload: %s" % self.data)
+        self.logger.debug("creating ILM pool with payload: %s", self.data)
         api = "api/%s/private/ilm-pools" % self.api_version
         response, error = self.rest_api.post(api, self.data)
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
         return response["data"]
 
     def delete_ilm_pool(self):
-        __LOGGING__.append("deactivating ILM pool")
+        self.logger.info("deactivating ILM pool")
         api = "api/%s/private/ilm-pools/%s" % (self.api_version, self.id)
         response, error = self.rest_api.delete(api, None)
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
 
     def update_ilm_pool(self):
-        __LOGGING__.append("updating ILM pool with payload: %s" % self.data)
+        self.logger.debug("updating ILM pool with payload: %s", self.data)
         api = "api/%s/private/ilm-pools/%s" % (self.api_version, self.id)
         response, error = self.rest_api.put(api, self.data)
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
         return response["data"]
 
     def apply(self):
@@ -274,7 +275,7 @@ class ILM_pool(object):
         """
 
         ilm_pool = self.get_ilm_pools()
-        self.module_logging_handler("got matching ILM pool: %s" % ilm_pool)
+        self.logger.debug("got matching ILM pool: %s", ilm_pool)
 
         cd_action = self.na_helper.get_cd_action(ilm_pool, self.parameters)
 
@@ -295,19 +296,19 @@ class ILM_pool(object):
                     self.delete_ilm_pool()
                     resp_data = None
                     result_message = "ILM pool deleted"
-                    __LOGGING__.append("ILM pool deleted")
+                    self.logger.info("ILM pool deleted")
 
                 elif cd_action == "create":
                     resp_data = self.create_ilm_pool()
                     result_message = "ILM pool created"
-                    __LOGGING__.append("ILM pool created")
+                    self.logger.info("ILM pool created")
 
                 else:
                     resp_data = self.update_ilm_pool()
                     result_message = "ILM pool updated"
-                    __LOGGING__.append("ILM pool updated")
+                    self.logger.info("ILM pool updated")
 
-        self.module.exit_json(changed=self.na_helper.changed, msg=result_message, resp=resp_data, log=__LOGGING__)
+        self.module.exit_json(changed=self.na_helper.changed, msg=result_message, resp=resp_data, log=self.logger.entries)
 
 
 def main():
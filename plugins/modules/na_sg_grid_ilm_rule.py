@@ -199,6 +199,17 @@ options:
     - If omitted, applies to all objects
     required: false
     type: str
+  log_level:
+    description:
+    - Level of the messages returned in I(log).
+    - With C(debug), the parameters, request bodies and the objects listed from StorageGRID are also logged,
+      which can be large on grids with many ILM objects.
+    - The log is truncated to 64 KiB.
+    required: false
+    type: str
+    choices: ['error', 'warning', 'info', 'debug']
+    default: info
+    version_added: '21.18.0'
   validate_certs:
     description:
     - Should https certificates be validated?
@@ -268,16 +279,13 @@ resp:
     }
 """
 
-from datetime import datetime
-
 import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import SGRestAPI
+from ansible_collections.netapp.storagegrid.plugins.module_utils.logger import ModuleLogger, log_level_argument_spec
 from ansible_collections.netapp.storagegrid.plugins.module_utils.tools import first_inside_second_dict_or_list
 
-__LOGGING__ = []
-
 
 class ILM_rule(object):
     """
@@ -384,6 +392,7 @@ class ILM_rule(object):
                 tenant_account_id=dict(required=False, type="str"),
             )
         )
+        self.argument_spec.update(log_level_argument_spec())
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
             required_if=[("state", "present", ["placements"])],
@@ -393,7 +402,8 @@ class ILM_rule(object):
 
         # set up state variables
         self.parameters = self.na_helper.set_parameters(self.module.params)
-        __LOGGING__.append("params: %s" % (self.module.params))
+        self.logger = ModuleLogger(self.module, self.parameters["log_level"])
+        self.logger.debug_params()
         # Calling generic SG rest_api class
         self.rest_api = SGRestAPI(self.module)
         # Get API version
@@ -418,16 +428,7 @@ class ILM_rule(object):
             self.data["referenceTime"] = self.parameters.get("reference_time")
         if self.parameters.get("tenant_account_id"):
             self.data["tenantAccountId"] = self.parameters.get("tenant_account_id")
-        __LOGGING__.append("data: %s" % (self.data))
-
-    def module_logging_handler(self, log_msg):
-        """Module logging handler"""
-        # Create timestamp for logs
-        date_now = datetime.now()
-        timestamp = date_now.strftime("%Y/%m/%d-%H:%M:%S")
-        # Log events
-        self.module.log(log_msg)
-        __LOGGING__.append("%s: %s" % (timestamp, log_msg))
+        self.logger.debug("data: %s", self.data)
 
     def get_ilm_rule(self):
         # Check if rule exists
@@ -436,8 +437,8 @@ class ILM_rule(object):
         response, error = self.rest_api.get(api)
 
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
-        self.module_logging_handler("all ILM rules: %s" % (response["data"]))
+            self.module.fail_json(msg=error, log=self.logger.entries)
+        self.logger.debug("all ILM rules: %s", response["data"])
         # if rule with 'name' exists, return it, else none
         for rule in response["data"]:
             if rule["displayName"] == self.parameters["name"]:
@@ -447,30 +448,30 @@ class ILM_rule(object):
         return None
 
     def create_ilm_rule(self):
-        __LOGGING__.append("creating ILM rule with payload: %s" % (self.data))
+        self.logger.debug("creating ILM rule with payload: %s", self.data)
         api = "api/%s/grid/ilm-rules" % self.api_version
         response, error = self.rest_api.post(api, self.data)
 
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
 
         return response["data"]
 
     def delete_ilm_rule(self):
-        __LOGGING__.append("deleting ILM rule")
+        self.logger.info("deleting ILM rule")
         api = "api/%s/grid/ilm-rules/%s" % (self.api_version, self.id)
 
         response, error = self.rest_api.delete(api, None)
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
 
     def update_ilm_rule(self):
-        __LOGGING__.append("updating ILM rule with payload: %s" % (self.data))
+        self.logger.debug("updating ILM rule with payload: %s", self.data)
         api = "api/%s/grid/ilm-rules/%s" % (self.api_version, self.id)
         response, error = self.rest_api.put(api, self.data)
 
         if error:
-            self.module.fail_json(msg=error, log=__LOGGING__)
+            self.module.fail_json(msg=error, log=self.logger.entries)
 
         return response["data"]
 
@@ -480,7 +481,7 @@ class ILM_rule(object):
         """
 
         ilm_rule = self.get_ilm_rule()
-        self.module_logging_handler("got matching ILM rules: %s" % (ilm_rule))
+        self.logger.debug("got matching ILM rules: %s", ilm_rule)
 
         cd_action = self.na_helper.get_cd_action(ilm_rule, self.parameters)
 
@@ -511,19 +512,19 @@ class ILM_rule(object):
                     self.delete_ilm_rule()
                     resp_data = None
                     result_message = "ILM rule deleted"
-                    __LOGGING__.append("ILM rule deleted")
+                    self.logger.info("ILM rule deleted")
 
                 elif cd_action == "create":
                     resp_data = self.create_ilm_rule()
                     result_message = "ILM rule created"
-                    __LOGGING__.append("ILM rule created")
+                    self.logger.info("ILM rule created")
 
                 else:
                     resp_data = self.update_ilm_rule()
                     result_message = "ILM rule updated"
-                    __LOGGING__.append("ILM rule updated")
+                    self.logger.info("ILM rule updated")
 
-        self.module.exit_json(changed=self.na_helper.changed, msg=result_message, resp=resp_data, log=__LOGGING__)
+        self.module.exit_json(changed=self.na_helper.changed, msg=result_message, resp=resp_data, log=self.logger.entries)
 
 
 def main():
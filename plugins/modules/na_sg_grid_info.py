@@ -25,6 +25,55 @@ description:
 version_added: 20.11.0
 
 options:
+    api_url:
+        description:
+        - The url to the StorageGRID Admin Node REST API, or a list of urls of admin nodes of the same grid.
+        - Required unless I(grids) is set.
+        required: false
+        type: list
+        elements: str
+    auth_token:
+        description:
+        - The authorization token for the API request.
+        - Required unless I(grids) is set.
+        required: false
+        type: str
+    grids:
+        description:
+        - Gather the same subsets from several grids at once, instead of the grid of I(api_url).
+        - The grids are queried concurrently, and I(grids) is returned instead of I(sg_info), keyed by grid.
+        - An error on a grid does not stop the others, the result of the grid holds C(failed) and C(msg),
+          and the module only fails when every grid fails.
+        - Mutually exclusive with I(api_url), I(auth_token), I(snapshot) and I(dest).
+        type: list
+        elements: dict
+        version_added: '21.18.0'
+        suboptions:
+            name:
+                description:
+                - Key of the grid in the results, defaults to I(api_url).
+                type: str
+            api_url:
+                description:
+                - The url to the StorageGRID Admin Node REST API of the grid, or a list of urls of its admin nodes.
+                type: list
+                elements: str
+                required: true
+            auth_token:
+                description:
+                - The authorization token of the grid.
+                type: str
+                required: true
+            validate_certs:
+                description:
+                - Should https certificates be validated, defaults to I(validate_certs).
+                type: bool
+    max_concurrent_grids:
+        description:
+        - Maximum number of I(grids) queried at the same time.
+        type: int
+        default: 12
+        version_added: '21.18.0'
     gather_subset:
         type: list
         elements: str
@@ -84,11 +133,109 @@ options:
             - C(grid_vlan_interfaces_info) or C(grid/vlan-interfaces)
             - C(versions_info) or C(versions)
             - Can specify a list of values to include a larger subset.
-        default: all
+            - Defaults to C(all), or to the subsets listed in I(subset_options) when it is set.
     parameters:
         description:
         - Allows for any rest option to be passed in.
+        - Applied to every subset, see I(subset_options) for the parameters of one subset.
         type: dict
+    subset_options:
+        description:
+        - Query parameters, fields and filters of individual subsets.
+        - The subsets listed here are gathered in addition to I(gather_subset).
+        - With I(fields) or I(filters), the response is decoded item by item, only the selected fields of the
+          matching items are kept, and only the C(data) member of the response is returned.
+        type: list
+        elements: dict
+        version_added: '21.18.0'
+        suboptions:
+            subset:
+                description:
+                - Subset the options apply to, either the info name or the REST API.
+                type: str
+                required: true
+            fields:
+                description:
+                - Fields to keep in each item, as dotted paths such as C(policy.quotaObjectBytes).
+                - A path going through a list keeps the field in each element of the list.
+                - By default, items are returned whole.
+                type: list
+                elements: str
+            filters:
+                description:
+                - Keep the items matching all the filters.
+                - A filter is a path, true when the value is present and not null, or C(path operator value),
+                  where the operator is one of C(==), C(!=), C(<), C(<=), C(>), C(>=), or C(=~) for a regular expression search.
+                - The value is a JSON literal, such as C(10), C(true), C(null) or C("text"), or a bare string.
+                - When a path reaches a list, the filter is true if it holds for any element.
+                - For a subset returning an object rather than a list, C(data) is null when the object does not match.
+                type: list
+                elements: str
+            parameters:
+                description:
+                - REST API query parameters of this subset, such as C(limit), C(marker) or C(include).
+                - They are merged over I(parameters).
+                type: dict
+    snapshot:
+        description:
+        - Path of a snapshot file, on the host running the module, holding content hashes of the gathered subsets.
+        - When set, I(sg_info) only holds the subsets that changed since the snapshot was written.
+        - For a list subset, only the added and modified items are returned in C(data), along with the keys of
+          the C(added), C(modified) and C(removed) items.  Items are identified by their C(id), C(name), C(uniqueName)
+          or C(key), or by their content when they have none of these.
+        - The snapshot is created on the first run, when every gathered subset is returned, and it is replaced
+          atomically after each run where a subset changed, except in check mode.
+        - C(changed) is true when a subset changed, and the snapshot was or, in check mode, would be updated.
+        - Subsets that are not gathered keep their entry in the snapshot.
+        type: path
+        version_added: '21.18.0'
+    dest:
+        description:
+        - Path of a gzip compressed NDJSON file, on the host running the module, the gathered subsets are written to
+          instead of being returned in I(sg_info).
+        - Each item of a list subset is written on its own line, a JSON object with the C(subset) name and the C(item),
+          as the response is decoded, so a large subset is never held in memory.
+        - Other subsets are written on one line, with the C(subset) name and its C(data).
+        - I(fields) and I(filters) of I(subset_options) apply to the written items.
+        - The file is written to a temporary file in the same directory and renamed when complete.
+        - A new file is created with mode C(0600), as subsets may hold credentials, a replaced file keeps its mode.
+        - In check mode, the items are counted and hashed but the file is not written.
+        - An existing file with the same lines is kept, C(changed) is true when the file was or, in check mode, would be replaced.
+        - Mutually exclusive with I(snapshot).
+        type: path
+        version_added: '21.18.0'
+    cache:
+        description:
+        - Cache the responses of the subsets that rarely change in a local directory, on the host running the module,
+          and return them without a request while they are younger than their time to live.
+        - By default, C(grid/config/product-version), C(grid/ec-profiles), C(grid/license) and C(grid/regions) are cached
+          for an hour and C(grid/versions) for a day, other subsets are always requested.
+        - The product version, requested by every run to choose the API version, is cached with the
+          time to live of C(grid/config/product-version).
+        - Entries are keyed by I(api_url), subset and query parameters, and are replaced atomically,
+          so concurrent tasks can share the directory.
+        - Subsets with I(fields) or I(filters) in I(subset_options), and subsets written to I(dest), are not cached.
+        type: dict
+        version_added: '21.18.0'
+        suboptions:
+            path:
+                description:
+                - Directory of the cache, created if it does not exist.
+                - Entries are only readable by the user running the module.
+                type: path
+                required: true
+            ttl:
+                description:
+                - Time to live in seconds by subset, the info name or the REST API, merged over the defaults.
+                - A time to live of C(0) disables the cache for the subset.
+                type: dict
+            stale_if_error:
+                description:
+                - Number of seconds an expired entry can still be returned, with a warning, when the request fails.
+                - Modules do not run between tasks, so an expired entry is not refreshed in the background,
+                  it is refreshed by the next request that succeeds.
+                type: int
+                default: 0
 """
 
 EXAMPLES = """
@@ -129,12 +276,80 @@ EXAMPLES = """
     parameters:
       limit: 5
   register: sg_grid_info
+
+- name: Gather the ID, name and quota of the S3 tenants with a quota, reading up to 1000 tenants
+  netapp.storagegrid.na_sg_grid_info:
+    api_url: "https://1.2.3.4/"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    subset_options:
+      - subset: grid/accounts
+        fields:
+          - id
+          - name
+          - policy.quotaObjectBytes
+        filters:
+          - "capabilities == s3"
+          - "policy.quotaObjectBytes != null"
+        parameters:
+          limit: 1000
+  register: sg_grid_info
+
+- name: Return the tenants and nodes that changed since the previous run
+  netapp.storagegrid.na_sg_grid_info:
+    api_url: "https://1.2.3.4/"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    gather_subset:
+      - grid/accounts
+      - grid/node-health
+    snapshot: /var/lib/storagegrid/grid_info.snapshot
+  register: sg_grid_changes
+
+- name: Gather StorageGRID Grid info, caching the license for a day and the node health for a minute
+  netapp.storagegrid.na_sg_grid_info:
+    api_url: "https://1.2.3.4/"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    cache:
+      path: /var/cache/storagegrid
+      ttl:
+        grid/license: 86400
+        grid_health_info: 60
+      stale_if_error: 3600
+  register: sg_grid_info
+
+- name: Gather the tenants and the health of several grids in one task
+  netapp.storagegrid.na_sg_grid_info:
+    validate_certs: false
+    grids:
+      - name: east
+        api_url: "https://1.2.3.4/"
+        auth_token: "{{ east_auth_token }}"
+      - name: west
+        api_url: "https://5.6.7.8/"
+        auth_token: "{{ west_auth_token }}"
+    gather_subset:
+      - grid/accounts
+      - grid/health
+  register: sg_grids_info
+
+- name: Write every grid subset to a compressed file
+  netapp.storagegrid.na_sg_grid_info:
+    api_url: "https://1.2.3.4/"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    dest: /var/lib/storagegrid/grid_info.ndjson.gz
+  register: sg_grid_dump
 """
 
 RETURN = """
 sg_info:
-    description: Returns various information about the StorageGRID Grid configuration.
-    returned: always
+    description:
+      - Returns various information about the StorageGRID Grid configuration.
+      - With I(snapshot), only the subsets that changed, and for list subsets the added and modified items
+        with the C(added), C(modified) and C(removed) keys.
+    returned: when I(dest) and I(grids) are not set
     type: dict
     sample: {
         "grid/accounts": {...},
@@ -189,12 +404,58 @@ sg_info:
         "grid/vlan-interfaces": {...},
         "grid/versions": {...}
     }
+manifest:
+    description:
+      - With I(dest), the path and the number of lines written, with the size and SHA-256 of the compressed file,
+        and for each subset, its type, the number and size of its lines and the SHA-256 of its lines.
+      - C(changed) tells whether the lines differ from the existing file, and C(written) whether the file was replaced.
+      - C(bytes) and C(sha256) of the compressed file are not returned in check mode, as no file is written.
+    returned: when I(dest) is set
+    type: dict
+    version_added: '21.18.0'
+    sample: {
+        "dest": "/var/lib/storagegrid/grid_info.ndjson.gz",
+        "format": "ndjson.gz",
+        "changed": true,
+        "written": true,
+        "items": 2,
+        "bytes": 301,
+        "sha256": "9f2c...",
+        "subsets": [
+            {"subset": "grid/groups", "type": "list", "count": 2, "bytes": 412, "sha256": "c41e..."}
+        ]
+    }
+grids:
+    description:
+      - With I(grids), the result of each grid keyed by its name, I(sg_info) or I(manifest),
+        or C(failed) and C(msg) when the grid failed.
+    returned: when I(grids) is set
+    type: dict
+    version_added: '21.18.0'
+    sample: {
+        "east": {"sg_info": {"grid/accounts": {...}, "grid/health": {...}}},
+        "west": {"failed": true, "msg": "..."}
+    }
 """
 
 from ansible.module_utils.basic import AnsibleModule
+import copy
 import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import SGRestAPI
+from ansible_collections.netapp.storagegrid.plugins.module_utils.info_query import InfoSubsets, subset_options_argument_spec
+from ansible_collections.netapp.storagegrid.plugins.module_utils.info_snapshot import diff_against_snapshot
+from ansible_collections.netapp.storagegrid.plugins.module_utils.info_cache import ResponseCache
+from ansible_collections.netapp.storagegrid.plugins.module_utils.grids import grids_argument_spec, grids_argument_constraints, run_grids
+
+# time to live in seconds of the subsets cached by default
+DEFAULT_CACHE_TTL = {
+    'grid/config/product-version': 3600,
+    'grid/ec-profiles': 3600,
+    'grid/license': 3600,
+    'grid/regions': 3600,
+    'grid/versions': 86400,
+}
 
 
 class NetAppSgGatherInfo(object):
@@ -207,47 +468,132 @@ class NetAppSgGatherInfo(object):
         """
         self.argument_spec = netapp_utils.na_storagegrid_host_argument_spec()
         self.argument_spec.update(dict(
-            gather_subset=dict(default=['all'], type='list', elements='str', required=False),
+            gather_subset=dict(type='list', elements='str', required=False),
             parameters=dict(type='dict', required=False)
         ))
+        self.argument_spec.update(subset_options_argument_spec())
+        self.argument_spec.update(dict(
+            snapshot=dict(type='path', required=False),
+            dest=dict(type='path', required=False),
+            cache=dict(type='dict', required=False, options=dict(
+                path=dict(type='path', required=True),
+                ttl=dict(type='dict', required=False),
+                stale_if_error=dict(type='int', required=False, default=0),
+            ))
+        ))
+        self.argument_spec.update(grids_argument_spec())
+        constraints = grids_argument_constraints()
+        constraints['mutually_exclusive'].extend([('dest', 'snapshot'), ('grids', 'snapshot'), ('grids', 'dest')])
 
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
-            supports_check_mode=True
+            supports_check_mode=True,
+            **constraints
         )
 
         # set up variables
         self.na_helper = NetAppModule()
         self.parameters = self.na_helper.set_parameters(self.module.params)
+        self.rest_api = None
+        self.info_subsets = None
+        self.cache = None
+        if not self.parameters.get('grids'):
+            self.connect()
+
+    def connect(self):
+        """ Set up the REST API client of the grid, and get its API version """
         self.rest_api = SGRestAPI(self.module)
+        self.info_subsets = InfoSubsets(self.rest_api, self.module, self.convert_subsets)
         # Get API version
-        self.rest_api.get_sg_product_version()
+        if self.parameters.get('cache'):
+            self.cache = ResponseCache(self.parameters['cache']['path'], self.rest_api.api_url)
+            self.get_cached_product_version()
+        else:
+            self.rest_api.get_sg_product_version()
         self.api_version = self.rest_api.get_api_version()
 
-    def get_subset_info(self, gather_subset_info):
+    def get_cached_product_version(self):
+        """
+        Get the product version from the cache while it is younger than the time to live of grid/config/product-version,
+        so a run gathering cached subsets only sends no request
+        """
+        api = 'api/v3/grid/config/product-version'
+        ttl = self.get_cache_ttl().get('grid/config/product-version', 0)
+        response = self.cache.get(api, {}, ttl)[0] if ttl > 0 else None
+        if response is None:
+            response, error = self.rest_api.get(api, {})
+            if error:
+                self.module.fail_json(msg=error)
+            if ttl > 0:
+                self.cache.put(api, {}, response)
+        self.rest_api.set_version(response)
+
+    def get_subset_info(self, gather_subset_info, options=None, ttl=0):
         """
         Gather StorageGRID information for the given subset using REST APIs
         Input for REST APIs call : (api, data)
+        With a ttl, a cached response younger than ttl seconds is returned without a request
         return gathered_sg_info
         """
 
         api = gather_subset_info['api_call']
-        data = {}
-        # allow for passing in any additional rest api parameters
-        if self.parameters.get('parameters'):
-            for each in self.parameters['parameters']:
-                data[each] = self.parameters['parameters'][each]
+        data = self.info_subsets.get_subset_parameters(options)
+
+        if options and options.get('query'):
+            return self.info_subsets.get_subset_items(api, data, options['query'])
+
+        use_cache = self.cache is not None and ttl > 0
+        if use_cache:
+            cached_sg_info, age = self.cache.get(api, data, ttl)
+            if cached_sg_info is not None:
+                return cached_sg_info
 
         gathered_sg_info, error = self.rest_api.get(api, data)
 
         if error:
+            stale_if_error = self.parameters['cache']['stale_if_error'] if use_cache else 0
+            if stale_if_error > 0:
+                cached_sg_info, age = self.cache.get(api, data, ttl + stale_if_error)
+                if cached_sg_info is not None:
+                    self.module.warn("Returning the cached response of %s from %d seconds ago: %s" % (api, age, error))
+                    return cached_sg_info
             self.module.fail_json(msg=error)
         else:
+            if use_cache:
+                self.cache.put(api, data, gathered_sg_info)
             return gathered_sg_info
 
         return None
 
-    def convert_subsets(self):
+    def apply_grids(self):
+        """ Gather the subsets from every grid concurrently, and exit with the results keyed by grid """
+        def gather(grid_module):
+            grid_info = copy.copy(self)
+            grid_info.module = grid_module
+            grid_info.parameters = dict(self.parameters)
+            del grid_info.parameters['grids']
+            grid_info.connect()
+            grid_info.apply()
+
+        results, error = run_grids(self.module, self.parameters['grids'], gather, self.parameters['max_concurrent_grids'])
+        if error:
+            self.module.fail_json(msg=error)
+        if all(result.get('failed') for result in results.values()):
+            self.module.fail_json(msg="Error: every grid failed: %s" % "; ".join("%s: %s" % (name, result['msg']) for name, result in results.items()),
+                                  grids=results)
+        self.module.exit_json(changed=False, grids=results)
+
+    def get_cache_ttl(self):
+        """ Return the time to live of the cached subsets, the cache ttl merged over the defaults """
+        cache_ttl = dict(DEFAULT_CACHE_TTL)
+        for subset, ttl in (self.parameters['cache'].get('ttl') or {}).items():
+            try:
+                cache_ttl[self.convert_subsets([subset])[0]] = int(ttl)
+            except (TypeError, ValueError):
+                self.module.fail_json(msg="Error in cache ttl for %s: expected a number of seconds, got %s." % (subset, ttl))
+        return cache_ttl
+
+    def convert_subsets(self, gather_subset):
         """ Convert an info to the REST API """
         info_to_rest_mapping = {
             'grid_accounts_info': 'grid/accounts',
@@ -304,7 +650,7 @@ class NetAppSgGatherInfo(object):
         }
         # Add rest API names as there info version, also make sure we don't add a duplicate.
         subsets = []
-        for subset in self.parameters['gather_subset']:
+        for subset in gather_subset:
             if subset in info_to_rest_mapping:
                 if info_to_rest_mapping[subset] not in subsets:
                     subsets.append(info_to_rest_mapping[subset])
@@ -316,6 +662,9 @@ class NetAppSgGatherInfo(object):
     def apply(self):
         """ Perform pre-checks, call functions and exit """
 
+        if self.parameters.get('grids'):
+            self.apply_grids()
+
         result_message = dict()
 
         # Defining gather_subset and appropriate api_call.
@@ -475,12 +824,25 @@ class NetAppSgGatherInfo(object):
             }
         }
 
-        if 'all' in self.parameters['gather_subset']:
+        subset_options = self.info_subsets.get_subset_options()
+        # all by default, or the subsets with options
+        gather_subset = self.parameters.get('gather_subset', [] if subset_options else ['all'])
+        if 'all' in gather_subset:
             # If all in subset list, get the information of all subsets.
-            self.parameters['gather_subset'] = sorted(get_sg_subset_info.keys())
+            gather_subset = sorted(get_sg_subset_info.keys())
 
-        converted_subsets = self.convert_subsets()
+        converted_subsets = self.convert_subsets(gather_subset)
+        converted_subsets.extend(subset for subset in subset_options if subset not in converted_subsets)
 
+        if self.parameters.get('dest'):
+            unknown = [subset for subset in converted_subsets if subset not in get_sg_subset_info]
+            if unknown:
+                self.module.fail_json(msg="Specified subset %s not found, supported subsets are %s" %
+                                      (unknown[0], list(get_sg_subset_info.keys())))
+            manifest = self.info_subsets.write_subsets(converted_subsets, get_sg_subset_info, subset_options)
+            self.module.exit_json(changed=manifest['changed'], manifest=manifest)
+
+        cache_ttl = self.get_cache_ttl() if self.cache is not None else {}
         for subset in converted_subsets:
             try:
                 # Verify whether the supported subset passed.
@@ -489,9 +851,22 @@ class NetAppSgGatherInfo(object):
                 self.module.fail_json(msg="Specified subset %s not found, supported subsets are %s" %
                                       (subset, list(get_sg_subset_info.keys())))
 
-            result_message[subset] = self.get_subset_info(specified_subset)
+            result_message[subset] = self.get_subset_info(specified_subset, subset_options.get(subset), cache_ttl.get(subset, 0))
+
+        if self.cache is not None:
+            for warning in self.cache.warnings:
+                self.module.warn(warning)
+
+        changed = False
+        if self.parameters.get('snapshot'):
+            # only return what changed since the previous run
+            result_message, error = diff_against_snapshot(self.parameters['snapshot'], result_message, update=not self.module.check_mode)
+            if error:
+                self.module.fail_json(msg=error)
+            # the snapshot is rewritten when a subset changed
+            changed = bool(result_message)
 
-        self.module.exit_json(changed=False, sg_info=result_message)
+        self.module.exit_json(changed=changed, sg_info=result_message)
 
 
 def main():
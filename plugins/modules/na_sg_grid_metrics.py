@@ -27,6 +27,55 @@ author: NetApp Ansible Team (@vinaykus) <ng-ansibleteam@netapp.com>
 description:
   - Get metrics on NetApp StorageGRID.
 options:
+  api_url:
+    description:
+    - The url to the StorageGRID Admin Node REST API, or a list of urls of admin nodes of the same grid.
+    - Required unless I(grids) is set.
+    required: false
+    type: list
+    elements: str
+  auth_token:
+    description:
+    - The authorization token for the API request.
+    - Required unless I(grids) is set.
+    required: false
+    type: str
+  grids:
+    description:
+    - Run the same query on several grids at once, instead of the grid of I(api_url).
+    - The grids are queried concurrently, and I(grids) is returned instead of I(sg_metric), keyed by grid.
+    - An error on a grid does not stop the others, the result of the grid holds C(failed) and C(msg),
+      and the module only fails when every grid fails.
+    - Mutually exclusive with I(api_url) and I(auth_token).
+    type: list
+    elements: dict
+    version_added: '21.18.0'
+    suboptions:
+      name:
+        description:
+        - Key of the grid in the results, defaults to I(api_url).
+        type: str
+      api_url:
+        description:
+        - The url to the StorageGRID Admin Node REST API of the grid, or a list of urls of its admin nodes.
+        type: list
+        elements: str
+        required: true
+      auth_token:
+        description:
+        - The authorization token of the grid.
+        type: str
+        required: true
+      validate_certs:
+        description:
+        - Should https certificates be validated, defaults to I(validate_certs).
+        type: bool
+  max_concurrent_grids:
+    description:
+    - Maximum number of I(grids) queried at the same time.
+    type: int
+    default: 12
+    version_added: '21.18.0'
   query:
     description:
     - Prometheus query string to execute.
@@ -74,12 +123,25 @@ EXAMPLES = """
     step: 60s
     timeout: 30s
   register: sg_metric
+
+- name: Query the usable space of several grids in one task
+  netapp.storagegrid.na_sg_grid_metrics:
+    validate_certs: false
+    grids:
+      - name: east
+        api_url: "https://1.2.3.4/"
+        auth_token: "{{ east_auth_token }}"
+      - name: west
+        api_url: "https://5.6.7.8/"
+        auth_token: "{{ west_auth_token }}"
+    query: storagegrid_storage_utilization_usable_space_bytes
+  register: sg_metrics
 """
 
 RETURN = """
 sg_metric:
     description: Returns information about the StorageGRID metrics.
-    returned: always
+    returned: when I(grids) is not set
     type: dict
     sample: {
         "query": {
@@ -103,12 +165,26 @@ sg_metric:
             "resultType": "vector"
         }
     }
+grids:
+    description:
+      - With I(grids), the result of each grid keyed by its name, I(sg_metric),
+        or C(failed) and C(msg) when the grid failed.
+    returned: when I(grids) is set
+    type: dict
+    version_added: '21.18.0'
+    sample: {
+        "east": {"sg_metric": {"query": {...}}},
+        "west": {"failed": true, "msg": "..."}
+    }
 """
 
+import copy
 import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import SGRestAPI
+import ansible_collections.netapp.storagegrid.plugins.module_utils.metrics as metrics_utils
+from ansible_collections.netapp.storagegrid.plugins.module_utils.grids import grids_argument_spec, grids_argument_constraints, run_grids
 
 
 class SgMetrics:
@@ -131,18 +207,20 @@ class SgMetrics:
                 step=dict(type="str", required=False),
             )
         )
+        self.argument_spec.update(grids_argument_spec())
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
-            supports_check_mode=True
+            supports_check_mode=True,
+            **grids_argument_constraints()
         )
         self.na_helper = NetAppModule()
 
         # set up variables
         self.parameters = self.na_helper.set_parameters(self.module.params)
-        # Calling generic SG rest_api class
-        self.rest_api = SGRestAPI(self.module)
-        # Get API version
-        self.rest_api.get_sg_product_version(api_root="grid")
+        self.rest_api = None
+        if not self.parameters.get("grids"):
+            self.connect()
+
         # Checking for the parameters passed and create new parameters list
 
         self.params = {
@@ -150,34 +228,61 @@ class SgMetrics:
             "timeout": self.parameters.get("timeout")
         }
 
+    def connect(self):
+        ''' Set up the REST API client of the grid '''
+        # Calling generic SG rest_api class
+        self.rest_api = SGRestAPI(self.module)
+        # Get API version
+        self.rest_api.get_sg_product_version(api_root="grid")
+
+    def apply_grids(self):
+        ''' Run the query on every grid concurrently, and exit with the results keyed by grid '''
+        def query(grid_module):
+            grid_metrics = copy.copy(self)
+            grid_metrics.module = grid_module
+            grid_metrics.parameters = dict(self.parameters)
+            del grid_metrics.parameters["grids"]
+            grid_metrics.params = dict(self.params)
+            grid_metrics.connect()
+            grid_metrics.apply()
+
+        results, error = run_grids(self.module, self.parameters["grids"], query, self.parameters["max_concurrent_grids"])
+        if error:
+            self.module.fail_json(msg=error)
+        if all(result.get("failed") for result in results.values()):
+            self.module.fail_json(msg="Error: every grid failed: %s" % "; ".join("%s: %s" % (name, result["msg"]) for name, result in results.items()),
+                                  grids=results)
+        self.module.exit_json(changed=False, grids=results)
+
     def get_metric_query(self):
         ''' Get metrics query'''
-        api = "api/v4/grid/metric-query"
         self.params.update({
             "time": self.parameters.get("time")
         })
-        response, error = self.rest_api.get(api, self.params)
+        data, error = metrics_utils.get_metric_query(self.rest_api, self.params)
         if error:
             self.module.fail_json(msg=error)
 
-        return response["data"]
+        return data
 
     def get_metric_query_range(self):
         ''' Get metrics query range'''
-        api = "api/v4/grid/metric-query-range"
         self.params.update({
             "start": self.parameters.get("time"),
             "end": self.parameters.get("end_time"),
             "step": self.parameters.get("step")
         })
-        response, error = self.rest_api.get(api, self.params)
+        data, error = metrics_utils.get_metric_query_range(self.rest_api, self.params)
         if error:
             self.module.fail_json(msg=error)
 
-        return response["data"]
+        return data
 
     def apply(self):
         ''' Apply metrics '''
+        if self.parameters.get("grids"):
+            self.apply_grids()
+
         result_message = dict()
         if self.parameters.get("query") and not self.parameters.get("end_time") and not self.parameters.get("step"):
             result_message = self.get_metric_query()
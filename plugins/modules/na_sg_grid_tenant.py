@@ -113,6 +113,96 @@ options:
     - on_create
     - always
     type: str
+  tenants:
+    description:
+    - List of tenant accounts to reconcile in a single task.
+    - Accounts are listed once, and the accounts to create, update and delete are then changed concurrently.
+    - Options not set for a tenant default to the value of the module option of the same name.
+    - Mutually exclusive with I(name) and I(account_id).
+    type: list
+    elements: dict
+    version_added: '21.18.0'
+    suboptions:
+      name:
+        description:
+        - Name of the tenant.
+        type: str
+        required: true
+      state:
+        description:
+        - Whether the account should exist or not.
+        type: str
+        choices: ['present', 'absent']
+      description:
+        description:
+        - Additional identifying information for the tenant account.
+        type: str
+      protocol:
+        description:
+        - Object Storage protocol used by the tenancy.
+        type: str
+        choices: ['s3', 'swift']
+      management:
+        description:
+        - Whether the tenant can login to the StorageGRID tenant portal.
+        type: bool
+      use_own_identity_source:
+        description:
+        - Whether the tenant account should configure its own identity source.
+        type: bool
+      allow_platform_services:
+        description:
+        - Allows tenant to use platform services features such as CloudMirror.
+        type: bool
+      allow_select_object_content:
+        description:
+        - Allows tenant to use the S3 SelectObjectContent API to filter and retrieve object data.
+        type: bool
+      allow_compliance_mode:
+        description:
+        - Whether a tenant can use compliance mode for object lock and retention.
+        type: bool
+      max_retention_days:
+        description:
+        - The maximum retention period in days allowed for new objects in compliance or governance mode.
+        type: int
+      root_access_group:
+        description:
+        - Existing federated group to have initial Root Access permissions for the tenant.
+        type: str
+      quota_size:
+        description:
+        - Quota to apply to the tenant specified in I(quota_size_unit).
+        type: int
+      quota_size_unit:
+        description:
+        - The unit used to interpret the size parameter.
+        choices: ['bytes', 'b', 'kb', 'mb', 'gb', 'tb', 'pb', 'eb', 'zb', 'yb']
+        type: str
+      tenant_password:
+        description:
+        - Root password for tenant account.
+        type: str
+      update_password:
+        description:
+        - Choose when to update the tenant password.
+        choices: ['on_create', 'always']
+        type: str
+  purge_tenants:
+    description:
+    - With I(tenants), delete the tenant accounts that are not in the list.
+    type: bool
+    default: false
+    version_added: '21.18.0'
+  max_concurrent_requests:
+    description:
+    - With I(tenants), maximum number of tenant accounts changed at the same time.
+    type: int
+    default: 8
+    version_added: '21.18.0'
+notes:
+- With I(tenants), an account that fails to be changed does not stop the other ones, and the module fails
+  after all the accounts are processed, reporting the error of each account in I(tenants).
 """
 
 EXAMPLES = """
@@ -156,6 +246,24 @@ EXAMPLES = """
     state: absent
     name: storagegrid-tenant-1
     protocol: s3
+
+- name: reconcile many tenant accounts in one task
+  netapp.storagegrid.na_sg_grid_tenant:
+    api_url: "https://<storagegrid-endpoint-url>"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    protocol: s3
+    use_own_identity_source: false
+    allow_platform_services: false
+    quota_size_unit: tb
+    tenants:
+      - name: storagegrid-tenant-1
+        quota_size: 10
+      - name: storagegrid-tenant-2
+        quota_size: 20
+        allow_platform_services: true
+      - name: storagegrid-tenant-3
+        state: absent
 """
 
 RETURN = """
@@ -173,6 +281,23 @@ resp:
         },
         "id": "12345678901234567890"
     }
+tenants:
+    description:
+    - Result for each tenant account, with I(tenants).
+    - I(action) is C(create), C(update), C(delete) or C(none), I(error) is only set when the change failed.
+    returned: success or failure, with I(tenants)
+    type: list
+    elements: dict
+    version_added: '21.18.0'
+    sample: [
+        {
+            "name": "storagegrid-tenant-1",
+            "id": "12345678901234567890",
+            "action": "update",
+            "changed": true,
+            "password_updated": false
+        }
+    ]
 """
 
 import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
@@ -183,6 +308,7 @@ from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module i
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import (
     SGRestAPI,
 )
+from ansible_collections.netapp.storagegrid.plugins.module_utils.tools import run_concurrently
 
 
 class SgGridTenantAccount(object):
@@ -234,23 +360,40 @@ class SgGridTenantAccount(object):
                 ),
                 tenant_password=dict(required=False, type="str", no_log=True),
                 update_password=dict(default="on_create", choices=["on_create", "always"]),
+                tenants=dict(
+                    required=False,
+                    type="list",
+                    elements="dict",
+                    options=dict(
+                        name=dict(required=True, type="str"),
+                        state=dict(required=False, type="str", choices=["present", "absent"]),
+                        description=dict(required=False, type="str"),
+                        protocol=dict(required=False, choices=["s3", "swift"]),
+                        management=dict(required=False, type="bool"),
+                        use_own_identity_source=dict(required=False, type="bool"),
+                        allow_platform_services=dict(required=False, type="bool"),
+                        allow_select_object_content=dict(required=False, type="bool"),
+                        allow_compliance_mode=dict(required=False, type="bool"),
+                        max_retention_days=dict(required=False, type="int"),
+                        root_access_group=dict(required=False, type="str"),
+                        quota_size=dict(required=False, type="int"),
+                        quota_size_unit=dict(
+                            required=False,
+                            choices=["bytes", "b", "kb", "mb", "gb", "tb", "pb", "eb", "zb", "yb"],
+                            type="str",
+                        ),
+                        tenant_password=dict(required=False, type="str", no_log=True),
+                        update_password=dict(required=False, choices=["on_create", "always"]),
+                    ),
+                ),
+                purge_tenants=dict(required=False, type="bool", default=False),
+                max_concurrent_requests=dict(required=False, type="int", default=8),
             )
         )
 
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
-            required_if=[
-                (
-                    "state",
-                    "present",
-                    [
-                        "name",
-                        "protocol",
-                        "use_own_identity_source",
-                        "allow_platform_services",
-                    ],
-                )
-            ],
+            mutually_exclusive=[("name", "tenants"), ("account_id", "tenants")],
             supports_check_mode=True,
         )
 
@@ -258,61 +401,85 @@ class SgGridTenantAccount(object):
 
         # set up state variables
         self.parameters = self.na_helper.set_parameters(self.module.params)
+
+        # options required when state is present, checked for each tenant with tenants
+        if "tenants" not in self.parameters:
+            self.check_required_options(self.parameters)
+
         # Calling generic SG rest_api class
         self.rest_api = SGRestAPI(self.module)
         # Get API version
         self.rest_api.get_sg_product_version()
         self.api_version = self.rest_api.get_api_version()
 
+        if "tenants" not in self.parameters:
+            self.data, self.pw_change = self.build_tenant_data(self.parameters)
+
+    def check_required_options(self, parameters, tenant=None):
+        if parameters["state"] != "present":
+            return
+        required = ["name", "protocol", "use_own_identity_source", "allow_platform_services"]
+        missing = [option for option in required if option not in parameters]
+        if missing:
+            msg = "state is present but all of the following are missing: %s" % ", ".join(missing)
+            if tenant is not None:
+                msg = "Error in tenants for %s: %s" % (tenant, msg)
+            self.module.fail_json(msg=msg)
+
+    def build_tenant_data(self, parameters):
+        """
+        Return the account body and the password change body for the parameters of a tenant
+        """
         # Checking for the parameters passed and create new parameters list
-        self.data = {}
-        self.data["name"] = self.parameters["name"]
-        self.data["capabilities"] = [self.parameters["protocol"]]
+        data = {}
+        data["name"] = parameters["name"]
+        data["capabilities"] = [parameters["protocol"]]
 
-        if self.parameters.get("description") is not None:
-            self.data["description"] = self.parameters["description"]
+        if parameters.get("description") is not None:
+            data["description"] = parameters["description"]
 
-        if self.parameters.get("tenant_password") is not None:
-            self.data["password"] = self.parameters["tenant_password"]
+        if parameters.get("tenant_password") is not None:
+            data["password"] = parameters["tenant_password"]
 
         # Append "management" to the capability list only if parameter is True
-        if self.parameters.get("management"):
-            self.data["capabilities"].append("management")
+        if parameters.get("management"):
+            data["capabilities"].append("management")
 
-        self.data["policy"] = {}
+        data["policy"] = {}
 
-        if "use_own_identity_source" in self.parameters:
-            self.data["policy"]["useAccountIdentitySource"] = self.parameters["use_own_identity_source"]
+        if "use_own_identity_source" in parameters:
+            data["policy"]["useAccountIdentitySource"] = parameters["use_own_identity_source"]
 
-        if "allow_platform_services" in self.parameters:
-            self.data["policy"]["allowPlatformServices"] = self.parameters["allow_platform_services"]
+        if "allow_platform_services" in parameters:
+            data["policy"]["allowPlatformServices"] = parameters["allow_platform_services"]
 
-        if "allow_compliance_mode" in self.parameters:
+        if "allow_compliance_mode" in parameters:
             self.rest_api.fail_if_not_sg_minimum_version("Compliance Mode", 11, 9)
-            self.data["policy"]["allowComplianceMode"] = self.parameters["allow_compliance_mode"]
+            data["policy"]["allowComplianceMode"] = parameters["allow_compliance_mode"]
 
-        if "max_retention_days" in self.parameters:
+        if "max_retention_days" in parameters:
             self.rest_api.fail_if_not_sg_minimum_version("Max Retention Days", 11, 9)
-            self.data["policy"]["maxRetentionDays"] = self.parameters["max_retention_days"]
+            data["policy"]["maxRetentionDays"] = parameters["max_retention_days"]
 
-        if self.parameters.get("root_access_group") is not None:
-            self.data["grantRootAccessToGroup"] = self.parameters["root_access_group"]
+        if parameters.get("root_access_group") is not None:
+            data["grantRootAccessToGroup"] = parameters["root_access_group"]
 
-        if self.parameters["quota_size"] > 0:
-            self.parameters["quota_size"] = (
-                self.parameters["quota_size"] * netapp_utils.POW2_BYTE_MAP[self.parameters["quota_size_unit"]]
+        if parameters["quota_size"] > 0:
+            data["policy"]["quotaObjectBytes"] = (
+                parameters["quota_size"] * netapp_utils.POW2_BYTE_MAP[parameters["quota_size_unit"]]
             )
-            self.data["policy"]["quotaObjectBytes"] = self.parameters["quota_size"]
-        elif self.parameters["quota_size"] == 0:
-            self.data["policy"]["quotaObjectBytes"] = None
+        elif parameters["quota_size"] == 0:
+            data["policy"]["quotaObjectBytes"] = None
 
-        self.pw_change = {}
-        if self.parameters.get("tenant_password") is not None:
-            self.pw_change["password"] = self.parameters["tenant_password"]
+        pw_change = {}
+        if parameters.get("tenant_password") is not None:
+            pw_change["password"] = parameters["tenant_password"]
 
-        if "allow_select_object_content" in self.parameters:
+        if "allow_select_object_content" in parameters:
             self.rest_api.fail_if_not_sg_minimum_version("S3 SelectObjectContent API", 11, 6)
-            self.data["policy"]["allowSelectObjectContent"] = self.parameters["allow_select_object_content"]
+            data["policy"]["allowSelectObjectContent"] = parameters["allow_select_object_content"]
+
+        return data, pw_change
 
     def get_tenant_account_id(self):
         # Check if tenant account exists
@@ -388,11 +555,137 @@ class SgGridTenantAccount(object):
         if error:
             self.module.fail_json(msg=error)
 
+    def get_tenant_accounts(self):
+        """ Page through every tenant account once, and index them by name """
+        api = "api/%s/grid/accounts" % self.api_version
+        accounts, error = self.rest_api.get_paginated(api)
+        if error:
+            self.module.fail_json(msg=error)
+        return dict((account["name"], account) for account in accounts)
+
+    def get_tenant_parameters(self, tenant):
+        """ Options not set for a tenant default to the module options """
+        parameters = dict(self.parameters)
+        for option in ("tenants", "purge_tenants", "max_concurrent_requests"):
+            parameters.pop(option, None)
+        parameters.update((key, value) for key, value in tenant.items() if value is not None)
+        return parameters
+
+    def plan_tenant_changes(self, tenant_accounts):
+        """
+        Compare each tenant with its current account, and return the list of changes.
+        Each change is a dict with name, action (create, update, delete or None), the current account
+        and the request bodies.
+        """
+        changes = []
+        names = set()
+        for tenant in self.parameters["tenants"]:
+            parameters = self.get_tenant_parameters(tenant)
+            name = parameters["name"]
+            if name in names:
+                self.module.fail_json(msg="Error in tenants: %s is listed more than once." % name)
+            names.add(name)
+            current = tenant_accounts.get(name)
+            change = dict(name=name, action=None, current=current, data=None, pw_change={})
+
+            if parameters["state"] == "absent":
+                if current is not None:
+                    change["action"] = "delete"
+                changes.append(change)
+                continue
+
+            self.check_required_options(parameters, name)
+            change["data"], change["pw_change"] = self.build_tenant_data(parameters)
+            if current is None:
+                change["action"] = "create"
+                # the password is set by the POST
+                change["pw_change"] = {}
+            else:
+                if NetAppModule().get_modified_attributes(current, change["data"]):
+                    change["action"] = "update"
+                if parameters["update_password"] != "always":
+                    change["pw_change"] = {}
+            changes.append(change)
+
+        if self.parameters["purge_tenants"]:
+            for name in sorted(set(tenant_accounts) - names):
+                changes.append(dict(name=name, action="delete", current=tenant_accounts[name], data=None, pw_change={}))
+        return changes
+
+    def apply_tenant_change(self, change):
+        """
+        Apply the change of one tenant, called from a worker thread.
+        Errors are reported in the result rather than with fail_json, so the other tenants carry on.
+        """
+        current = change["current"]
+        result = dict(
+            name=change["name"],
+            id=current["id"] if current else None,
+            action=change["action"] or "none",
+            changed=bool(change["action"] or change["pw_change"]),
+            password_updated=bool(change["pw_change"]),
+        )
+        if self.module.check_mode or not result["changed"]:
+            return result
+
+        error = None
+        if change["action"] == "delete":
+            api = "api/%s/grid/accounts/%s" % (self.api_version, current["id"])
+            response, error = self.rest_api.delete(api, None)
+        elif change["action"] == "create":
+            api = "api/%s/grid/accounts" % self.api_version
+            response, error = self.rest_api.post(api, change["data"])
+            if not error:
+                result["id"] = response["data"]["id"]
+        elif change["action"] == "update":
+            api = "api/%s/grid/accounts/%s" % (self.api_version, current["id"])
+            data = dict(
+                (key, value) for key, value in change["data"].items() if key not in ("password", "grantRootAccessToGroup")
+            )
+            response, error = self.rest_api.put(api, data)
+
+        if not error and change["pw_change"]:
+            api = "api/%s/grid/accounts/%s/change-password" % (self.api_version, current["id"])
+            response, error = self.rest_api.post(api, change["pw_change"])
+
+        if error:
+            result["error"] = str(error)
+        return result
+
+    def apply_tenants(self):
+        """
+        Reconcile the list of tenants: list the accounts once, then create, update and delete concurrently
+        """
+        changes = self.plan_tenant_changes(self.get_tenant_accounts())
+        results = run_concurrently(self.apply_tenant_change, changes, self.parameters["max_concurrent_requests"])
+
+        changed = any(result["changed"] and "error" not in result for result in results)
+        succeeded = [result for result in results if "error" not in result]
+        counts = []
+        for action in ("create", "update", "delete"):
+            count = len([result for result in succeeded if result["action"] == action])
+            if count:
+                counts.append("%d tenant accounts %sd" % (count, action))
+        count = len([result for result in succeeded if result["password_updated"]])
+        if count:
+            counts.append("%d tenant root passwords updated" % count)
+        failed = [result for result in results if "error" in result]
+        if failed:
+            msg = "Error changing %d of %d tenant accounts: %s" % (
+                len(failed), len(results), "; ".join("%s: %s" % (result["name"], result["error"]) for result in failed)
+            )
+            self.module.fail_json(msg=msg, changed=changed, tenants=results)
+        self.module.exit_json(changed=changed, msg="; ".join(counts), tenants=results)
+
     def apply(self):
         """
         Perform pre-checks, call functions and exit
         """
 
+        if "tenants" in self.parameters:
+            self.apply_tenants()
+            return
+
         tenant_account = None
 
         if self.parameters.get("account_id"):
@@ -41,9 +41,8 @@ options:
   unique_name:
     description:
     - Unique Name for the user. Must begin with C(user/) or C(federated-user/)
-    - Required for create, modify or delete operation.
+    - Required for create, modify or delete operation, unless I(users) is set.
     type: str
-    required: true
   member_of:
     description:
     - List of C(unique_groups) that the user is a member of.
@@ -69,6 +68,66 @@ options:
     description:
     - Disable the user from signing in. Does not apply to federated users.
     type: bool
+  users:
+    description:
+    - List of users to manage in a single task.
+    - Users and groups are listed once, then users are created, updated and deleted concurrently,
+      and their passwords changed in the same pass.
+    - Options not set for a user default to the module option of the same name.
+    - Mutually exclusive with I(unique_name).
+    type: list
+    elements: dict
+    version_added: '21.18.0'
+    suboptions:
+      unique_name:
+        description:
+        - Unique Name for the user. Must begin with C(user/) or C(federated-user/).
+        type: str
+        required: true
+      state:
+        description:
+        - Whether the user should exist or not.
+        type: str
+        choices: ['present', 'absent']
+      full_name:
+        description:
+        - Full Name of the user.
+        type: str
+      member_of:
+        description:
+        - List of unique_groups that the user is a member of.
+        type: list
+        elements: str
+      password:
+        description:
+        - Set a password for a local user.
+        type: str
+      update_password:
+        description:
+        - Choose when to update the password.
+        choices: ['on_create', 'always']
+        type: str
+      disable:
+        description:
+        - Disable the user from signing in.
+        type: bool
+  purge_users:
+    description:
+    - With I(users), delete the local and federated users that are not in the list.
+    - The root user is never deleted.
+    type: bool
+    default: false
+    version_added: '21.18.0'
+  max_concurrent_requests:
+    description:
+    - With I(users), maximum number of users changed at the same time.
+    type: int
+    default: 8
+    version_added: '21.18.0'
+notes:
+- Groups named in I(member_of) are looked up by paging through all the admin groups of the grid.
+- With I(users), a user that fails to be changed does not stop the other ones, and the module fails
+  after all the users are processed, reporting the error of each user in I(users).
 """
 
 EXAMPLES = """
@@ -82,6 +141,22 @@ EXAMPLES = """
     unique_name: user/ansibleuser100
     member_of: "group/ansiblegroup100"
     disable: false
+
+- name: sync a roster of grid users in one task
+  netapp.storagegrid.na_sg_grid_user:
+    api_url: "https://<storagegrid-endpoint-url>"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    member_of: "group/ansiblegroup101"
+    users:
+      - unique_name: user/ansibleuser101
+        full_name: ansibleuser101
+        password: "user1-password"
+      - unique_name: user/ansibleuser102
+        full_name: ansibleuser102
+        member_of: ["group/ansiblegroup101", "group/ansiblegroup102"]
+      - unique_name: user/ansibleuser103
+        state: absent
 """
 
 RETURN = """
@@ -99,14 +174,30 @@ resp:
         "federated": false,
         "userURN": "urn:sgws:identity::0:user/Example"
     }
+users:
+    description:
+    - Result for each user, with I(users).
+    - I(action) is C(create), C(update), C(delete) or C(none), I(error) is only set when the change failed.
+    returned: success or failure, with I(users)
+    type: list
+    elements: dict
+    version_added: '21.18.0'
+    sample: [
+        {
+            "unique_name": "user/Example",
+            "id": "00000000-0000-0000-0000-000000000000",
+            "action": "update",
+            "changed": true,
+            "password_updated": false
+        }
+    ]
 """
 
-import re
-
 import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import SGRestAPI
+from ansible_collections.netapp.storagegrid.plugins.module_utils.tools import run_concurrently
 
 
 class SgGridUser(object):
@@ -124,17 +215,34 @@ class SgGridUser(object):
             dict(
                 state=dict(required=False, type="str", choices=["present", "absent"], default="present"),
                 full_name=dict(required=False, type="str"),
-                unique_name=dict(required=True, type="str"),
+                unique_name=dict(required=False, type="str"),
                 member_of=dict(required=False, type="list", elements="str"),
                 disable=dict(required=False, type="bool"),
                 password=dict(required=False, type="str", no_log=True),
                 update_password=dict(default="on_create", choices=["on_create", "always"]),
+                users=dict(
+                    required=False,
+                    type="list",
+                    elements="dict",
+                    options=dict(
+                        unique_name=dict(required=True, type="str"),
+                        state=dict(required=False, type="str", choices=["present", "absent"]),
+                        full_name=dict(required=False, type="str"),
+                        member_of=dict(required=False, type="list", elements="str"),
+                        disable=dict(required=False, type="bool"),
+                        password=dict(required=False, type="str", no_log=True),
+                        update_password=dict(required=False, choices=["on_create", "always"]),
+                    ),
+                ),
+                purge_users=dict(required=False, type="bool", default=False),
+                max_concurrent_requests=dict(required=False, type="int", default=8),
             )
         )
 
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
-            required_if=[("state", "present", ["full_name", "unique_name"])],
+            mutually_exclusive=[("unique_name", "users")],
+            required_one_of=[("unique_name", "users")],
             supports_check_mode=True,
         )
 
@@ -142,53 +250,68 @@ class SgGridUser(object):
 
         # set up state variables
         self.parameters = self.na_helper.set_parameters(self.module.params)
+
+        if "users" not in self.parameters:
+            self.check_user_parameters(self.parameters)
+
         # Calling generic SG rest_api class
         self.rest_api = SGRestAPI(self.module)
         # Get API version
         self.rest_api.get_sg_product_version()
         self.api_version = self.rest_api.get_api_version()
 
-        # Checking for the parameters passed and create new parameters list
-        self.data = {}
-        self.data["memberOf"] = []
-        if self.parameters.get("full_name"):
-            self.data["fullName"] = self.parameters["full_name"]
-        if self.parameters.get("unique_name"):
-            self.data["uniqueName"] = self.parameters["unique_name"]
+        if "users" not in self.parameters:
+            self.data, self.pw_change = self.build_user_data(self.parameters)
 
-        if self.parameters.get("disable") is not None:
-            self.data["disable"] = self.parameters["disable"]
+    def check_user_parameters(self, parameters, prefix=""):
+        """ Fail if full_name is missing for a present user, or the unique_name or password are not valid """
+        if parameters["state"] == "present" and "full_name" not in parameters:
+            self.module.fail_json(msg="%sstate is present but all of the following are missing: full_name" % prefix)
 
-        re_local_user = re.compile("^user/")
-        re_fed_user = re.compile("^federated-user/")
+        if not parameters["unique_name"].startswith(("user/", "federated-user/")):
+            self.module.fail_json(msg="%sunique_name must begin with 'user/' or 'federated-user/'" % prefix)
 
-        if (
-            re_local_user.match(self.parameters["unique_name"]) is None
-            and re_fed_user.match(self.parameters["unique_name"]) is None
-        ):
-            self.module.fail_json(msg="unique_name must begin with 'user/' or 'federated-user/'")
+        if parameters.get("password") is not None and parameters["unique_name"].startswith("federated-user/"):
+            self.module.fail_json(msg="%spassword cannot be set for a federated user" % prefix)
 
-        self.pw_change = {}
-        if self.parameters.get("password") is not None:
-            if re_fed_user.match(self.parameters["unique_name"]):
-                self.module.fail_json(msg="password cannot be set for a federated user")
-            self.pw_change["password"] = self.parameters["password"]
+    def build_user_data(self, parameters):
+        """ Checking for the parameters passed and return the user and password change bodies """
+        data = {}
+        data["memberOf"] = []
+        if parameters.get("full_name"):
+            data["fullName"] = parameters["full_name"]
+        if parameters.get("unique_name"):
+            data["uniqueName"] = parameters["unique_name"]
 
-    def get_grid_groups(self):
-        # Get list of admin groups
-        # Retrun mapping of uniqueName to ids if found, or None
-        api = "api/%s/grid/groups?limit=350" % self.api_version
+        if parameters.get("disable") is not None:
+            data["disable"] = parameters["disable"]
 
-        response, error = self.rest_api.get(api)
+        pw_change = {}
+        if parameters.get("password") is not None:
+            pw_change["password"] = parameters["password"]
+        return data, pw_change
+
+    def get_grid_groups(self):
+        # Get list of admin groups, paging through all of them
+        # Return mapping of uniqueName to ids
+        api = "api/%s/grid/groups" % self.api_version
+        groups, error = self.rest_api.get_paginated(api)
 
         if error:
             self.module.fail_json(msg=error)
 
-        if response["data"]:
-            name_to_id_map = dict(zip([i["uniqueName"] for i in response["data"]], [j["id"] for j in response["data"]]))
-            return name_to_id_map
+        return dict((group["uniqueName"], group["id"]) for group in groups)
 
-        return None
+    def get_grid_users(self):
+        # Get list of users, paging through all of them
+        # Return mapping of uniqueName to users
+        api = "api/%s/grid/users" % self.api_version
+        users, error = self.rest_api.get_paginated(api)
+
+        if error:
+            self.module.fail_json(msg=error)
+
+        return dict((user["uniqueName"], user) for user in users)
 
     def get_grid_user(self, unique_name):
         # Use the unique name to check if the user exists
@@ -236,10 +359,141 @@ class SgGridUser(object):
         if error:
             self.module.fail_json(msg=error)
 
+    def get_user_parameters(self, user):
+        """ Options not set for a user default to the module options """
+        parameters = dict(self.parameters)
+        for option in ("users", "purge_users", "max_concurrent_requests"):
+            parameters.pop(option, None)
+        parameters.update((key, value) for key, value in user.items() if value is not None)
+        return parameters
+
+    def plan_user_changes(self, grid_users):
+        """
+        Compare each user with its current state, and return the list of changes.
+        Each change is a dict with unique_name, action (create, update, delete or None), the current user,
+        the request bodies and an error if the user cannot be changed.
+        """
+        user_parameters = [self.get_user_parameters(user) for user in self.parameters["users"]]
+        grid_groups = {}
+        if any(parameters.get("member_of") for parameters in user_parameters):
+            grid_groups = self.get_grid_groups()
+
+        changes = []
+        names = set()
+        for parameters in user_parameters:
+            unique_name = parameters["unique_name"]
+            if unique_name in names:
+                self.module.fail_json(msg="Error in users: %s is listed more than once." % unique_name)
+            names.add(unique_name)
+            prefix = "Error in users for %s: " % unique_name
+            self.check_user_parameters(parameters, prefix)
+            current = grid_users.get(unique_name)
+            change = dict(unique_name=unique_name, action=None, current=current, data=None, pw_change={}, error=None)
+            changes.append(change)
+
+            if parameters["state"] == "absent":
+                if current is not None:
+                    change["action"] = "delete"
+                continue
+
+            change["data"], change["pw_change"] = self.build_user_data(parameters)
+            missing = set(parameters.get("member_of") or []) - set(grid_groups)
+            if missing:
+                change["error"] = "Invalid unique_group supplied: '%s' not found" % "', '".join(sorted(missing))
+                continue
+            change["data"]["memberOf"] = [grid_groups[group] for group in parameters.get("member_of") or []]
+
+            if current is None:
+                change["action"] = "create"
+            else:
+                if set(current.get("memberOf") or []) != set(change["data"]["memberOf"]):
+                    change["action"] = "update"
+                if parameters.get("disable") is not None and parameters["disable"] != current.get("disable"):
+                    change["action"] = "update"
+                if parameters["update_password"] != "always":
+                    change["pw_change"] = {}
+
+        if self.parameters["purge_users"]:
+            for unique_name in sorted(set(grid_users) - names):
+                # the root user has no user/ or federated-user/ prefix
+                if unique_name.startswith(("user/", "federated-user/")):
+                    changes.append(
+                        dict(unique_name=unique_name, action="delete", current=grid_users[unique_name], data=None, pw_change={}, error=None)
+                    )
+        return changes
+
+    def apply_user_change(self, change):
+        """
+        Apply the change of one user, and set its password, called from a worker thread.
+        Errors are reported in the result rather than with fail_json, so the other users carry on.
+        """
+        current = change["current"]
+        result = dict(
+            unique_name=change["unique_name"],
+            id=current["id"] if current else None,
+            action=change["action"] or "none",
+            changed=bool(change["action"] or change["pw_change"]),
+            password_updated=bool(change["pw_change"]),
+        )
+        error = change["error"]
+        if error or self.module.check_mode or not result["changed"]:
+            if error:
+                result["error"] = str(error)
+            return result
+
+        if change["action"] == "delete":
+            api = "api/%s/grid/users/%s" % (self.api_version, current["id"])
+            response, error = self.rest_api.delete(api, None)
+        elif change["action"] == "create":
+            api = "api/%s/grid/users" % self.api_version
+            response, error = self.rest_api.post(api, change["data"])
+            if not error:
+                result["id"] = response["data"]["id"]
+        elif change["action"] == "update":
+            api = "api/%s/grid/users/%s" % (self.api_version, current["id"])
+            response, error = self.rest_api.put(api, change["data"])
+
+        if not error and change["pw_change"]:
+            api = "api/%s/grid/users/%s/change-password" % (self.api_version, change["unique_name"])
+            response, error = self.rest_api.post(api, change["pw_change"])
+
+        if error:
+            result["error"] = str(error)
+        return result
+
+    def apply_users(self):
+        """
+        Manage the list of users: list users and groups once, then change the users concurrently
+        """
+        changes = self.plan_user_changes(self.get_grid_users())
+        results = run_concurrently(self.apply_user_change, changes, self.parameters["max_concurrent_requests"])
+
+        succeeded = [result for result in results if "error" not in result]
+        changed = any(result["changed"] for result in succeeded)
+        counts = []
+        for action in ("create", "update", "delete"):
+            count = len([result for result in succeeded if result["action"] == action])
+            if count:
+                counts.append("%d Grid Users %sd" % (count, action))
+        count = len([result for result in succeeded if result["password_updated"]])
+        if count:
+            counts.append("%d Grid User passwords updated" % count)
+        failed = [result for result in results if "error" in result]
+        if failed:
+            msg = "Error changing %d of %d Grid Users: %s" % (
+                len(failed), len(results), "; ".join("%s: %s" % (result["unique_name"], result["error"]) for result in failed)
+            )
+            self.module.fail_json(msg=msg, changed=changed, users=results)
+        self.module.exit_json(changed=changed, msg="; ".join(counts), users=results)
+
     def apply(self):
         """
         Perform pre-checks, call functions and exit
         """
+        if "users" in self.parameters:
+            self.apply_users()
+            return
+
         grid_user = self.get_grid_user(self.parameters["unique_name"])
 
         if self.parameters.get("member_of"):
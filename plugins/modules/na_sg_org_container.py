@@ -36,7 +36,7 @@ options:
   name:
     description:
     - Name of the bucket.
-    required: true
+    - Required unless I(buckets) is set.
     type: str
   region:
     description:
@@ -92,6 +92,77 @@ options:
       - Configure bucket policy.
     type: dict
     version_added: '21.16.0'
+  buckets:
+    description:
+    - List of buckets to manage in a single task.
+    - The bucket list is read once, then the settings of every bucket are read and written concurrently.
+    - Options not set for a bucket default to the module option of the same name.
+    - Mutually exclusive with I(name).
+    type: list
+    elements: dict
+    version_added: '21.18.0'
+    suboptions:
+      name:
+        description:
+        - Name of the bucket.
+        type: str
+        required: true
+      state:
+        description:
+        - Whether the bucket should exist or not.
+        type: str
+        choices: ['present', 'absent']
+      region:
+        description:
+        - Set a region for the bucket.
+        type: str
+      compliance:
+        description:
+        - Configure compliance settings for the bucket, see I(compliance).
+        type: dict
+        suboptions:
+          auto_delete:
+            description:
+            - If enabled, objects will be deleted automatically when its retention period expires.
+            type: bool
+          legal_hold:
+            description:
+            - If enabled, objects in this bucket cannot be deleted.
+            type: bool
+          retention_period_minutes:
+            description:
+            - specify the length of the retention period for objects added to this bucket, in minutes.
+            type: int
+      capacity_limit:
+        description:
+        - The maximum number of GB available for this buckets's objects.
+        type: float
+      s3_object_lock_enabled:
+        description:
+        - Enable S3 Object Lock on the bucket.
+        type: bool
+      bucket_versioning_enabled:
+        description:
+        - Enable versioning on the bucket.
+        type: bool
+      consistency:
+        description:
+        - The consistency control of the bucket.
+        type: str
+        choices: ['all', 'strong-global', 'strong-site', 'read-after-new-write', 'available']
+      policy:
+        description:
+        - Configure bucket policy.
+        type: dict
+  max_concurrent_requests:
+    description:
+    - With I(buckets), maximum number of requests sent at the same time.
+    type: int
+    default: 8
+    version_added: '21.18.0'
+notes:
+- With I(buckets), a bucket that fails to be changed does not stop the other ones, and the module fails
+  after all the buckets are processed, reporting the error of each bucket in I(buckets).
 """
 
 EXAMPLES = """
@@ -154,6 +225,22 @@ EXAMPLES = """
             - "arn:aws:s3:::mybucket/myobject"
             - "arn:aws:s3:::mybucket/myobject"
           Principal: "*"
+
+- name: manage many s3 buckets in one task
+  netapp.storagegrid.na_sg_org_container:
+    api_url: "https://<storagegrid-endpoint-url>"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    bucket_versioning_enabled: true
+    consistency: read-after-new-write
+    buckets:
+      - name: ansiblebucket1
+      - name: ansiblebucket2
+        capacity_limit: 100
+      - name: ansiblebucket3
+        bucket_versioning_enabled: false
+      - name: oldbucket
+        state: absent
 """
 
 RETURN = """
@@ -189,12 +276,30 @@ resp:
           ]
         }
     }
+buckets:
+    description:
+    - Result for each bucket, with I(buckets).
+    - I(action) is C(create), C(update), C(delete) or C(none), I(updated) lists the bucket settings written.
+    - I(error) is only set when the change failed.
+    returned: success or failure, with I(buckets)
+    type: list
+    elements: dict
+    version_added: '21.18.0'
+    sample: [
+        {
+            "name": "ansiblebucket2",
+            "action": "update",
+            "changed": true,
+            "updated": ["versioning", "quota-object-bytes"]
+        }
+    ]
 """
 
 import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import SGRestAPI
+from ansible_collections.netapp.storagegrid.plugins.module_utils.tools import run_concurrently
 
 
 class SgOrgContainer(object):
@@ -211,7 +316,7 @@ class SgOrgContainer(object):
         self.argument_spec.update(
             dict(
                 state=dict(required=False, type="str", choices=["present", "absent"], default="present"),
-                name=dict(required=True, type="str"),
+                name=dict(required=False, type="str"),
                 region=dict(required=False, type="str"),
                 compliance=dict(
                     required=False,
@@ -227,16 +332,42 @@ class SgOrgContainer(object):
                 bucket_versioning_enabled=dict(required=False, type="bool"),
                 consistency=dict(required=False, type="str", choices=["all", "strong-global", "strong-site", "read-after-new-write", "available"]),
                 policy=dict(required=False, type="dict"),
+                buckets=dict(
+                    required=False,
+                    type="list",
+                    elements="dict",
+                    options=dict(
+                        name=dict(required=True, type="str"),
+                        state=dict(required=False, type="str", choices=["present", "absent"]),
+                        region=dict(required=False, type="str"),
+                        compliance=dict(
+                            required=False,
+                            type="dict",
+                            options=dict(
+                                auto_delete=dict(required=False, type="bool"),
+                                legal_hold=dict(required=False, type="bool"),
+                                retention_period_minutes=dict(required=False, type="int"),
+                            ),
+                        ),
+                        capacity_limit=dict(required=False, type="float"),
+                        s3_object_lock_enabled=dict(required=False, type="bool"),
+                        bucket_versioning_enabled=dict(required=False, type="bool"),
+                        consistency=dict(
+                            required=False,
+                            type="str",
+                            choices=["all", "strong-global", "strong-site", "read-after-new-write", "available"],
+                        ),
+                        policy=dict(required=False, type="dict"),
+                    ),
+                    mutually_exclusive=[("compliance", "s3_object_lock_enabled")],
+                ),
+                max_concurrent_requests=dict(required=False, type="int", default=8),
             )
         )
-        parameter_map = {
-            "auto_delete": "autoDelete",
-            "legal_hold": "legalHold",
-            "retention_period_minutes": "retentionPeriodMinutes",
-        }
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
-            mutually_exclusive=[("compliance", "s3_object_lock_enabled")],
+            mutually_exclusive=[("compliance", "s3_object_lock_enabled"), ("name", "buckets")],
+            required_one_of=[("name", "buckets")],
             supports_check_mode=True,
         )
 
@@ -250,45 +381,67 @@ class SgOrgContainer(object):
         self.rest_api.get_sg_product_version(api_root="org")
         self.api_version = self.rest_api.get_api_version()
 
-        # Checking for the parameters passed and create new parameters list.
-
         self.data_versioning = {}
-        self.consistency_setting = {}
-        self.bucket_policy = {}
-        self.quota_object_bytes = {}
-
-        self.data = {}
-        self.data["name"] = self.parameters["name"]
-        self.data["region"] = self.parameters.get("region")
-        if self.parameters.get("compliance"):
-            self.data["compliance"] = dict(
-                (parameter_map[k], v) for (k, v) in self.parameters["compliance"].items() if v is not None
+        if "buckets" not in self.parameters:
+            settings = self.build_bucket_settings(self.parameters)
+            self.data = settings["data"]
+            self.consistency_setting = settings["consistency_setting"]
+            self.quota_object_bytes = settings["quota_object_bytes"]
+            self.bucket_policy = settings["bucket_policy"]
+
+    def build_bucket_settings(self, parameters):
+        """
+        Checking for the parameters passed and create the request bodies of a bucket.
+        Return a dict with data, consistency_setting, quota_object_bytes and bucket_policy.
+        """
+        parameter_map = {
+            "auto_delete": "autoDelete",
+            "legal_hold": "legalHold",
+            "retention_period_minutes": "retentionPeriodMinutes",
+        }
+        consistency_setting = {}
+        bucket_policy = {}
+        quota_object_bytes = {}
+
+        data = {}
+        data["name"] = parameters["name"]
+        data["region"] = parameters.get("region")
+        if parameters.get("compliance"):
+            data["compliance"] = dict(
+                (parameter_map[k], v) for (k, v) in parameters["compliance"].items() if v is not None
             )
 
-        if self.parameters.get("s3_object_lock_enabled") is not None:
+        if parameters.get("s3_object_lock_enabled") is not None:
             self.rest_api.fail_if_not_sg_minimum_version("S3 Object Lock", 11, 5)
-            self.data["s3ObjectLock"] = dict(enabled=self.parameters["s3_object_lock_enabled"])
+            data["s3ObjectLock"] = dict(enabled=parameters["s3_object_lock_enabled"])
 
-        if self.parameters.get("bucket_versioning_enabled") is not None:
+        if parameters.get("bucket_versioning_enabled") is not None:
             self.rest_api.fail_if_not_sg_minimum_version("Bucket versioning configuration", 11, 6)
 
-        if self.parameters.get("consistency") is not None:
+        if parameters.get("consistency") is not None:
             self.rest_api.fail_if_not_sg_minimum_version("consistency setting", 11, 6)
-            self.consistency_setting["consistency"] = self.parameters["consistency"]
+            consistency_setting["consistency"] = parameters["consistency"]
 
-        if self.parameters.get("capacity_limit"):
+        if parameters.get("capacity_limit"):
             self.rest_api.fail_if_not_sg_minimum_version("Bucket capacity limit", 11, 9)
-            self.quota_object_bytes["quotaObjectBytes"] = int(self.parameters["capacity_limit"] * 1024 ** 3)
+            quota_object_bytes["quotaObjectBytes"] = int(parameters["capacity_limit"] * 1024 ** 3)
 
-        if self.parameters.get("policy") is not None:
+        if parameters.get("policy") is not None:
             self.rest_api.fail_if_not_sg_minimum_version("bucket policy", 11, 9)
-            policy_value = self.parameters.get("policy")
+            policy_value = parameters.get("policy")
             if policy_value == {}:
                 policy_value = None
-            self.bucket_policy = {"policy": policy_value}
+            bucket_policy = {"policy": policy_value}
 
-    def get_org_container(self):
-        ''' Get org container details '''
+        return dict(
+            data=data,
+            consistency_setting=consistency_setting,
+            quota_object_bytes=quota_object_bytes,
+            bucket_policy=bucket_policy,
+        )
+
+    def get_org_containers(self):
+        ''' Get the details of every org container '''
         params = {"include": "compliance,region"}
         if self.rest_api.meets_sg_minimum_version(11, 9):
             params["include"] += ",quotaObjectBytes"
@@ -297,7 +450,11 @@ class SgOrgContainer(object):
         if error:
             self.module.fail_json(msg=error)
 
-        for container in response["data"]:
+        return response["data"]
+
+    def get_org_container(self):
+        ''' Get org container details '''
+        for container in self.get_org_containers():
             if container["name"] == self.parameters["name"]:
                 return container
 
@@ -409,10 +566,169 @@ class SgOrgContainer(object):
 
         return response["data"]
 
+    def get_bucket_parameters(self, bucket):
+        """ Options not set for a bucket default to the module options """
+        parameters = dict(self.parameters)
+        for option in ("buckets", "max_concurrent_requests"):
+            parameters.pop(option, None)
+        parameters.update((key, value) for key, value in bucket.items() if value is not None)
+        return parameters
+
+    def bucket_subresource_api(self, name, subresource):
+        if subresource == "policy":
+            return "api/v3/org/containers/%s/policy" % name
+        return "api/%s/org/containers/%s/%s" % (self.api_version, name, subresource)
+
+    def get_bucket_subresource(self, request):
+        """ GET a setting of a bucket, called from a worker thread, return (response, error) """
+        bucket, subresource = request
+        return self.rest_api.get(self.bucket_subresource_api(bucket["name"], subresource))
+
+    def put_bucket_subresource(self, request):
+        """ PUT a setting of a bucket, called from a worker thread, return (response, error) """
+        bucket, subresource, body = request
+        return self.rest_api.put(self.bucket_subresource_api(bucket["name"], subresource), body)
+
+    def create_or_delete_bucket(self, bucket):
+        """ POST or DELETE a bucket, called from a worker thread, return (response, error) """
+        if bucket["action"] == "delete":
+            return self.rest_api.delete("api/%s/org/containers/%s" % (self.api_version, bucket["name"]), None)
+        return self.rest_api.post("api/%s/org/containers" % self.api_version, bucket["settings"]["data"])
+
+    def plan_bucket_writes(self, bucket, current_settings):
+        """ Return the list of (subresource, body) to write for a bucket, in the order of the single bucket mode """
+        parameters = bucket["parameters"]
+        settings = bucket["settings"]
+        current = bucket["current"]
+        writes = []
+        if current is None:
+            if parameters.get("bucket_versioning_enabled"):
+                writes.append(("versioning", {"versioningEnabled": True, "versioningSuspended": False}))
+            if parameters.get("consistency") is not None:
+                writes.append(("consistency", settings["consistency_setting"]))
+            if parameters.get("capacity_limit"):
+                writes.append(("quota-object-bytes", settings["quota_object_bytes"]))
+            if parameters.get("policy"):
+                writes.append(("policy", settings["bucket_policy"]))
+            return writes
+
+        if parameters.get("compliance") and current.get("compliance") != settings["data"]["compliance"]:
+            writes.append(("compliance", settings["data"]["compliance"]))
+        if "versioning" in current_settings:
+            desired_enabled = parameters["bucket_versioning_enabled"]
+            if desired_enabled != current_settings["versioning"].get("versioningEnabled", False):
+                writes.append(("versioning", {"versioningEnabled": desired_enabled, "versioningSuspended": not desired_enabled}))
+        if "consistency" in current_settings:
+            if current_settings["consistency"]["consistency"] != settings["consistency_setting"]["consistency"]:
+                writes.append(("consistency", settings["consistency_setting"]))
+        if parameters.get("capacity_limit") and current.get("quotaObjectBytes") != settings["quota_object_bytes"]["quotaObjectBytes"]:
+            writes.append(("quota-object-bytes", settings["quota_object_bytes"]))
+        if "policy" in current_settings:
+            current_policy = current_settings["policy"].get("policy") or None
+            if settings["bucket_policy"].get("policy") != current_policy:
+                writes.append(("policy", settings["bucket_policy"]))
+        return writes
+
+    def apply_buckets(self):
+        """
+        Manage the list of buckets: read the bucket list once, then read and write the bucket settings concurrently
+        """
+        max_workers = self.parameters["max_concurrent_requests"]
+        containers = dict((container["name"], container) for container in self.get_org_containers())
+
+        buckets = []
+        names = set()
+        for item in self.parameters["buckets"]:
+            parameters = self.get_bucket_parameters(item)
+            name = parameters["name"]
+            if name in names:
+                self.module.fail_json(msg="Error in buckets: %s is listed more than once." % name)
+            names.add(name)
+            bucket = dict(name=name, parameters=parameters, current=containers.get(name), settings=None, action=None, writes=[], error=None)
+            if parameters["state"] == "present":
+                bucket["settings"] = self.build_bucket_settings(parameters)
+                if bucket["current"] is None:
+                    bucket["action"] = "create"
+            elif bucket["current"] is not None:
+                bucket["action"] = "delete"
+            buckets.append(bucket)
+
+        # read the settings of the existing buckets
+        reads = []
+        for bucket in buckets:
+            if bucket["current"] is None or bucket["parameters"]["state"] != "present":
+                continue
+            for subresource, option in (("versioning", "bucket_versioning_enabled"), ("consistency", "consistency"), ("policy", "policy")):
+                if bucket["parameters"].get(option) is not None:
+                    reads.append((bucket, subresource))
+        current_settings = {}
+        for (bucket, subresource), (response, error) in zip(reads, run_concurrently(self.get_bucket_subresource, reads, max_workers)):
+            if error:
+                bucket["error"] = bucket["error"] or error
+            else:
+                current_settings.setdefault(bucket["name"], {})[subresource] = response["data"]
+
+        for bucket in buckets:
+            if bucket["settings"] is not None and bucket["error"] is None:
+                bucket["writes"] = self.plan_bucket_writes(bucket, current_settings.get(bucket["name"], {}))
+                if bucket["writes"] and bucket["action"] is None:
+                    bucket["action"] = "update"
+
+        # S3 Object Lock requires the global setting, read it once for all the buckets
+        object_lock_buckets = [
+            bucket for bucket in buckets if bucket["action"] == "create" and bucket["parameters"].get("s3_object_lock_enabled")
+        ]
+        if object_lock_buckets:
+            response, error = self.rest_api.get("api/%s/org/compliance-global" % self.api_version)
+            if error:
+                self.module.fail_json(msg=error)
+            if not response["data"]["complianceEnabled"]:
+                for bucket in object_lock_buckets:
+                    bucket["error"] = "Error: Global S3 Object Lock setting is not enabled."
+
+        if not self.module.check_mode:
+            changes = [bucket for bucket in buckets if bucket["action"] in ("create", "delete") and bucket["error"] is None]
+            for bucket, (response, error) in zip(changes, run_concurrently(self.create_or_delete_bucket, changes, max_workers)):
+                bucket["error"] = error
+            writes = [(bucket, subresource, body) for bucket in buckets if bucket["error"] is None for subresource, body in bucket["writes"]]
+            for (bucket, subresource, body), (response, error) in zip(writes, run_concurrently(self.put_bucket_subresource, writes, max_workers)):
+                if error:
+                    bucket["error"] = bucket["error"] or "%s: %s" % (subresource, error)
+
+        results = []
+        for bucket in buckets:
+            result = dict(
+                name=bucket["name"],
+                action=bucket["action"] or "none",
+                changed=bucket["action"] is not None,
+                updated=[subresource for subresource, body in bucket["writes"]],
+            )
+            if bucket["error"] is not None:
+                result["error"] = str(bucket["error"])
+            results.append(result)
+
+        changed = any(result["changed"] and "error" not in result for result in results)
+        counts = []
+        for action in ("create", "update", "delete"):
+            count = len([result for result in results if result["action"] == action and "error" not in result])
+            if count:
+                counts.append("%d Org Containers %sd" % (count, action))
+        failed = [result for result in results if "error" in result]
+        if failed:
+            msg = "Error changing %d of %d Org Containers: %s" % (
+                len(failed), len(results), "; ".join("%s: %s" % (result["name"], result["error"]) for result in failed)
+            )
+            self.module.fail_json(msg=msg, changed=changed, buckets=results)
+        self.module.exit_json(changed=changed, msg="; ".join(counts), buckets=results)
+
     def apply(self):
         """
         Perform pre-checks, call functions and exit
         """
+        if "buckets" in self.parameters:
+            self.apply_buckets()
+            return
+
         versioning_config = None
         update_versioning = False
         consistency_setting = None
@@ -49,11 +49,77 @@ options:
             - C(org_ilm_info) or C(org/ilm-policy-tags)
             - C(versions_info) or C(versions)
             - Can specify a list of values to include a larger subset.
-        default: "all"
+            - Defaults to C(all), or to the subsets listed in I(subset_options) when it is set.
     parameters:
         description:
         - Allows for any rest option to be passed in.
+        - Applied to every subset, see I(subset_options) for the parameters of one subset.
         type: dict
+    subset_options:
+        description:
+        - Query parameters, fields and filters of individual subsets.
+        - The subsets listed here are gathered in addition to I(gather_subset).
+        - With I(fields) or I(filters), the response is decoded item by item, only the selected fields of the
+          matching items are kept, and only the C(data) member of the response is returned.
+        type: list
+        elements: dict
+        version_added: '21.18.0'
+        suboptions:
+            subset:
+                description:
+                - Subset the options apply to, either the info name or the REST API.
+                type: str
+                required: true
+            fields:
+                description:
+                - Fields to keep in each item, as dotted paths such as C(policy.quotaObjectBytes).
+                - A path going through a list keeps the field in each element of the list.
+                - By default, items are returned whole.
+                type: list
+                elements: str
+            filters:
+                description:
+                - Keep the items matching all the filters.
+                - A filter is a path, true when the value is present and not null, or C(path operator value),
+                  where the operator is one of C(==), C(!=), C(<), C(<=), C(>), C(>=), or C(=~) for a regular expression search.
+                - The value is a JSON literal, such as C(10), C(true), C(null) or C("text"), or a bare string.
+                - When a path reaches a list, the filter is true if it holds for any element.
+                - For a subset returning an object rather than a list, C(data) is null when the object does not match.
+                type: list
+                elements: str
+            parameters:
+                description:
+                - REST API query parameters of this subset, such as C(limit), C(marker) or C(include).
+                - They are merged over I(parameters).
+                type: dict
+    snapshot:
+        description:
+        - Path of a snapshot file, on the host running the module, holding content hashes of the gathered subsets.
+        - When set, I(sg_info) only holds the subsets that changed since the snapshot was written.
+        - For a list subset, only the added and modified items are returned in C(data), along with the keys of
+          the C(added), C(modified) and C(removed) items.  Items are identified by their C(id), C(name), C(uniqueName)
+          or C(key), or by their content when they have none of these.
+        - The snapshot is created on the first run, when every gathered subset is returned, and it is replaced
+          atomically after each run where a subset changed, except in check mode.
+        - C(changed) is true when a subset changed, and the snapshot was or, in check mode, would be updated.
+        - Subsets that are not gathered keep their entry in the snapshot.
+        type: path
+        version_added: '21.18.0'
+    dest:
+        description:
+        - Path of a gzip compressed NDJSON file, on the host running the module, the gathered subsets are written to
+          instead of being returned in I(sg_info).
+        - Each item of a list subset is written on its own line, a JSON object with the C(subset) name and the C(item),
+          as the response is decoded, so a large subset is never held in memory.
+        - Other subsets are written on one line, with the C(subset) name and its C(data).
+        - I(fields) and I(filters) of I(subset_options) apply to the written items.
+        - The file is written to a temporary file in the same directory and renamed when complete.
+        - A new file is created with mode C(0600), as subsets may hold credentials, a replaced file keeps its mode.
+        - In check mode, the items are counted and hashed but the file is not written.
+        - An existing file with the same lines is kept, C(changed) is true when the file was or, in check mode, would be replaced.
+        - Mutually exclusive with I(snapshot).
+        type: path
+        version_added: '21.18.0'
 """
 
 EXAMPLES = """
@@ -94,12 +160,51 @@ EXAMPLES = """
     parameters:
       limit: 5
   register: sg_org_info
+
+- name: Gather the name, region and creation time of the buckets whose name starts with prod-
+  netapp.storagegrid.na_sg_org_info:
+    api_url: "https://1.2.3.4/"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    subset_options:
+      - subset: org/containers
+        fields:
+          - name
+          - region
+          - creationTime
+        filters:
+          - "name =~ ^prod-"
+        parameters:
+          include: compliance,region
+  register: sg_org_info
+
+- name: Return the buckets and users that changed since the previous run
+  netapp.storagegrid.na_sg_org_info:
+    api_url: "https://1.2.3.4/"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    gather_subset:
+      - org/containers
+      - org/users
+    snapshot: /var/lib/storagegrid/org_info.snapshot
+  register: sg_org_changes
+
+- name: Write every org subset to a compressed file
+  netapp.storagegrid.na_sg_org_info:
+    api_url: "https://1.2.3.4/"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    dest: /var/lib/storagegrid/org_info.ndjson.gz
+  register: sg_org_dump
 """
 
 RETURN = """
 sg_info:
-    description: Returns various information about the StorageGRID Grid configuration.
-    returned: always
+    description:
+      - Returns various information about the StorageGRID Grid configuration.
+      - With I(snapshot), only the subsets that changed, and for list subsets the added and modified items
+        with the C(added), C(modified) and C(removed) keys.
+    returned: when I(dest) is not set
     type: dict
     sample: {
         "org/compliance-global": {...},
@@ -119,12 +224,35 @@ sg_info:
         "org/ilm-policy-tags": {...},
         "org/versions": {...}
     }
+manifest:
+    description:
+      - With I(dest), the path and the number of lines written, with the size and SHA-256 of the compressed file,
+        and for each subset, its type, the number and size of its lines and the SHA-256 of its lines.
+      - C(changed) tells whether the lines differ from the existing file, and C(written) whether the file was replaced.
+      - C(bytes) and C(sha256) of the compressed file are not returned in check mode, as no file is written.
+    returned: when I(dest) is set
+    type: dict
+    version_added: '21.18.0'
+    sample: {
+        "dest": "/var/lib/storagegrid/org_info.ndjson.gz",
+        "format": "ndjson.gz",
+        "changed": true,
+        "written": true,
+        "items": 2,
+        "bytes": 301,
+        "sha256": "9f2c...",
+        "subsets": [
+            {"subset": "org/groups", "type": "list", "count": 2, "bytes": 412, "sha256": "c41e..."}
+        ]
+    }
 """
 
 from ansible.module_utils.basic import AnsibleModule
 import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import SGRestAPI
+from ansible_collections.netapp.storagegrid.plugins.module_utils.info_query import InfoSubsets, subset_options_argument_spec
+from ansible_collections.netapp.storagegrid.plugins.module_utils.info_snapshot import diff_against_snapshot
 
 
 class NetAppSgGatherInfo(object):
@@ -137,12 +265,18 @@ class NetAppSgGatherInfo(object):
         """
         self.argument_spec = netapp_utils.na_storagegrid_host_argument_spec()
         self.argument_spec.update(dict(
-            gather_subset=dict(default=['all'], type='list', elements='str', required=False),
+            gather_subset=dict(type='list', elements='str', required=False),
             parameters=dict(type='dict', required=False)
         ))
+        self.argument_spec.update(subset_options_argument_spec())
+        self.argument_spec.update(dict(
+            snapshot=dict(type='path', required=False),
+            dest=dict(type='path', required=False)
+        ))
 
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
+            mutually_exclusive=[('dest', 'snapshot')],
             supports_check_mode=True
         )
 
@@ -150,11 +284,12 @@ class NetAppSgGatherInfo(object):
         self.na_helper = NetAppModule()
         self.parameters = self.na_helper.set_parameters(self.module.params)
         self.rest_api = SGRestAPI(self.module)
+        self.info_subsets = InfoSubsets(self.rest_api, self.module, self.convert_subsets)
         # Get API version
         self.rest_api.get_sg_product_version(api_root="org")
         self.api_version = self.rest_api.get_api_version()
 
-    def get_subset_info(self, gather_subset_info):
+    def get_subset_info(self, gather_subset_info, options=None):
         """
         Gather StorageGRID information for the given subset using REST APIs
         Input for REST APIs call : (api, data)
@@ -162,11 +297,10 @@ class NetAppSgGatherInfo(object):
         """
 
         api = gather_subset_info['api_call']
-        data = {}
-        # allow for passing in any additional rest api parameters
-        if self.parameters.get('parameters'):
-            for each in self.parameters['parameters']:
-                data[each] = self.parameters['parameters'][each]
+        data = self.info_subsets.get_subset_parameters(options)
+
+        if options and options.get('query'):
+            return self.info_subsets.get_subset_items(api, data, options['query'])
 
         gathered_sg_info, error = self.rest_api.get(api, data)
 
@@ -177,7 +311,7 @@ class NetAppSgGatherInfo(object):
 
         return None
 
-    def convert_subsets(self):
+    def convert_subsets(self, gather_subset):
         """ Convert an info to the REST API """
         info_to_rest_mapping = {
             'org_compliance_global_info': 'org/compliance-global',
@@ -199,7 +333,7 @@ class NetAppSgGatherInfo(object):
         }
         # Add rest API names as there info version, also make sure we don't add a duplicate
         subsets = []
-        for subset in self.parameters['gather_subset']:
+        for subset in gather_subset:
             if subset in info_to_rest_mapping:
                 if info_to_rest_mapping[subset] not in subsets:
                     subsets.append(info_to_rest_mapping[subset])
@@ -265,11 +399,23 @@ class NetAppSgGatherInfo(object):
             },
         }
 
-        if 'all' in self.parameters['gather_subset']:
+        subset_options = self.info_subsets.get_subset_options()
+        # all by default, or the subsets with options
+        gather_subset = self.parameters.get('gather_subset', [] if subset_options else ['all'])
+        if 'all' in gather_subset:
             # If all in subset list, get the information of all subsets
-            self.parameters['gather_subset'] = sorted(get_sg_subset_info.keys())
+            gather_subset = sorted(get_sg_subset_info.keys())
+
+        converted_subsets = self.convert_subsets(gather_subset)
+        converted_subsets.extend(subset for subset in subset_options if subset not in converted_subsets)
 
-        converted_subsets = self.convert_subsets()
+        if self.parameters.get('dest'):
+            unknown = [subset for subset in converted_subsets if subset not in get_sg_subset_info]
+            if unknown:
+                self.module.fail_json(msg="Specified subset %s not found, supported subsets are %s" %
+                                      (unknown[0], list(get_sg_subset_info.keys())))
+            manifest = self.info_subsets.write_subsets(converted_subsets, get_sg_subset_info, subset_options)
+            self.module.exit_json(changed=manifest['changed'], manifest=manifest)
 
         for subset in converted_subsets:
             try:
@@ -279,9 +425,18 @@ class NetAppSgGatherInfo(object):
                 self.module.fail_json(msg="Specified subset %s not found, supported subsets are %s" %
                                       (subset, list(get_sg_subset_info.keys())))
 
-            result_message[subset] = self.get_subset_info(specified_subset)
+            result_message[subset] = self.get_subset_info(specified_subset, subset_options.get(subset))
+
+        changed = False
+        if self.parameters.get('snapshot'):
+            # only return what changed since the previous run
+            result_message, error = diff_against_snapshot(self.parameters['snapshot'], result_message, update=not self.module.check_mode)
+            if error:
+                self.module.fail_json(msg=error)
+            # the snapshot is rewritten when a subset changed
+            changed = bool(result_message)
 
-        self.module.exit_json(changed=False, sg_info=result_message)
+        self.module.exit_json(changed=changed, sg_info=result_message)
 
 
 def main():
@@ -0,0 +1,340 @@
+#!/usr/bin/python
+
+# (c) 2026, NetApp Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""NetApp StorageGRID - Rotate the S3 access keys of every user of a tenant"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {
+    "metadata_version": "1.1",
+    "status": ["preview"],
+    "supported_by": "community",
+}
+
+
+DOCUMENTATION = """
+module: na_sg_org_s3_key_rotation
+short_description: NetApp StorageGRID rotate the S3 access keys of the users of a tenant.
+extends_documentation_fragment:
+    - netapp.storagegrid.netapp.sg
+version_added: '21.18.0'
+author: NetApp Ansible Team (@vinaykus) <ng-ansibleteam@netapp.com>
+description:
+  - Sweep the S3 access keys of all the users of a NetApp StorageGRID tenant, or of the listed users,
+    and replace the keys that are expired, expire soon, or never expire.
+  - Users are listed once, and the keys of every user are read, created and deleted concurrently.
+  - A replacement key is created for each key to rotate, the superseded keys are optionally deleted.
+  - The new secret access keys are written to a vault encrypted file on the controller with I(dest).
+options:
+  unique_names:
+    description:
+      - Unique names of the users whose keys are rotated, for instance C(user/service1).
+      - By default, the keys of all the users of the tenant are rotated.
+    type: list
+    elements: str
+  expiring_within_days:
+    description:
+      - Rotate the keys expiring within this number of days, including the keys already expired.
+    type: int
+    default: 30
+  rotate_non_expiring:
+    description:
+      - Rotate the keys without an expiry date.
+    type: bool
+    default: false
+  key_lifetime_days:
+    description:
+      - Number of days the replacement keys are valid for.
+      - The StorageGRID API does not report when a key was created, setting a lifetime on the replacement keys
+        lets later runs rotate them by age with I(expiring_within_days).
+      - By default, replacement keys do not expire.
+    type: int
+  delete_superseded:
+    description:
+      - Delete the rotated keys once their replacement is created.
+      - Otherwise the rotated keys are kept until they expire, so clients can switch to the new keys.
+    type: bool
+    default: false
+  max_concurrent_requests:
+    description:
+      - Maximum number of users whose keys are read or rotated at the same time.
+    type: int
+    default: 8
+  dest:
+    description:
+      - Path of a file on the controller where the new access keys and secret access keys are written, encrypted
+        with Ansible Vault.
+      - The file is written by the action plugin of this module, using the vault secrets of the playbook run.
+      - When set, the secret access keys are removed from the module result.
+      - Without I(dest), the secret access keys are returned in I(rotated), consider using C(no_log).
+    type: path
+  vault_id:
+    description:
+      - Vault ID of the vault secret used to encrypt I(dest).
+      - By default, the first vault secret is used.
+    type: str
+notes:
+  - Check mode reports the keys that would be rotated, without creating or deleting keys.
+  - A user that fails to be rotated does not stop the other ones, the module fails after all the users are processed,
+    and the keys already created are still written to I(dest).
+"""
+
+EXAMPLES = """
+- name: rotate the keys expiring within 30 days, or never expiring, for every user of the tenant
+  netapp.storagegrid.na_sg_org_s3_key_rotation:
+    api_url: "https://<storagegrid-endpoint-url>"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    expiring_within_days: 30
+    rotate_non_expiring: true
+    key_lifetime_days: 90
+    dest: "{{ playbook_dir }}/s3_keys_{{ ansible_date_time.date }}.vault"
+
+- name: rotate and delete the old keys of two service accounts
+  netapp.storagegrid.na_sg_org_s3_key_rotation:
+    api_url: "https://<storagegrid-endpoint-url>"
+    auth_token: "storagegrid-auth-token"
+    validate_certs: false
+    unique_names:
+      - user/service1
+      - user/service2
+    rotate_non_expiring: true
+    delete_superseded: true
+    dest: /secure/s3_keys.vault
+"""
+
+RETURN = """
+rotated:
+    description:
+      - One entry for each rotated key.
+      - I(secret_access_key) is removed when I(dest) is set.
+      - I(error) is only set when the rotation failed.
+    returned: always
+    type: list
+    elements: dict
+    sample: [
+        {
+            "unique_name": "user/service1",
+            "user_id": "00000000-0000-0000-0000-000000000000",
+            "superseded": "****************AB12",
+            "superseded_id": "abcABC_01234-0123456789abcABCabc0123456789==",
+            "superseded_expires": "2026-09-04T00:00:00.000Z",
+            "access_key": "ABCDEFGHIJKLMNOPQRST",
+            "secret_access_key": "abcdefghijklmnopqrstuvwxyz0123456789ABCD",
+            "expires": "2026-12-03T00:00:00.000Z",
+            "deleted": true
+        }
+    ]
+summary:
+    description: Number of users and keys scanned, rotated, deleted and failed.
+    returned: always
+    type: dict
+    sample: {
+        "users": 800,
+        "keys": 1250,
+        "rotated": 412,
+        "deleted": 412,
+        "failed": 0
+    }
+dest:
+    description: Path of the vault encrypted file, when keys were written to it.
+    returned: when I(dest) is set and keys were rotated
+    type: str
+"""
+
+import time
+from datetime import datetime
+
+import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
+from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import SGRestAPI
+from ansible_collections.netapp.storagegrid.plugins.module_utils.tools import run_concurrently
+
+EPOCH = datetime(1970, 1, 1)
+SECONDS_PER_DAY = 86400
+
+
+def parse_expires(value):
+    """ Return the epoch of an expires date, such as 2020-09-04T00:00:00.000Z, or None """
+    if not value:
+        return None
+    for time_format in ("%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ"):
+        try:
+            return (datetime.strptime(value, time_format) - EPOCH).total_seconds()
+        except ValueError:
+            continue
+    return None
+
+
+def format_expires(epoch):
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(epoch))
+
+
+class SgOrgS3KeyRotation(object):
+    """
+    Rotate the S3 access keys of the users of a StorageGRID tenant
+    """
+
+    def __init__(self):
+        """
+        Parse arguments, setup state variables,
+        check parameters and ensure request module is installed
+        """
+        self.argument_spec = netapp_utils.na_storagegrid_host_argument_spec()
+        self.argument_spec.update(
+            dict(
+                unique_names=dict(required=False, type="list", elements="str"),
+                expiring_within_days=dict(required=False, type="int", default=30),
+                rotate_non_expiring=dict(required=False, type="bool", default=False),
+                key_lifetime_days=dict(required=False, type="int"),
+                delete_superseded=dict(required=False, type="bool", default=False),
+                max_concurrent_requests=dict(required=False, type="int", default=8),
+                dest=dict(required=False, type="path"),
+                vault_id=dict(required=False, type="str"),
+            )
+        )
+
+        self.module = AnsibleModule(
+            argument_spec=self.argument_spec,
+            supports_check_mode=True,
+        )
+
+        self.na_helper = NetAppModule()
+
+        # set up state variables
+        self.parameters = self.na_helper.set_parameters(self.module.params)
+        # Calling generic SG rest_api class
+        self.rest_api = SGRestAPI(self.module)
+        # Get API version
+        self.rest_api.get_sg_product_version(api_root="org")
+        self.api_version = self.rest_api.get_api_version()
+
+        self.now = time.time()
+        self.data = {}
+        if self.parameters.get("key_lifetime_days") is not None:
+            self.data["expires"] = format_expires(self.now + self.parameters["key_lifetime_days"] * SECONDS_PER_DAY)
+
+    def get_org_users(self):
+        """ Page through the users of the tenant, keep the listed users if unique_names is set """
+        api = "api/%s/org/users" % self.api_version
+        users, error = self.rest_api.get_paginated(api)
+        if error:
+            self.module.fail_json(msg=error)
+        if self.parameters.get("unique_names") is None:
+            return users
+
+        users = dict((user["uniqueName"], user) for user in users)
+        missing = [name for name in self.parameters["unique_names"] if name not in users]
+        if missing:
+            self.module.fail_json(msg="Error: users not found: %s" % ", ".join(missing))
+        return [users[name] for name in self.parameters["unique_names"]]
+
+    def get_user_s3_keys(self, user):
+        """ GET the keys of a user, called from a worker thread, return (keys, error) """
+        api = "api/%s/org/users/%s/s3-access-keys" % (self.api_version, user["id"])
+        response, error = self.rest_api.get(api)
+        if error:
+            return None, error
+        return response.get("data") or [], None
+
+    def needs_rotation(self, key):
+        expires = parse_expires(key.get("expires"))
+        if expires is None:
+            return self.parameters["rotate_non_expiring"]
+        return expires <= self.now + self.parameters["expiring_within_days"] * SECONDS_PER_DAY
+
+    def rotate_user_keys(self, rotation):
+        """
+        Create a replacement for each key of a user, and delete the superseded keys, called from a worker thread.
+        Errors are reported in the entries rather than with fail_json, so the other users carry on.
+        """
+        user, entries = rotation
+        api = "api/%s/org/users/%s/s3-access-keys" % (self.api_version, user["id"])
+        for entry in entries:
+            response, error = self.rest_api.post(api, self.data)
+            if error:
+                entry["error"] = str(error)
+                # do not create more keys for a user that fails
+                break
+            entry["access_key"] = response["data"].get("accessKey")
+            entry["secret_access_key"] = response["data"].get("secretAccessKey")
+            entry["expires"] = response["data"].get("expires")
+
+            if self.parameters["delete_superseded"]:
+                response, error = self.rest_api.delete("%s/%s" % (api, entry["superseded_id"]), None)
+                if error:
+                    entry["error"] = "replacement key created, deleting the superseded key failed: %s" % error
+                else:
+                    entry["deleted"] = True
+        return entries
+
+    def apply(self):
+        """
+        Perform pre-checks, call functions and exit
+        """
+        max_workers = self.parameters["max_concurrent_requests"]
+        users = self.get_org_users()
+
+        rotations = []
+        rotated = []
+        key_count = 0
+        for user, (keys, error) in zip(users, run_concurrently(self.get_user_s3_keys, users, max_workers)):
+            if error:
+                rotated.append(dict(unique_name=user["uniqueName"], user_id=user["id"], error=str(error)))
+                continue
+            key_count += len(keys)
+            entries = [
+                dict(
+                    unique_name=user["uniqueName"],
+                    user_id=user["id"],
+                    superseded=key.get("displayName"),
+                    superseded_id=key["id"],
+                    superseded_expires=key.get("expires"),
+                    deleted=False,
+                )
+                for key in keys
+                if self.needs_rotation(key)
+            ]
+            if entries:
+                rotations.append((user, entries))
+                rotated.extend(entries)
+
+        if rotations and self.module.check_mode:
+            self.na_helper.changed = True
+        elif rotations:
+            run_concurrently(self.rotate_user_keys, rotations, max_workers)
+            self.na_helper.changed = any(entry.get("access_key") for entry in rotated)
+
+        failed = [entry for entry in rotated if "error" in entry]
+        summary = dict(
+            users=len(users),
+            keys=key_count,
+            rotated=len([entry for entry in rotated if entry.get("access_key")]),
+            deleted=len([entry for entry in rotated if entry.get("deleted")]),
+            failed=len(failed),
+        )
+        if failed:
+            msg = "Error rotating the S3 access keys of %d users: %s" % (
+                len(set(entry["unique_name"] for entry in failed)),
+                "; ".join("%s: %s" % (entry["unique_name"], entry["error"]) for entry in failed),
+            )
+            self.module.fail_json(msg=msg, changed=self.na_helper.changed, rotated=rotated, summary=summary)
+        self.module.exit_json(changed=self.na_helper.changed, rotated=rotated, summary=summary)
+
+
+def main():
+    """
+    Main function
+    """
+    na_sg_org_s3_key_rotation = SgOrgS3KeyRotation()
+    na_sg_org_s3_key_rotation.apply()
+
+
+if __name__ == "__main__":
+    main()
@@ -54,6 +54,17 @@ options:
         description:
         - Allows for any rest option to be passed in.
         type: dict
+    dest:
+        description:
+        - Path of a gzip compressed NDJSON file, on the host running the module, the gathered subsets are written to
+          instead of being returned in I(sg_info).
+        - Each subset is written on its own line as soon as it is read, a JSON object with the C(subset) name and its C(data).
+        - The file is written to a temporary file in the same directory and renamed when complete.
+        - A new file is created with mode C(0600), as subsets may hold credentials, a replaced file keeps its mode.
+        - In check mode, the subsets are counted and hashed but the file is not written.
+        - An existing file with the same lines is kept, C(changed) is true when the file was or, in check mode, would be replaced.
+        type: path
+        version_added: '21.18.0'
 """
 
 EXAMPLES = """
@@ -90,12 +101,19 @@ EXAMPLES = """
     parameters:
       limit: 5
   register: sg_pge_info
+
+- name: Write every StorageGRID PGE subset to a compressed file
+  netapp.storagegrid.na_sg_pge_info:
+    api_url: "https://1.2.3.4/"
+    validate_certs: false
+    dest: /var/lib/storagegrid/pge_info.ndjson.gz
+  register: sg_pge_dump
 """
 
 RETURN = """
 sg_pge_info:
     description: Returns various information about the StorageGRID node PGE configuration.
-    returned: always
+    returned: when I(dest) is not set
     type: dict
     sample: {
         "pge/storage-configuration/networking": {...},
@@ -116,12 +134,34 @@ sg_pge_info:
         "pge/debug/dump-bonding-raw": {...},
         "pge/debug/dump-lldp-attributes": {...}
     }
+manifest:
+    description:
+      - With I(dest), the path and the number of lines written, with the size and SHA-256 of the compressed file,
+        and for each subset, the size and SHA-256 of its line.
+      - C(changed) tells whether the lines differ from the existing file, and C(written) whether the file was replaced.
+      - C(bytes) and C(sha256) of the compressed file are not returned in check mode, as no file is written.
+    returned: when I(dest) is set
+    type: dict
+    version_added: '21.18.0'
+    sample: {
+        "dest": "/var/lib/storagegrid/pge_info.ndjson.gz",
+        "format": "ndjson.gz",
+        "changed": true,
+        "written": true,
+        "items": 1,
+        "bytes": 187,
+        "sha256": "5b1d...",
+        "subsets": [
+            {"subset": "pge/dns", "type": "object", "count": 1, "bytes": 142, "sha256": "0c7a..."}
+        ]
+    }
 """
 
 from ansible.module_utils.basic import AnsibleModule
 import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp_module import NetAppModule
 from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import PgeRestAPI
+from ansible_collections.netapp.storagegrid.plugins.module_utils.info_output import NdjsonWriter
 
 
 class NetAppSgGatherPgeInfo(object):
@@ -135,7 +175,8 @@ class NetAppSgGatherPgeInfo(object):
         self.argument_spec = netapp_utils.na_storagegrid_pge_argument_spec()
         self.argument_spec.update(dict(
             gather_subset=dict(default=['all'], type='list', elements='str', required=False),
-            parameters=dict(type='dict', required=False)
+            parameters=dict(type='dict', required=False),
+            dest=dict(type='path', required=False)
         ))
 
         self.module = AnsibleModule(
@@ -171,6 +212,29 @@ class NetAppSgGatherPgeInfo(object):
 
         return None
 
+    def write_subsets(self, subsets, get_sg_subset_info):
+        """
+        Write the subsets to the dest file, one line each as they are read
+        return the manifest of the file
+        """
+        try:
+            writer = NdjsonWriter(self.parameters['dest'], dry_run=self.module.check_mode)
+        except (IOError, OSError) as exc:
+            self.module.fail_json(msg="Error writing %s: %s" % (self.parameters['dest'], exc))
+        for subset in subsets:
+            data = {}
+            if self.parameters.get('parameters'):
+                data.update(self.parameters['parameters'])
+            response, error = self.rest_api.get(get_sg_subset_info[subset]['api_call'], data)
+            if error:
+                writer.abort()
+                self.module.fail_json(msg=error)
+            writer.write_document(subset, response.get('data', response) if isinstance(response, dict) else response)
+        manifest, error = writer.close()
+        if error:
+            self.module.fail_json(msg=error)
+        return manifest
+
     def convert_subsets(self):
         """ Convert an info to the REST API """
         info_to_rest_mapping = {
@@ -268,6 +332,14 @@ class NetAppSgGatherPgeInfo(object):
             self.parameters['gather_subset'] = sorted(get_sg_subset_info.keys())
 
         converted_subsets = self.convert_subsets()
+
+        if self.parameters.get('dest'):
+            unknown = [subset for subset in converted_subsets if subset not in get_sg_subset_info]
+            if unknown:
+                self.module.fail_json(msg="Specified subset %s not found, supported subsets are %s" %
+                                      (unknown[0], list(get_sg_subset_info.keys())))
+            manifest = self.write_subsets(converted_subsets, get_sg_subset_info)
+            self.module.exit_json(changed=manifest['changed'], manifest=manifest)
         for subset in converted_subsets:
             try:
                 # Verify whether the supported subset passed.
@@ -0,0 +1,162 @@
+# Copyright: (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" Run StorageGRID modules inside the controller worker, rather than through AnsiballZ """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import traceback
+
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from ansible.module_utils.common.parameters import remove_values
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.action import ActionBase
+from ansible_collections.netapp.storagegrid.plugins.plugin_utils import sg_client
+
+
+class ModuleExit(Exception):
+    """ Raised by exit_json and fail_json to stop the module and carry its result """
+
+    def __init__(self, result):
+        super(ModuleExit, self).__init__(result.get("msg"))
+        self.result = result
+
+
+class ControllerModule(object):
+    """
+    Stand-in for AnsibleModule when a module runs inside an action plugin.
+    Arguments are validated against the module argument spec the same way, and exit_json and
+    fail_json raise ModuleExit instead of printing the result and exiting the process.
+    """
+
+    def __init__(self, task_args, check_mode, instances, argument_spec, supports_check_mode=False, mutually_exclusive=None,
+                 required_together=None, required_one_of=None, required_if=None, required_by=None, **kwargs):
+        # let the action plugin find the no_log values and warnings, even if validation fails
+        instances.append(self)
+        self.check_mode = check_mode
+        self.warnings = []
+        self.no_log_values = set()
+        validator = ArgumentSpecValidator(
+            argument_spec,
+            mutually_exclusive=mutually_exclusive,
+            required_together=required_together,
+            required_one_of=required_one_of,
+            required_if=required_if,
+            required_by=required_by,
+        )
+        validation = validator.validate(task_args)
+        self.no_log_values = getattr(validation, "_no_log_values", set())
+        self.params = validation.validated_parameters
+        if validation.error_messages:
+            self.fail_json(msg="; ".join(validation.error_messages))
+        if check_mode and not supports_check_mode:
+            raise ModuleExit(dict(skipped=True, msg="action does not support check mode"))
+        # pooled connections, shared by every loop item run in this worker
+        api_url = self.params.get("api_url")
+        if isinstance(api_url, list):
+            # the admin nodes of a grid share a session
+            api_url = api_url[0] if len(api_url) == 1 else tuple(api_url)
+        self.sg_session = sg_client.get_session(api_url, self.params.get("validate_certs"))
+
+    def warn(self, warning):
+        self.warnings.append(warning)
+
+    def exit_json(self, **kwargs):
+        kwargs.setdefault("changed", False)
+        raise ModuleExit(kwargs)
+
+    def fail_json(self, msg, **kwargs):
+        kwargs["failed"] = True
+        kwargs["msg"] = msg
+        raise ModuleExit(kwargs)
+
+
+class SGActionModule(ActionBase):
+    """
+    Run a StorageGRID module in-process when it runs on the controller, which is how these modules
+    are used (delegate_to: localhost or connection: local).  This skips building, copying and
+    starting an AnsiballZ payload for every loop item, and keeps HTTP connections open between items.
+    Other connections, and async tasks, execute the module as usual.
+    Subclasses set MODULE to the python module of the Ansible module.
+    """
+
+    MODULE = None
+    _supports_async = True
+
+    def runs_in_process(self):
+        return self._connection.transport == "local" and not self._task.async_val
+
+    def set_environment(self):
+        """
+        Apply the environment of the task to this process, as it would be to the module process,
+        including the variables read by requests (HTTPS_PROXY, REQUESTS_CA_BUNDLE) and by the collection.
+        Return the previous values, to restore them with restore_environment.
+        """
+        environment = {}
+        self._compute_environment_string(raw_environment_out=environment)
+        previous = {}
+        for name, value in environment.items():
+            name = to_native(name)
+            previous[name] = os.environ.get(name)
+            os.environ[name] = to_native(value)
+        return previous
+
+    @staticmethod
+    def restore_environment(previous):
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(SGActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        if not self.runs_in_process():
+            # same as the normal action plugin
+            wrap_async = self._task.async_val and not self._connection.has_native_async
+            result.update(self._execute_module(task_vars=task_vars, wrap_async=wrap_async))
+            if not wrap_async:
+                self._remove_tmp_path(self._connection._shell.tmpdir)
+            return result
+
+        task_args = dict(self._task.args)
+        check_mode = bool(self._task.check_mode)
+        instances = []
+
+        def module_factory(*args, **kwargs):
+            return ControllerModule(task_args, check_mode, instances, *args, **kwargs)
+
+        ansible_module = self.MODULE.AnsibleModule
+        self.MODULE.AnsibleModule = module_factory
+        previous_environment = {}
+        try:
+            # the env_fallback of options is resolved against this environment too
+            previous_environment = self.set_environment()
+            self.MODULE.main()
+            module_result = dict(failed=True, msg="%s did not exit with a result" % self._task.action)
+        except ModuleExit as exc:
+            module_result = exc.result
+        except Exception as exc:
+            module_result = dict(failed=True, msg=to_native(exc), exception=traceback.format_exc())
+        finally:
+            self.MODULE.AnsibleModule = ansible_module
+            self.restore_environment(previous_environment)
+
+        no_log_values = set()
+        warnings = []
+        module_args = task_args
+        for module in instances:
+            no_log_values.update(module.no_log_values)
+            warnings.extend(module.warnings)
+            module_args = getattr(module, "params", None) or module_args
+        result.update(remove_values(module_result, no_log_values))
+        result.setdefault("changed", False)
+        result["invocation"] = dict(module_args=remove_values(module_args, no_log_values))
+        if warnings:
+            result["warnings"] = warnings
+        return result
@@ -0,0 +1,60 @@
+# Copyright: (c) 2026, NetApp Ansible Team <ng-ansibleteam@netapp.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" Support for StorageGRID REST API calls made on the Ansible controller (inventory, lookup and action plugins) """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import threading
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.common.text.converters import to_native
+from ansible_collections.netapp.storagegrid.plugins.module_utils.netapp import HAS_REQUESTS, SGRestAPI
+from ansible_collections.netapp.storagegrid.plugins.module_utils.tools import run_concurrently  # noqa: F401
+
+if HAS_REQUESTS:
+    import requests
+
+# (api_url, validate_certs) -> requests.Session, shared by every task run in this process
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+class PluginModule(object):
+    """
+    Minimal stand-in for AnsibleModule, so SGRestAPI can run inside a controller plugin.
+    fail_json raises AnsibleError instead of exiting the process.
+    """
+
+    def __init__(self, params):
+        self.params = params
+        self.check_mode = False
+
+    def fail_json(self, msg, **kwargs):
+        raise AnsibleError(to_native(msg))
+
+
+def get_session(api_url, validate_certs):
+    """
+    Return the pooled HTTP session of an endpoint, creating it on first use.
+    Keeping connections open saves a TCP and TLS handshake on every request.
+    """
+    key = (api_url, validate_certs)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None and HAS_REQUESTS:
+            session = _SESSIONS[key] = requests.Session()
+    return session
+
+
+def get_rest_api(api_url, auth_token, validate_certs=True, timeout=60):
+    """ Return a SGRestAPI object for a grid or tenant endpoint """
+    params = dict(
+        api_url=to_native(api_url),
+        auth_token=to_native(auth_token),
+        validate_certs=validate_certs,
+    )
+    return SGRestAPI(PluginModule(params), timeout=timeout)
+
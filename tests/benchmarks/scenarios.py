@@ -0,0 +1,195 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" Module scenarios run by the benchmarks, in order, against a seeded mock StorageGRID """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Number of existing objects of each kind in the seeded grid
+DATASET_SIZES = [10, 1000, 10000]
+
+
+def seed_dataset(state, size):
+    """ Seed size tenants, buckets, grid and org groups and users, and ILM pools and rules """
+    state.seed(tenants=size, buckets=size, users=size, groups=size, nodes=min(size, 200), sites=3, pools=min(size, 100), rules=min(size, 100))
+    # a non expiring S3 access key for the users rotated by na_sg_org_s3_key_rotation
+    for user in list(state.collections["org/users"].values())[1:4]:
+        state.add("org/users/{id}/s3-access-keys", dict(displayName="****************BENCH", expires=None), parent=user["id"])
+
+
+# identity provider of na_sg_grid_sso, mapping the name of the seeded primary admin node to its id
+SSO_IDENTITY_PROVIDER = dict(
+    idp_type="Azure", federation_service_name="bench", relying_party_identifier="bench",
+    admin_nodes=[dict(name="DC1-ADM1", federation_metadata_url="https://adm1.example.com/metadata")],
+)
+
+# ILM pool, rule, policy and tag created and deleted together by na_sg_grid_ilm_bundle
+ILM_BUNDLE = dict(
+    pools=[dict(name="Bench pool", disks=[dict(group=10)], archives=[])],
+    rules=[dict(name="Bench 2 copies", placements=[dict(retention=dict(after=0), replicated=[dict(poolId="Bench pool", copies=2)])])],
+    policies=[dict(name="Bench policy", reason="benchmark", rules=["Bench 2 copies"], default_rule="Bench 2 copies")],
+    policy_tags=[dict(name="bench", description="benchmark", policy_id="Bench policy")],
+)
+
+
+# module name: (module class path, scenarios)
+# each scenario is (name, module arguments, expected changed), run in the listed order
+SCENARIOS = {
+    "na_sg_grid_account": (
+        "na_sg_grid_account.SgGridAccount",
+        [
+            ("create", dict(name="bench-tenant", protocol="s3", management=True, use_own_identity_source=False,
+                            allow_platform_services=False, password="benchmark1"), True),
+            ("idempotent", dict(name="bench-tenant", protocol="s3", management=True, use_own_identity_source=False,
+                                allow_platform_services=False), False),
+            ("update", dict(name="bench-tenant", protocol="s3", management=True, use_own_identity_source=False,
+                            allow_platform_services=True), True),
+            ("delete", dict(name="bench-tenant", protocol="s3", state="absent"), True),
+        ],
+    ),
+    "na_sg_grid_tenant": (
+        "na_sg_grid_tenant.SgGridTenantAccount",
+        [
+            ("bulk_create", dict(protocol="s3", use_own_identity_source=False, allow_platform_services=False,
+                                 tenants=[dict(name="bench-tenant-%d" % index) for index in range(3)]), True),
+            ("bulk_idempotent", dict(protocol="s3", use_own_identity_source=False, allow_platform_services=False,
+                                     tenants=[dict(name="bench-tenant-%d" % index) for index in range(3)]), False),
+            ("bulk_update", dict(protocol="s3", use_own_identity_source=False, allow_platform_services=False,
+                                 tenants=[dict(name="bench-tenant-%d" % index, allow_platform_services=index == 0) for index in range(3)]), True),
+            ("bulk_delete", dict(protocol="s3", tenants=[dict(name="bench-tenant-%d" % index, state="absent") for index in range(3)]), True),
+        ],
+    ),
+    "na_sg_grid_group": (
+        "na_sg_grid_group.SgGridGroup",
+        [
+            ("create", dict(display_name="Bench", unique_name="group/bench", management_policy=dict(tenant_accounts=True)), True),
+            ("idempotent", dict(display_name="Bench", unique_name="group/bench", management_policy=dict(tenant_accounts=True)), False),
+            ("update", dict(display_name="Bench", unique_name="group/bench", management_policy=dict(tenant_accounts=True, ilm=True)), True),
+            ("delete", dict(unique_name="group/bench", state="absent"), True),
+        ],
+    ),
+    "na_sg_grid_user": (
+        "na_sg_grid_user.SgGridUser",
+        [
+            ("create", dict(full_name="Bench", unique_name="user/bench", disable=False), True),
+            ("idempotent", dict(full_name="Bench", unique_name="user/bench", disable=False), False),
+            ("update", dict(full_name="Bench", unique_name="user/bench", disable=True), True),
+            ("delete", dict(unique_name="user/bench", state="absent"), True),
+            ("bulk_create", dict(users=[dict(unique_name="user/bench-%d" % index, full_name="Bench %d" % index) for index in range(3)]), True),
+            ("bulk_idempotent", dict(users=[dict(unique_name="user/bench-%d" % index, full_name="Bench %d" % index) for index in range(3)]), False),
+            ("bulk_update", dict(users=[dict(unique_name="user/bench-%d" % index, full_name="Bench %d" % index, disable=index == 0)
+                                        for index in range(3)]), True),
+            ("bulk_delete", dict(users=[dict(unique_name="user/bench-%d" % index, state="absent") for index in range(3)]), True),
+        ],
+    ),
+    "na_sg_org_group": (
+        "na_sg_org_group.SgOrgGroup",
+        [
+            ("create", dict(display_name="Bench", unique_name="group/bench", management_policy=dict(manage_all_containers=True)), True),
+            ("idempotent", dict(display_name="Bench", unique_name="group/bench", management_policy=dict(manage_all_containers=True)), False),
+            ("update", dict(display_name="Bench", unique_name="group/bench", management_policy=dict(manage_all_containers=False)), True),
+            ("delete", dict(unique_name="group/bench", state="absent"), True),
+        ],
+    ),
+    "na_sg_org_user": (
+        "na_sg_org_user.SgOrgUser",
+        [
+            ("create", dict(full_name="Bench", unique_name="user/bench", disable=False), True),
+            ("idempotent", dict(full_name="Bench", unique_name="user/bench", disable=False), False),
+            ("update", dict(full_name="Bench", unique_name="user/bench", disable=True), True),
+            ("delete", dict(unique_name="user/bench", state="absent"), True),
+            ("bulk_create", dict(users=[dict(unique_name="user/bench-%d" % index, full_name="Bench %d" % index) for index in range(3)]), True),
+            ("bulk_idempotent", dict(users=[dict(unique_name="user/bench-%d" % index, full_name="Bench %d" % index) for index in range(3)]), False),
+            ("bulk_update", dict(users=[dict(unique_name="user/bench-%d" % index, full_name="Bench %d" % index, disable=index == 0)
+                                        for index in range(3)]), True),
+            ("bulk_delete", dict(users=[dict(unique_name="user/bench-%d" % index, state="absent") for index in range(3)]), True),
+        ],
+    ),
+    "na_sg_org_container": (
+        "na_sg_org_container.SgOrgContainer",
+        [
+            ("create", dict(name="bench-bucket", region="us-east-1"), True),
+            ("idempotent", dict(name="bench-bucket", region="us-east-1"), False),
+            ("update", dict(name="bench-bucket", region="us-east-1", bucket_versioning_enabled=True), True),
+            ("delete", dict(name="bench-bucket", state="absent"), True),
+            ("bulk_create", dict(buckets=[dict(name="bench-bucket-%d" % index) for index in range(3)]), True),
+            ("bulk_idempotent", dict(buckets=[dict(name="bench-bucket-%d" % index) for index in range(3)]), False),
+            ("bulk_update", dict(buckets=[dict(name="bench-bucket-%d" % index, bucket_versioning_enabled=index == 0) for index in range(3)]), True),
+            ("bulk_delete", dict(buckets=[dict(name="bench-bucket-%d" % index, state="absent") for index in range(3)]), True),
+        ],
+    ),
+    "na_sg_grid_sso": (
+        "na_sg_grid_sso.SgSSO",
+        [
+            ("enable", dict(disable=False, sandbox=True, identity_provider=SSO_IDENTITY_PROVIDER), True),
+            ("idempotent", dict(disable=False, sandbox=True, identity_provider=SSO_IDENTITY_PROVIDER), False),
+            ("disable", dict(disable=True, sandbox=False, identity_provider=SSO_IDENTITY_PROVIDER), True),
+        ],
+    ),
+    "na_sg_grid_firewall": (
+        "na_sg_grid_firewall.SgFirewall",
+        [
+            ("firewalls_create", dict(blocked_tcp_ports=[22, 80], privileged_ips=["192.168.1.1/32"], grid_internal_access=True,
+                                      firewalls=[dict(id="node-%d" % index) for index in range(3)]), True),
+            ("firewalls_idempotent", dict(blocked_tcp_ports=[22, 80], privileged_ips=["192.168.1.1/32"], grid_internal_access=True,
+                                          firewalls=[dict(id="node-%d" % index) for index in range(3)]), False),
+            ("firewalls_purge", dict(blocked_tcp_ports=[22], privileged_ips=["192.168.1.1/32"], grid_internal_access=True,
+                                     firewalls=[dict(id="node-0")], purge_firewalls=True), True),
+            ("delete", dict(id="node-0", state="absent"), True),
+        ],
+    ),
+    "na_sg_grid_ilm_bundle": (
+        "na_sg_grid_ilm_bundle.SgGridIlmBundle",
+        [
+            ("create", ILM_BUNDLE, True),
+            ("idempotent", ILM_BUNDLE, False),
+            ("delete", dict(policy_tags=[dict(name="bench", state="absent")], policies=[dict(name="Bench policy", state="absent")],
+                            rules=[dict(name="Bench 2 copies", state="absent")], pools=[dict(name="Bench pool", state="absent")]), True),
+        ],
+    ),
+    "na_sg_org_s3_key_rotation": (
+        "na_sg_org_s3_key_rotation.SgOrgS3KeyRotation",
+        [
+            ("rotate", dict(unique_names=["user/user-%05d" % index for index in range(3)], rotate_non_expiring=True,
+                            key_lifetime_days=90, delete_superseded=True), True),
+            ("idempotent", dict(unique_names=["user/user-%05d" % index for index in range(3)], rotate_non_expiring=True,
+                                key_lifetime_days=90, delete_superseded=True), False),
+        ],
+    ),
+    "na_sg_grid_dns": (
+        "na_sg_grid_dns.SgGridDns",
+        [
+            ("update", dict(dns_servers="10.0.0.1,10.0.0.2"), True),
+            ("idempotent", dict(dns_servers="10.0.0.1,10.0.0.2"), False),
+        ],
+    ),
+    "na_sg_grid_ntp": (
+        "na_sg_grid_ntp.SgGridNtp",
+        [
+            ("update", dict(ntp_servers="10.0.0.1,10.0.0.2", passphrase="benchmark"), True),
+            ("idempotent", dict(ntp_servers="10.0.0.1,10.0.0.2", passphrase="benchmark"), False),
+        ],
+    ),
+    "na_sg_grid_regions": (
+        "na_sg_grid_regions.SgGridRegions",
+        [
+            ("update", dict(regions="us-east-1,us-west-1"), True),
+            ("idempotent", dict(regions="us-east-1,us-west-1"), False),
+        ],
+    ),
+    "na_sg_grid_domain_name": (
+        "na_sg_grid_domain_name.SgDomainName",
+        [
+            ("update", dict(domain_name=["s3.example.com"]), True),
+            ("idempotent", dict(domain_name=["s3.example.com"]), False),
+        ],
+    ),
+    "na_sg_grid_info": (
+        "na_sg_grid_info.NetAppSgGatherInfo",
+        [
+            ("gather", dict(), False),
+        ],
+    ),
+}
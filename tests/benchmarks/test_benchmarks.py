@@ -0,0 +1,147 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Benchmarks of the NetApp StorageGRID modules against the local mock server.
+
+Each module runs its scenarios in order against grids seeded with 10, 1,000 and 10,000 objects,
+recording wall time, HTTP requests, bytes transferred and peak RSS.  A scenario fails when it sends
+more requests than its budget in budgets.json.
+
+    PYTHONPATH=<collections path> python -m pytest -q tests/benchmarks
+
+Environment variables:
+    SG_BENCHMARK_RESULTS: path of a JSON file the measurements are written to
+    SG_BENCHMARK_UPDATE_BUDGETS: set to 1 to write the measured request counts to budgets.json
+    SG_BENCHMARK_SIZES: comma separated dataset sizes, to run a subset, for instance 10,1000
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import importlib
+import json
+import os
+import pytest
+import resource
+import sys
+import time
+import warnings
+
+from ansible_collections.netapp.storagegrid.tests.unit.compat.mock import patch
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+from ansible_collections.netapp.storagegrid.tests.benchmarks.scenarios import DATASET_SIZES, SCENARIOS, seed_dataset
+
+if sys.version_info < (3, 11):
+    pytestmark = pytest.mark.skip("Skipping Unit Tests on 3.11")
+
+pytest.importorskip("cryptography")
+from ansible_collections.netapp.storagegrid.tests.mock_server import MockStorageGRID  # noqa: E402
+
+BUDGETS_PATH = os.path.join(os.path.dirname(__file__), "budgets.json")
+AUTH_TOKEN = "benchmark-auth-token"
+SIZES = [int(size) for size in os.environ["SG_BENCHMARK_SIZES"].split(",")] if os.environ.get("SG_BENCHMARK_SIZES") else DATASET_SIZES
+
+RESULTS = []
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({"ANSIBLE_MODULE_ARGS": args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class ModuleExit(Exception):
+    """Raised by the patched exit_json and fail_json with the module result"""
+
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    kwargs.setdefault("changed", False)
+    raise ModuleExit(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    kwargs["failed"] = True
+    raise ModuleExit(kwargs)
+
+
+def load_budgets():
+    with open(BUDGETS_PATH) as budgets_file:
+        return json.load(budgets_file)
+
+
+def peak_rss_kb():
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    return usage // 1024 if sys.platform == "darwin" else usage
+
+
+def run_module(server, class_path, args):
+    """ Run a module against the server, return its result and measurements """
+    module_name, class_name = class_path.split(".")
+    module_class = getattr(importlib.import_module("ansible_collections.netapp.storagegrid.plugins.modules.%s" % module_name), class_name)
+    set_module_args(dict(args, api_url=server.url, auth_token=AUTH_TOKEN, validate_certs=False))
+    server.reset_stats()
+    start = time.time()
+    try:
+        module_class().apply()
+        result = dict(failed=True, msg="module did not exit")
+    except ModuleExit as exc:
+        result = exc.args[0]
+    elapsed = time.time() - start
+    return result, dict(
+        wall_time=round(elapsed, 4),
+        requests=server.stats["requests"],
+        bytes_in=server.stats["bytes_in"],
+        bytes_out=server.stats["bytes_out"],
+        peak_rss_kb=peak_rss_kb(),
+    )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patched_module():
+    with patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="Unverified HTTPS request")
+            yield
+    if os.environ.get("SG_BENCHMARK_RESULTS"):
+        with open(os.environ["SG_BENCHMARK_RESULTS"], "w") as results_file:
+            json.dump(RESULTS, results_file, indent=2)
+    if os.environ.get("SG_BENCHMARK_UPDATE_BUDGETS") == "1":
+        budgets = load_budgets()
+        for entry in RESULTS:
+            budgets.setdefault(entry["module"], {}).setdefault(entry["scenario"], {})[str(entry["size"])] = entry["requests"]
+        with open(BUDGETS_PATH, "w") as budgets_file:
+            json.dump(budgets, budgets_file, indent=2, sort_keys=True)
+            budgets_file.write("\n")
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: "%d_objects" % size)
+def grid(request):
+    server = MockStorageGRID(auth_token=AUTH_TOKEN)
+    seed_dataset(server.state, request.param)
+    server.start()
+    yield request.param, server
+    server.stop()
+
+
+@pytest.mark.parametrize("module_name", sorted(SCENARIOS))
+def test_module_request_budget(grid, module_name):
+    size, server = grid
+    class_path, scenarios = SCENARIOS[module_name]
+    budgets = load_budgets().get(module_name, {})
+    over_budget = []
+    for scenario, args, expected_changed in scenarios:
+        result, measurements = run_module(server, class_path, args)
+        RESULTS.append(dict(measurements, module=module_name, scenario=scenario, size=size))
+        assert not result.get("failed"), "%s %s: %s" % (module_name, scenario, result.get("msg"))
+        assert result["changed"] == expected_changed, "%s %s: changed is %s" % (module_name, scenario, result["changed"])
+        budget = budgets.get(scenario, {}).get(str(size))
+        if os.environ.get("SG_BENCHMARK_UPDATE_BUDGETS") != "1":
+            assert budget is not None, "%s %s: no request budget for %d objects in budgets.json" % (module_name, scenario, size)
+            if measurements["requests"] > budget:
+                over_budget.append("%s: %d requests, budget %d" % (scenario, measurements["requests"], budget))
+    assert not over_budget, "%s with %d objects exceeds its request budget: %s" % (module_name, size, "; ".join(over_budget))
@@ -0,0 +1,13 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" Local StorageGRID API stand-in, for tests and benchmarks that need real HTTP """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from .server import MockStorageGRID
+from .state import MockError, MockState
+
+__all__ = ["MockStorageGRID", "MockState", "MockError"]
@@ -0,0 +1,426 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" Threaded HTTPS stand-in for the StorageGRID grid, org and PGE APIs """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import datetime
+import json
+import os
+import re
+import shutil
+import ssl
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .state import MockError, MockState
+
+API_PATH = re.compile(r"^/api/v(\d+)/(.*)$")
+
+# PGE endpoints, answered without authorization
+PGE_DEFAULTS = {
+    "install-status": {"installStatus": "notStarted", "progress": 0},
+    "system-config": {"name": "mock-appliance", "nodeType": "storage", "computeMode": "normal"},
+    "admin-connection": {"useDiscovery": False, "ip": None},
+    "storage-configuration/networking": {},
+    "bmc-config": {},
+    "networks": {},
+    "link-config": {},
+    "dns": {"servers": []},
+    "system-info": {"model": "SG6060", "serialNumber": "000000000000"},
+    "ipmi-sensors": [],
+    "upgrade/status": {"status": "idle"},
+    "update-config/status": {"status": "idle"},
+}
+
+
+def make_certificate(directory):
+    """ Write a self-signed certificate for localhost, return (certificate path, key path) """
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, u"localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=30))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName(u"localhost")]), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as cert_file:
+        cert_file.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as key_file:
+        key_file.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()))
+    return cert_path, key_path
+
+
+class Injection(object):
+    """ Answer matching requests with an error status, count times, or forever when count is None """
+
+    def __init__(self, method, pattern, status, count, retry_after, message, delay):
+        self.method = method
+        self.pattern = re.compile(pattern)
+        self.status = status
+        self.count = count
+        self.retry_after = retry_after
+        self.message = message
+        self.delay = delay
+
+    def matches(self, method, path):
+        if self.count is not None and self.count <= 0:
+            return False
+        return (self.method is None or self.method == method) and self.pattern.search(path) is not None
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MockStorageGRID/1.0"
+    # headers and body are written separately, do not let Nagle and delayed ACKs stall every response
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        # keep test output quiet
+        pass
+
+    def do_GET(self):
+        self.handle_api("GET")
+
+    def do_POST(self):
+        self.handle_api("POST")
+
+    def do_PUT(self):
+        self.handle_api("PUT")
+
+    def do_PATCH(self):
+        self.handle_api("PATCH")
+
+    def do_DELETE(self):
+        self.handle_api("DELETE")
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if not raw:
+            return None, 0
+        try:
+            return json.loads(raw.decode("utf-8")), length
+        except ValueError:
+            # multipart uploads and other payloads are accepted as is
+            return None, length
+
+    def send_json(self, status, body, headers=None):
+        self.send_response(status)
+        if body:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for header, value in (headers or {}).items():
+            self.send_header(header, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def handle_api(self, method):
+        mock = self.server.mock
+        start = time.time()
+        url = urlsplit(self.path)
+        path = unquote(url.path)
+        query = dict((key, values[-1]) for key, values in parse_qs(url.query).items())
+        body, bytes_in = self.read_body()
+        status, payload, headers = mock.dispatch(method, path, query, body, self.headers)
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        # record before responding, so the request is accounted for when the client gets the response
+        mock.record(method, path, status, bytes_in, len(body), time.time() - start)
+        self.send_json(status, body, headers)
+
+
+class MockStorageGRID(object):
+    """
+    Local, stateful StorageGRID API server for tests and benchmarks.
+
+    Serves the grid, org and private APIs under api/v3 and api/v4, and the PGE API under api/v2,
+    over HTTPS with a self-signed certificate generated at start, so clients need validate_certs false.
+    Collections support marker pagination with limit and marker, the same way as StorageGRID.
+    A single org namespace is shared by all tenants.
+
+    Usage:
+        with MockStorageGRID() as server:
+            server.state.seed(tenants=1000, buckets=100, nodes=12, sites=3)
+            server.inject("GET", r"grid/accounts$", 429, count=1, retry_after=1)
+            ... run a module with api_url=server.url ...
+            server.stats["requests"]
+    """
+
+    def __init__(self, state=None, seed=0, tls=True, strict=False, auth_token=None, api_version=4):
+        """
+        state: a MockState, a new one seeded with seed by default
+        tls: serve HTTPS, which is needed by SGRestAPI, or plain HTTP
+        strict: unknown GET endpoints return 404, otherwise an empty object
+        auth_token: bearer token required by the grid and org APIs, any token is accepted by default
+        """
+        self.state = state if state is not None else MockState(seed)
+        self.tls = tls
+        self.strict = strict
+        self.auth_token = auth_token
+        self.api_version = api_version
+        self.latency = 0.0
+        self.injections = []
+        self.requests = []
+        self.stats = {}
+        self.stats_lock = threading.Lock()
+        self.reset_stats()
+        self.httpd = None
+        self.thread = None
+        self.cert_dir = None
+        for path, data in PGE_DEFAULTS.items():
+            self.state.singletons.setdefault("pge/%s" % path, data)
+
+    # lifecycle
+
+    def start(self):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), MockRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.mock = self
+        if self.tls:
+            self.cert_dir = tempfile.mkdtemp(prefix="sg_mock_")
+            cert_path, key_path = make_certificate(self.cert_dir)
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(cert_path, key_path)
+            self.httpd.socket = context.wrap_socket(self.httpd.socket, server_side=True)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="mock-storagegrid")
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.thread.join()
+            self.httpd = None
+        if self.cert_dir is not None:
+            shutil.rmtree(self.cert_dir, ignore_errors=True)
+            self.cert_dir = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def url(self):
+        return "%s://localhost:%d" % ("https" if self.tls else "http", self.httpd.server_address[1])
+
+    # behaviour
+
+    def set_latency(self, seconds):
+        """ Delay every response by seconds """
+        self.latency = seconds
+
+    def inject(self, method, pattern, status, count=1, retry_after=None, message=None, delay=0.0):
+        """
+        Answer requests whose path, without the api/vN prefix, matches the pattern with an error.
+        method None matches any method, count None injects the error until clear_injections.
+        retry_after sets a Retry-After header, typically with status 429.
+        """
+        injection = Injection(method, pattern, status, count, retry_after, message, delay)
+        with self.stats_lock:
+            self.injections.append(injection)
+        return injection
+
+    def clear_injections(self):
+        with self.stats_lock:
+            self.injections = []
+
+    # accounting
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.requests = []
+            self.stats = dict(requests=0, bytes_in=0, bytes_out=0, by_method={}, by_status={})
+
+    def record(self, method, path, status, bytes_in, bytes_out, elapsed):
+        with self.stats_lock:
+            self.requests.append(dict(method=method, path=path, status=status, bytes_in=bytes_in, bytes_out=bytes_out, elapsed=elapsed))
+            self.stats["requests"] += 1
+            self.stats["bytes_in"] += bytes_in
+            self.stats["bytes_out"] += bytes_out
+            self.stats["by_method"][method] = self.stats["by_method"].get(method, 0) + 1
+            self.stats["by_status"][status] = self.stats["by_status"].get(status, 0) + 1
+
+    def count_requests(self, method=None, pattern=None):
+        """ Number of requests received, optionally for a method and a path pattern """
+        regex = re.compile(pattern) if pattern else None
+        with self.stats_lock:
+            return len([
+                request for request in self.requests
+                if (method is None or request["method"] == method) and (regex is None or regex.search(request["path"]))
+            ])
+
+    # request handling
+
+    def take_injection(self, method, path):
+        with self.stats_lock:
+            for injection in self.injections:
+                if injection.matches(method, path):
+                    if injection.count is not None:
+                        injection.count -= 1
+                    return injection
+        return None
+
+    def envelope(self, status, data, api_version):
+        return dict(responseTime=time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime()), status="success", apiVersion="%s.0" % api_version, data=data)
+
+    def error(self, status, text, key, api_version):
+        return dict(
+            responseTime=time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime()),
+            status="error", apiVersion="%s.0" % api_version, code=status, message=dict(key=key, text=text),
+        )
+
+    def dispatch(self, method, path, query, body, headers):
+        """ Return (status, payload, headers) for a request """
+        if self.latency:
+            time.sleep(self.latency)
+        if path.rstrip("/") == "/api/versions" and method == "GET":
+            # unauthenticated, used to probe admin nodes
+            return 200, self.envelope(200, [self.api_version - 1, self.api_version], self.api_version), None
+        match = API_PATH.match(path)
+        if not match:
+            return 404, self.error(404, "%s not found" % path, "notFound", self.api_version), None
+        api_version, route = int(match.group(1)), match.group(2).rstrip("/")
+
+        injection = self.take_injection(method, route)
+        if injection is not None:
+            if injection.delay:
+                time.sleep(injection.delay)
+            extra = {"Retry-After": str(injection.retry_after)} if injection.retry_after is not None else None
+            text = injection.message or ("too many requests" if injection.status == 429 else "injected error")
+            return injection.status, self.error(injection.status, text, "injected", api_version), extra
+
+        is_pge = api_version == 2
+        if not is_pge and route != "authorize" and self.auth_token is not None:
+            if headers.get("Authorization") != "Bearer %s" % self.auth_token:
+                return 401, self.error(401, "unauthorized", "unauthorized", api_version), None
+        try:
+            if is_pge:
+                status, data = self.handle_pge(method, route, body)
+            else:
+                status, data = self.handle_grid(method, route, query, body)
+        except MockError as exc:
+            return exc.status, self.error(exc.status, exc.text, exc.key, api_version), None
+        if status == 204:
+            return 204, None, None
+        return status, self.envelope(status, data, api_version), None
+
+    def handle_pge(self, method, route, body):
+        state = self.state
+        if method == "GET":
+            data = state.get_singleton("pge/%s" % route)
+            if data is None:
+                if self.strict:
+                    raise MockError(404, "%s not found" % route)
+                data = {}
+            return 200, data
+        if route == "start-install":
+            status = dict(state.get_singleton("pge/install-status"), installStatus="started")
+            state.set_singleton("pge/install-status", status)
+            return 202, status
+        data = dict(state.get_singleton("pge/%s" % route) or {})
+        data.update(body or {})
+        state.set_singleton("pge/%s" % route, data)
+        return 200, data
+
+    def handle_grid(self, method, route, query, body):
+        state = self.state
+        if route == "authorize" and method == "POST":
+            return 200, self.auth_token or "mock-auth-token"
+        if route == "grid/ntp-servers/update" and method == "POST":
+            # the passphrase is checked by the grid, only the servers are kept
+            state.set_singleton("grid/ntp-servers", (body or {}).get("servers") or [])
+            return 200, state.get_singleton("grid/ntp-servers")
+
+        matched = state.match_collection(route)
+        if matched is None:
+            return self.handle_singleton(method, route, body)
+        collection, records, rest = matched
+
+        if not rest:
+            if method == "GET":
+                limit = int(query["limit"]) if "limit" in query else None
+                include_marker = query.get("includeMarker") == "true"
+                return 200, state.list_records(records, limit, query.get("marker"), include_marker)
+            if method == "POST":
+                return 201, state.create(collection, records, body)
+            raise MockError(405, "%s not allowed on %s" % (method, route), "methodNotAllowed")
+
+        with state.lock:
+            key, sub = state.find_item(collection, records, rest)
+            record = records[key]
+            if not sub:
+                if method == "GET":
+                    return 200, dict(record)
+                if method in ("PUT", "PATCH"):
+                    updated = dict(record) if method == "PATCH" else {}
+                    updated.update(body or {})
+                    key_field = "name" if collection == "org/containers" else "id"
+                    updated[key_field] = key
+                    updated.pop("password", None)
+                    records[key] = updated
+                    return 200, dict(updated)
+                if method == "DELETE":
+                    del records[key]
+                    state.subresources.pop((collection, key), None)
+                    return 204, None
+                raise MockError(405, "%s not allowed on %s" % (method, route), "methodNotAllowed")
+            return self.handle_subresource(method, collection, key, record, "/".join(sub), body)
+
+    def handle_subresource(self, method, collection, key, record, name, body):
+        state = self.state
+        if name == "change-password":
+            return 204, None
+        if name == "deactivate" and method == "POST":
+            record["active"] = False
+            return 204, None
+        stored = state.subresources.setdefault((collection, key), {})
+        if method == "GET":
+            if name not in stored and self.strict:
+                raise MockError(404, "%s not found" % name)
+            return 200, stored.get(name, {})
+        if method == "DELETE":
+            stored.pop(name, None)
+            return 204, None
+        stored[name] = body if body is not None else {}
+        return 200, stored[name]
+
+    def handle_singleton(self, method, route, body):
+        state = self.state
+        if method == "GET":
+            data = state.get_singleton(route)
+            if data is None:
+                if self.strict:
+                    raise MockError(404, "%s not found" % route)
+                data = {}
+            return 200, data
+        if method in ("PUT", "POST", "PATCH"):
+            state.set_singleton(route, body if body is not None else {})
+            return 200, body if body is not None else {}
+        if method == "DELETE":
+            state.singletons.pop(route, None)
+            return 204, None
+        raise MockError(405, "%s not allowed on %s" % (method, route), "methodNotAllowed")
@@ -0,0 +1,275 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" In-memory state of the mock StorageGRID API: collections, singletons, and synthetic grids """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+# Collections, addressed as <collection> and <collection>/<key>, with the field holding the key.
+# {id} in a collection stands for the key of a parent item.
+COLLECTIONS = OrderedDict([
+    ("grid/accounts", "id"),
+    ("grid/alert-receivers", "id"),
+    ("grid/client-certificates", "id"),
+    ("grid/groups", "id"),
+    ("grid/users", "id"),
+    ("grid/ilm-rules", "id"),
+    ("grid/ilm-policies", "id"),
+    ("grid/ilm-policy-tags", "id"),
+    ("grid/traffic-classes/policies", "id"),
+    ("private/ec-profiles", "id"),
+    ("private/ilm-pools", "id"),
+    ("private/firewall-blocked-ports", "id"),
+    ("private/firewall-privileged-ips", "id"),
+    ("private/gateway-configs", "id"),
+    ("private/ha-groups", "id"),
+    ("private/vlan-interfaces", "id"),
+    ("org/containers", "name"),
+    ("org/groups", "id"),
+    ("org/users", "id"),
+    ("org/users/{id}/s3-access-keys", "id"),
+])
+
+# Read-only views of another collection
+ALIASES = {
+    "grid/ec-profiles": "private/ec-profiles",
+    "grid/ilm-pools": "private/ilm-pools",
+    "grid/ha-groups": "private/ha-groups",
+    "grid/gateway-configs": "private/gateway-configs",
+    "grid/vlan-interfaces": "private/vlan-interfaces",
+    "grid/firewall-blocked-ports": "private/firewall-blocked-ports",
+    "grid/firewall-privileged-ips": "private/firewall-privileged-ips",
+}
+
+# Collections whose items are created with the id of the node they apply to
+NODE_ID_COLLECTIONS = frozenset(["private/firewall-blocked-ports", "private/firewall-privileged-ips"])
+
+# Items also addressed by their unique name, e.g. grid/groups/group/admins
+UNIQUE_NAME_COLLECTIONS = frozenset(["grid/groups", "grid/users", "org/groups", "org/users"])
+
+PRODUCT_VERSION = "11.8.0-20230721.1338.d3969b3"
+
+
+class MockError(Exception):
+    """ Error answered with a StorageGRID error body """
+
+    def __init__(self, status, text, key="notFound"):
+        super(MockError, self).__init__(text)
+        self.status = status
+        self.text = text
+        self.key = key
+
+
+class MockState(object):
+    """
+    Stateful store behind the mock server.
+    Collections are ordered dicts of records by key, singletons are payloads by path.
+    Every method is safe to call from the server threads.
+    """
+
+    def __init__(self, seed=0):
+        self.lock = threading.RLock()
+        self.random = random.Random(seed)
+        self.collections = dict((name, OrderedDict()) for name in COLLECTIONS if "{id}" not in name)
+        # nested collections, by parent key
+        self.nested = {}
+        # sub-resources of an item, e.g. org/containers/bucket1/versioning
+        self.subresources = {}
+        self.singletons = {
+            "grid/config/product-version": {"productVersion": PRODUCT_VERSION},
+            "org/config/product-version": {"productVersion": PRODUCT_VERSION},
+            "grid/node-health": [],
+            "grid/regions": ["us-east-1"],
+            "grid/dns-servers": [],
+            "grid/ntp-servers": [],
+            "grid/domain-names": [],
+            "private/firewall-external-ports": {"externalTcpPorts": [22, 80, 443, 8082, 8443], "externalUdpPorts": [53, 68, 123, 161]},
+            "org/compliance-global": {"complianceEnabled": True},
+            "private/single-sign-on": {"disable": True, "sandbox": False},
+        }
+        for collection in ("grid/users", "org/users"):
+            self.add(collection, dict(fullName="Root", uniqueName="root", memberOf=[], disable=False, federated=False))
+
+    # identifiers
+
+    def new_id(self, collection):
+        if collection == "grid/accounts":
+            return "".join(self.random.choice("0123456789") for dummy in range(20))
+        if collection == "private/ilm-pools":
+            return "p%d" % self.random.getrandbits(63)
+        if collection == "grid/ilm-rules":
+            return "r%d" % self.random.getrandbits(63)
+        if collection == "private/ec-profiles":
+            return str(len(self.collections[collection]) + 1)
+        if collection.endswith("s3-access-keys"):
+            return "".join(self.random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789") for dummy in range(20))
+        return str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+
+    # routing helpers
+
+    def match_collection(self, path):
+        """ Return (collection name, records, remaining segments) for a path, or None """
+        segments = path.split("/")
+        with self.lock:
+            for name in sorted(list(COLLECTIONS) + list(ALIASES), key=lambda item: -item.count("/")):
+                template = name.split("/")
+                if len(segments) < len(template):
+                    continue
+                parent = None
+                for segment, expected in zip(segments, template):
+                    if expected == "{id}":
+                        parent = segment
+                    elif segment != expected:
+                        break
+                else:
+                    target = ALIASES.get(name, name)
+                    if parent is None:
+                        records = self.collections[target]
+                    else:
+                        records = self.nested.setdefault((target, parent), OrderedDict())
+                    return target, records, segments[len(template):]
+        return None
+
+    def find_item(self, collection, records, rest):
+        """ Return (key, remaining segments) of the item addressed by rest """
+        if collection in UNIQUE_NAME_COLLECTIONS and len(rest) >= 2 and rest[0] in ("group", "user", "federated-group", "federated-user"):
+            unique_name = "%s/%s" % (rest[0], rest[1])
+            for key, record in records.items():
+                if record.get("uniqueName") == unique_name:
+                    return key, rest[2:]
+            raise MockError(404, "%s not found" % unique_name)
+        if collection in ("grid/users", "org/users") and rest[0] == "root":
+            for key, record in records.items():
+                if record.get("uniqueName") == "root":
+                    return key, rest[1:]
+            raise MockError(404, "root user not found")
+        if rest[0] not in records:
+            raise MockError(404, "%s %s not found" % (collection, rest[0]))
+        return rest[0], rest[1:]
+
+    # collection operations
+
+    def list_records(self, records, limit=None, marker=None, include_marker=False):
+        with self.lock:
+            keys = list(records)
+            start = 0
+            if marker is not None and marker in records:
+                start = keys.index(marker) + (0 if include_marker else 1)
+            end = len(keys) if limit is None else start + limit
+            return [copy.deepcopy(records[key]) for key in keys[start:end]]
+
+    def create(self, collection, records, body):
+        key_field = COLLECTIONS[collection]
+        record = dict(body or {})
+        with self.lock:
+            if key_field == "id" and not (collection in NODE_ID_COLLECTIONS and record.get("id")):
+                record["id"] = self.new_id(collection)
+            elif not record.get(key_field):
+                raise MockError(400, "%s is required" % key_field, "validation")
+            if record[key_field] in records:
+                raise MockError(409, "%s already exists" % record[key_field], "conflict")
+            for name_field in ("name", "displayName", "uniqueName"):
+                if name_field in record and key_field != name_field and name_field != "displayName" and any(
+                    other.get(name_field) == record[name_field] for other in records.values()
+                ):
+                    raise MockError(409, "%s %s already exists" % (name_field, record[name_field]), "conflict")
+            if collection == "org/containers":
+                record.setdefault("creationTime", time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime()))
+                record.setdefault("region", "us-east-1")
+            if collection == "private/ec-profiles":
+                record.setdefault("active", True)
+            record.pop("password", None)
+            response = copy.deepcopy(record)
+            if collection.endswith("s3-access-keys"):
+                secret = "".join(self.random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for dummy in range(40))
+                record = dict(id=record["id"], displayName="****************" + record["id"][-4:], expires=record.get("expires"))
+                response = dict(record, accessKey=record["id"], secretAccessKey=secret)
+            records[record[key_field]] = record
+        return response
+
+    def add(self, collection, record, parent=None):
+        """ Seed a record, with a generated id unless it has one """
+        with self.lock:
+            records = self.collections[collection] if parent is None else self.nested.setdefault((collection, parent), OrderedDict())
+            key_field = COLLECTIONS[collection]
+            if key_field == "id" and "id" not in record:
+                record["id"] = self.new_id(collection)
+            records[record[key_field]] = record
+            return record
+
+    def get_singleton(self, path):
+        with self.lock:
+            if path not in self.singletons:
+                return None
+            return copy.deepcopy(self.singletons[path])
+
+    def set_singleton(self, path, data):
+        with self.lock:
+            self.singletons[path] = copy.deepcopy(data)
+
+    # synthetic grids
+
+    def seed(self, tenants=0, buckets=0, users=0, groups=0, nodes=0, sites=1, rules=0, pools=0):
+        """
+        Populate a synthetic grid of any size: tenant accounts, grid groups and users, org buckets,
+        org users and groups, nodes spread over sites, ILM pools and rules.
+        """
+        site_ids = [str(uuid.UUID(int=self.random.getrandbits(128), version=4)) for dummy in range(max(sites, 1))]
+        for index in range(tenants):
+            self.add("grid/accounts", dict(
+                name="tenant-%05d" % index,
+                capabilities=["management", "s3"],
+                policy=dict(useAccountIdentitySource=False, allowPlatformServices=False, quotaObjectBytes=None),
+            ))
+        for index in range(groups):
+            self.add("grid/groups", dict(
+                displayName="Group %05d" % index, uniqueName="group/group-%05d" % index,
+                policies=dict(management=dict(tenantAccounts=True)), federated=False,
+            ))
+            self.add("org/groups", dict(
+                displayName="Group %05d" % index, uniqueName="group/group-%05d" % index,
+                policies=dict(management=dict(manageAllContainers=True)), federated=False,
+            ))
+        for index in range(users):
+            self.add("grid/users", dict(fullName="User %05d" % index, uniqueName="user/user-%05d" % index, memberOf=[], disable=False, federated=False))
+            self.add("org/users", dict(fullName="User %05d" % index, uniqueName="user/user-%05d" % index, memberOf=[], disable=False, federated=False))
+        for index in range(buckets):
+            self.add("org/containers", dict(name="bucket-%05d" % index, creationTime="2026-01-01T00:00:00.000Z", region="us-east-1"))
+        node_health = []
+        for index in range(nodes):
+            site = index % len(site_ids)
+            node_health.append(dict(
+                id=str(uuid.UUID(int=self.random.getrandbits(128), version=4)),
+                isPrimaryAdmin=index == 0,
+                name="DC%d-SN%d" % (site + 1, index + 1) if index else "DC1-ADM1",
+                siteId=site_ids[site],
+                siteName="DC%d" % (site + 1),
+                severity="normal",
+                state="connected",
+                type="adminNode" if index == 0 else "storageNode",
+            ))
+        if nodes:
+            self.set_singleton("grid/node-health", node_health)
+        pool_ids = []
+        for index in range(pools):
+            pool = self.add("private/ilm-pools", dict(
+                displayName="Pool %05d" % index, name="Pool %05d" % index, archives=[],
+                disks=[dict(group=None, grade=None, siteId=site_ids[index % len(site_ids)])],
+            ))
+            pool_ids.append(pool["id"])
+        for index in range(rules):
+            self.add("grid/ilm-rules", dict(
+                displayName="Rule %05d" % index, filters=[], ingestBehavior="balanced", referenceTime="ingestTime",
+                placements=[dict(retention=dict(after=0), replicated=[dict(copies=2, poolId=pool_ids[index % len(pool_ids)] if pool_ids else None)])],
+                active=False, proposed=False,
+            ))
+        return self
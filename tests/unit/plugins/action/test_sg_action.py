@@ -0,0 +1,193 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests NetApp StorageGRID action plugins running modules in-process """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import os
+import pytest
+import sys
+
+from ansible_collections.netapp.storagegrid.tests.unit.compat import unittest
+from ansible_collections.netapp.storagegrid.tests.unit.compat.mock import MagicMock, patch
+import ansible_collections.netapp.storagegrid.plugins.modules.na_sg_org_group as na_sg_org_group
+from ansible_collections.netapp.storagegrid.plugins.action.na_sg_org_group import ActionModule
+from ansible_collections.netapp.storagegrid.plugins.plugin_utils import sg_client
+
+if sys.version_info < (3, 11):
+    pytestmark = pytest.mark.skip("Skipping Unit Tests on 3.11")
+
+# REST API canned responses when mocking send_request
+SRR = {
+    "end_of_sequence": (None, "Unexpected call to send_request"),
+    "generic_error": (None, "Expected error"),
+    "server_error": ({"code": 500}, "Expected error"),
+    "version_118": ({"data": {"productVersion": "11.8.0-20230721.1338.d3969b3"}}, None),
+    "not_found": (
+        {"status": "error", "code": 404, "data": {}},
+        {"key": "error.404"},
+    ),
+    "org_group_record": (
+        {
+            "data": {
+                "displayName": "TestOrgGroup",
+                "uniqueName": "group/testorggroup",
+                "policies": {
+                    "management": {
+                        "manageAllContainers": True,
+                        "manageEndpoints": True,
+                        "manageOwnS3Credentials": True,
+                    },
+                },
+                "accountId": "12345678901234567890",
+                "id": "00000000-0000-0000-0000-000000000000",
+                "federated": False,
+            }
+        },
+        None,
+    ),
+}
+
+
+class TestSGActionModule(unittest.TestCase):
+    """Unit Tests for the in-process action plugins"""
+
+    def get_action(self, args, transport="local", check_mode=False, environment=None):
+        task = MagicMock(args=args, async_val=0, check_mode=check_mode, action="netapp.storagegrid.na_sg_org_group", environment=environment)
+        connection = MagicMock(transport=transport)
+        connection._shell.tmpdir = None
+        templar = MagicMock()
+        templar.template.side_effect = lambda value: value
+        return ActionModule(task, connection, MagicMock(), MagicMock(), templar, MagicMock())
+
+    def set_args_create(self):
+        return dict(
+            {
+                "state": "present",
+                "display_name": "TestOrgGroup",
+                "unique_name": "group/testorggroup",
+                "management_policy": {
+                    "manage_all_containers": True,
+                    "manage_endpoints": True,
+                    "manage_own_s3_credentials": True,
+                },
+                "api_url": "gmi.example.com",
+                "auth_token": "01234567-5678-9abc-78de-9fgabc123def",
+                "validate_certs": False,
+            }
+        )
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_create_in_process(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],
+            SRR["not_found"],  # get
+            SRR["org_group_record"],  # post
+            SRR["end_of_sequence"],
+        ]
+        action = self.get_action(self.set_args_create())
+        result = action.run(task_vars={})
+        print("Info: test_create_in_process: %s" % repr(result))
+        assert result["changed"]
+        assert result["resp"]["uniqueName"] == "group/testorggroup"
+        # secrets are masked in the invocation
+        assert result["invocation"]["module_args"]["auth_token"] == "VALUE_SPECIFIED_IN_NO_LOG_PARAMETER"
+        assert result["invocation"]["module_args"]["state"] == "present"
+        # the module is restored after the run
+        assert na_sg_org_group.AnsibleModule.__name__ == "AnsibleModule"
+        assert not action._connection.exec_command.called
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_loop_items_share_the_session(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],
+            SRR["org_group_record"],  # get
+            SRR["version_118"],
+            SRR["org_group_record"],  # get
+            SRR["end_of_sequence"],
+        ]
+        sessions = []
+        original = na_sg_org_group.SGRestAPI.__init__
+
+        def init(rest_api, module, *args, **kwargs):
+            original(rest_api, module, *args, **kwargs)
+            sessions.append(rest_api.session)
+
+        with patch.object(na_sg_org_group.SGRestAPI, "__init__", init):
+            for dummy in range(2):
+                result = self.get_action(self.set_args_create()).run(task_vars={})
+                assert not result["changed"]
+        assert sessions[0] is not None
+        assert sessions[0] is sessions[1]
+        assert sessions[0] is sg_client.get_session("gmi.example.com", False)
+
+    @patch.dict(os.environ, {"NETAPP_SG_API_TELEMETRY": "", "NETAPP_SG_RATE_LIMIT": ""})
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_task_environment(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],
+            SRR["org_group_record"],  # get
+            SRR["end_of_sequence"],
+        ]
+        os.environ.pop("NETAPP_SG_PERF", None)
+        environment = [{"NETAPP_SG_PERF": "0", "NETAPP_SG_RATE_LIMIT": "20"}, {"NETAPP_SG_PERF": "1"}]
+        result = self.get_action(self.set_args_create(), environment=environment).run(task_vars={})
+        assert not result["changed"]
+        assert "perf" in result
+        # env_fallback options read the task environment
+        assert result["invocation"]["module_args"]["rate_limit"] == 20.0
+        # the controller environment is restored
+        assert "NETAPP_SG_PERF" not in os.environ
+        assert os.environ["NETAPP_SG_RATE_LIMIT"] == ""
+
+    def test_invalid_arguments_fail(self):
+        args = self.set_args_create()
+        args["bogus"] = True
+        del args["unique_name"]
+        result = self.get_action(args).run(task_vars={})
+        assert result["failed"]
+        assert "missing required arguments: unique_name" in result["msg"]
+        assert "bogus" in result["msg"]
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_module_error(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],
+            SRR["server_error"],  # get
+            SRR["end_of_sequence"],
+        ]
+        result = self.get_action(self.set_args_create()).run(task_vars={})
+        assert result["failed"]
+        assert result["msg"] == "Expected error"
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_module_exception(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],
+            SRR["generic_error"],  # get, no response to read the status code from
+            SRR["end_of_sequence"],
+        ]
+        result = self.get_action(self.set_args_create()).run(task_vars={})
+        assert result["failed"]
+        assert "Traceback" in result["exception"]
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_check_mode(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],
+            SRR["not_found"],  # get
+            SRR["end_of_sequence"],
+        ]
+        result = self.get_action(self.set_args_create(), check_mode=True).run(task_vars={})
+        assert result["changed"]
+        assert mock_request.call_count == 2
+
+    def test_remote_connection_runs_module(self):
+        action = self.get_action(self.set_args_create(), transport="ssh")
+        action._execute_module = MagicMock(return_value=dict(changed=True))
+        action._remove_tmp_path = MagicMock()
+        action._connection.has_native_async = False
+        assert action.run(task_vars={})["changed"]
+        action._execute_module.assert_called_once_with(task_vars={}, wrap_async=0)
@@ -0,0 +1,91 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests NetApp StorageGRID action plugin: na_sg_org_s3_key_rotation """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import json
+import os
+import pytest
+import shutil
+import stat
+import sys
+import tempfile
+
+from ansible_collections.netapp.storagegrid.tests.unit.compat import unittest
+from ansible_collections.netapp.storagegrid.tests.unit.compat.mock import MagicMock, patch
+from ansible.module_utils.common.text.converters import to_bytes
+from ansible.parsing.vault import VaultLib, VaultSecret
+from ansible_collections.netapp.storagegrid.plugins.action.na_sg_org_s3_key_rotation import ActionModule
+
+if sys.version_info < (3, 11):
+    pytestmark = pytest.mark.skip("Skipping Unit Tests on 3.11")
+
+# REST API canned responses when mocking send_request
+SRR = {
+    "end_of_sequence": (None, "Unexpected call to send_request"),
+    "version_118": ({"data": {"productVersion": "11.8.0-20230721.1338.d3969b3"}}, None),
+    "org_users": ({"data": [{"id": "00000000-0000-0000-0000-000000000002", "uniqueName": "user/service1"}]}, None),
+    "service1_keys": ({"data": [{"id": "key-s1-1", "displayName": "****************S101", "expires": "2020-09-04T00:00:00.000Z"}]}, None),
+    "new_key": (
+        {"data": {"id": "key-new", "accessKey": "ABCDEFGHIJKLMNOPQRST", "secretAccessKey": "abcdefghijklmnopqrstuvwxyz0123456789ABCD"}},
+        None,
+    ),
+}
+
+
+class TestS3KeyRotationAction(unittest.TestCase):
+    """Unit Tests for the vault encrypted output of na_sg_org_s3_key_rotation"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.dest = os.path.join(self.tmpdir, "keys.vault")
+        self.secrets = [("default", VaultSecret(to_bytes("vault-password")))]
+
+    def get_action(self, secrets, check_mode=False):
+        args = dict(
+            dest=self.dest,
+            api_url="gmi.example.com",
+            auth_token="01234567-5678-9abc-78de-9fgabc123def",
+            validate_certs=False,
+        )
+        task = MagicMock(args=args, async_val=0, check_mode=check_mode, action="netapp.storagegrid.na_sg_org_s3_key_rotation")
+        connection = MagicMock(transport="local")
+        loader = MagicMock()
+        loader._vault.secrets = secrets
+        return ActionModule(task, connection, MagicMock(), loader, MagicMock(), MagicMock())
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_keys_written_to_vault_file(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],
+            SRR["org_users"],  # get all users
+            SRR["service1_keys"],  # get service1 keys
+            SRR["new_key"],  # post replacement key
+            SRR["end_of_sequence"],
+        ]
+        result = self.get_action(self.secrets).run(task_vars={})
+        print("Info: test_keys_written_to_vault_file: %s" % repr(result))
+        assert result["changed"]
+        assert result["dest"] == self.dest
+        assert "secret_access_key" not in result["rotated"][0]
+        assert result["rotated"][0]["access_key"] == "ABCDEFGHIJKLMNOPQRST"
+        assert stat.S_IMODE(os.stat(self.dest).st_mode) == 0o600
+        with open(self.dest, "rb") as vault_file:
+            vaulttext = vault_file.read()
+        assert vaulttext.startswith(b"$ANSIBLE_VAULT;")
+        content = json.loads(VaultLib(self.secrets).decrypt(vaulttext))
+        assert content["keys"][0]["secret_access_key"] == "abcdefghijklmnopqrstuvwxyz0123456789ABCD"
+        assert content["keys"][0]["unique_name"] == "user/service1"
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_fail_without_vault_secret_before_rotation(self, mock_request):
+        result = self.get_action([]).run(task_vars={})
+        print("Info: test_fail_without_vault_secret_before_rotation: %s" % repr(result))
+        assert result["failed"]
+        assert "A vault password is required" in result["msg"]
+        assert not mock_request.called
+        assert not os.path.exists(self.dest)
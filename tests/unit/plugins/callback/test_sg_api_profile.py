@@ -0,0 +1,111 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests NetApp StorageGRID callback plugin: sg_api_profile """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import csv
+import json
+import os
+import pytest
+import sys
+import tempfile
+
+from ansible_collections.netapp.storagegrid.tests.unit.compat import unittest
+from ansible_collections.netapp.storagegrid.tests.unit.compat.mock import MagicMock, patch
+from ansible.plugins.loader import callback_loader
+import ansible_collections.netapp.storagegrid.plugins.callback.sg_api_profile as sg_api_profile
+
+if sys.version_info < (3, 11):
+    pytestmark = pytest.mark.skip("Skipping Unit Tests on 3.11")
+
+
+def get_callback_plugin(**options):
+    """ register the options from DOCUMENTATION and name the plugin, as the plugin loader does """
+    name = "netapp.storagegrid.sg_api_profile"
+    path = sg_api_profile.__file__
+    callback_loader._load_config_defs(name, sg_api_profile, path)
+    plugin = sg_api_profile.CallbackModule(display=MagicMock(verbosity=0))
+    callback_loader._update_object(plugin, name, path, resolved=name)
+    plugin.set_options(direct=options)
+    return plugin
+
+
+def call(method, endpoint, latency_ms, status=200):
+    return dict(method=method, endpoint=endpoint, status=status, bytes=100, latency_ms=latency_ms)
+
+
+def task_result(uuid, name, result):
+    task = MagicMock(_uuid=uuid)
+    task.get_name.return_value = name
+    task.get_path.return_value = "playbook.yml:%s" % uuid
+    return MagicMock(_task=task, _result=result)
+
+
+# the callback enables telemetry in the environment, keep it from leaking into other tests
+@patch.dict(os.environ, {})
+class TestSgApiProfileCallback(unittest.TestCase):
+    """Unit Tests for sg_api_profile callback plugin"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def test_enables_module_telemetry(self):
+        get_callback_plugin()
+        assert os.environ[sg_api_profile.TELEMETRY_ENV] == "1"
+
+    def test_percentile(self):
+        latencies = list(range(1, 101))
+        assert sg_api_profile.percentile(latencies, 0.50) == 50
+        assert sg_api_profile.percentile(latencies, 0.95) == 95
+        assert sg_api_profile.percentile(latencies, 0.99) == 99
+        assert sg_api_profile.percentile([7], 0.99) == 7
+        assert sg_api_profile.percentile([], 0.5) is None
+
+    def test_aggregate_and_write_report(self):
+        path = os.path.join(self.tmpdir, "report")
+        plugin = get_callback_plugin(report_path=path, report_format=["json", "csv"], slowest_tasks=1)
+        version_call = call("GET", "api/v3/grid/config/product-version", 5.0)
+        # a loop task, calls are returned with every item
+        loop_result = {
+            "results": [
+                {"sg_api_calls": [version_call, call("GET", "api/v4/org/containers/{id}", 10.0 * item)]}
+                for item in range(1, 101)
+            ]
+        }
+        plugin.v2_runner_on_ok(task_result("task-1", "Create buckets", loop_result))
+        failed_result = {"sg_api_calls": [version_call, call("POST", "api/v4/org/containers", 3.0, status=400)]}
+        plugin.v2_runner_on_failed(task_result("task-2", "Create bad bucket", failed_result))
+        # the calls are removed from the results
+        assert "sg_api_calls" not in failed_result
+        plugin.v2_playbook_on_stats(MagicMock())
+
+        with open(path + ".json") as report_file:
+            report = json.load(report_file)
+        endpoints = dict(((item["method"], item["endpoint"]), item) for item in report["endpoints"])
+        bucket = endpoints[("GET", "api/v4/org/containers/{id}")]
+        assert bucket["calls"] == 100
+        assert (bucket["p50_ms"], bucket["p95_ms"], bucket["p99_ms"], bucket["max_ms"]) == (500.0, 950.0, 990.0, 1000.0)
+        assert endpoints[("GET", "api/v3/grid/config/product-version")]["calls"] == 101
+        assert endpoints[("POST", "api/v4/org/containers")]["errors"] == 1
+        assert report["endpoints"][0]["endpoint"] == "api/v4/org/containers/{id}"
+        tasks = dict((item["task"], item) for item in report["tasks"])
+        assert tasks["Create buckets"]["calls"] == 200
+        assert tasks["Create bad bucket"]["errors"] == 1
+        assert [task["task"] for task in report["slowest_tasks"]] == ["Create buckets"]
+
+        with open(path + "_endpoints.csv") as report_file:
+            rows = list(csv.DictReader(report_file))
+        assert len(rows) == 3
+        assert rows[0]["endpoint"] == "api/v4/org/containers/{id}"
+        with open(path + "_tasks.csv") as report_file:
+            assert len(list(csv.DictReader(report_file))) == 2
+
+    def test_no_report_without_calls(self):
+        path = os.path.join(self.tmpdir, "empty")
+        plugin = get_callback_plugin(report_path=path)
+        plugin.v2_runner_on_ok(task_result("task-1", "debug", {"msg": "hello"}))
+        plugin.v2_playbook_on_stats(MagicMock())
+        assert not os.path.exists(path + ".json")
@@ -0,0 +1,216 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests NetApp StorageGRID inventory plugin: storagegrid """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import os
+import pytest
+import sys
+import tempfile
+
+from ansible_collections.netapp.storagegrid.tests.unit.compat import unittest
+from ansible_collections.netapp.storagegrid.tests.unit.compat.mock import patch
+from ansible.errors import AnsibleError
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible.plugins.loader import inventory_loader
+import ansible_collections.netapp.storagegrid.plugins.inventory.storagegrid as storagegrid_inventory
+
+if sys.version_info < (3, 11):
+    pytestmark = pytest.mark.skip("Skipping Unit Tests on 3.11")
+
+# REST API canned responses when mocking send_request
+SRR = {
+    "end_of_sequence": (None, "Unexpected call to send_request"),
+    "generic_error": (None, "Expected error"),
+    "version_118": ({"data": {"productVersion": "11.8.0-20240131.1338.d3969b3"}}, None),
+    "node_health": (
+        {
+            "data": [
+                {
+                    "id": "0b1866ed-d6e7-41b4-815f-bf867348b76b",
+                    "isPrimaryAdmin": True,
+                    "name": "SITE1-ADM1",
+                    "siteId": "ae56d06d-bd83-46bd-adce-77146b1d94bd",
+                    "siteName": "SITE1",
+                    "severity": "normal",
+                    "state": "connected",
+                    "type": "adminNode",
+                },
+                {
+                    "id": "7bb5bf05-a04c-4344-8abd-08c5c4048666",
+                    "isPrimaryAdmin": None,
+                    "name": "SITE1-G1",
+                    "siteId": "ae56d06d-bd83-46bd-adce-77146b1d94bd",
+                    "siteName": "SITE1",
+                    "severity": "normal",
+                    "state": "connected",
+                    "type": "apiGatewayNode",
+                },
+                {
+                    "id": "970ad050-b68b-4aae-a94d-aef73f3095c4",
+                    "isPrimaryAdmin": None,
+                    "name": "SITE2-S1",
+                    "siteId": "7c24002e-5157-43e9-83e5-02db9b265b02",
+                    "siteName": "SITE2",
+                    "severity": "major",
+                    "state": "unknown",
+                    "type": "storageNode",
+                },
+            ]
+        },
+        None,
+    ),
+    "ha_groups": (
+        {
+            "data": [
+                {
+                    "id": "c08e6dca-038d-4a05-9499-6fbd1e6a4c3e",
+                    "name": "site1_primary",
+                    "virtualIps": ["10.193.174.117"],
+                    "interfaces": [
+                        {"nodeId": "0b1866ed-d6e7-41b4-815f-bf867348b76b", "interface": "eth2"},
+                        {"nodeId": "7bb5bf05-a04c-4344-8abd-08c5c4048666", "interface": "eth2"},
+                    ],
+                },
+            ]
+        },
+        None,
+    ),
+}
+
+
+
+def get_inventory_plugin():
+    """ register the options from DOCUMENTATION and name the plugin, as the plugin loader does """
+    name = storagegrid_inventory.InventoryModule.NAME
+    path = storagegrid_inventory.__file__
+    inventory_loader._load_config_defs(name, storagegrid_inventory, path)
+    plugin = storagegrid_inventory.InventoryModule()
+    inventory_loader._update_object(plugin, name, path, resolved=name)
+    return plugin
+
+
+INVENTORY_CONFIG = """
+plugin: netapp.storagegrid.storagegrid
+grids:
+  - api_url: https://grid1.example.com
+    auth_token: storagegrid-auth-token
+    validate_certs: false
+%s
+"""
+
+
+class TestStorageGridInventory(unittest.TestCase):
+    """Unit Tests for storagegrid inventory plugin"""
+
+    def setUp(self):
+        self.inventory = get_inventory_plugin()
+        self.loader = DataLoader()
+        self.tmpdir = tempfile.mkdtemp()
+
+    def parse(self, extra=""):
+        path = os.path.join(self.tmpdir, "test.storagegrid.yml")
+        with open(path, "w") as config:
+            config.write(INVENTORY_CONFIG % extra)
+        inventory = InventoryData()
+        self.inventory.parse(inventory, self.loader, path, cache=True)
+        return inventory
+
+    def test_verify_file(self):
+        path = os.path.join(self.tmpdir, "grid.storagegrid.yml")
+        open(path, "w").close()
+        assert self.inventory.verify_file(path)
+        other = os.path.join(self.tmpdir, "hosts.yml")
+        open(other, "w").close()
+        assert not self.inventory.verify_file(other)
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_populate_groups_and_hostvars(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["node_health"],  # get nodes
+            SRR["ha_groups"],  # get HA groups
+            SRR["end_of_sequence"],
+        ]
+        inventory = self.parse()
+        assert sorted(inventory.hosts) == ["SITE1-ADM1", "SITE1-G1", "SITE2-S1"]
+        groups = inventory.groups
+        assert sorted(host.name for host in groups["sg_grid_grid1_example_com"].hosts) == ["SITE1-ADM1", "SITE1-G1", "SITE2-S1"]
+        assert sorted(host.name for host in groups["sg_site_SITE1"].hosts) == ["SITE1-ADM1", "SITE1-G1"]
+        assert [host.name for host in groups["sg_storage_nodes"].hosts] == ["SITE2-S1"]
+        assert [host.name for host in groups["sg_gateway_nodes"].hosts] == ["SITE1-G1"]
+        assert [host.name for host in groups["sg_primary_admin"].hosts] == ["SITE1-ADM1"]
+        assert [host.name for host in groups["sg_health_major"].hosts] == ["SITE2-S1"]
+        assert [host.name for host in groups["sg_state_unknown"].hosts] == ["SITE2-S1"]
+        assert sorted(host.name for host in groups["sg_ha_site1_primary"].hosts) == ["SITE1-ADM1", "SITE1-G1"]
+        assert groups["sg_ha_site1_primary"].vars["sg_virtual_ips"] == ["10.193.174.117"]
+        hostvars = inventory.get_host("SITE2-S1").vars
+        assert hostvars["sg_node_id"] == "970ad050-b68b-4aae-a94d-aef73f3095c4"
+        assert hostvars["sg_site_name"] == "SITE2"
+        assert hostvars["sg_ha_groups"] == []
+        assert inventory.get_host("SITE1-G1").vars["sg_ha_groups"] == ["site1_primary"]
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_constructed_groups(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["node_health"],  # get nodes
+            SRR["ha_groups"],  # get HA groups
+            SRR["end_of_sequence"],
+        ]
+        inventory = self.parse(
+            "groups:\n  degraded: sg_severity != 'normal'\ncompose:\n  ansible_host: inventory_hostname | lower ~ '.example.com'"
+        )
+        assert [host.name for host in inventory.groups["degraded"].hosts] == ["SITE2-S1"]
+        assert inventory.get_host("SITE1-ADM1").vars["ansible_host"] == "site1-adm1.example.com"
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_inventory_cache(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["node_health"],  # get nodes
+            SRR["ha_groups"],  # get HA groups
+            SRR["end_of_sequence"],
+        ]
+        cache = "cache: true\ncache_plugin: jsonfile\ncache_connection: %s\ncache_timeout: 60" % self.tmpdir
+        self.parse(cache)
+        self.inventory._cache.update_cache_if_changed()
+        # the second parse is served from the cache
+        self.inventory = get_inventory_plugin()
+        inventory = self.parse(cache)
+        assert sorted(inventory.hosts) == ["SITE1-ADM1", "SITE1-G1", "SITE2-S1"]
+        assert mock_request.call_count == 3
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_multiple_grids(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["node_health"],  # get nodes
+            SRR["ha_groups"],  # get HA groups
+            SRR["version_118"],  # SG version check, second grid
+            SRR["node_health"],  # get nodes
+            SRR["ha_groups"],  # get HA groups
+            SRR["end_of_sequence"],
+        ]
+        inventory = self.parse(
+            "  - api_url: grid2.example.com\n    auth_token: token2\n    name: grid2\n    host_prefix: 'g2-'\nmax_concurrent_grids: 1"
+        )
+        assert len(inventory.hosts) == 6
+        assert inventory.get_host("g2-SITE2-S1").vars["sg_grid"] == "grid2"
+        assert len(inventory.groups["sg_grid_grid2"].hosts) == 3
+        assert len(inventory.groups["sg_site_SITE1"].hosts) == 4
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_grid_error(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["generic_error"],  # get nodes
+            SRR["end_of_sequence"],
+        ]
+        with pytest.raises(AnsibleError) as exc:
+            self.parse()
+        assert "Error reading nodes of grid grid1.example.com: Expected error" in str(exc.value)
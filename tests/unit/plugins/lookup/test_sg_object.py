@@ -0,0 +1,142 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests NetApp StorageGRID lookup plugin: sg_object """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import pytest
+import sys
+
+from ansible_collections.netapp.storagegrid.tests.unit.compat import unittest
+from ansible_collections.netapp.storagegrid.tests.unit.compat.mock import patch
+from ansible.errors import AnsibleError
+from ansible.plugins.loader import lookup_loader
+import ansible_collections.netapp.storagegrid.plugins.lookup.sg_object as sg_object_lookup
+
+if sys.version_info < (3, 11):
+    pytestmark = pytest.mark.skip("Skipping Unit Tests on 3.11")
+
+
+def page(prefix, start, count):
+    return ({"data": [{"id": "%s-%d" % (prefix, index), "name": "%s%d" % (prefix, index)} for index in range(start, start + count)]}, None)
+
+
+# REST API canned responses when mocking send_request
+SRR = {
+    "end_of_sequence": (None, "Unexpected call to send_request"),
+    "generic_error": (None, "Expected error"),
+    "version_118": ({"data": {"productVersion": "11.8.0-20240131.1338.d3969b3"}}, None),
+    "tenants_page_1": page("tenant", 0, 250),
+    "tenants_page_2": page("tenant", 250, 250),
+    "tenants_page_3": page("tenant", 500, 10),
+    "org_groups": (
+        {
+            "data": [
+                {"id": "00000000-0000-0000-0000-000000000001", "uniqueName": "group/admins"},
+                {"id": "00000000-0000-0000-0000-000000000002", "uniqueName": "federated-group/readers"},
+            ]
+        },
+        None,
+    ),
+    "ilm_pools": ({"data": [{"id": "pool-1", "name": "pool-site1"}, {"id": "pool-2", "name": "pool-site2"}]}, None),
+}
+
+CONNECTION = dict(api_url="https://<storagegrid-endpoint-url>", auth_token="storagegrid-auth-token", validate_certs=False)
+
+
+def get_lookup_plugin():
+    """ register the options from DOCUMENTATION and name the plugin, as the plugin loader does """
+    name = "netapp.storagegrid.sg_object"
+    path = sg_object_lookup.__file__
+    lookup_loader._load_config_defs(name, sg_object_lookup, path)
+    plugin = sg_object_lookup.LookupModule()
+    lookup_loader._update_object(plugin, name, path, resolved=name)
+    return plugin
+
+
+class TestSgObjectLookup(unittest.TestCase):
+    """Unit Tests for sg_object lookup plugin"""
+
+    def setUp(self):
+        sg_object_lookup._MEMO.clear()
+        self.lookup = get_lookup_plugin()
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_tenant_ids_in_one_sweep(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["tenants_page_1"],
+            SRR["tenants_page_2"],  # all names found, stop
+            SRR["end_of_sequence"],
+        ]
+        result = self.lookup.run(["tenant", "tenant3", "tenant260"], {}, **CONNECTION)
+        assert result == ["tenant-3", "tenant-260"]
+        assert mock_request.call_args_list[2].args[2] == {"limit": 250, "marker": "tenant-249"}
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_memoized_lookups(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["tenants_page_1"],  # tenant1 found, stop
+            SRR["tenants_page_1"],  # tenant505 not seen yet, sweep again
+            SRR["tenants_page_2"],
+            SRR["tenants_page_3"],  # last page, the collection is now complete
+            SRR["end_of_sequence"],
+        ]
+        assert self.lookup.run(["tenant", "tenant1"], {}, **CONNECTION) == ["tenant-1"]
+        # served from the memo
+        assert get_lookup_plugin().run(["tenant", "tenant2"], {}, **CONNECTION) == ["tenant-2"]
+        assert get_lookup_plugin().run(["tenant", "tenant505"], {}, **CONNECTION) == ["tenant-505"]
+        # the whole collection was read, a missing name needs no request
+        assert get_lookup_plugin().run(["tenant", "tenant999"], {}, on_missing="skip", **CONNECTION) == [None]
+        assert mock_request.call_count == 5
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_unique_name_prefix_and_whole_object(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["org_groups"],
+            SRR["end_of_sequence"],
+        ]
+        result = self.lookup.run(["org_group", "admins", "federated-group/readers"], {}, attribute="", **CONNECTION)
+        assert result == SRR["org_groups"][0]["data"]
+        assert mock_request.call_args_list[0].args[1] == "api/v3/org/config/product-version"
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_unpaginated_kind(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["ilm_pools"],
+            SRR["end_of_sequence"],
+        ]
+        assert self.lookup.run(["ilm_pool", "pool-site2"], {}, **CONNECTION) == ["pool-2"]
+        assert mock_request.call_args_list[1].args[1:3] == ("api/v4/private/ilm-pools", None)
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_missing_name_fail(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["ilm_pools"],
+            SRR["end_of_sequence"],
+        ]
+        with pytest.raises(AnsibleError) as exc:
+            self.lookup.run(["ilm_pool", "pool-site3"], {}, **CONNECTION)
+        assert "ilm_pool 'pool-site3' not found." in str(exc.value)
+
+    def test_unsupported_kind_fail(self):
+        with pytest.raises(AnsibleError) as exc:
+            self.lookup.run(["volume", "vol1"], {}, **CONNECTION)
+        assert "Unsupported object kind 'volume'" in str(exc.value)
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_api_error_fail(self, mock_request):
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["generic_error"],
+            SRR["end_of_sequence"],
+        ]
+        with pytest.raises(AnsibleError) as exc:
+            self.lookup.run(["tenant", "tenant1"], {}, **CONNECTION)
+        assert "Error reading api/v4/grid/accounts: Expected error" in str(exc.value)
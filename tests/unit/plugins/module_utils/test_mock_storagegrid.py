@@ -0,0 +1,246 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests NetApp StorageGRID module_utils: netapp, over HTTPS against the local mock server """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import json
+import pytest
+import sys
+import warnings
+
+from ansible_collections.netapp.storagegrid.tests.unit.compat import unittest
+from ansible_collections.netapp.storagegrid.tests.unit.compat.mock import patch
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
+from ansible_collections.netapp.storagegrid.plugins.modules.na_sg_grid_account import (
+    SgGridAccount as grid_account_module,
+)
+from ansible_collections.netapp.storagegrid.plugins.modules.na_sg_grid_info import (
+    NetAppSgGatherInfo as grid_info_module,
+)
+
+if sys.version_info < (3, 11):
+    pytestmark = pytest.mark.skip("Skipping Unit Tests on 3.11")
+
+pytest.importorskip("cryptography")
+from ansible_collections.netapp.storagegrid.tests.mock_server import MockStorageGRID  # noqa: E402
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({"ANSIBLE_MODULE_ARGS": args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an exception"""
+    if "changed" not in kwargs:
+        kwargs["changed"] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs["failed"] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class TestMockStorageGRID(unittest.TestCase):
+    """Unit Tests for SGRestAPI against the mock server"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockStorageGRID(auth_token="storagegrid-auth-token").start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+        warnings.filterwarnings("ignore", message="Unverified HTTPS request")
+        self.server.clear_injections()
+        self.server.reset_stats()
+        self.server.set_latency(0)
+
+    def default_args(self):
+        return dict(
+            api_url=self.server.url,
+            auth_token="storagegrid-auth-token",
+            validate_certs=False,
+        )
+
+    def get_rest_api(self, args=None):
+        set_module_args(args or self.default_args())
+        module = basic.AnsibleModule(argument_spec=netapp_utils.na_storagegrid_host_argument_spec())
+        return netapp_utils.SGRestAPI(module)
+
+    def test_product_version(self):
+        rest_api = self.get_rest_api()
+        rest_api.get_sg_product_version()
+        assert rest_api.get_sg_version() == (11, 8)
+        assert rest_api.get_api_version() == "v4"
+
+    def test_marker_pagination(self):
+        self.server.state.seed(tenants=612)
+        self.addCleanup(self.server.state.collections["grid/accounts"].clear)
+        rest_api = self.get_rest_api()
+        records, error = rest_api.get_paginated("api/v4/grid/accounts", limit=250)
+        assert error is None
+        assert len(records) == 612
+        assert len(set(record["id"] for record in records)) == 612
+        assert records[-1]["name"] == "tenant-00611"
+        assert self.server.count_requests("GET", r"grid/accounts$") == 3
+
+    def test_iter_data_stops_early(self):
+        self.server.state.seed(tenants=5000)
+        self.addCleanup(self.server.state.collections["grid/accounts"].clear)
+        rest_api = self.get_rest_api()
+        matches, error = rest_api.filter_data("api/v4/grid/accounts", predicate=lambda account: account["name"] == "tenant-00003", first=True)
+        assert error is None
+        assert [account["name"] for account in matches] == ["tenant-00003"]
+        matches, error = rest_api.filter_data("api/v4/grid/accounts", predicate=lambda account: account["name"].endswith("99"))
+        assert len(matches) == 50
+        items, error = rest_api.iter_data("api/v4/grid/dns-servers")
+        assert list(items) == []
+        self.server.inject("GET", r"grid/accounts$", 503, message="unavailable")
+        items, error = rest_api.iter_data("api/v4/grid/accounts")
+        assert items is None
+        assert error["text"] == "unavailable"
+
+    def test_unauthorized(self):
+        args = self.default_args()
+        args["auth_token"] = "wrong-token"
+        response, error = self.get_rest_api(args).get("api/v4/grid/accounts")
+        assert error["text"] == "unauthorized"
+        assert response["status_code"] == 401
+
+    def test_injected_errors(self):
+        rest_api = self.get_rest_api()
+        self.server.inject("GET", r"grid/accounts$", 429, count=1, retry_after=2)
+        self.server.inject(None, r"grid/groups", 500, count=None, message="backend down")
+        response, error = rest_api.get("api/v4/grid/accounts")
+        assert response["status_code"] == 429
+        assert error["text"] == "too many requests"
+        assert rest_api.get("api/v4/grid/accounts")[1] is None
+        for dummy in range(2):
+            assert rest_api.get("api/v4/grid/groups")[1]["text"] == "backend down"
+        assert self.server.stats["by_status"] == {429: 1, 200: 1, 500: 2}
+
+    def test_collection_lifecycle(self):
+        rest_api = self.get_rest_api()
+        response, error = rest_api.post("api/v4/grid/groups", {"displayName": "Admins", "uniqueName": "group/admins"})
+        assert error is None
+        group_id = response["data"]["id"]
+        response, error = rest_api.get("api/v4/grid/groups/group/admins")
+        assert response["data"]["id"] == group_id
+        response, error = rest_api.post("api/v4/grid/groups", {"displayName": "Admins", "uniqueName": "group/admins"})
+        assert response["status_code"] == 409
+        response, error = rest_api.put("api/v4/grid/groups/%s" % group_id, {"displayName": "Admins 2", "uniqueName": "group/admins"})
+        assert response["data"] == {"displayName": "Admins 2", "uniqueName": "group/admins", "id": group_id}
+        response, error = rest_api.delete("api/v4/grid/groups/%s" % group_id, None)
+        assert error is None
+        response, error = rest_api.get("api/v4/grid/groups/%s" % group_id)
+        assert response["status_code"] == 404
+
+    def test_bucket_subresources(self):
+        rest_api = self.get_rest_api()
+        assert rest_api.post("api/v4/org/containers", {"name": "bucket1", "region": "us-east-1"})[1] is None
+        self.addCleanup(self.server.state.collections["org/containers"].clear)
+        assert rest_api.put("api/v4/org/containers/bucket1/versioning", {"versioningEnabled": True})[1] is None
+        response, error = rest_api.get("api/v4/org/containers/bucket1/versioning")
+        assert response["data"] == {"versioningEnabled": True}
+        response, error = rest_api.get("api/v4/org/containers/bucket2/versioning")
+        assert response["status_code"] == 404
+
+    def test_latency(self):
+        self.server.set_latency(0.05)
+        rest_api = self.get_rest_api()
+        rest_api.get("api/v4/grid/node-health")
+        assert self.server.requests[-1]["elapsed"] >= 0.05
+
+    def test_module_end_to_end(self):
+        args = self.default_args()
+        args.update(
+            {
+                "state": "present",
+                "name": "tenant-e2e",
+                "protocol": "s3",
+                "management": True,
+                "use_own_identity_source": False,
+                "allow_platform_services": False,
+                "password": "abc12345",
+            }
+        )
+        self.addCleanup(self.server.state.collections["grid/accounts"].clear)
+        set_module_args(args)
+        my_obj = grid_account_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]["changed"]
+        assert [record["name"] for record in self.server.state.collections["grid/accounts"].values()] == ["tenant-e2e"]
+
+        set_module_args(args)
+        my_obj = grid_account_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert not exc.value.args[0]["changed"]
+
+    def test_admin_node_failover(self):
+        standby = MockStorageGRID(state=self.server.state, auth_token="storagegrid-auth-token").start()
+        self.addCleanup(standby.stop)
+        down = MockStorageGRID(auth_token="storagegrid-auth-token").start()
+        down_url = down.url
+        down.stop()
+        self.server.set_latency(0.1)
+        args = self.default_args()
+        args["api_url"] = [down_url, self.server.url, standby.url]
+        with patch.dict(netapp_utils._ENDPOINTS, clear=True):
+            rest_api = self.get_rest_api(args)
+            assert rest_api.api_urls == [standby.url, self.server.url, down_url]
+            standby.stop()
+            response, error = rest_api.get("api/v4/grid/regions")
+            assert error is None
+            assert rest_api.api_url == self.server.url
+            assert self.server.count_requests("GET", r"grid/regions$") == 1
+
+    def test_grids_fan_out(self):
+        other = MockStorageGRID(seed=1, auth_token="other-auth-token").start()
+        self.addCleanup(other.stop)
+        other.state.seed(tenants=3)
+        set_module_args(
+            {
+                "validate_certs": False,
+                "grids": [
+                    {"name": "main", "api_url": self.server.url, "auth_token": "storagegrid-auth-token"},
+                    {"name": "other", "api_url": other.url, "auth_token": "other-auth-token"},
+                    {"name": "denied", "api_url": other.url, "auth_token": "wrong-token"},
+                ],
+                "gather_subset": ["grid/accounts"],
+            }
+        )
+        with pytest.raises(AnsibleExitJson) as exc:
+            grid_info_module().apply()
+        grids = exc.value.args[0]["grids"]
+        assert grids["main"]["sg_info"]["grid/accounts"]["data"] == []
+        assert len(grids["other"]["sg_info"]["grid/accounts"]["data"]) == 3
+        assert grids["denied"]["failed"]
+        assert self.server.count_requests("GET", r"grid/accounts$") == 1
@@ -0,0 +1,596 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests NetApp StorageGRID module_utils: netapp """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import json
+import multiprocessing
+import os
+import pstats
+import pytest
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from ansible_collections.netapp.storagegrid.tests.unit.compat import unittest
+from ansible_collections.netapp.storagegrid.tests.unit.compat.mock import MagicMock, patch
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+import ansible_collections.netapp.storagegrid.plugins.module_utils.netapp as netapp_utils
+from ansible_collections.netapp.storagegrid.plugins.module_utils.info_query import InfoQuery, InfoSubsets
+from ansible_collections.netapp.storagegrid.plugins.module_utils.json_stream import DataArrayDecoder, iter_data_items
+from ansible_collections.netapp.storagegrid.plugins.module_utils.logger import ModuleLogger
+from ansible_collections.netapp.storagegrid.plugins.module_utils.profiler import PROFILE_ENV, PROFILE_MODE_ENV
+from ansible_collections.netapp.storagegrid.plugins.module_utils.rate_limit import TokenBucket
+from ansible_collections.netapp.storagegrid.plugins.module_utils.telemetry import PERF_ENV, TELEMETRY_ENV, endpoint_template
+
+if sys.version_info < (3, 11):
+    pytestmark = pytest.mark.skip("Skipping Unit Tests on 3.11")
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({"ANSIBLE_MODULE_ARGS": args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an exception"""
+    if "changed" not in kwargs:
+        kwargs["changed"] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs["failed"] = True
+    raise AnsibleFailJson(kwargs)
+
+
+def mock_response(status_code, data):
+    response = MagicMock(status_code=status_code, headers={"content-type": "application/json"})
+    response.content = to_bytes(json.dumps(data))
+    response.json.return_value = data
+    return response
+
+
+class TestSGRestAPI(unittest.TestCase):
+    """Unit Tests for SGRestAPI"""
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+        set_module_args(
+            {
+                "api_url": "gmi.example.com",
+                "auth_token": "storagegrid-auth-token",
+                "validate_certs": False,
+            }
+        )
+
+    def get_rest_api(self):
+        module = basic.AnsibleModule(argument_spec=netapp_utils.na_storagegrid_host_argument_spec())
+        return module, netapp_utils.SGRestAPI(module)
+
+    def test_endpoint_template(self):
+        assert endpoint_template("api/v4/grid/accounts/12345678901234567890") == "api/v4/grid/accounts/{id}"
+        assert endpoint_template("api/v4/org/containers/bucket1/versioning") == "api/v4/org/containers/{id}/versioning"
+        assert endpoint_template("api/v4/org/groups/group/admins") == "api/v4/org/groups/{id}"
+        assert endpoint_template("api/v4/org/users/federated-user/bob/change-password") == "api/v4/org/users/{id}/change-password"
+        assert endpoint_template("api/v4/org/users/current-user/s3-access-keys/AKIA1") == "api/v4/org/users/current-user/s3-access-keys/{id}"
+        assert endpoint_template("api/v4/grid/groups?limit=350") == "api/v4/grid/groups"
+        assert endpoint_template("api/v4/grid/users/root") == "api/v4/grid/users/root"
+
+    @patch.dict(os.environ, {TELEMETRY_ENV: ""})
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_telemetry_disabled(self, mock_request):
+        mock_request.return_value = mock_response(200, {"data": []})
+        module, rest_api = self.get_rest_api()
+        rest_api.get("api/v4/org/containers")
+        with pytest.raises(AnsibleExitJson) as exc:
+            module.exit_json(changed=False)
+        assert "sg_api_calls" not in exc.value.args[0]
+
+    @patch.dict(os.environ, {TELEMETRY_ENV: "1"})
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_telemetry_returned_with_result(self, mock_request):
+        mock_request.side_effect = [
+            mock_response(200, {"data": {"productVersion": "11.8.0-20240131.1338.d3969b3"}}),
+            mock_response(404, {"message": {"text": "not found"}}),
+        ]
+        module, rest_api = self.get_rest_api()
+        rest_api.get_sg_product_version(api_root="org")
+        dummy, error = rest_api.get("api/v4/org/containers/bucket1/versioning")
+        assert error == {"text": "not found"}
+        with pytest.raises(AnsibleFailJson) as exc:
+            module.fail_json(msg=error)
+        calls = exc.value.args[0]["sg_api_calls"]
+        assert [(call["method"], call["endpoint"], call["status"]) for call in calls] == [
+            ("GET", "api/v3/org/config/product-version", 200),
+            ("GET", "api/v4/org/containers/{id}/versioning", 404),
+        ]
+        assert calls[1]["bytes"] == len(b'{"message": {"text": "not found"}}')
+        assert all(call["latency_ms"] >= 0 for call in calls)
+
+    @patch.dict(os.environ, {TELEMETRY_ENV: "1"})
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_telemetry_connection_error(self, mock_request):
+        mock_request.side_effect = netapp_utils.requests.exceptions.ConnectionError("refused")
+        module, rest_api = self.get_rest_api()
+        dummy, error = rest_api.get("api/v4/grid/accounts")
+        assert error == "refused"
+        with pytest.raises(AnsibleExitJson) as exc:
+            module.exit_json(changed=False)
+        assert exc.value.args[0]["sg_api_calls"][0]["status"] is None
+
+    @patch.dict(os.environ, {TELEMETRY_ENV: "", PERF_ENV: "1"})
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_perf_returned_with_result(self, mock_request):
+        created = mock_response(201, {"data": {"id": "1"}})
+        created.request.body = b'{"name": "bucket1"}'
+        responses = [mock_response(200, {"data": []}), created, mock_response(200, {"data": [{"id": "1"}]})]
+        mock_request.side_effect = list(responses)
+        module, rest_api = self.get_rest_api()
+        rest_api.get("api/v4/org/containers")
+        rest_api.post("api/v4/org/containers", {"name": "bucket1"})
+        rest_api.get("api/v4/org/containers")
+        with pytest.raises(AnsibleExitJson) as exc:
+            module.exit_json(changed=True)
+        result = exc.value.args[0]
+        assert "sg_api_calls" not in result
+        perf = result["perf"]
+        assert perf["requests"] == 3
+        assert perf["requests_by_method"] == {"GET": 2, "POST": 1}
+        assert perf["bytes_sent"] == len(b'{"name": "bucket1"}')
+        assert perf["bytes_received"] == sum(len(response.content) for response in responses)
+        assert perf["retries"] == 0
+        assert perf["wall_time_ms"] >= perf["http_time_ms"]
+        slowest = perf["slowest_endpoints"]
+        assert sorted((entry["method"], entry["endpoint"], entry["requests"]) for entry in slowest) == [
+            ("GET", "api/v4/org/containers", 2),
+            ("POST", "api/v4/org/containers", 1),
+        ]
+        assert slowest[0]["total_ms"] >= slowest[1]["total_ms"]
+
+
+class TestGetMemoization(unittest.TestCase):
+    """Unit Tests for the memoized GETs of SGRestAPI"""
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+        set_module_args({"api_url": "gmi.example.com", "auth_token": "storagegrid-auth-token"})
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url.split("/api/", 1)[1]))
+        if url.endswith("missing"):
+            return mock_response(404, {"message": {"text": "not found"}})
+        time.sleep(0.01)
+        return mock_response(200, {"data": {"items": [len(self.requests)]}})
+
+    def get_rest_api(self, **kwargs):
+        module = basic.AnsibleModule(argument_spec=netapp_utils.na_storagegrid_host_argument_spec())
+        return netapp_utils.SGRestAPI(module, **kwargs)
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_repeated_gets(self, mock_request):
+        mock_request.side_effect = self.request
+        rest_api = self.get_rest_api()
+        response, error = rest_api.get("api/v4/org/compliance-global")
+        response["data"]["items"].append("changed by the caller")
+        assert rest_api.get("api/v4/org/compliance-global")[0]["data"] == {"items": [1]}
+        assert rest_api.get("api/v4/org/containers", {"include": "compliance"})[0]["data"] == {"items": [2]}
+        assert rest_api.get("api/v4/org/containers", {"include": "compliance"})[0]["data"] == {"items": [2]}
+        # errors are sent again
+        assert rest_api.get("api/v4/org/missing")[1] == {"text": "not found"}
+        assert rest_api.get("api/v4/org/missing")[1] == {"text": "not found"}
+        assert len(self.requests) == 4
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_writes_invalidate_the_path(self, mock_request):
+        mock_request.side_effect = self.request
+        rest_api = self.get_rest_api()
+        for api in ("api/v4/org/containers", "api/v4/org/containers/bucket1/versioning", "api/v4/org/compliance-global"):
+            rest_api.get(api)
+        rest_api.put("api/v4/org/containers/bucket1/versioning", {"versioningEnabled": True})
+        for api in ("api/v4/org/containers", "api/v4/org/containers/bucket1/versioning", "api/v4/org/compliance-global"):
+            rest_api.get(api)
+        assert [api for method, api in self.requests[3:]] == [
+            "v4/org/containers/bucket1/versioning", "v4/org/containers", "v4/org/containers/bucket1/versioning",
+        ]
+        rest_api.post("api/v4/org/containers", {"name": "bucket2"})
+        rest_api.get("api/v4/org/containers/bucket1/versioning")
+        assert self.requests[-1] == ("GET", "v4/org/containers/bucket1/versioning")
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_concurrent_gets_are_sent_once(self, mock_request):
+        mock_request.side_effect = self.request
+        rest_api = self.get_rest_api()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(rest_api.get("api/v4/grid/node-health"))) for dummy in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(self.requests) == 1
+        assert all(result == ({"data": {"items": [1]}, "status_code": 200}, None) for result in results)
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_memoize_disabled(self, mock_request):
+        mock_request.side_effect = self.request
+        rest_api = self.get_rest_api(memoize=False)
+        assert rest_api.get("api/v4/private/software-update/nodes")[0]["data"] == {"items": [1]}
+        assert rest_api.get("api/v4/private/software-update/nodes")[0]["data"] == {"items": [2]}
+
+
+class TestEndpointSelection(unittest.TestCase):
+    """Unit Tests for the selection of an admin node from a list of api_url"""
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+        endpoints = patch.dict(netapp_utils._ENDPOINTS, clear=True)
+        endpoints.start()
+        self.addCleanup(endpoints.stop)
+        set_module_args(
+            {
+                "api_url": ["node1.example.com", "node2.example.com", "https://node3.example.com"],
+                "auth_token": "storagegrid-auth-token",
+                "validate_certs": False,
+            }
+        )
+        self.down = set(["https://node1.example.com"])
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        """ node1 is down, node2 answers slower than node3 """
+        self.requests.append((method, url))
+        if any(url.startswith(node) for node in self.down):
+            raise netapp_utils.requests.exceptions.ConnectionError("refused")
+        if url.startswith("https://node2.example.com"):
+            time.sleep(0.05)
+        return mock_response(200, {"data": url})
+
+    def get_rest_api(self):
+        module = basic.AnsibleModule(argument_spec=netapp_utils.na_storagegrid_host_argument_spec())
+        return netapp_utils.SGRestAPI(module)
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_fastest_healthy_node(self, mock_request):
+        mock_request.side_effect = self.request
+        rest_api = self.get_rest_api()
+        assert rest_api.api_urls == ["https://node3.example.com", "https://node2.example.com", "https://node1.example.com"]
+        assert sorted(url for method, url in self.requests) == [
+            "https://node%d.example.com/api/versions" % node for node in (1, 2, 3)
+        ]
+        response, error = rest_api.get("api/v4/grid/accounts")
+        assert response["data"] == "https://node3.example.com/api/v4/grid/accounts"
+        # remembered for the run
+        self.requests = []
+        assert self.get_rest_api().api_url == "https://node3.example.com"
+        assert self.requests == []
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_fail_over_idempotent_requests(self, mock_request):
+        mock_request.side_effect = self.request
+        rest_api = self.get_rest_api()
+        self.down.add("https://node3.example.com")
+        response, error = rest_api.put("api/v4/grid/groups/1", {})
+        assert error is None
+        assert response["data"] == "https://node2.example.com/api/v4/grid/groups/1"
+        assert self.get_rest_api().api_url == "https://node2.example.com"
+        self.down.add("https://node2.example.com")
+        response, error = rest_api.post("api/v4/grid/groups", {})
+        assert error == "refused"
+        assert self.requests[-1] == ("POST", "https://node2.example.com/api/v4/grid/groups")
+        response, error = rest_api.get("api/v4/grid/groups")
+        assert error == "refused"
+        assert self.requests[-1] == ("GET", "https://node1.example.com/api/v4/grid/groups")
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_endpoint_cache(self, mock_request):
+        mock_request.side_effect = self.request
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        with patch.dict(os.environ, {netapp_utils.ENDPOINT_CACHE_ENV: os.path.join(tmpdir, "endpoints.json")}):
+            self.get_rest_api()
+            netapp_utils._ENDPOINTS.clear()
+            self.requests = []
+            assert self.get_rest_api().api_url == "https://node3.example.com"
+            assert self.requests == []
+
+
+def take_tokens(path, count):
+    bucket = TokenBucket(path, 20, 1)
+    for dummy in range(count):
+        bucket.acquire()
+
+
+class TestRateLimit(unittest.TestCase):
+    """Unit Tests for the token bucket shared by module processes"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.path = os.path.join(self.tmpdir, "bucket.json")
+
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(self.path, 50, 3)
+        start = time.time()
+        waits = [bucket.acquire() for dummy in range(5)]
+        assert waits[:3] == [pytest.approx(0, abs=0.01)] * 3
+        # 2 tokens at 50 per second
+        assert time.time() - start >= 0.039
+
+    def test_shared_by_processes(self):
+        processes = [multiprocessing.Process(target=take_tokens, args=(self.path, 5)) for dummy in range(2)]
+        start = time.time()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        # 10 tokens, the first one from the burst, then 20 per second
+        assert time.time() - start >= 0.44
+        assert all(process.exitcode == 0 for process in processes)
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_rest_api_rate_limit_from_environment(self, mock_request):
+        mock_request.return_value = mock_response(200, {"data": []})
+        set_module_args({"api_url": "gmi.example.com", "auth_token": "storagegrid-auth-token"})
+        with patch.dict(os.environ, {"NETAPP_SG_RATE_LIMIT": "40", "NETAPP_SG_RATE_LIMIT_BURST": "2"}):
+            with patch("tempfile.tempdir", self.tmpdir):
+                module = basic.AnsibleModule(argument_spec=netapp_utils.na_storagegrid_host_argument_spec())
+                rest_api = netapp_utils.SGRestAPI(module)
+                assert (rest_api.rate_limit, rest_api.rate_limit_burst) == (40.0, 2)
+                start = time.time()
+                for index in range(4):
+                    rest_api.get("api/v4/grid/accounts", {"marker": index})
+                assert time.time() - start >= 0.049
+                assert len(os.listdir(self.tmpdir)) == 1
+
+    def test_invalid_rate_limit(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+        for name, value, message in [
+            ("NETAPP_SG_RATE_LIMIT", "-1", "rate_limit must be greater than 0, got -1.0"),
+            ("NETAPP_SG_RATE_LIMIT", "0", "rate_limit must be greater than 0, got 0.0"),
+            ("NETAPP_SG_RATE_LIMIT_BURST", "0", "rate_limit_burst must be at least 1, got 0"),
+        ]:
+            set_module_args({"api_url": "gmi.example.com", "auth_token": "storagegrid-auth-token"})
+            with patch.dict(os.environ, {"NETAPP_SG_RATE_LIMIT": "10", name: value}):
+                module = basic.AnsibleModule(argument_spec=netapp_utils.na_storagegrid_host_argument_spec())
+                with pytest.raises(AnsibleFailJson) as exc:
+                    netapp_utils.SGRestAPI(module)
+            assert exc.value.args[0]["msg"] == "Error: %s" % message
+
+
+class Unprintable(object):
+    """ Fails if it is formatted, to check that disabled messages are not formatted """
+
+    def __str__(self):
+        raise AssertionError("formatted a disabled log message")
+
+    __repr__ = __str__
+
+
+class TestModuleProfiler(unittest.TestCase):
+    """Unit Tests for the cProfile and tracemalloc hook"""
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        set_module_args({"api_url": "gmi.example.com", "auth_token": "storagegrid-auth-token"})
+
+    def run_module(self, mock_request):
+        mock_request.return_value = mock_response(200, {"data": [{"id": str(index)} for index in range(100)]})
+        module = basic.AnsibleModule(argument_spec=netapp_utils.na_storagegrid_host_argument_spec())
+        rest_api = netapp_utils.SGRestAPI(module)
+        rest_api.get("api/v4/grid/accounts")
+        netapp_utils.SGRestAPI(module).get("api/v4/grid/groups")
+        with pytest.raises(AnsibleFailJson) as exc:
+            module.fail_json(msg="error")
+        return exc.value.args[0]
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_profile_disabled(self, mock_request):
+        with patch.dict(os.environ, {PROFILE_ENV: ""}):
+            assert "sg_profile" not in self.run_module(mock_request)
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_cpu_and_memory_profiles(self, mock_request):
+        with patch.dict(os.environ, {PROFILE_ENV: os.path.join(self.directory, "profiles"), PROFILE_MODE_ENV: ""}):
+            profile = self.run_module(mock_request)["sg_profile"]
+        assert sorted(os.listdir(os.path.join(self.directory, "profiles"))) == sorted(
+            os.path.basename(path) for path in (profile["prof"], profile["allocations"])
+        )
+        assert 0 < len(profile["top_functions"]) <= 20
+        assert all(set(entry) == set(["function", "calls", "total_ms", "cumulative_ms"]) for entry in profile["top_functions"])
+        assert "send_request" in [name for dummy, dummy_line, name in pstats.Stats(profile["prof"]).stats]
+        assert profile["peak_bytes"] > 0
+        with open(profile["allocations"]) as report:
+            assert report.readline().startswith("peak %d bytes" % profile["peak_bytes"])
+        assert not tracemalloc.is_tracing()
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_cpu_profile_only(self, mock_request):
+        with patch.dict(os.environ, {PROFILE_ENV: self.directory, PROFILE_MODE_ENV: "cpu"}):
+            profile = self.run_module(mock_request)["sg_profile"]
+        assert sorted(profile) == ["prof", "top_functions"]
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.requests.request")
+    def test_write_error(self, mock_request):
+        path = os.path.join(self.directory, "file")
+        open(path, "w").close()
+        with patch.dict(os.environ, {PROFILE_ENV: path, PROFILE_MODE_ENV: "memory"}):
+            profile = self.run_module(mock_request)["sg_profile"]
+        assert profile["error"].startswith("Error writing the profile to %s" % path)
+        assert not tracemalloc.is_tracing()
+
+
+class TestModuleLogger(unittest.TestCase):
+    """Unit Tests for ModuleLogger"""
+
+    def setUp(self):
+        self.module = MagicMock(params={"api_url": "gmi.example.com", "auth_token": "storagegrid-auth-token"})
+        self.module.no_log_values = set(["storagegrid-auth-token"])
+
+    def test_levels_and_lazy_formatting(self):
+        logger = ModuleLogger(self.module, "info")
+        logger.debug("all ILM rules: %s", Unprintable())
+        logger.debug_params()
+        logger.info("ILM rule %s", "created")
+        logger.error("failed")
+        assert [entry.split(" ", 1)[1] for entry in logger.entries] == ["info: ILM rule created", "error: failed"]
+        assert self.module.log.call_count == 2
+
+    def test_debug_params_without_no_log_values(self):
+        logger = ModuleLogger(self.module, "debug")
+        logger.debug_params()
+        assert "gmi.example.com" in logger.entries[0]
+        assert "storagegrid-auth-token" not in logger.entries[0]
+
+    def test_size_caps(self):
+        logger = ModuleLogger(self.module, "debug", max_size=300, max_message_size=50)
+        logger.debug("payload: %s", "x" * 200)
+        assert logger.entries[0].endswith("x... (159 characters truncated)")
+        for index in range(10):
+            logger.info("message %d", index)
+        entries = logger.entries
+        assert sum(len(entry) for entry in entries[:-1]) <= 300
+        assert entries[-1] == "log truncated at 300 characters, %d messages dropped" % (11 - len(entries[:-1]))
+
+
+def split_bytes(document, size):
+    data = to_bytes(document)
+    return [data[index:index + size] for index in range(0, len(data), size)]
+
+
+class TestDataArrayDecoder(unittest.TestCase):
+    """Unit Tests for the incremental decoder of the data array"""
+
+    DOCUMENT = json.dumps(
+        {
+            "responseTime": "2026-01-01T00:00:00.000Z",
+            "status": "success",
+            "meta": {"data": ["not", "this"], "note": "a \"data\": [ string"},
+            "data": [{"id": "1", "name": "caf\u00e9 \u2603"}, {"id": "2", "nested": {"data": [1, 2]}}, 12345, -1.5e3, "x \"]\\", None],
+            "apiVersion": "4.0",
+        },
+        ensure_ascii=False,
+    )
+
+    def test_any_chunk_size(self):
+        expected = json.loads(self.DOCUMENT)["data"]
+        for size in (1, 2, 3, 7, 64, 100000):
+            assert list(iter_data_items(split_bytes(self.DOCUMENT, size))) == expected
+
+    def test_stops_after_the_array(self):
+        decoder = DataArrayDecoder()
+        items = decoder.feed(to_bytes('{"data": [{"id": 1}, {"id": 2}], "trailing": '))
+        assert items == [{"id": 1}, {"id": 2}]
+        assert decoder.done
+        assert decoder.feed(b"garbage") == []
+
+    def test_data_object(self):
+        assert list(iter_data_items(split_bytes('{"status": "success", "data": {"productVersion": "11.8.0"}}', 5))) == [{"productVersion": "11.8.0"}]
+
+    def test_data_object_decoded_once(self):
+        value = {"topology": [{"name": "site-%d" % index, "note": "a \"}\" string", "children": [{"id": index}]} for index in range(2000)]}
+        document = json.dumps({"status": "success", "data": value})
+        decoder = DataArrayDecoder()
+        decoder.json_decoder = MagicMock(wraps=json.JSONDecoder())
+        assert list(iter_data_items(split_bytes(document, 1024), decoder=decoder)) == [value]
+        assert len(document) > 50 * 1024
+        # one raw_decode when the closing brace arrives, not one per chunk
+        assert decoder.json_decoder.raw_decode.call_count == 1
+
+    def test_incomplete_documents(self):
+        with pytest.raises(ValueError):
+            list(iter_data_items([b'{"data": {"id": 1, "name": "x']))
+        with pytest.raises(ValueError, match="no data member"):
+            list(iter_data_items([b'{"status": "success"}']))
+        with pytest.raises(ValueError):
+            list(iter_data_items([b'{"data": [{"id": 1}, {"id"']))
+
+    def test_memory_is_bounded_by_an_item(self):
+        decoder = DataArrayDecoder()
+        decoder.feed(b'{"data": [')
+        count = 0
+        for index in range(20000):
+            count += len(decoder.feed(to_bytes('{"id": "%05d", "name": "tenant-%05d"},' % (index, index))))
+            assert len(decoder.buffer) < 70000
+        assert count == 20000
+
+
+class TestInfoQuery(unittest.TestCase):
+    """Unit Tests for the fields and filters of the info modules"""
+
+    ITEMS = [
+        {"id": "1", "name": "prod-a", "capabilities": ["management", "s3"], "policy": {"quotaObjectBytes": 5000, "other": 1},
+         "disks": [{"siteId": "s1", "grade": None}, {"siteId": "s2", "grade": "fast"}]},
+        {"id": "2", "name": "dev-b", "capabilities": ["swift"], "policy": {"quotaObjectBytes": None}, "disks": []},
+    ]
+
+    def select(self, fields=None, filters=None):
+        return list(InfoQuery(fields, filters).apply(self.ITEMS))
+
+    def test_filters(self):
+        assert [item["id"] for item in self.select(filters=["capabilities == s3"])] == ["1"]
+        assert [item["id"] for item in self.select(filters=["name =~ ^dev-"])] == ["2"]
+        assert [item["id"] for item in self.select(filters=["policy.quotaObjectBytes"])] == ["1"]
+        assert [item["id"] for item in self.select(filters=["policy.quotaObjectBytes >= 5000", "disks.1.grade == fast"])] == ["1"]
+        assert [item["id"] for item in self.select(filters=["missing != 3", "name > \"a\""])] == ["1", "2"]
+        assert self.select(filters=["name < 3"]) == []
+
+    def test_fields(self):
+        assert self.select(fields=["id", "policy.quotaObjectBytes", "disks.siteId", "missing"]) == [
+            {"id": "1", "policy": {"quotaObjectBytes": 5000}, "disks": [{"siteId": "s1"}, {"siteId": "s2"}]},
+            {"id": "2", "policy": {"quotaObjectBytes": None}, "disks": []},
+        ]
+
+    def test_invalid_filters(self):
+        for expression in ("name ==", "name = 1", "", "a =~ ("):
+            with pytest.raises(ValueError):
+                InfoQuery(filters=[expression])
+
+    def test_info_subsets(self):
+        module = MagicMock(params=dict(parameters={"limit": 5, "marker": "a"}, subset_options=[
+            dict(subset="accounts", parameters={"limit": 10}, fields=["id"], filters=["name =~ ^prod-"]),
+        ]))
+        module.fail_json.side_effect = fail_json
+        rest_api = MagicMock()
+        rest_api.iter_data.side_effect = lambda api, data, decoder: (iter_data_items([to_bytes(json.dumps({"data": self.ITEMS}))], decoder=decoder), None)
+        info_subsets = InfoSubsets(rest_api, module, lambda subsets: ["grid/%s" % subset for subset in subsets])
+        options = info_subsets.get_subset_options()["grid/accounts"]
+        data = info_subsets.get_subset_parameters(options)
+        assert data == {"limit": 10, "marker": "a"}
+        assert info_subsets.get_subset_items("api/v3/grid/accounts", data, options["query"]) == dict(data=[{"id": "1"}])
+        module.params["subset_options"].append(dict(subset="accounts"))
+        with pytest.raises(AnsibleFailJson, match="listed more than once"):
+            info_subsets.get_subset_options()
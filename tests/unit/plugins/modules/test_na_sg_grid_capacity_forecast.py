@@ -0,0 +1,225 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests NetApp StorageGRID Capacity Forecast Ansible module: na_sg_grid_capacity_forecast """
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import json
+import pytest
+import sys
+
+from ansible_collections.netapp.storagegrid.tests.unit.compat import unittest
+from ansible_collections.netapp.storagegrid.tests.unit.compat.mock import patch
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+from ansible_collections.netapp.storagegrid.plugins.modules.na_sg_grid_capacity_forecast import (
+    SgCapacityForecast as forecast_module,
+)
+
+if sys.version_info < (3, 11):
+    pytestmark = pytest.mark.skip("Skipping Unit Tests on 3.11")
+
+# 2026-01-01T00:00:00Z to 2026-01-11T00:00:00Z, one sample per day
+START = 1767225600
+DAY = 86400
+
+
+def matrix(series):
+    """ build a metric-query-range response from (labels, values) pairs """
+    return (
+        {
+            "data": {
+                "resultType": "matrix",
+                "result": [
+                    {"metric": labels, "values": [[START + index * DAY, str(value)] for index, value in enumerate(values)]}
+                    for labels, values in series
+                ],
+            }
+        },
+        None,
+    )
+
+
+SITE1 = {"site_id": "99d94acc-b2d4-4e4e-86e5-b715af68b40b", "site_name": "site1"}
+SITE2 = {"site_id": "5a1b7c3e-2f4d-4e6a-9b8c-0d1e2f3a4b5c", "site_name": "site2"}
+# site1 grows by 1 GB a day, with an outlier sample on day 5; site2 is flat
+SITE1_USED = [1000000000000 + 1000000000 * day for day in range(11)]
+SITE1_USED[5] = 5000000000000
+
+# REST API canned responses when mocking send_request
+SRR = {
+    "empty_good": ({"data": []}, None),
+    "end_of_sequence": (None, "Unexpected call to send_request"),
+    "generic_error": (None, "Expected error"),
+    "version_118": ({"data": {"productVersion": "11.8.0-20240131.1338.d3969b3"}}, None),
+    "site_used": matrix([(SITE1, SITE1_USED), (SITE2, [500000000000] * 11)]),
+    "site_usable": matrix([(SITE1, [1000000000000] * 11), (SITE2, [500000000000] * 11)]),
+    "empty_matrix": ({"data": {"resultType": "matrix", "result": []}}, None),
+}
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({"ANSIBLE_MODULE_ARGS": args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an exception"""
+    if "changed" not in kwargs:
+        kwargs["changed"] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs["failed"] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class TestCapacityForecastModule(unittest.TestCase):
+    """Unit Tests for na_sg_grid_capacity_forecast module"""
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+
+    def set_default_args_fail_check(self):
+        return dict(
+            {
+                "validate_certs": False,
+            }
+        )
+
+    def set_args_forecast(self):
+        return dict(
+            {
+                "api_url": "https://<storagegrid-endpoint-url>",
+                "auth_token": "storagegrid-auth-token",
+                "validate_certs": False,
+                "lookback_days": 10,
+                "step": "1d",
+                "end_time": "2026-01-11T00:00:00Z",
+            }
+        )
+
+    def test_missing_required_args(self):
+        """Test missing required arguments"""
+        with pytest.raises(AnsibleFailJson) as exc:
+            set_module_args(self.set_default_args_fail_check())
+            forecast_module()
+        assert "missing required arguments" in str(exc.value)
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_invalid_step_fail(self, mock_request):
+        args = self.set_args_forecast()
+        args["step"] = "one hour"
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_118"],
+        ]
+        with pytest.raises(AnsibleFailJson) as exc:
+            forecast_module()
+        assert exc.value.args[0]["msg"] == "Error: invalid duration: one hour"
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_forecast_site_pass(self, mock_request):
+        set_module_args(self.set_args_forecast())
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["site_used"],  # used capacity of all sites
+            SRR["site_usable"],  # usable capacity of all sites
+            SRR["end_of_sequence"],
+        ]
+        my_obj = forecast_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_forecast_site_pass: %s" % repr(exc.value.args[0]))
+        result = exc.value.args[0]["sg_capacity_forecast"]
+        assert exc.value.args[0]["changed"] is False
+        assert result["window"] == {"start": "2026-01-01T00:00:00Z", "end": "2026-01-11T00:00:00Z", "step_seconds": 86400}
+        site1, site2 = result["site"]
+        # the outlier on day 5 does not bend the trend
+        assert site1["site_name"] == "site1"
+        assert site1["growth_bytes_per_day"] == 1000000000.0
+        assert site1["capacity_bytes"] == 2010000000000
+        assert site1["days_to_exhaustion"] == 1000.0
+        assert site1["exhaustion_date"] == "2028-10-07T00:00:00Z"
+        assert site1["samples"] == 11
+        # a flat site never runs out and is sorted last
+        assert site2["site_name"] == "site2"
+        assert site2["growth_bytes_per_day"] == 0.0
+        assert site2["days_to_exhaustion"] is None
+        assert site2["utilization_percent"] == 50.0
+        # one query per metric for all sites
+        api_calls = [call.args[1] for call in mock_request.call_args_list[1:]]
+        assert api_calls == ["api/v4/grid/metric-query-range"] * 2
+        assert mock_request.call_args_list[1].args[2]["query"] == "sum by (site_id, site_name) (storagegrid_storage_utilization_data_bytes)"
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_forecast_seasonal_pass(self, mock_request):
+        args = self.set_args_forecast()
+        args["trend"] = "seasonal"
+        args["season"] = "2d"
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["site_used"],  # used capacity of all sites
+            SRR["site_usable"],  # usable capacity of all sites
+            SRR["end_of_sequence"],
+        ]
+        my_obj = forecast_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        site1 = exc.value.args[0]["sg_capacity_forecast"]["site"][0]
+        assert site1["seasonal"] is True
+        assert site1["growth_bytes_per_day"] == 1000000000.0
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_forecast_long_window_is_chunked(self, mock_request):
+        args = self.set_args_forecast()
+        args["levels"] = ["node"]
+        args["lookback_days"] = 2
+        args["step"] = "10s"
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["empty_matrix"],  # used capacity, first chunk
+            SRR["empty_matrix"],  # used capacity, second chunk
+            SRR["empty_matrix"],  # usable capacity, first chunk
+            SRR["empty_matrix"],  # usable capacity, second chunk
+            SRR["end_of_sequence"],
+        ]
+        my_obj = forecast_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]["sg_capacity_forecast"]["node"] == []
+        assert mock_request.call_count == 5
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_forecast_query_error_fail(self, mock_request):
+        set_module_args(self.set_args_forecast())
+        mock_request.side_effect = [
+            SRR["version_118"],  # SG version check
+            SRR["generic_error"],
+            SRR["end_of_sequence"],
+        ]
+        my_obj = forecast_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]["msg"] == "Expected error"
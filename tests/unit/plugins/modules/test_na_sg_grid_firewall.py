@@ -390,3 +390,163 @@ class TestFirewallModule(unittest.TestCase):
         with pytest.raises(AnsibleExitJson) as exc:
             my_obj.apply()
         assert exc.value.args[0]["changed"]
+
+    def set_args_firewalls(self):
+        return dict(
+            {
+                "api_url": "https://<storagegrid-endpoint-url>",
+                "auth_token": "storagegrid-auth-token",
+                "validate_certs": False,
+                "max_concurrent_requests": 1,
+            }
+        )
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_firewalls_create_update_collapsed_ips(self, mock_request):
+        args = self.set_args_firewalls()
+        args["firewalls"] = [
+            {
+                "id": "00000000-0000-0000-0000-000000000000",
+                "blocked_tcp_ports": [22, 2022, 22],
+                "blocked_udp_ports": [68],
+                "privileged_ips": ["10.0.0.0/25", "10.0.0.128/25", "192.168.1.100/32", "10.0.0.7"],
+            },
+            {"id": "00000000-0000-0000-0000-000000000001", "blocked_tcp_ports": [22]},
+        ]
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_114"],  # Get version
+            SRR["api_response_existing_blocked_port"],  # Get all blocked ports
+            SRR["api_response_existing_privileged_ip"],  # Get all privileged IPs
+            SRR["api_response_external_ports"],  # Get external ports
+            SRR["api_response_privileged_ip_updated"],  # Update privileged IPs of node 0
+            SRR["api_response_blocked_port_creation_succeeded"],  # Create blocked ports of node 1
+            SRR["end_of_sequence"],
+        ]
+        my_obj = firewall_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_firewalls_create_update_collapsed_ips: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["changed"]
+        assert exc.value.args[0]["msg"] == "1 blocked port lists created; 1 privileged IP lists updated"
+        assert exc.value.args[0]["firewalls"] == [
+            dict(id="00000000-0000-0000-0000-000000000000", blocked_ports="none", privileged_ips="update", changed=True),
+            dict(id="00000000-0000-0000-0000-000000000001", blocked_ports="create", privileged_ips="none", changed=True),
+        ]
+        assert mock_request.call_args_list[4][0][:2] == ("PUT", "api/v4/private/firewall-privileged-ips/00000000-0000-0000-0000-000000000000")
+        assert mock_request.call_args_list[4][1]["json"] == {
+            "id": "00000000-0000-0000-0000-000000000000",
+            "privilegedIps": ["10.0.0.0/24", "192.168.1.100"],
+            "gridInternalAccess": False,
+        }
+        assert mock_request.call_args_list[5][1]["json"] == {"id": "00000000-0000-0000-0000-000000000001", "tcpPorts": [22], "udpPorts": []}
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_firewalls_idempotent(self, mock_request):
+        args = self.set_args_firewalls()
+        args["blocked_tcp_ports"] = [2022, 22]
+        args["firewalls"] = [{"id": "00000000-0000-0000-0000-000000000000", "privileged_ips": ["192.168.1.100/32", "192.168.1.100"]}]
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_114"],  # Get version
+            SRR["api_response_existing_blocked_port"],  # Get all blocked ports
+            SRR["api_response_existing_privileged_ip"],  # Get all privileged IPs
+            SRR["end_of_sequence"],
+        ]
+        my_obj = firewall_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_firewalls_idempotent: %s" % repr(exc.value.args[0]))
+        assert not exc.value.args[0]["changed"]
+        assert exc.value.args[0]["firewalls"][0]["blocked_ports"] == "none"
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_firewalls_absent_and_purge_with_error(self, mock_request):
+        args = self.set_args_firewalls()
+        args["purge_firewalls"] = True
+        args["firewalls"] = [{"id": "00000000-0000-0000-0000-000000000001", "state": "absent"}]
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_114"],  # Get version
+            SRR["api_response_existing_blocked_port"],  # Get all blocked ports
+            SRR["api_response_existing_privileged_ip"],  # Get all privileged IPs
+            SRR["delete_good"],  # Delete blocked ports of node 0
+            SRR["generic_error"],  # Delete privileged IPs of node 0
+            SRR["end_of_sequence"],
+        ]
+        my_obj = firewall_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        print("Info: test_firewalls_absent_and_purge_with_error: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["changed"]
+        assert exc.value.args[0]["msg"] == (
+            "Error changing 1 of 2 firewall entries: 00000000-0000-0000-0000-000000000000: privileged_ips: Expected error"
+        )
+        assert exc.value.args[0]["firewalls"][0] == dict(
+            id="00000000-0000-0000-0000-000000000001", blocked_ports="none", privileged_ips="none", changed=False
+        )
+        assert mock_request.call_args_list[3][0][:2] == ("DELETE", "api/v4/private/firewall-blocked-ports/00000000-0000-0000-0000-000000000000")
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_firewalls_check_mode(self, mock_request):
+        args = self.set_args_firewalls()
+        args["_ansible_check_mode"] = True
+        args["firewalls"] = [{"id": "00000000-0000-0000-0000-000000000000", "grid_internal_access": True}]
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_114"],  # Get version
+            SRR["empty_good"],  # Get all blocked ports
+            SRR["api_response_existing_privileged_ip"],  # Get all privileged IPs
+            SRR["end_of_sequence"],
+        ]
+        my_obj = firewall_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]["changed"]
+        assert exc.value.args[0]["msg"] == "1 privileged IP lists updated"
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_firewalls_fail_invalid_port_and_ip(self, mock_request):
+        args = self.set_args_firewalls()
+        args["firewalls"] = [{"id": "00000000-0000-0000-0000-000000000001", "blocked_tcp_ports": [22, 4444]}]
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_114"],  # Get version
+            SRR["empty_good"],  # Get all blocked ports
+            SRR["empty_good"],  # Get all privileged IPs
+            SRR["api_response_external_ports"],  # Get external ports
+            SRR["end_of_sequence"],
+        ]
+        my_obj = firewall_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]["msg"] == "Error in firewalls for 00000000-0000-0000-0000-000000000001: TCP port 4444 is not a valid external port."
+
+        args["firewalls"] = [{"id": "00000000-0000-0000-0000-000000000001", "privileged_ips": ["10.0.0.300"]}]
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_114"],  # Get version
+            SRR["empty_good"],  # Get all blocked ports
+            SRR["empty_good"],  # Get all privileged IPs
+            SRR["end_of_sequence"],
+        ]
+        my_obj = firewall_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]["msg"].startswith("Error in firewalls for 00000000-0000-0000-0000-000000000001: ")
+
+    def test_firewalls_fail_duplicate_id(self):
+        args = self.set_args_firewalls()
+        args["firewalls"] = [{"id": "00000000-0000-0000-0000-000000000001"}, {"id": "00000000-0000-0000-0000-000000000001"}]
+        set_module_args(args)
+        with patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request") as mock_request:
+            mock_request.side_effect = [
+                SRR["version_114"],  # Get version
+                SRR["empty_good"],  # Get all blocked ports
+                SRR["empty_good"],  # Get all privileged IPs
+                SRR["end_of_sequence"],
+            ]
+            my_obj = firewall_module()
+            with pytest.raises(AnsibleFailJson) as exc:
+                my_obj.apply()
+        assert exc.value.args[0]["msg"] == "Error in firewalls: 00000000-0000-0000-0000-000000000001 is listed more than once."
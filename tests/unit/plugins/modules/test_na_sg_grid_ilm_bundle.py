@@ -0,0 +1,291 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests NetApp StorageGRID ILM bundle Ansible module: na_sg_grid_ilm_bundle"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import json
+import pytest
+import sys
+
+from ansible_collections.netapp.storagegrid.tests.unit.compat import unittest
+from ansible_collections.netapp.storagegrid.tests.unit.compat.mock import patch
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+from ansible_collections.netapp.storagegrid.plugins.modules.na_sg_grid_ilm_bundle import (
+    SgGridIlmBundle as ilm_bundle_module,
+)
+
+if sys.version_info < (3, 11):
+    pytestmark = pytest.mark.skip("Skipping Unit Tests on 3.11")
+
+# REST API canned responses when mocking send_request
+SRR = {
+    "empty_good": ({"data": []}, None),
+    "generic_error": (None, "Expected error"),
+    "delete_good": (None, None),
+    "version_118": ({"data": {"productVersion": "11.8.0-20230721.1338.d3969b3"}}, None),
+    "pools": ({"data": [{"id": "p1", "displayName": "DC1", "disks": [{"group": 10, "grade": None, "siteId": None}], "archives": []}]}, None),
+    "ec_profiles": (
+        {
+            "data": [
+                {"id": "3", "name": "2 plus 1", "poolId": "p1", "schemeId": "1", "active": False},
+                {"id": "5", "name": "2 plus 1", "poolId": "p1", "schemeId": "1", "active": True},
+            ]
+        },
+        None,
+    ),
+    "rules": (
+        {
+            "data": [
+                {
+                    "id": "r1",
+                    "displayName": "EC DC1",
+                    "filters": [],
+                    "ingestBehavior": "balanced",
+                    "referenceTime": "ingestTime",
+                    "placements": [{"retention": {"after": 0}, "erasureCoded": [{"poolId": "p1", "profileId": "5"}]}],
+                }
+            ]
+        },
+        None,
+    ),
+    "policies": ({"data": [{"id": "f1", "name": "DC1 policy", "rules": ["r1"], "defaultRule": "r1", "reason": "EC"}]}, None),
+    "policy_tags": ({"data": [{"id": "t1", "name": "dc1", "description": "DC1", "policyId": "f1"}]}, None),
+}
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({"ANSIBLE_MODULE_ARGS": args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an exception"""
+    if "changed" not in kwargs:
+        kwargs["changed"] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs["failed"] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class MockGrid(object):
+    """ Answer GET with the canned collections, and POST with a new ID, recording the write requests """
+
+    def __init__(self, existing=True, errors=None):
+        self.existing = existing
+        self.errors = errors or {}
+        self.writes = []
+        self.gets = []
+
+    def __call__(self, method, api, params=None, json=None, files=None):
+        if api.endswith("product-version"):
+            return SRR["version_118"]
+        if method == "GET":
+            kind = api.split("/")[-1].split("?")[0].replace("ilm-", "").replace("-", "_")
+            self.gets.append(kind)
+            return SRR[kind] if self.existing else SRR["empty_good"]
+        self.writes.append((method, api, json))
+        if (method, api) in self.errors:
+            return SRR["generic_error"]
+        if method == "POST" and json is not None:
+            return {"data": dict(json, id="new-%s" % (json.get("name") or json.get("displayName")))}, None
+        if method == "PUT":
+            return {"data": json}, None
+        return SRR["delete_good"]
+
+
+class TestMyModule(unittest.TestCase):
+    """a group of related Unit Tests"""
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+
+    def set_default_args(self):
+        return dict(
+            {
+                "api_url": "gmi.example.com",
+                "auth_token": "01234567-5678-9abc-78de-9fgabc123def",
+                "validate_certs": False,
+            }
+        )
+
+    def set_args_bundle(self):
+        args = self.set_default_args()
+        args.update(
+            pools=[{"name": "DC1", "disks": [{"group": 10}], "archives": []}],
+            ec_profiles=[{"name": "2 plus 1", "pool_id": "DC1", "scheme_id": "1"}],
+            rules=[
+                {
+                    "name": "EC DC1",
+                    "placements": [{"retention": {"after": 0}, "erasureCoded": [{"poolId": "DC1", "profileId": "2 plus 1"}]}],
+                }
+            ],
+            policies=[{"name": "DC1 policy", "rules": ["EC DC1"], "default_rule": "EC DC1", "reason": "EC"}],
+            policy_tags=[{"name": "dc1", "description": "DC1", "policy_id": "DC1 policy"}],
+        )
+        return args
+
+    def test_module_fail_when_required_args_missing(self):
+        """required arguments are reported as errors"""
+        with pytest.raises(AnsibleFailJson) as exc:
+            set_module_args(self.set_default_args())
+            ilm_bundle_module()
+        print("Info: test_module_fail_when_required_args_missing: %s" % exc.value.args[0]["msg"])
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_create_bundle_in_dependency_order(self, mock_request):
+        set_module_args(self.set_args_bundle())
+        grid = MockGrid(existing=False)
+        mock_request.side_effect = grid
+        my_obj = ilm_bundle_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_create_bundle_in_dependency_order: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["changed"]
+        assert exc.value.args[0]["msg"] == (
+            "1 ILM pools created; 1 EC profiles created; 1 ILM rules created; 1 ILM policies created; 1 ILM policy tags created"
+        )
+        assert sorted(grid.gets) == ["ec_profiles", "policies", "policy_tags", "pools", "rules"]
+        assert [write[1] for write in grid.writes] == [
+            "api/v4/private/ilm-pools",
+            "api/v4/private/ec-profiles",
+            "api/v4/grid/ilm-rules",
+            "api/v4/grid/ilm-policies",
+            "api/v4/grid/ilm-policy-tags",
+        ]
+        assert grid.writes[1][2]["poolId"] == "new-DC1"
+        assert grid.writes[2][2]["placements"][0]["erasureCoded"] == [{"poolId": "new-DC1", "profileId": "new-2 plus 1"}]
+        assert grid.writes[3][2]["rules"] == ["new-EC DC1"]
+        assert grid.writes[4][2]["policyId"] == "new-DC1 policy"
+        assert exc.value.args[0]["plan"][4]["id"] == "new-dc1"
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_idempotent_bundle(self, mock_request):
+        args = self.set_args_bundle()
+        args["max_concurrent_requests"] = 1
+        set_module_args(args)
+        grid = MockGrid()
+        mock_request.side_effect = grid
+        my_obj = ilm_bundle_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_idempotent_bundle: %s" % repr(exc.value.args[0]))
+        assert not exc.value.args[0]["changed"]
+        assert grid.gets == ["pools", "ec_profiles", "rules", "policies", "policy_tags"]
+        assert not grid.writes
+        assert [entry["action"] for entry in exc.value.args[0]["plan"]] == ["none"] * 5
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_check_mode_plan_with_pending_ids(self, mock_request):
+        args = self.set_default_args()
+        args["_ansible_check_mode"] = True
+        args["rules"] = [
+            {"name": "2 Copies", "placements": [{"retention": {"after": 0}, "replicated": [{"poolId": "DC1", "copies": 2}]}]},
+        ]
+        args["policies"] = [{"name": "DC1 policy", "rules": ["EC DC1", "2 Copies"], "default_rule": "2 Copies"}]
+        set_module_args(args)
+        grid = MockGrid()
+        mock_request.side_effect = grid
+        my_obj = ilm_bundle_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_check_mode_plan_with_pending_ids: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["changed"]
+        assert not grid.writes
+        # policy tags are not used by the bundle
+        assert sorted(grid.gets) == ["ec_profiles", "policies", "pools", "rules"]
+        plan = exc.value.args[0]["plan"]
+        assert plan[0]["action"] == "create"
+        assert plan[0]["after"]["placements"][0]["replicated"][0]["poolId"] == "p1"
+        assert plan[1]["action"] == "update"
+        assert plan[1]["before"]["rules"] == ["r1"]
+        assert plan[1]["after"]["rules"] == ["r1", "<created rules 2 Copies>"]
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_fail_unresolved_reference_before_changes(self, mock_request):
+        args = self.set_args_bundle()
+        args["ec_profiles"][0]["pool_id"] = "DC2"
+        set_module_args(args)
+        grid = MockGrid(existing=False)
+        mock_request.side_effect = grid
+        my_obj = ilm_bundle_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]["msg"] == "Error in ec_profiles for 2 plus 1: pools DC2 not found."
+        assert not grid.writes
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_failed_create_skips_dependents_and_deletes(self, mock_request):
+        args = self.set_args_bundle()
+        args["pools"].append({"name": "Old pool", "state": "absent"})
+        set_module_args(args)
+        grid = MockGrid(existing=False, errors={("POST", "api/v4/private/ec-profiles"): True})
+        mock_request.side_effect = grid
+        my_obj = ilm_bundle_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        print("Info: test_failed_create_skips_dependents_and_deletes: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["changed"]
+        assert [write[1] for write in grid.writes] == ["api/v4/private/ilm-pools", "api/v4/private/ec-profiles"]
+        assert exc.value.args[0]["msg"].startswith(
+            "Error applying 4 of 5 ILM changes: ec_profiles 2 plus 1: Expected error; "
+            "rules EC DC1: not applied, ec_profiles 2 plus 1 was not created"
+        )
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_delete_in_reverse_dependency_order(self, mock_request):
+        args = self.set_default_args()
+        args["max_concurrent_requests"] = 1
+        args["pools"] = [{"name": "DC1", "state": "absent"}]
+        args["ec_profiles"] = [{"name": "2 plus 1", "state": "absent"}]
+        args["rules"] = [{"name": "EC DC1", "state": "absent"}]
+        args["policy_tags"] = [{"name": "dc1", "state": "absent"}]
+        set_module_args(args)
+        grid = MockGrid()
+        mock_request.side_effect = grid
+        my_obj = ilm_bundle_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_delete_in_reverse_dependency_order: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["changed"]
+        assert [write[:2] for write in grid.writes] == [
+            ("DELETE", "api/v4/grid/ilm-policy-tags/t1"),
+            ("DELETE", "api/v4/grid/ilm-rules/r1"),
+            ("POST", "api/v4/private/ec-profiles/5/deactivate"),
+            ("DELETE", "api/v4/private/ilm-pools/p1"),
+        ]
+        assert exc.value.args[0]["msg"] == "1 ILM pools deleted; 1 EC profiles deactivated; 1 ILM rules deleted; 1 ILM policy tags deleted"
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_fail_reference_to_removed_object(self, mock_request):
+        args = self.set_default_args()
+        args["pools"] = [{"name": "DC1", "state": "absent"}]
+        args["ec_profiles"] = [{"name": "4 plus 2", "pool_id": "DC1", "scheme_id": "2"}]
+        set_module_args(args)
+        mock_request.side_effect = MockGrid()
+        my_obj = ilm_bundle_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]["msg"] == "Error in ec_profiles for 4 plus 2: pools DC1 is removed by the bundle."
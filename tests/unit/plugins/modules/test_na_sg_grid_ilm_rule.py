@@ -259,3 +259,31 @@ class TestMyModule(unittest.TestCase):
             my_obj.apply()
         print("Info: test_delete_na_sg_grid_ilm_rule_pass: %s" % repr(exc.value.args[0]))
         assert exc.value.args[0]["changed"]
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_log_level(self, mock_request):
+        args = self.set_args_create_na_sg_grid_ilm_rule()
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_114"],
+            SRR["api_response_existing_ilm_rule"],  # get
+            SRR["end_of_sequence"],
+        ]
+        my_obj = grid_ilm_rule_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]["log"] == []
+
+        args["log_level"] = "debug"
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_114"],
+            SRR["api_response_existing_ilm_rule"],  # get
+            SRR["end_of_sequence"],
+        ]
+        my_obj = grid_ilm_rule_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_log_level: %s" % repr(exc.value.args[0]["log"]))
+        assert any("debug: all ILM rules: " in entry for entry in exc.value.args[0]["log"])
+        assert not any("01234567-5678-9abc-78de-9fgabc123def" in entry for entry in exc.value.args[0]["log"])
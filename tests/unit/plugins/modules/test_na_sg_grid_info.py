@@ -5,15 +5,23 @@
 
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
+import copy
+import gzip
 import json
+import os
 import pytest
+import shutil
 import sys
+import tempfile
+import threading
 
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
 from ansible_collections.netapp.storagegrid.tests.unit.compat import unittest
 from ansible_collections.netapp.storagegrid.tests.unit.compat.mock import patch
 
+from ansible_collections.netapp.storagegrid.plugins.module_utils.info_cache import ResponseCache
+from ansible_collections.netapp.storagegrid.plugins.module_utils.json_stream import iter_data_items
 from ansible_collections.netapp.storagegrid.plugins.modules.na_sg_grid_info \
     import NetAppSgGatherInfo as sg_grid_info_module
 
@@ -192,6 +200,15 @@ def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
     raise AnsibleFailJson(kwargs)
 
 
+def streamed(documents):
+    """ side effect of iter_data, decoding the document of the api 10 bytes at a time """
+
+    def iter_data(api, params=None, chunk_size=65536, decoder=None):
+        data = to_bytes(json.dumps(documents[api]))
+        return iter_data_items((data[index:index + 10] for index in range(0, len(data), 10)), decoder=decoder), None
+    return iter_data
+
+
 class TestMyModule(unittest.TestCase):
     ''' A group of related Unit Tests '''
 
@@ -624,3 +641,304 @@ class TestMyModule(unittest.TestCase):
             my_obj.apply()
         print('Info: test_get_na_sg_grid_info_firewall_privileged_ips_pass: %s' % repr(exc.value.args))
         assert set(exc.value.args[0]['sg_info']) == set(gather_subset)
+
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.iter_data')
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request')
+    def test_subset_options_fields_and_filters(self, mock_request, mock_iter_data):
+        args = self.set_default_args_pass_check()
+        args['parameters'] = {'limit': 5}
+        args['subset_options'] = [
+            {
+                'subset': 'grid_accounts_info',
+                'fields': ['id', 'policy.quotaObjectBytes'],
+                'filters': ['capabilities == s3', 'policy.quotaObjectBytes > 1000'],
+                'parameters': {'limit': 1000},
+            },
+            {'subset': 'grid/users/root', 'fields': ['uniqueName'], 'filters': ['disable == true']},
+            {'subset': 'grid/regions', 'parameters': {'marker': 'us-east-1'}},
+        ]
+        set_module_args(args)
+        accounts = [
+            {'id': '1', 'name': 'a', 'capabilities': ['management', 's3'], 'policy': {'quotaObjectBytes': 5000}},
+            {'id': '2', 'name': 'b', 'capabilities': ['s3'], 'policy': {'quotaObjectBytes': None}},
+            {'id': '3', 'name': 'c', 'capabilities': ['swift'], 'policy': {'quotaObjectBytes': 5000}},
+        ]
+        mock_request.side_effect = [
+            SRR['version_114'],
+            SRR['empty_good'],
+            SRR['end_of_sequence'],
+        ]
+        mock_iter_data.side_effect = streamed({
+            'api/v3/grid/accounts': {'responseTime': 'now', 'data': accounts, 'apiVersion': '3.0'},
+            'api/v3/grid/users/root': {'data': {'uniqueName': 'root', 'disable': False}},
+        })
+        my_obj = sg_grid_info_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        sg_info = exc.value.args[0]['sg_info']
+        assert list(sg_info) == ['grid/accounts', 'grid/users/root', 'grid/regions']
+        assert sg_info['grid/accounts'] == {'data': [{'id': '1', 'policy': {'quotaObjectBytes': 5000}}]}
+        assert sg_info['grid/users/root'] == {'data': None}
+        assert mock_iter_data.call_args_list[0][0] == ('api/v3/grid/accounts', {'limit': 1000})
+        assert mock_request.call_args_list[1][0][2] == {'limit': 5, 'marker': 'us-east-1'}
+
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request')
+    def test_subset_options_errors(self, mock_request):
+        mock_request.side_effect = [SRR['version_114']] * 2
+        args = self.set_default_args_pass_check()
+        args['subset_options'] = [{'subset': 'grid/accounts', 'filters': ['name ==']}]
+        set_module_args(args)
+        with pytest.raises(AnsibleFailJson) as exc:
+            sg_grid_info_module().apply()
+        assert exc.value.args[0]['msg'].startswith("Error in subset_options for grid/accounts: invalid filter 'name =='")
+        args['subset_options'] = [{'subset': 'grid/accounts'}, {'subset': 'grid_accounts_info'}]
+        set_module_args(args)
+        with pytest.raises(AnsibleFailJson) as exc:
+            sg_grid_info_module().apply()
+        assert exc.value.args[0]['msg'] == "Error in subset_options: grid_accounts_info is listed more than once."
+
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request')
+    def test_snapshot_returns_changes_only(self, mock_request):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        snapshot = os.path.join(tmpdir, 'grid_info.snapshot')
+        args = self.set_default_args_pass_check()
+        args['gather_subset'] = ['grid/accounts', 'grid/users/root']
+        args['snapshot'] = snapshot
+        accounts = copy.deepcopy(SRR['grid_accounts'][0])
+        modified = copy.deepcopy(accounts)
+        modified['data'][1]['policy']['quotaObjectBytes'] = 1000
+        del modified['data'][2]
+        modified['data'].append({'id': '12345678901234567899', 'name': 'new'})
+        root = copy.deepcopy(SRR['grid_users_root'][0])
+        root['responseTime'] = 'later'
+        mock_request.side_effect = [
+            SRR['version_114'], (accounts, None), SRR['grid_users_root'],
+            SRR['version_114'], (accounts, None), (root, None),
+            SRR['version_114'], (modified, None), SRR['grid_users_root'],
+            SRR['end_of_sequence'],
+        ]
+        # first run, everything is new
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            sg_grid_info_module().apply()
+        assert exc.value.args[0]['changed']
+        sg_info = exc.value.args[0]['sg_info']
+        assert set(sg_info) == set(['grid/accounts', 'grid/users/root'])
+        assert len(sg_info['grid/accounts']['added']) == len(accounts['data'])
+        assert os.path.exists(snapshot)
+        # nothing changed, the response time is not part of the content
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            sg_grid_info_module().apply()
+        assert exc.value.args[0]['sg_info'] == {}
+        assert not exc.value.args[0]['changed']
+        # one tenant modified, one removed, one added
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            sg_grid_info_module().apply()
+        delta = exc.value.args[0]['sg_info']['grid/accounts']
+        assert [item['id'] for item in delta['data']] == ['12345678901234567892', '12345678901234567899']
+        assert delta['added'] == ['id:12345678901234567899']
+        assert delta['modified'] == ['id:12345678901234567892']
+        assert delta['removed'] == ['id:%s' % accounts['data'][2]['id']]
+        assert list(exc.value.args[0]['sg_info']) == ['grid/accounts']
+        assert [name for name in os.listdir(tmpdir)] == ['grid_info.snapshot']
+
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request')
+    def test_snapshot_check_mode_and_errors(self, mock_request):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        args = self.set_default_args_pass_check()
+        args['gather_subset'] = ['grid/users/root']
+        args['snapshot'] = os.path.join(tmpdir, 'grid_info.snapshot')
+        args['_ansible_check_mode'] = True
+        mock_request.side_effect = [SRR['version_114'], SRR['grid_users_root']] * 2
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            sg_grid_info_module().apply()
+        assert list(exc.value.args[0]['sg_info']) == ['grid/users/root']
+        assert not os.path.exists(args['snapshot'])
+        with open(args['snapshot'], 'w') as snapshot_file:
+            snapshot_file.write('{"version": 0}')
+        set_module_args(args)
+        with pytest.raises(AnsibleFailJson) as exc:
+            sg_grid_info_module().apply()
+        assert exc.value.args[0]['msg'] == 'Error reading snapshot %s: not a version 1 snapshot.' % args['snapshot']
+
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.iter_data')
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request')
+    def test_dest_writes_ndjson(self, mock_request, mock_iter_data):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        args = self.set_default_args_pass_check()
+        args['gather_subset'] = ['grid/accounts', 'grid/users/root']
+        args['subset_options'] = [{'subset': 'grid/accounts', 'filters': ['name != b']}]
+        args['dest'] = os.path.join(tmpdir, 'grid_info.ndjson.gz')
+        accounts = [{'id': '1', 'name': 'a'}, {'id': '2', 'name': 'b'}, {'id': '3', 'name': 'c'}]
+        mock_request.side_effect = [SRR['version_114']] * 2
+        mock_iter_data.side_effect = streamed({
+            'api/v3/grid/accounts': {'data': accounts},
+            'api/v3/grid/users/root': {'data': {'uniqueName': 'root'}},
+        })
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            sg_grid_info_module().apply()
+        assert 'sg_info' not in exc.value.args[0]
+        assert exc.value.args[0]['changed']
+        manifest = exc.value.args[0]['manifest']
+        assert manifest['written'] and manifest['items'] == 3
+        assert [(entry['subset'], entry['type'], entry['count']) for entry in manifest['subsets']] == [
+            ('grid/accounts', 'list', 2), ('grid/users/root', 'object', 1)]
+        with gzip.open(args['dest'], 'rt') as dest_file:
+            lines = [json.loads(line) for line in dest_file]
+        assert lines == [
+            {'subset': 'grid/accounts', 'item': {'id': '1', 'name': 'a'}},
+            {'subset': 'grid/accounts', 'item': {'id': '3', 'name': 'c'}},
+            {'subset': 'grid/users/root', 'data': {'uniqueName': 'root'}},
+        ]
+        assert os.listdir(tmpdir) == ['grid_info.ndjson.gz']
+
+        # check mode hashes the same lines without writing
+        os.unlink(args['dest'])
+        args['_ansible_check_mode'] = True
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            sg_grid_info_module().apply()
+        assert exc.value.args[0]['changed']
+        assert not exc.value.args[0]['manifest']['written']
+        assert exc.value.args[0]['manifest']['subsets'] == manifest['subsets']
+        assert os.listdir(tmpdir) == []
+
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.iter_data')
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request')
+    def test_dest_error_removes_partial_file(self, mock_request, mock_iter_data):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        args = self.set_default_args_pass_check()
+        args['gather_subset'] = ['grid/accounts', 'grid/users/root']
+        args['dest'] = os.path.join(tmpdir, 'grid_info.ndjson.gz')
+        mock_request.side_effect = [SRR['version_114']]
+        mock_iter_data.side_effect = [streamed({'api/v3/grid/accounts': {'data': [{'id': '1'}]}})('api/v3/grid/accounts'), (None, 'Expected error')]
+        set_module_args(args)
+        with pytest.raises(AnsibleFailJson) as exc:
+            sg_grid_info_module().apply()
+        assert exc.value.args[0]['msg'] == 'Expected error'
+        assert os.listdir(tmpdir) == []
+
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request')
+    def test_cache_ttl(self, mock_request):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        args = self.set_default_args_pass_check()
+        args['gather_subset'] = ['grid/license', 'grid/health', 'grid_regions_info']
+        args['cache'] = {'path': os.path.join(tmpdir, 'cache'), 'ttl': {'grid_health_info': 60, 'grid/regions': 0}}
+        license_response = ({'data': {'license': 'abc'}}, None)
+        mock_request.side_effect = [
+            SRR['version_114'], license_response, SRR['grid_health'], SRR['grid_regions'],
+            # the product version, grid/license and grid/health are cached
+            SRR['grid_regions'],
+            SRR['end_of_sequence'],
+        ]
+        for dummy in range(2):
+            set_module_args(args)
+            with pytest.raises(AnsibleExitJson) as exc:
+                sg_grid_info_module().apply()
+            assert exc.value.args[0]['sg_info']['grid/license'] == {'data': {'license': 'abc'}}
+        assert mock_request.call_count == 5
+        assert len(os.listdir(args['cache']['path'])) == 3
+
+        # a run gathering cached subsets only sends no request
+        args['gather_subset'] = ['grid/license']
+        set_module_args(args)
+        my_obj = sg_grid_info_module()
+        assert my_obj.rest_api.get_sg_version() == (11, 4)
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['sg_info']['grid/license'] == {'data': {'license': 'abc'}}
+        assert mock_request.call_count == 5
+
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request')
+    def test_cache_stale_if_error(self, mock_request):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        args = self.set_default_args_pass_check()
+        args['gather_subset'] = ['grid/license']
+        # the product version is not cached, the only entry is grid/license
+        args['cache'] = {'path': tmpdir, 'ttl': {'grid/license': 1, 'grid/config/product-version': 0}}
+        mock_request.side_effect = [SRR['version_114'], ({'data': {'license': 'abc'}}, None)] + [SRR['version_114'], SRR['generic_error']] * 2
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson):
+            sg_grid_info_module().apply()
+        entry = os.path.join(tmpdir, os.listdir(tmpdir)[0])
+        # expire the entry
+        with open(entry) as entry_file:
+            content = json.load(entry_file)
+        content['stored'] -= 100
+        with open(entry, 'w') as entry_file:
+            json.dump(content, entry_file)
+        set_module_args(args)
+        with pytest.raises(AnsibleFailJson) as exc:
+            sg_grid_info_module().apply()
+        assert exc.value.args[0]['msg'] == 'Expected error'
+        args['cache']['stale_if_error'] = 3600
+        set_module_args(args)
+        with patch.object(basic.AnsibleModule, 'warn') as mock_warn:
+            with pytest.raises(AnsibleExitJson) as exc:
+                sg_grid_info_module().apply()
+        assert exc.value.args[0]['sg_info']['grid/license'] == {'data': {'license': 'abc'}}
+        assert 'Returning the cached response of api/v3/grid/license from 100 seconds ago' in mock_warn.call_args[0][0]
+
+    def test_cache_concurrent_writers(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, 'cache')
+        errors = []
+
+        def worker(index):
+            cache = ResponseCache(path, 'https://sgmi.example.com')
+            for dummy in range(50):
+                cache.put('api/v4/grid/license', {}, {'data': {'writer': index, 'padding': 'x' * 4096}})
+                response, age = cache.get('api/v4/grid/license', {}, 60)
+                if response is None or response['data']['padding'] != 'x' * 4096:
+                    errors.append(response)
+            errors.extend(cache.warnings)
+
+        threads = [threading.Thread(target=worker, args=(index,)) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert len(os.listdir(path)) == 1
+
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request', autospec=True)
+    def test_grids_fan_out(self, mock_request):
+        args = {
+            'grids': [
+                {'name': 'east', 'api_url': 'east.example.com', 'auth_token': 'east-token'},
+                {'name': 'west', 'api_url': 'west.example.com', 'auth_token': 'west-token'},
+                {'name': 'north', 'api_url': 'north.example.com', 'auth_token': 'north-token'},
+            ],
+            'gather_subset': ['grid/accounts', 'grid/health'],
+        }
+
+        def send_request(rest_api, method, api, params=None, json=None, files=None):
+            if rest_api.api_url == 'https://north.example.com':
+                return SRR['generic_error']
+            if 'config/product-version' in api:
+                return SRR['version_114']
+            if api.endswith('grid/health') and rest_api.api_url == 'https://west.example.com':
+                return ({'data': {'alarms': 1}}, None)
+            return SRR['grid_accounts'] if api.endswith('grid/accounts') else SRR['grid_health']
+
+        mock_request.side_effect = send_request
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            sg_grid_info_module().apply()
+        grids = exc.value.args[0]['grids']
+        assert set(grids['east']['sg_info']) == {'grid/accounts', 'grid/health'}
+        assert grids['west']['sg_info']['grid/health'] == {'data': {'alarms': 1}}
+        assert grids['north'] == {'failed': True, 'msg': 'Expected error'}
+        # product version, then the two subsets, except for north
+        assert mock_request.call_count == 7
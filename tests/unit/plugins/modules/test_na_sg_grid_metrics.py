@@ -225,3 +225,50 @@ class TestMetricsModule(unittest.TestCase):
         print("Info: test_get_na_sg_grid_metrics_over_range_missing_step_fail: %s" % repr(exc.value.args[0]))
         error = "If 'query' provided, 'time' (or 'start_time'), 'end_time', and 'step' must also be specified for query over range of time."
         assert exc.value.args[0]["msg"] == error
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request", autospec=True)
+    def test_get_na_sg_grid_metrics_grids(self, mock_request):
+        args = self.set_args_get_metrics()
+        del args["api_url"], args["auth_token"]
+        args["grids"] = [
+            {"name": "east", "api_url": "https://east.example.com", "auth_token": "east-token"},
+            {"api_url": "https://west.example.com", "auth_token": "west-token", "validate_certs": True},
+        ]
+
+        def send_request(rest_api, method, api, params=None, json=None, files=None):
+            if "config/product-version" in api:
+                return SRR["version_114"]
+            if rest_api.api_url == "https://west.example.com":
+                assert rest_api.verify and rest_api.auth_token == "west-token"
+                return SRR["generic_error"]
+            return SRR["api_response_get_succeeded"]
+
+        mock_request.side_effect = send_request
+        set_module_args(args)
+        my_obj = metrics_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        grids = exc.value.args[0]["grids"]
+        assert grids["east"] == {"sg_metric": SRR["expected_sg_metric"][0]["data"]}
+        assert grids["https://west.example.com"] == {"failed": True, "msg": "Expected error"}
+        assert mock_request.call_count == 4
+
+        mock_request.side_effect = [SRR["generic_error"]] * 2
+        set_module_args(args)
+        my_obj = metrics_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]["msg"] == "Error: every grid failed: east: Expected error; https://west.example.com: Expected error"
+
+    def test_grids_and_api_url_are_exclusive(self):
+        args = self.set_args_get_metrics()
+        args["grids"] = [{"api_url": "https://east.example.com", "auth_token": "east-token"}] * 2
+        set_module_args(args)
+        with pytest.raises(AnsibleFailJson) as exc:
+            metrics_module()
+        assert "mutually exclusive" in exc.value.args[0]["msg"]
+        del args["api_url"], args["auth_token"]
+        set_module_args(args)
+        with pytest.raises(AnsibleFailJson) as exc:
+            metrics_module().apply()
+        assert exc.value.args[0]["msg"] == "Error in grids: https://east.example.com is listed more than once, use name to tell them apart."
@@ -414,3 +414,159 @@ class TestMyModule(unittest.TestCase):
             "Info: test_create_na_sg_grid_account_with_compliance_mode_and_retention_time: %s" % repr(exc.value.args[0])
         )
         assert exc.value.args[0]["changed"]
+
+    def set_args_tenants(self):
+        return dict(
+            {
+                "protocol": "s3",
+                "use_own_identity_source": True,
+                "allow_platform_services": False,
+                "tenants": [
+                    {"name": "TestTenantAccount", "description": "Ansible Test"},
+                    {"name": "NewTenant", "tenant_password": "abc123"},
+                    {"name": "OtherTenant", "description": "Update Account", "quota_size": 10},
+                    {"name": "OldTenant", "state": "absent"},
+                ],
+                "max_concurrent_requests": 1,
+                "api_url": "gmi.example.com",
+                "auth_token": "01234567-5678-9abc-78de-9fgabc123def",
+                "validate_certs": False,
+            }
+        )
+
+    def grid_accounts_bulk(self):
+        accounts = []
+        for index, name in enumerate(["TestTenantAccount", "OtherTenant", "OldTenant", "UnlistedTenant"]):
+            account = dict(SRR["grid_account_record"][0]["data"], name=name, id="1234567890123456789%d" % index)
+            accounts.append(account)
+        return ({"data": accounts}, None)
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_tenants_create_update_delete(self, mock_request):
+        set_module_args(self.set_args_tenants())
+        mock_request.side_effect = [
+            SRR["version_114"],  # get
+            self.grid_accounts_bulk(),  # get all accounts
+            SRR["grid_account_record"],  # post NewTenant
+            SRR["grid_account_record_with_quota"],  # put OtherTenant
+            SRR["delete_good"],  # delete OldTenant
+            SRR["end_of_sequence"],
+        ]
+        my_obj = grid_account_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_tenants_create_update_delete: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["changed"]
+        results = dict((result["name"], result) for result in exc.value.args[0]["tenants"])
+        assert results["TestTenantAccount"]["action"] == "none"
+        assert not results["TestTenantAccount"]["changed"]
+        assert results["NewTenant"]["action"] == "create"
+        assert results["NewTenant"]["id"] == "12345678901234567890"
+        assert results["OtherTenant"]["action"] == "update"
+        assert results["OldTenant"]["action"] == "delete"
+        assert "UnlistedTenant" not in results
+        assert exc.value.args[0]["msg"] == "1 tenant accounts created; 1 tenant accounts updated; 1 tenant accounts deleted"
+        # accounts are listed once
+        assert mock_request.call_args_list[1][0][:2] == ("GET", "api/v3/grid/accounts")
+        assert mock_request.call_args_list[2][0][0] == "POST"
+        assert mock_request.call_args_list[2][1]["json"]["password"] == "abc123"
+        assert mock_request.call_args_list[3][0][:2] == ("PUT", "api/v3/grid/accounts/12345678901234567891")
+        assert mock_request.call_args_list[3][1]["json"]["policy"]["quotaObjectBytes"] == 10737418240
+        assert mock_request.call_args_list[4][0][:2] == ("DELETE", "api/v3/grid/accounts/12345678901234567892")
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_tenants_purge_check_mode(self, mock_request):
+        args = self.set_args_tenants()
+        args["purge_tenants"] = True
+        args["_ansible_check_mode"] = True
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_114"],  # get
+            self.grid_accounts_bulk(),  # get all accounts
+            SRR["end_of_sequence"],
+        ]
+        my_obj = grid_account_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_tenants_purge_check_mode: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["changed"]
+        results = dict((result["name"], result) for result in exc.value.args[0]["tenants"])
+        assert results["UnlistedTenant"]["action"] == "delete"
+        assert mock_request.call_count == 2
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_tenants_concurrent_with_errors(self, mock_request):
+        args = self.set_args_tenants()
+        args["max_concurrent_requests"] = 4
+        args["update_password"] = "always"
+        args["tenant_password"] = "def456"
+        set_module_args(args)
+
+        def send_request(method, api, params=None, json=None, files=None):
+            if api.endswith("product-version"):
+                return SRR["version_114"]
+            if method == "GET":
+                return self.grid_accounts_bulk()
+            if method == "PUT":
+                return SRR["generic_error"]
+            if api.endswith("change-password"):
+                return SRR["pw_change_good"]
+            if method == "POST":
+                return SRR["grid_account_record"]
+            return SRR["delete_good"]
+
+        mock_request.side_effect = send_request
+        my_obj = grid_account_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        print("Info: test_tenants_concurrent_with_errors: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["msg"] == "Error changing 1 of 4 tenant accounts: OtherTenant: Expected error"
+        assert exc.value.args[0]["changed"]
+        results = exc.value.args[0]["tenants"]
+        # results are in the order of tenants
+        assert [result["name"] for result in results] == ["TestTenantAccount", "NewTenant", "OtherTenant", "OldTenant"]
+        assert results[0]["password_updated"]
+        # the password is set by the POST on create
+        assert not results[1]["password_updated"]
+        assert results[2]["error"] == "Expected error"
+        posts = [call for call in mock_request.call_args_list if call[0][0] == "POST"]
+        assert len(posts) == 2
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_tenants_fail_duplicate_or_missing_options(self, mock_request):
+        args = self.set_args_tenants()
+        args["tenants"].append({"name": "NewTenant"})
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_114"],  # get
+            self.grid_accounts_bulk(),  # get all accounts
+            SRR["end_of_sequence"],
+        ]
+        my_obj = grid_account_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]["msg"] == "Error in tenants: NewTenant is listed more than once."
+
+        args = self.set_args_tenants()
+        del args["protocol"]
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_114"],  # get
+            self.grid_accounts_bulk(),  # get all accounts
+            SRR["end_of_sequence"],
+        ]
+        my_obj = grid_account_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]["msg"] == (
+            "Error in tenants for TestTenantAccount: state is present but all of the following are missing: protocol"
+        )
+
+    def test_tenants_mutually_exclusive_with_name(self):
+        args = self.set_args_tenants()
+        args["name"] = "TestTenantAccount"
+        set_module_args(args)
+        with pytest.raises(AnsibleFailJson) as exc:
+            grid_account_module()
+        print("Info: test_tenants_mutually_exclusive_with_name: %s" % exc.value.args[0]["msg"])
+        assert "mutually exclusive" in exc.value.args[0]["msg"]
@@ -436,3 +436,48 @@ class TestMyModule(unittest.TestCase):
             ]
             grid_user_module()
         print("Info: test_fail_set_federated_user_password: %s" % repr(exc.value.args[0]))
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_users_concurrent(self, mock_request):
+        args = dict(
+            {
+                "update_password": "always",
+                "password": "netapp123",
+                "users": [
+                    {"unique_name": "user/ansible-sg-adm-user1", "full_name": "testgriduser", "member_of": ["group/testgridgroup1"]},
+                    {"unique_name": "user/newuser", "full_name": "New User", "member_of": ["group/testgridgroup2"]},
+                    {"unique_name": "user/brokenuser", "full_name": "Broken User", "disable": True},
+                ],
+                "max_concurrent_requests": 4,
+                "api_url": "gmi.example.com",
+                "auth_token": "01234567-5678-9abc-78de-9fgabc123def",
+                "validate_certs": False,
+            }
+        )
+        set_module_args(args)
+
+        def send_request(method, api, params=None, json=None, files=None):
+            if api.endswith("product-version"):
+                return SRR["version_114"]
+            if api.endswith("grid/users") and method == "GET":
+                return SRR["grid_users"]
+            if api.endswith("grid/groups"):
+                return SRR["grid_groups"]
+            if api.endswith("user/brokenuser/change-password"):
+                return SRR["generic_error"]
+            if api.endswith("change-password"):
+                return SRR["pw_change_good"]
+            return SRR["grid_user_record"]
+
+        mock_request.side_effect = send_request
+        my_obj = grid_user_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        print("Info: test_users_concurrent: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["msg"] == "Error changing 1 of 3 Grid Users: user/brokenuser: Expected error"
+        results = exc.value.args[0]["users"]
+        assert [result["action"] for result in results] == ["none", "create", "create"]
+        # existing users get their password changed with update_password always
+        assert results[0]["changed"] and results[0]["password_updated"]
+        assert results[1]["password_updated"]
+        assert mock_request.call_count == 8
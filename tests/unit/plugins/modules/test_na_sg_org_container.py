@@ -549,3 +549,142 @@ class TestMyModule(unittest.TestCase):
             my_obj.apply()
         print("Info: test_update_na_sg_org_container_policy_pass: %s" % repr(exc.value.args[0]))
         assert exc.value.args[0]["changed"]
+
+    def set_args_buckets(self):
+        return dict(
+            {
+                "bucket_versioning_enabled": True,
+                "consistency": "all",
+                "buckets": [
+                    {"name": "testbucket"},
+                    {"name": "newbucket", "capacity_limit": 1.5},
+                    {"name": "oldbucket", "state": "absent"},
+                ],
+                "max_concurrent_requests": 1,
+                "api_url": "gmi.example.com",
+                "auth_token": "01234567-5678-9abc-78de-9fgabc123def",
+                "validate_certs": False,
+            }
+        )
+
+    def org_containers_bulk(self):
+        return (
+            {
+                "data": [
+                    {"name": "testbucket", "creationTime": "2020-02-04T12:43:50.777Z", "region": "us-east-1"},
+                    {"name": "oldbucket", "creationTime": "2020-02-04T12:43:50.777Z", "region": "us-east-1"},
+                ]
+            },
+            None,
+        )
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_buckets_create_update_delete(self, mock_request):
+        set_module_args(self.set_args_buckets())
+        mock_request.side_effect = [
+            SRR["version_119"],
+            self.org_containers_bulk(),  # get all buckets
+            SRR["org_container_versioning_disabled"],  # get testbucket versioning
+            SRR["consistency"],  # get testbucket consistency
+            SRR["org_container_record"],  # post newbucket
+            SRR["delete_good"],  # delete oldbucket
+            SRR["org_container_versioning_enabled"],  # put testbucket versioning
+            SRR["consistency_updated"],  # put testbucket consistency
+            SRR["org_container_versioning_enabled"],  # put newbucket versioning
+            SRR["consistency_updated"],  # put newbucket consistency
+            SRR["org_container_capacity_limit"],  # put newbucket quota
+            SRR["end_of_sequence"],
+        ]
+        my_obj = org_container_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_buckets_create_update_delete: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["changed"]
+        assert exc.value.args[0]["msg"] == "1 Org Containers created; 1 Org Containers updated; 1 Org Containers deleted"
+        results = exc.value.args[0]["buckets"]
+        assert results[0] == dict(name="testbucket", action="update", changed=True, updated=["versioning", "consistency"])
+        assert results[1] == dict(
+            name="newbucket", action="create", changed=True, updated=["versioning", "consistency", "quota-object-bytes"]
+        )
+        assert results[2] == dict(name="oldbucket", action="delete", changed=True, updated=[])
+        assert mock_request.call_args_list[6][0][:2] == ("PUT", "api/v4/org/containers/testbucket/versioning")
+        assert mock_request.call_args_list[10][1]["json"] == {"quotaObjectBytes": 1610612736}
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_buckets_idempotent(self, mock_request):
+        args = self.set_args_buckets()
+        args["buckets"] = [{"name": "testbucket", "consistency": "available"}, {"name": "otherbucket", "state": "absent"}]
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_119"],
+            self.org_containers_bulk(),  # get all buckets
+            SRR["org_container_versioning_enabled"],  # get testbucket versioning
+            SRR["consistency"],  # get testbucket consistency
+            SRR["end_of_sequence"],
+        ]
+        my_obj = org_container_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_buckets_idempotent: %s" % repr(exc.value.args[0]))
+        assert not exc.value.args[0]["changed"]
+        assert [result["action"] for result in exc.value.args[0]["buckets"]] == ["none", "none"]
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_buckets_object_lock_global_compliance_checked_once(self, mock_request):
+        args = self.set_args_buckets()
+        del args["bucket_versioning_enabled"]
+        del args["consistency"]
+        args["s3_object_lock_enabled"] = True
+        args["buckets"] = [{"name": "lockbucket1"}, {"name": "lockbucket2"}]
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_119"],
+            self.org_containers_bulk(),  # get all buckets
+            SRR["global_compliance_disabled"],  # get compliance-global
+            SRR["end_of_sequence"],
+        ]
+        my_obj = org_container_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        print("Info: test_buckets_object_lock_global_compliance_checked_once: %s" % exc.value.args[0]["msg"])
+        assert not exc.value.args[0]["changed"]
+        assert exc.value.args[0]["msg"].startswith("Error changing 2 of 2 Org Containers: lockbucket1: Error: Global S3 Object Lock")
+        assert mock_request.call_count == 3
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_buckets_concurrent_with_errors(self, mock_request):
+        args = self.set_args_buckets()
+        args["max_concurrent_requests"] = 4
+        set_module_args(args)
+
+        def send_request(method, api, params=None, json=None, files=None):
+            if api.endswith("product-version"):
+                return SRR["version_119"]
+            if api.endswith("org/containers"):
+                return self.org_containers_bulk() if method == "GET" else SRR["org_container_record"]
+            if api.endswith("/versioning"):
+                return SRR["org_container_versioning_disabled"]
+            if api.endswith("/consistency"):
+                return SRR["consistency"] if method == "GET" else SRR["generic_error"]
+            return SRR["delete_good"]
+
+        mock_request.side_effect = send_request
+        my_obj = org_container_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        print("Info: test_buckets_concurrent_with_errors: %s" % exc.value.args[0]["msg"])
+        assert exc.value.args[0]["changed"]
+        results = exc.value.args[0]["buckets"]
+        assert [result["name"] for result in results] == ["testbucket", "newbucket", "oldbucket"]
+        assert results[0]["error"] == "consistency: Expected error"
+        assert results[1]["error"] == "consistency: Expected error"
+        assert "error" not in results[2]
+
+    def test_buckets_mutually_exclusive_with_name(self):
+        args = self.set_args_buckets()
+        args["name"] = "testbucket"
+        set_module_args(args)
+        with pytest.raises(AnsibleFailJson) as exc:
+            org_container_module()
+        print("Info: test_buckets_mutually_exclusive_with_name: %s" % exc.value.args[0]["msg"])
+        assert "mutually exclusive" in exc.value.args[0]["msg"]
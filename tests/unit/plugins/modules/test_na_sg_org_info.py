@@ -5,15 +5,21 @@
 
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
+import gzip
 import json
+import os
 import pytest
+import shutil
+import stat
 import sys
+import tempfile
 
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
 from ansible_collections.netapp.storagegrid.tests.unit.compat import unittest
 from ansible_collections.netapp.storagegrid.tests.unit.compat.mock import patch
 
+from ansible_collections.netapp.storagegrid.plugins.module_utils.json_stream import iter_data_items
 from ansible_collections.netapp.storagegrid.plugins.modules.na_sg_org_info \
     import NetAppSgGatherInfo as sg_org_info_module
 
@@ -105,6 +111,15 @@ def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
     raise AnsibleFailJson(kwargs)
 
 
+def streamed(documents):
+    """ side effect of iter_data, decoding the document of the api 10 bytes at a time """
+
+    def iter_data(api, params=None, chunk_size=65536, decoder=None):
+        data = to_bytes(json.dumps(documents[api]))
+        return iter_data_items((data[index:index + 10] for index in range(0, len(data), 10)), decoder=decoder), None
+    return iter_data
+
+
 class TestMyModule(unittest.TestCase):
     ''' A group of related Unit Tests '''
 
@@ -329,3 +344,125 @@ class TestMyModule(unittest.TestCase):
             my_obj.apply()
         print('Info: test_run_sg_gather_facts_for_org_ilm_info_pass: %s' % repr(exc.value.args))
         assert set(exc.value.args[0]['sg_info']) == set(gather_subset)
+
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.iter_data')
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request')
+    def test_subset_options_only_gathers_listed_subsets(self, mock_request, mock_iter_data):
+        args = self.set_default_args_pass_check()
+        args['subset_options'] = [
+            {'subset': 'org/containers', 'fields': ['name', 'region'], 'filters': ['name =~ ^prod-'], 'parameters': {'include': 'region'}},
+        ]
+        set_module_args(args)
+        containers = [
+            {'name': 'prod-logs', 'region': 'us-east-1', 'creationTime': '2026-01-01T00:00:00.000Z'},
+            {'name': 'dev-logs', 'region': 'us-east-1', 'creationTime': '2026-01-01T00:00:00.000Z'},
+        ]
+        mock_request.side_effect = [
+            SRR['version_114'],
+            SRR['end_of_sequence'],
+        ]
+        mock_iter_data.side_effect = streamed({'api/v3/org/containers': {'data': containers}})
+        my_obj = sg_org_info_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['sg_info'] == {'org/containers': {'data': [{'name': 'prod-logs', 'region': 'us-east-1'}]}}
+        assert mock_iter_data.call_args_list[0][0] == ('api/v3/org/containers', {'include': 'region'})
+
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.iter_data')
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request')
+    def test_dest_writes_ndjson(self, mock_request, mock_iter_data):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        args = self.set_default_args_pass_check()
+        args['gather_subset'] = ['org/containers', 'org/users/root']
+        args['dest'] = os.path.join(tmpdir, 'org_info.ndjson.gz')
+        documents = {
+            'api/v3/org/containers': {'data': [{'name': 'bucket1'}, {'name': 'bucket2'}]},
+            'api/v3/org/users/root': {'data': {'uniqueName': 'root'}},
+        }
+        mock_request.side_effect = [SRR['version_114']] * 4
+        mock_iter_data.side_effect = streamed(documents)
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            sg_org_info_module().apply()
+        assert exc.value.args[0]['changed']
+        manifest = exc.value.args[0]['manifest']
+        assert manifest['written'] and manifest['items'] == 3
+        with gzip.open(args['dest'], 'rt') as dest_file:
+            lines = [json.loads(line) for line in dest_file]
+        assert lines == [
+            {'subset': 'org/containers', 'item': {'name': 'bucket1'}},
+            {'subset': 'org/containers', 'item': {'name': 'bucket2'}},
+            {'subset': 'org/users/root', 'data': {'uniqueName': 'root'}},
+        ]
+        # the dump may hold credentials
+        assert stat.S_IMODE(os.stat(args['dest']).st_mode) == 0o600
+
+        # the same lines keep the existing file
+        mtime = os.path.getmtime(args['dest']) - 10
+        os.utime(args['dest'], (mtime, mtime))
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            sg_org_info_module().apply()
+        assert not exc.value.args[0]['changed']
+        assert not exc.value.args[0]['manifest']['written']
+        assert exc.value.args[0]['manifest']['sha256'] == manifest['sha256']
+        assert os.path.getmtime(args['dest']) == mtime
+        assert os.listdir(tmpdir) == ['org_info.ndjson.gz']
+
+        # check mode reports the change without writing
+        documents['api/v3/org/containers']['data'].pop()
+        args['_ansible_check_mode'] = True
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            sg_org_info_module().apply()
+        assert exc.value.args[0]['changed']
+        assert not exc.value.args[0]['manifest']['written']
+        assert os.path.getmtime(args['dest']) == mtime
+        assert 'sha256' not in exc.value.args[0]['manifest']
+
+        # a replaced file keeps its mode
+        os.chmod(args['dest'], 0o640)
+        args['_ansible_check_mode'] = False
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            sg_org_info_module().apply()
+        assert exc.value.args[0]['manifest']['written']
+        assert stat.S_IMODE(os.stat(args['dest']).st_mode) == 0o640
+
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request')
+    def test_snapshot_returns_changes_only(self, mock_request):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        args = self.set_default_args_pass_check()
+        args['gather_subset'] = ['org/users/root']
+        args['snapshot'] = os.path.join(tmpdir, 'org_info.snapshot')
+        root = json.loads(json.dumps(SRR['org_users_root'][0]))
+        root['data']['disable'] = True
+        mock_request.side_effect = [
+            SRR['version_114'], SRR['org_users_root'],
+            SRR['version_114'], SRR['org_users_root'],
+            SRR['version_114'], (root, None),
+            SRR['end_of_sequence'],
+        ]
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            sg_org_info_module().apply()
+        assert exc.value.args[0]['changed']
+        assert list(exc.value.args[0]['sg_info']) == ['org/users/root']
+        with open(args['snapshot']) as snapshot_file:
+            snapshot = snapshot_file.read()
+        # nothing changed, the snapshot is kept
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            sg_org_info_module().apply()
+        assert not exc.value.args[0]['changed']
+        assert exc.value.args[0]['sg_info'] == {}
+        # the root user changed
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            sg_org_info_module().apply()
+        assert exc.value.args[0]['changed']
+        assert exc.value.args[0]['sg_info']['org/users/root']['data']['disable']
+        with open(args['snapshot']) as snapshot_file:
+            assert snapshot_file.read() != snapshot
@@ -0,0 +1,220 @@
+# (c) 2026, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" unit tests NetApp StorageGRID Org S3 key rotation Ansible module: na_sg_org_s3_key_rotation"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+import json
+import pytest
+import sys
+
+from ansible_collections.netapp.storagegrid.tests.unit.compat import unittest
+from ansible_collections.netapp.storagegrid.tests.unit.compat.mock import patch
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+from ansible_collections.netapp.storagegrid.plugins.modules.na_sg_org_s3_key_rotation import (
+    SgOrgS3KeyRotation as org_s3_key_rotation_module,
+)
+
+if sys.version_info < (3, 11):
+    pytestmark = pytest.mark.skip("Skipping Unit Tests on 3.11")
+
+# REST API canned responses when mocking send_request
+SRR = {
+    "end_of_sequence": (None, "Unexpected call to send_request"),
+    "generic_error": (None, "Expected error"),
+    "delete_good": (None, None),
+    "version_118": ({"data": {"productVersion": "11.8.0-20230721.1338.d3969b3"}}, None),
+    "org_users": (
+        {
+            "data": [
+                {"id": "00000000-0000-0000-0000-000000000001", "uniqueName": "root", "fullName": "Root"},
+                {"id": "00000000-0000-0000-0000-000000000002", "uniqueName": "user/service1", "fullName": "Service 1"},
+                {"id": "00000000-0000-0000-0000-000000000003", "uniqueName": "user/service2", "fullName": "Service 2"},
+            ]
+        },
+        None,
+    ),
+    "root_keys": ({"data": [{"id": "key-root-1", "displayName": "****************RT01", "expires": "2099-01-01T00:00:00.000Z"}]}, None),
+    "service1_keys": (
+        {
+            "data": [
+                {"id": "key-s1-1", "displayName": "****************S101", "expires": "2020-09-04T00:00:00.000Z"},
+                {"id": "key-s1-2", "displayName": "****************S102", "expires": None},
+            ]
+        },
+        None,
+    ),
+    "service2_keys": ({"data": [{"id": "key-s2-1", "displayName": "****************S201"}]}, None),
+    "new_key": (
+        {
+            "data": {
+                "id": "key-new",
+                "accessKey": "ABCDEFGHIJKLMNOPQRST",
+                "secretAccessKey": "abcdefghijklmnopqrstuvwxyz0123456789ABCD",
+                "expires": None,
+            }
+        },
+        None,
+    ),
+}
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({"ANSIBLE_MODULE_ARGS": args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an exception"""
+    if "changed" not in kwargs:
+        kwargs["changed"] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs["failed"] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class TestMyModule(unittest.TestCase):
+    """a group of related Unit Tests"""
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+
+    def set_default_args(self):
+        return dict(
+            {
+                "max_concurrent_requests": 1,
+                "api_url": "gmi.example.com",
+                "auth_token": "01234567-5678-9abc-78de-9fgabc123def",
+                "validate_certs": False,
+            }
+        )
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_rotate_expired_keys(self, mock_request):
+        set_module_args(self.set_default_args())
+        mock_request.side_effect = [
+            SRR["version_118"],
+            SRR["org_users"],  # get all users
+            SRR["root_keys"],  # get root keys
+            SRR["service1_keys"],  # get service1 keys
+            SRR["service2_keys"],  # get service2 keys
+            SRR["new_key"],  # post service1 replacement key
+            SRR["end_of_sequence"],
+        ]
+        my_obj = org_s3_key_rotation_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_rotate_expired_keys: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["changed"]
+        assert exc.value.args[0]["summary"] == dict(users=3, keys=4, rotated=1, deleted=0, failed=0)
+        rotated = exc.value.args[0]["rotated"]
+        assert len(rotated) == 1
+        assert rotated[0]["unique_name"] == "user/service1"
+        assert rotated[0]["superseded"] == "****************S101"
+        assert rotated[0]["secret_access_key"] == "abcdefghijklmnopqrstuvwxyz0123456789ABCD"
+        assert mock_request.call_args_list[5][0][:2] == ("POST", "api/v4/org/users/00000000-0000-0000-0000-000000000002/s3-access-keys")
+        assert mock_request.call_args_list[5][1]["json"] == {}
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_rotate_non_expiring_and_delete_superseded(self, mock_request):
+        args = self.set_default_args()
+        args["unique_names"] = ["user/service1", "user/service2"]
+        args["rotate_non_expiring"] = True
+        args["delete_superseded"] = True
+        args["key_lifetime_days"] = 90
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_118"],
+            SRR["org_users"],  # get all users
+            SRR["service1_keys"],  # get service1 keys
+            SRR["service2_keys"],  # get service2 keys
+            SRR["new_key"],  # post service1 replacement key
+            SRR["delete_good"],  # delete key-s1-1
+            SRR["new_key"],  # post service1 replacement key
+            SRR["delete_good"],  # delete key-s1-2
+            SRR["new_key"],  # post service2 replacement key
+            SRR["generic_error"],  # delete key-s2-1
+            SRR["end_of_sequence"],
+        ]
+        my_obj = org_s3_key_rotation_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        print("Info: test_rotate_non_expiring_and_delete_superseded: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["changed"]
+        assert exc.value.args[0]["summary"] == dict(users=2, keys=3, rotated=3, deleted=2, failed=1)
+        assert exc.value.args[0]["msg"] == (
+            "Error rotating the S3 access keys of 1 users: user/service2: "
+            "replacement key created, deleting the superseded key failed: Expected error"
+        )
+        assert mock_request.call_args_list[5][0][:2] == (
+            "DELETE", "api/v4/org/users/00000000-0000-0000-0000-000000000002/s3-access-keys/key-s1-1"
+        )
+        assert mock_request.call_args_list[4][1]["json"]["expires"].endswith(".000Z")
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_check_mode_concurrent(self, mock_request):
+        args = self.set_default_args()
+        args["rotate_non_expiring"] = True
+        args["max_concurrent_requests"] = 4
+        args["_ansible_check_mode"] = True
+        set_module_args(args)
+
+        def send_request(method, api, params=None, json=None, files=None):
+            if api.endswith("product-version"):
+                return SRR["version_118"]
+            if api.endswith("org/users"):
+                return SRR["org_users"]
+            if "-000000000001/" in api:
+                return SRR["root_keys"]
+            if "-000000000002/" in api:
+                return SRR["service1_keys"]
+            return SRR["generic_error"]
+
+        mock_request.side_effect = send_request
+        my_obj = org_s3_key_rotation_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        print("Info: test_check_mode_concurrent: %s" % repr(exc.value.args[0]))
+        # two keys would be rotated
+        assert exc.value.args[0]["changed"]
+        rotated = exc.value.args[0]["rotated"]
+        assert [entry["superseded_id"] for entry in rotated if "error" not in entry] == ["key-s1-1", "key-s1-2"]
+        assert rotated[-1] == dict(unique_name="user/service2", user_id="00000000-0000-0000-0000-000000000003", error="Expected error")
+        assert not [call for call in mock_request.call_args_list if call[0][0] != "GET"]
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_fail_unknown_user(self, mock_request):
+        args = self.set_default_args()
+        args["unique_names"] = ["user/service1", "user/unknown"]
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_118"],
+            SRR["org_users"],  # get all users
+            SRR["end_of_sequence"],
+        ]
+        my_obj = org_s3_key_rotation_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]["msg"] == "Error: users not found: user/unknown"
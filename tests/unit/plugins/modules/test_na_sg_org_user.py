@@ -458,3 +458,131 @@ class TestMyModule(unittest.TestCase):
             ]
             org_user_module()
         print("Info: test_fail_set_federated_user_password: %s" % repr(exc.value.args[0]))
+
+    def set_args_users(self):
+        return dict(
+            {
+                "member_of": ["group/testorggroup1"],
+                "users": [
+                    {"unique_name": "user/ansible-sg-demo-user1", "full_name": "testorguser"},
+                    {"unique_name": "user/newuser", "full_name": "New User", "password": "netapp123"},
+                    {
+                        "unique_name": "user/otheruser",
+                        "full_name": "Other User",
+                        "member_of": ["group/testorggroup1", "group/testorggroup2"],
+                    },
+                    {"unique_name": "user/olduser", "state": "absent"},
+                ],
+                "max_concurrent_requests": 1,
+                "api_url": "gmi.example.com",
+                "auth_token": "01234567-5678-9abc-78de-9fgabc123def",
+                "validate_certs": False,
+            }
+        )
+
+    def org_users_bulk(self):
+        users = []
+        for index, name in enumerate(["ansible-sg-demo-user1", "otheruser", "olduser", "unlisteduser"]):
+            user = dict(SRR["org_users"][0]["data"][0], uniqueName="user/%s" % name, id="09876543-abcd-4321-abcd-09876543210%d" % index)
+            users.append(user)
+        users.append(dict(SRR["org_users"][0]["data"][0], uniqueName="root", id="root-id"))
+        return ({"data": users}, None)
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_users_create_update_delete(self, mock_request):
+        set_module_args(self.set_args_users())
+        mock_request.side_effect = [
+            SRR["version_114"],
+            self.org_users_bulk(),  # get all users
+            SRR["org_groups"],  # get all groups
+            SRR["org_user_record"],  # post newuser
+            SRR["pw_change_good"],  # post newuser password
+            SRR["org_user_record_update"],  # put otheruser
+            SRR["delete_good"],  # delete olduser
+            SRR["end_of_sequence"],
+        ]
+        my_obj = org_user_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_users_create_update_delete: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["changed"]
+        assert exc.value.args[0]["msg"] == "1 Org Users created; 1 Org Users updated; 1 Org Users deleted; 1 Org User passwords updated"
+        results = exc.value.args[0]["users"]
+        assert [result["action"] for result in results] == ["none", "create", "update", "delete"]
+        assert mock_request.call_args_list[1][0][:2] == ("GET", "api/v3/org/users")
+        assert mock_request.call_args_list[2][0][:2] == ("GET", "api/v3/org/groups")
+        assert mock_request.call_args_list[3][1]["json"]["memberOf"] == ["12345678-abcd-1234-abcd-1234567890ab"]
+        assert mock_request.call_args_list[4][0][:2] == ("POST", "api/v3/org/users/user/newuser/change-password")
+        assert sorted(mock_request.call_args_list[5][1]["json"]["memberOf"]) == [
+            "12345678-abcd-1234-abcd-1234567890ab",
+            "87654321-abcd-1234-cdef-1234567890ab",
+        ]
+        assert mock_request.call_args_list[6][0][:2] == ("DELETE", "api/v3/org/users/09876543-abcd-4321-abcd-098765432102")
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_users_purge_check_mode_keeps_root(self, mock_request):
+        args = self.set_args_users()
+        args["purge_users"] = True
+        args["_ansible_check_mode"] = True
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_114"],
+            self.org_users_bulk(),  # get all users
+            SRR["org_groups"],  # get all groups
+            SRR["end_of_sequence"],
+        ]
+        my_obj = org_user_module()
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        print("Info: test_users_purge_check_mode_keeps_root: %s" % repr(exc.value.args[0]))
+        names = [result["unique_name"] for result in exc.value.args[0]["users"]]
+        assert names[-1] == "user/unlisteduser"
+        assert "root" not in names
+        assert mock_request.call_count == 3
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_users_groups_paged_and_missing_group(self, mock_request):
+        args = self.set_args_users()
+        args["member_of"] = ["group/lastgroup"]
+        args["users"] = [
+            {"unique_name": "user/newuser", "full_name": "New User"},
+            {"unique_name": "user/otheruser", "full_name": "Other User", "member_of": ["group/nogroup"]},
+        ]
+        set_module_args(args)
+        first_page = [dict(uniqueName="group/group%d" % index, id="group-id-%d" % index) for index in range(250)]
+        mock_request.side_effect = [
+            SRR["version_114"],
+            self.org_users_bulk(),  # get all users
+            ({"data": first_page}, None),  # get groups, first page
+            ({"data": [dict(uniqueName="group/lastgroup", id="last-group-id")]}, None),  # get groups, second page
+            SRR["org_user_record"],  # post newuser
+            SRR["end_of_sequence"],
+        ]
+        my_obj = org_user_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        print("Info: test_users_groups_paged_and_missing_group: %s" % repr(exc.value.args[0]))
+        assert exc.value.args[0]["msg"] == (
+            "Error changing 1 of 2 Org Users: user/otheruser: Invalid unique_group supplied: 'group/nogroup' not found"
+        )
+        assert exc.value.args[0]["changed"]
+        assert mock_request.call_args_list[3][0][2] == {"limit": 250, "marker": "group-id-249"}
+        assert mock_request.call_args_list[4][1]["json"]["memberOf"] == ["last-group-id"]
+
+    @patch("ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.SGRestAPI.send_request")
+    def test_users_fail_missing_full_name(self, mock_request):
+        args = self.set_args_users()
+        args["users"].append({"unique_name": "user/nofullname"})
+        set_module_args(args)
+        mock_request.side_effect = [
+            SRR["version_114"],
+            self.org_users_bulk(),  # get all users
+            SRR["org_groups"],  # get all groups
+            SRR["end_of_sequence"],
+        ]
+        my_obj = org_user_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]["msg"] == (
+            "Error in users for user/nofullname: state is present but all of the following are missing: full_name"
+        )
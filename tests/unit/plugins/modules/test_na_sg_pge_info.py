@@ -5,9 +5,13 @@
 
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
+import gzip
 import json
+import os
 import pytest
+import shutil
 import sys
+import tempfile
 
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
@@ -389,6 +393,30 @@ class TestMyModule(unittest.TestCase):
         print('Info: test_run_sg_gather_facts_for_storage_configuration_networking_and_dns_info_pass: %s' % repr(exc.value.args))
         assert set(exc.value.args[0]['sg_info']) == set(gather_subset)
 
+    @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.PgeRestAPI.send_request')
+    def test_dest_writes_ndjson(self, mock_request):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        args = self.set_args_run_sg_gather_facts_for_storage_configuration_networking_and_dns_info()
+        args['dest'] = os.path.join(tmpdir, 'pge_info.ndjson.gz')
+        set_module_args(args)
+        my_obj = sg_pge_info_module()
+        mock_request.side_effect = [
+            SRR['pge_storage_configuration_networking'],
+            SRR['pge_dns'],
+            SRR['end_of_sequence'],
+        ]
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['changed']
+        manifest = exc.value.args[0]['manifest']
+        assert [entry['subset'] for entry in manifest['subsets']] == ['pge/storage-configuration/networking', 'pge/dns']
+        with gzip.open(args['dest'], 'rt') as dest_file:
+            lines = [json.loads(line) for line in dest_file]
+        assert lines[0] == {'subset': 'pge/storage-configuration/networking', 'data': SRR['pge_storage_configuration_networking'][0]['data']}
+        assert lines[1]['subset'] == 'pge/dns'
+        assert manifest['items'] == 2 and manifest['bytes'] == os.path.getsize(args['dest'])
+
     @patch('ansible_collections.netapp.storagegrid.plugins.module_utils.netapp.PgeRestAPI.send_request')
     def test_get_na_sg_pge_info_upgrade_status_pass(self, mock_request):
         set_module_args(self.set_args_run_sg_gather_facts_for_pge_upgrade_status())